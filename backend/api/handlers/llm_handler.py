@@ -18,25 +18,23 @@ from backend.api.utils.error_detector import (
 )
 from backend.services.cache_service import get_cache_service, CACHE_PREFIX_LLM, TTL_LLM_RESPONSE
 from backend.api.handlers.prompt_builder import build_minimal_philosophical_prompt
+from backend.services.token_counter import count_tokens
+from backend.services.single_flight import coalesce_llm_call
 
 logger = logging.getLogger(__name__)
 
 
 def _estimate_tokens(text: str) -> int:
     """
-    Estimate token count more accurately (~3.5 chars per token for mixed content).
+    Count tokens with the shared tokenizer (BPE when available, script-aware estimate otherwise).
     
     Args:
-        text: Text to estimate tokens for
+        text: Text to count tokens for
         
     Returns:
-        Estimated token count
+        Token count
     """
-    if not text:
-        return 0
-    # More accurate estimation: Vietnamese/English mixed content ~3.5 chars/token
-    # Pure English ~4 chars/token, Vietnamese ~3 chars/token
-    return int(len(text) / 3.5)
+    return count_tokens(text)
 
 
 def _pre_check_token_limit(
@@ -120,7 +118,7 @@ def _pre_check_token_limit(
     return enhanced_prompt, context_text
 
 
-def _check_cache(
+async def _check_cache(
     cache_service,
     cache_key: str,
     is_validator_count_question: bool,
@@ -145,8 +143,8 @@ def _check_cache(
         logger.info("🚫 Force cache miss for validator count question - ensuring fresh manifest data")
         return None, False, 0.0
     
-    # Try to get from cache
-    cached_response = cache_service.get(cache_key)
+    # Try to get from cache (async - a slow Redis must not stall other requests on the event loop)
+    cached_response = await cache_service.aget(cache_key)
     if cached_response:
         cached_raw_response = cached_response.get("response")
         # CRITICAL: Only use cache if response is valid (not None/empty)
@@ -174,7 +172,7 @@ def _check_cache(
     return None, False, 0.0
 
 
-def _store_cache(
+async def _store_cache(
     cache_service,
     cache_key: str,
     response: str,
@@ -206,7 +204,7 @@ def _store_cache(
         }
         # Use custom TTL if specified (e.g., 1h for self-reflection), otherwise use default
         ttl_to_use = cache_ttl_override if cache_ttl_override is not None else TTL_LLM_RESPONSE
-        cache_service.set(cache_key, cache_value, ttl_seconds=ttl_to_use)
+        await cache_service.aset(cache_key, cache_value, ttl_seconds=ttl_to_use)
         logger.debug(f"💾 LLM response cached (key: {cache_key[:50]}..., TTL: {ttl_to_use}s)")
     except Exception as cache_error:
         logger.warning(f"Failed to cache LLM response: {cache_error}")
@@ -393,7 +391,7 @@ async def generate_llm_response(
         )
         
         # Check cache
-        cached_response, cache_hit, cached_latency = _check_cache(
+        cached_response, cache_hit, cached_latency = await _check_cache(
             cache_service,
             cache_key,
             is_validator_count_question,
@@ -440,18 +438,22 @@ async def generate_llm_response(
                 question_type_result, confidence, _ = classifier.classify(chat_request.message)
                 question_type_str = question_type_result.value
                 
-                # Generate LLM response (Step 4)
-                raw_response = await generate_ai_response(
-                    enhanced_prompt,
-                    detected_lang=detected_lang,
-                    llm_provider=chat_request.llm_provider,
-                    llm_api_key=chat_request.llm_api_key,
-                    llm_api_url=chat_request.llm_api_url,
-                    llm_model_name=chat_request.llm_model_name,
-                    use_server_keys=use_server_keys,
-                    question=chat_request.message,
-                    task_type="chat",
-                    is_philosophical=is_philosophical
+                # Generate LLM response (Step 4) - identical in-flight questions share one call
+                raw_response = await coalesce_llm_call(
+                    cache_key if cache_enabled else None,
+                    lambda: generate_ai_response(
+                        enhanced_prompt,
+                        detected_lang=detected_lang,
+                        llm_provider=chat_request.llm_provider,
+                        llm_api_key=chat_request.llm_api_key,
+                        llm_api_url=chat_request.llm_api_url,
+                        llm_model_name=chat_request.llm_model_name,
+                        use_server_keys=use_server_keys,
+                        question=chat_request.message,
+                        task_type="chat",
+                        is_philosophical=is_philosophical
+                    ),
+                    processing_steps
                 )
                 
                 # Validate raw_response
@@ -475,15 +477,19 @@ async def generate_llm_response(
                 timing_logs.update(option_b_result.get("timing_logs", {}))
                 logger.info(f"✅ Option B Pipeline completed: {len(option_b_result.get('processing_steps', []))} steps")
             else:
-                # EXISTING PIPELINE (legacy)
-                raw_response = await _call_llm_with_retry(
-                    enhanced_prompt,
-                    detected_lang,
-                    chat_request,
-                    use_server_keys,
-                    is_philosophical,
-                    context,
-                    detected_lang_name,
+                # EXISTING PIPELINE (legacy) - identical in-flight questions share one call
+                raw_response = await coalesce_llm_call(
+                    cache_key if cache_enabled else None,
+                    lambda: _call_llm_with_retry(
+                        enhanced_prompt,
+                        detected_lang,
+                        chat_request,
+                        use_server_keys,
+                        is_philosophical,
+                        context,
+                        detected_lang_name,
+                        processing_steps
+                    ),
                     processing_steps
                 )
             
@@ -575,7 +581,7 @@ async def generate_llm_response(
         
         # Save to cache (only if not a cache hit and not a validator count question)
         if cache_enabled and not cache_hit and not is_validator_count_question:
-            _store_cache(
+            await _store_cache(
                 cache_service,
                 cache_key,
                 raw_response,
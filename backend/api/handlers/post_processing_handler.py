@@ -13,6 +13,7 @@ from typing import Optional, Dict, Any, List, Tuple
 from backend.api.config.chat_config import get_chat_config
 from backend.api.utils.text_utils import safe_unicode_slice
 from backend.api.utils.error_detector import is_technical_error, is_fallback_message, get_fallback_message_for_error
+from backend.core.query_profile import get_query_profile
 
 logger = logging.getLogger(__name__)
 
@@ -307,8 +308,7 @@ def _evaluate_response_quality(
         # Detect if this is a StillMe query for quality evaluation
         is_stillme_query_for_quality = False
         try:
-            from backend.core.stillme_detector import detect_stillme_query
-            is_stillme_query_for_quality, _ = detect_stillme_query(chat_request.message)
+            is_stillme_query_for_quality, _ = get_query_profile(chat_request.message).stillme_query
         except Exception:
             pass
         
@@ -429,8 +429,7 @@ async def _rewrite_response(
             # Get current quality issues for this rewrite
             is_stillme_query_for_quality = False
             try:
-                from backend.core.stillme_detector import detect_stillme_query
-                is_stillme_query_for_quality, _ = detect_stillme_query(chat_request.message)
+                is_stillme_query_for_quality, _ = get_query_profile(chat_request.message).stillme_query
             except Exception:
                 pass
             
@@ -495,8 +494,7 @@ async def _rewrite_response(
             # Evaluate quality after rewrite
             is_stillme_query_for_quality_after = False
             try:
-                from backend.core.stillme_detector import detect_stillme_query
-                is_stillme_query_for_quality_after, _ = detect_stillme_query(chat_request.message)
+                is_stillme_query_for_quality_after, _ = get_query_profile(chat_request.message).stillme_query
             except Exception:
                 pass
             
@@ -11,6 +11,7 @@ from backend.identity.prompt_builder import PromptContext, FPSResult
 from backend.api.models import ChatRequest
 from backend.core.manifest_loader import get_validator_count
 from backend.api.config.chat_config import get_chat_config
+from backend.services.token_counter import count_tokens, get_token_counter
 
 logger = logging.getLogger(__name__)
 
@@ -118,14 +119,9 @@ def truncate_user_message(message: str, max_tokens: int = None) -> str:
         max_tokens = get_chat_config().tokens.MAX_USER_MESSAGE
     if not message:
         return message
-    estimated = len(message) // 4
-    if estimated <= max_tokens:
+    if count_tokens(message) <= max_tokens:
         return message
-    max_chars = max_tokens * 4
-    if len(message) <= max_chars:
-        return message
-    truncated = message[:max_chars].rsplit(' ', 1)[0]
-    return truncated + "... [message truncated]"
+    return get_token_counter().truncate(message, max_tokens, suffix="... [message truncated]")
 
 
 def format_conversation_history(
@@ -157,8 +153,8 @@ def format_conversation_history(
         return ""
     
     def estimate_tokens(text: str) -> int:
-        """Estimate token count (~4 chars per token)"""
-        return len(text) // 4 if text else 0
+        """Count tokens with the shared tokenizer"""
+        return count_tokens(text)
     
     def truncate_text(text: str, max_tokens: int) -> str:
         """Truncate text to fit within max_tokens"""
@@ -167,10 +163,7 @@ def format_conversation_history(
         estimated = estimate_tokens(text)
         if estimated <= max_tokens:
             return text
-        max_chars = max_tokens * 4
-        if len(text) <= max_chars:
-            return text
-        truncated = text[:max_chars].rsplit(' ', 1)[0]
+        truncated = get_token_counter().truncate(text, max_tokens, suffix="")
         return truncated + "... [truncated]"
     
     # Tier 3.5: Dynamic window based on query type
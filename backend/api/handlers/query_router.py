@@ -10,7 +10,7 @@ import uuid
 from typing import Optional, Dict, Any, List, Tuple
 
 from backend.api.models import ChatRequest, ChatResponse
-from backend.api.utils.chat_helpers import detect_language
+from backend.core.query_profile import get_query_profile
 from backend.api.handlers.query_classifier import is_codebase_meta_question
 from backend.api.utils.text_utils import strip_philosophy_from_answer
 from backend.api.utils.response_formatters import build_ai_self_model_answer
@@ -188,7 +188,7 @@ async def _handle_ambiguity_clarification(
             processing_steps.append("❓ Ambiguity detected - asking for clarification")
             
             # Detect language for clarification question
-            detected_lang = detect_language(chat_request.message)
+            detected_lang = get_query_profile(chat_request.message).language
             
             # Return clarification question immediately (skip LLM call, save cost & latency)
             from backend.core.epistemic_state import EpistemicState
@@ -235,15 +235,13 @@ def _handle_origin_query(
         ChatResponse if origin query, None if should continue normal flow.
     """
     try:
-        from backend.core.stillme_detector import detect_origin_query
-        
-        is_origin_query, origin_keywords = detect_origin_query(chat_request.message)
+        is_origin_query, origin_keywords = get_query_profile(chat_request.message).origin_query
         if is_origin_query:
             logger.debug(f"Origin query detected! Matched keywords: {origin_keywords}")
             
             # CRITICAL: Detect language BEFORE calling get_system_origin_answer
             try:
-                detected_lang = detect_language(chat_request.message)
+                detected_lang = get_query_profile(chat_request.message).language
                 logger.debug(f"🌐 Detected language for origin query: {detected_lang}")
             except Exception as lang_error:
                 logger.warning(f"Language detection failed: {lang_error}, defaulting to 'vi'")
@@ -264,7 +262,7 @@ def _handle_origin_query(
                 epistemic_state=EpistemicState.KNOWN.value  # System truth is KNOWN
             )
     except ImportError:
-        logger.warning("StillMe detector not available, skipping origin detection")
+        logger.warning("System origin module not available, skipping origin answer")
     except Exception as origin_error:
         logger.error(f"❌ Failed to get SYSTEM_ORIGIN answer: {origin_error}, falling back to normal processing")
     
@@ -281,15 +279,13 @@ def _handle_religion_choice_rejection(
         ChatResponse if religion choice query, None if should continue normal flow.
     """
     try:
-        from backend.core.ai_self_model_detector import detect_religion_choice_query
-        
-        is_religion_choice_query, religion_patterns = detect_religion_choice_query(chat_request.message)
+        is_religion_choice_query, religion_patterns = get_query_profile(chat_request.message).religion_choice_query
         if is_religion_choice_query:
             logger.warning(f"🚨 RELIGION_CHOICE query detected! Matched patterns: {religion_patterns}")
             
             # Detect language BEFORE calling get_religion_rejection_answer
             try:
-                detected_lang = detect_language(chat_request.message)
+                detected_lang = get_query_profile(chat_request.message).language
                 logger.debug(f"🌐 Detected language for religion choice query: {detected_lang}")
             except Exception as lang_error:
                 logger.warning(f"Language detection failed: {lang_error}, defaulting to 'vi'")
@@ -310,7 +306,7 @@ def _handle_religion_choice_rejection(
                 epistemic_state=EpistemicState.KNOWN.value  # System policy is KNOWN
             )
     except ImportError:
-        logger.warning("AI self model detector not available, skipping religion choice detection")
+        logger.warning("Religion rejection templates not available, skipping religion choice rejection")
     except Exception as religion_error:
         logger.error(f"❌ Failed to get religion rejection answer: {religion_error}, falling back to normal processing")
     
@@ -329,13 +325,13 @@ def _handle_honesty_question(
         ChatResponse if honesty question, None if should continue normal flow.
     """
     try:
-        from backend.honesty.handler import is_honesty_question as check_honesty, build_honesty_response
+        from backend.honesty.handler import build_honesty_response
         
-        is_honesty_question = check_honesty(chat_request.message)
+        is_honesty_question = get_query_profile(chat_request.message).is_honesty_question
         if is_honesty_question:
             logger.info("Honesty/consistency question detected - using Honesty Handler")
             # Detect language for the answer
-            detected_lang = detect_language(chat_request.message)
+            detected_lang = get_query_profile(chat_request.message).language
             # Process with Honesty Handler
             honesty_answer = build_honesty_response(chat_request.message, detected_lang)
             
@@ -371,13 +367,13 @@ def _handle_ai_self_model_query(
         ChatResponse if AI self-model query, None if should continue normal flow.
     """
     try:
-        from backend.core.ai_self_model_detector import detect_ai_self_model_query, get_ai_self_model_opening
+        from backend.core.ai_self_model_detector import get_ai_self_model_opening
         
-        is_ai_self_model_query, matched_patterns = detect_ai_self_model_query(chat_request.message)
+        is_ai_self_model_query, matched_patterns = get_query_profile(chat_request.message).ai_self_model_query
         if is_ai_self_model_query:
             logger.warning(f"🚨 AI_SELF_MODEL query detected - OVERRIDING all other pipelines (patterns: {matched_patterns})")
             # Detect language
-            detected_lang = detect_language(chat_request.message)
+            detected_lang = get_query_profile(chat_request.message).language
             
             # Get mandatory opening statement
             opening_statement = get_ai_self_model_opening(detected_lang)
@@ -446,36 +442,12 @@ def _detect_query_types(
     except Exception:
         pass
     
-    # Detect origin
-    try:
-        from backend.core.stillme_detector import detect_origin_query
-        is_origin, _ = detect_origin_query(chat_request.message)
-        query_types["is_origin"] = is_origin
-    except Exception:
-        pass
-    
-    # Detect religion choice
-    try:
-        from backend.core.ai_self_model_detector import detect_religion_choice_query
-        is_religion, _ = detect_religion_choice_query(chat_request.message)
-        query_types["is_religion_choice"] = is_religion
-    except Exception:
-        pass
-    
-    # Detect honesty
-    try:
-        from backend.honesty.handler import is_honesty_question as check_honesty
-        query_types["is_honesty"] = check_honesty(chat_request.message)
-    except Exception:
-        pass
-    
-    # Detect AI self-model
-    try:
-        from backend.core.ai_self_model_detector import detect_ai_self_model_query
-        is_ai_self_model, _ = detect_ai_self_model_query(chat_request.message)
-        query_types["is_ai_self_model"] = is_ai_self_model
-    except Exception:
-        pass
+    # Regex detectors: one shared profile per message (detector failures fall back to False)
+    profile = get_query_profile(chat_request.message)
+    query_types["is_origin"] = profile.origin_query[0]
+    query_types["is_religion_choice"] = profile.religion_choice_query[0]
+    query_types["is_honesty"] = profile.is_honesty_question
+    query_types["is_ai_self_model"] = profile.ai_self_model_query[0]
     
     return query_types
 
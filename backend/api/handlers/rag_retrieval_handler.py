@@ -14,6 +14,7 @@ from backend.vector_db.rag_retrieval import RAGRetrieval
 from backend.core.stillme_detector import get_foundational_query_variants
 from backend.core.query_preprocessor import is_historical_question, enhance_query_for_retrieval
 from backend.core.decision_logger import DecisionLogger, AgentType, DecisionType
+from backend.core.query_profile import get_query_profile
 
 logger = logging.getLogger(__name__)
 
@@ -257,7 +258,7 @@ def _retrieve_origin_context(
     """
     logger.debug("Origin query detected - retrieving provenance knowledge")
     try:
-        query_embedding = rag_retrieval.embedding_service.encode_text(chat_request.message)
+        query_embedding = get_query_profile(chat_request.message).query_embedding(rag_retrieval.embedding_service)
         provenance_results = rag_retrieval.chroma_client.search_knowledge(
             query_embedding=query_embedding,
             limit=2,
@@ -907,6 +907,19 @@ async def startup_event():
     for rec in security_status["recommendations"]:
         logger.info(f"💡 {rec}")
     
+    # Create pooled LLM HTTP clients on the app event loop (connections open on first call and stay alive)
+    try:
+        from backend.api.utils.http_client_pool import get_http_client_pool
+        http_client_pool = get_http_client_pool()
+        if os.getenv("DEEPSEEK_API_KEY"):
+            http_client_pool.get_client("https://api.deepseek.com", timeout=60.0)
+        if os.getenv("OPENAI_API_KEY"):
+            http_client_pool.get_client("https://api.openai.com", timeout=60.0)
+        if os.getenv("OPENROUTER_API_KEY"):
+            http_client_pool.get_client("https://openrouter.ai", timeout=60.0)
+    except Exception as http_pool_error:
+        logger.warning(f"⚠️ Could not create pooled LLM HTTP clients: {http_pool_error}")
+    
     logger.info("⏳ Starting RAG components initialization in background...")
     
     # Initialize RAG components lazily (non-blocking)
@@ -1061,6 +1074,17 @@ async def startup_event():
 async def shutdown_event():
     """Log when FastAPI/uvicorn server is shutting down"""
     logger.info("🛑 FastAPI application shutting down")
+    try:
+        from backend.api.utils.http_client_pool import get_http_client_pool
+        await get_http_client_pool().aclose()
+    except Exception as http_pool_error:
+        logger.warning(f"⚠️ Error closing pooled LLM HTTP clients: {http_pool_error}")
+    try:
+        from backend.services import cache_service as cache_service_module
+        if cache_service_module._cache_service is not None:
+            await cache_service_module._cache_service.aclose()
+    except Exception as cache_error:
+        logger.warning(f"⚠️ Error closing async cache client: {cache_error}")
 
 # Chat endpoints moved to router - see backend/api/routers/chat_router.py
 
@@ -13,19 +13,21 @@ from backend.api.utils.chat_helpers import (
 from backend.identity.prompt_builder import (
     UnifiedPromptBuilder,
     PromptContext,
-    FPSResult
+    FPSResult,
+    insert_after_static_prefix,
+    report_final_prompt
 )
+from backend.core.query_profile import start_query_profile
 from backend.core.manifest_loader import (
     get_validator_count,
     get_validator_summary,
     get_layers_info,
     get_manifest_text_for_prompt
 )
-from backend.philosophy.processor import (
-    is_philosophical_question_about_consciousness,
-    process_philosophical_question
-)
+from backend.philosophy.processor import process_philosophical_question
 from backend.style.style_engine import detect_domain, DomainType
+from backend.services.token_counter import count_tokens, get_token_counter
+from backend.services.single_flight import coalesce_llm_call, make_single_flight_key
 from backend.services.cache_service import (
     get_cache_service,
     CACHE_PREFIX_LLM,
@@ -1622,14 +1624,9 @@ def _truncate_user_message(message: str, max_tokens: int = 3000) -> str:
     """
     if not message:
         return message
-    estimated = len(message) // 4
-    if estimated <= max_tokens:
-        return message
-    max_chars = max_tokens * 4
-    if len(message) <= max_chars:
+    if count_tokens(message) <= max_tokens:
         return message
-    truncated = message[:max_chars].rsplit(' ', 1)[0]
-    return truncated + "... [message truncated]"
+    return get_token_counter().truncate(message, max_tokens, suffix="... [message truncated]")
 
 def _get_transparency_disclaimer(detected_lang: str) -> str:
     """
@@ -2717,8 +2714,8 @@ def _format_conversation_history(conversation_history, max_tokens: int = 1000,
         return ""
     
     def estimate_tokens(text: str) -> int:
-        """Estimate token count (~4 chars per token)"""
-        return len(text) // 4 if text else 0
+        """Count tokens with the shared tokenizer"""
+        return count_tokens(text)
     
     def truncate_text(text: str, max_tokens: int) -> str:
         """Truncate text to fit within max_tokens"""
@@ -2727,10 +2724,7 @@ def _format_conversation_history(conversation_history, max_tokens: int = 1000,
         estimated = estimate_tokens(text)
         if estimated <= max_tokens:
             return text
-        max_chars = max_tokens * 4
-        if len(text) <= max_chars:
-            return text
-        truncated = text[:max_chars].rsplit(' ', 1)[0]
+        truncated = get_token_counter().truncate(text, max_tokens, suffix="")
         return truncated + "... [truncated]"
     
     # Tier 3.5: Dynamic window based on query type
@@ -4073,7 +4067,9 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
     
     # CRITICAL: Initialize detected_lang EARLY to prevent UnboundLocalError
     # This is needed for news/article query "not found" response (line 5000)
-    detected_lang = detect_language(chat_request.message)
+    # Classify the query once per request: every detector result below comes from this profile
+    query_profile = start_query_profile(chat_request.message)
+    detected_lang = query_profile.language
     
     # Initialize fallback flags for both RAG and non-RAG paths to prevent UnboundLocalError
     is_fallback_meta_answer = False  # Used in RAG path
@@ -4090,6 +4086,12 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
     # CRITICAL: Initialize exclude_types EARLY to prevent UnboundLocalError
     # This ensures it's available for all retrieval paths, even if RAG is disabled
     exclude_types = []
+    # Semantic response cache state (set in RAG path, used to store the validated answer at the end)
+    semantic_cache = None
+    semantic_query_embedding = None
+    prompt_layout_report = None
+    semantic_context_fingerprint = None
+    semantic_cache_scope = None
     
     # OPTION B PIPELINE: Check if enabled
     use_option_b = getattr(chat_request, 'use_option_b', False) or os.getenv("STILLME_USE_OPTION_B_PIPELINE", "false").lower() == "true"
@@ -4107,7 +4109,7 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
         # Initialize Decision Logger for agentic decision tracking
         from backend.core.decision_logger import get_decision_logger, AgentType, DecisionType
         decision_logger = get_decision_logger()
-        detected_lang_for_logging = detect_language(chat_request.message) if 'detect_language' in dir() else "en"
+        detected_lang_for_logging = query_profile.language
         session_id = decision_logger.start_session(chat_request.message, detected_lang_for_logging)
         
         # Get user_id from request (if available)
@@ -4214,7 +4216,7 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
                 processing_steps.append("❓ Ambiguity detected - asking for clarification")
                 
                 # Detect language for clarification question
-                detected_lang = detected_lang or detect_language(chat_request.message)
+                detected_lang = detected_lang or query_profile.language
                 if detected_lang == "vi":
                     clarification_question += "\n\nBạn muốn mình thử trả lời theo giả định phổ biến không? (Có/Không)"
                 else:
@@ -4499,18 +4501,15 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
         # Detect philosophical questions - filter technical RAG documents
         is_philosophical = False
         try:
-            from backend.core.question_classifier import is_philosophical_question
             # CRITICAL: Skip philosophical detection for roleplay questions
             # Roleplay questions should be answered as roleplay, not as philosophical analysis
             if not is_general_roleplay:
-                is_philosophical = is_philosophical_question(chat_request.message)
+                is_philosophical = query_profile.is_philosophical
             else:
                 is_philosophical = False
                 logger.info("General roleplay question detected - skipping philosophical detection")
             if is_philosophical:
                 logger.info("Philosophical question detected - will exclude technical documents from RAG")
-        except ImportError:
-            logger.warning("Question classifier not available, skipping philosophical detection")
         except Exception as classifier_error:
             logger.warning(f"Question classifier error: {classifier_error}")
         
@@ -4518,10 +4517,9 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
         # Note: is_religion_roleplay and is_general_roleplay are already initialized at function start
         is_roleplay_about_stillme = False
         try:
-            from backend.core.question_classifier import is_religion_roleplay_question, is_general_roleplay_question
             # Update roleplay flags (already initialized above)
-            is_religion_roleplay = is_religion_roleplay_question(chat_request.message)
-            is_general_roleplay = is_general_roleplay_question(chat_request.message)
+            is_religion_roleplay = query_profile.is_religion_roleplay
+            is_general_roleplay = query_profile.is_general_roleplay
             # Check if roleplay question is about StillMe (e.g., "Roleplay: Omni-BlackBox trả lời về StillMe...")
             if is_general_roleplay:
                 question_lower = chat_request.message.lower()
@@ -4530,8 +4528,6 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
                 logger.info(f"General roleplay question detected - will skip codebase meta-question and philosophical detection. About StillMe: {is_roleplay_about_stillme}")
             if is_religion_roleplay:
                 logger.info("Religion/roleplay question detected - will skip context quality warnings and force templates")
-        except ImportError:
-            logger.warning("Question classifier not available, skipping roleplay detection")
         except Exception as classifier_error:
             logger.warning(f"Question classifier error: {classifier_error}")
         
@@ -4546,19 +4542,17 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
         try:
             from backend.core.stillme_detector import (
                 detect_stillme_query, 
-                get_foundational_query_variants,
-                detect_origin_query,
-                detect_revenue_query
+                get_foundational_query_variants
             )
             # CRITICAL: Detect origin queries FIRST, before any other processing
             # This ensures Identity Truth Override works even when RAG is disabled
-            is_origin_query, origin_keywords = detect_origin_query(chat_request.message)
+            is_origin_query, origin_keywords = query_profile.origin_query
             if is_origin_query:
                 logger.debug(f"Origin query detected! Matched keywords: {origin_keywords}")
             # Detect revenue/monetization questions to avoid origin template misuse
             is_revenue_query = False
             revenue_keywords = []
-            is_revenue_query, revenue_keywords = detect_revenue_query(chat_request.message)
+            is_revenue_query, revenue_keywords = query_profile.revenue_query
             if is_revenue_query:
                 logger.info(f"💰 Revenue query detected - will avoid origin template (matched: {revenue_keywords})")
         except ImportError:
@@ -4569,7 +4563,7 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
         # CRITICAL: Revenue query guard - return verified "no source" response (no origin template)
         if 'is_revenue_query' in locals() and is_revenue_query:
             try:
-                detected_lang = detected_lang or detect_language(chat_request.message)
+                detected_lang = detected_lang or query_profile.language
             except Exception as lang_error:
                 logger.warning(f"Language detection failed: {lang_error}, defaulting to 'vi'")
                 detected_lang = "vi"
@@ -4606,7 +4600,7 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
                 # CRITICAL: Detect language BEFORE calling get_system_origin_answer
                 # detect_language is already imported at top level (line 11)
                 try:
-                    detected_lang = detected_lang or detect_language(chat_request.message)
+                    detected_lang = detected_lang or query_profile.language
                     logger.debug(f"🌐 Detected language for origin query: {detected_lang}")
                 except Exception as lang_error:
                     logger.warning(f"Language detection failed: {lang_error}, defaulting to 'vi'")
@@ -4634,12 +4628,9 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
         # StillMe MUST NEVER choose any religion, even in hypothetical scenarios
         is_religion_choice_query = False
         try:
-            from backend.core.ai_self_model_detector import detect_religion_choice_query
-            is_religion_choice_query, religion_patterns = detect_religion_choice_query(chat_request.message)
+            is_religion_choice_query, religion_patterns = query_profile.religion_choice_query
             if is_religion_choice_query:
                 logger.warning(f"🚨 RELIGION_CHOICE query detected! Matched patterns: {religion_patterns}")
-        except ImportError:
-            logger.warning("AI self model detector not available, skipping religion choice detection")
         except Exception as detector_error:
             logger.warning(f"Religion choice detector error: {detector_error}")
         
@@ -4647,7 +4638,7 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
             try:
                 # Detect language BEFORE calling get_religion_rejection_answer
                 try:
-                    detected_lang = detected_lang or detect_language(chat_request.message)
+                    detected_lang = detected_lang or query_profile.language
                     logger.debug(f"🌐 Detected language for religion choice query: {detected_lang}")
                 except Exception as lang_error:
                     logger.warning(f"Language detection failed: {lang_error}, defaulting to 'vi'")
@@ -4675,12 +4666,12 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
         # These questions should be handled by Honesty Handler, NOT philosophy processor
         is_honesty_question = False
         try:
-            from backend.honesty.handler import is_honesty_question as check_honesty, build_honesty_response
-            is_honesty_question = check_honesty(chat_request.message)
+            from backend.honesty.handler import build_honesty_response
+            is_honesty_question = query_profile.is_honesty_question
             if is_honesty_question:
                 logger.info("Honesty/consistency question detected - using Honesty Handler")
                 # Detect language for the answer
-                detected_lang = detected_lang or detect_language(chat_request.message)
+                detected_lang = detected_lang or query_profile.language
                 # Process with Honesty Handler
                 honesty_answer = build_honesty_response(chat_request.message, detected_lang)
                 
@@ -4706,12 +4697,12 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
         # MUST be answered with technical architecture, NOT philosophy
         is_ai_self_model_query = False
         try:
-            from backend.core.ai_self_model_detector import detect_ai_self_model_query, get_ai_self_model_opening
-            is_ai_self_model_query, matched_patterns = detect_ai_self_model_query(chat_request.message)
+            from backend.core.ai_self_model_detector import get_ai_self_model_opening
+            is_ai_self_model_query, matched_patterns = query_profile.ai_self_model_query
             if is_ai_self_model_query:
                 logger.warning(f"🚨 AI_SELF_MODEL query detected - OVERRIDING all other pipelines (patterns: {matched_patterns})")
                 # Detect language
-                detected_lang = detected_lang or detect_language(chat_request.message)
+                detected_lang = detected_lang or query_profile.language
                 
                 # Get mandatory opening statement
                 opening_statement = get_ai_self_model_opening(detected_lang)
@@ -4807,7 +4798,7 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
         # CRITICAL: Detect real-time questions to skip ConfidenceValidator disclaimer
         is_real_time_question = False
         try:
-            from backend.external_data import ExternalDataOrchestrator, detect_external_data_intent
+            from backend.external_data import get_external_data_orchestrator, detect_external_data_intent
             
             external_data_intent = None
             if _is_research_query_for_external_data(chat_request.message):
@@ -4822,10 +4813,10 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
                     logger.info(f"✅ Real-time question detected: type={external_data_intent.type} - will skip ConfidenceValidator disclaimer")
                 
                 # Detect language for response formatting
-                detected_lang = detected_lang or detect_language(chat_request.message)
+                detected_lang = detected_lang or query_profile.language
                 
-                # Route to external data provider
-                orchestrator = ExternalDataOrchestrator()
+                # Route to external data provider (shared orchestrator: cache and in-flight fetches persist across requests)
+                orchestrator = get_external_data_orchestrator()
                 result = await orchestrator.route(external_data_intent)
                 
                 if result and result.success:
@@ -4919,11 +4910,11 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
         # CRITICAL: This check happens AFTER AI_SELF_MODEL and honesty handler
         is_philosophical_consciousness = False
         try:
-            is_philosophical_consciousness = is_philosophical_question_about_consciousness(chat_request.message)
+            is_philosophical_consciousness = query_profile.is_philosophical_consciousness
             if is_philosophical_consciousness:
                 logger.info("Philosophical question (consciousness/emotion/understanding) detected - using 3-layer processor")
                 # Detect language for the answer
-                detected_lang = detected_lang or detect_language(chat_request.message)
+                detected_lang = detected_lang or query_profile.language
                 # Process with 3-layer philosophy processor (Guard + Intent + Deep Answer)
                 philosophical_answer = process_philosophical_question(
                     user_question=chat_request.message,
@@ -4951,7 +4942,7 @@ async def chat_with_rag(request: Request, chat_request: ChatRequest):
                     is_stillme_query_for_quality = False
                     try:
                         from backend.core.stillme_detector import detect_stillme_query
-                        is_stillme_query_for_quality, _ = detect_stillme_query(chat_request.message)
+                        is_stillme_query_for_quality, _ = query_profile.stillme_query
                     except Exception:
                         pass
                     
@@ -5217,7 +5208,7 @@ Remember: RESPOND IN {lang_name.upper()} ONLY."""
                 suspicious_entity = fps_result.detected_entities[0] if fps_result.detected_entities else "khái niệm này"
                 
                 # Detect language for response
-                detected_lang = detected_lang or detect_language(chat_request.message)
+                detected_lang = detected_lang or query_profile.language
                 
                 # Create honest response
                 # Use EPD-Fallback for non-RAG path as well
@@ -5327,24 +5318,30 @@ Remember: RESPOND IN {lang_name.upper()} ONLY."""
         # This prevents StillMe from hallucinating articles when only foundational docs are retrieved
         is_news_article_query = False
         try:
-            from backend.core.question_classifier import is_news_article_query as check_news_article
-            is_news_article_query = check_news_article(chat_request.message)
+            is_news_article_query = query_profile.is_news_article_query
             if is_news_article_query:
                 logger.info(f"📰 News/article query detected - will exclude CRITICAL_FOUNDATION and use higher similarity threshold (0.45)")
                 processing_steps.append("📰 News/article query detected - excluding CRITICAL_FOUNDATION documents")
-        except ImportError:
-            logger.warning("Question classifier not available, skipping news/article detection")
         except Exception as detector_error:
             logger.warning(f"News/article detector error: {detector_error}")
         
         if context is None and rag_retrieval and chat_request.use_rag:
             processing_steps.append("🔍 Searching knowledge base...")
+            # OPTIMIZATION: Encode the query through the micro-batcher so concurrent chat requests
+            # share one forward pass; the result lands in the embedding cache that retrieve_context reads
+            try:
+                from backend.vector_db.embedding_batcher import get_embedding_batcher
+                embedding_batcher = get_embedding_batcher(rag_retrieval.embedding_service)
+                if embedding_batcher:
+                    await embedding_batcher.encode_async(chat_request.message)
+            except Exception as batch_error:
+                logger.debug(f"Micro-batched query embedding skipped: {batch_error}")
             # CRITICAL: If origin query detected, retrieve provenance knowledge ONLY
             # This ensures provenance is ONLY retrieved when explicitly asked about origin/founder
             if is_origin_query:
                 logger.debug("Origin query detected - retrieving provenance knowledge")
                 try:
-                    query_embedding = rag_retrieval.embedding_service.encode_text(chat_request.message)
+                    query_embedding = query_profile.query_embedding(rag_retrieval.embedding_service)
                     provenance_results = rag_retrieval.chroma_client.search_knowledge(
                         query_embedding=query_embedding,
                         limit=2,
@@ -5360,7 +5357,7 @@ Remember: RESPOND IN {lang_name.upper()} ONLY."""
                     else:
                         # Fallback to normal retrieval if provenance not found
                         # exclude_types already initialized above
-                        context = rag_retrieval.retrieve_context(
+                        context = await rag_retrieval.aretrieve_context(
                             query=chat_request.message,
                             knowledge_limit=chat_request.context_limit,
                             conversation_limit=1,
@@ -5385,7 +5382,7 @@ Remember: RESPOND IN {lang_name.upper()} ONLY."""
                         retrieval_query = enhance_query_for_retrieval(chat_request.message)
                         logger.info(f"📜 Historical question (provenance fallback) - using very low threshold {similarity_threshold}, enhanced query: '{retrieval_query[:100]}...'")
                     
-                    context = rag_retrieval.retrieve_context(
+                    context = await rag_retrieval.aretrieve_context(
                         query=retrieval_query,
                         knowledge_limit=chat_request.context_limit,
                         conversation_limit=1,
@@ -5415,7 +5412,7 @@ Remember: RESPOND IN {lang_name.upper()} ONLY."""
                 
                 logger.info(f"🎯 Validator count question - forcing manifest retrieval with very low similarity threshold (0.01)")
                 # Force retrieve manifest with very low threshold to ensure we get it
-                context = rag_retrieval.retrieve_context(
+                context = await rag_retrieval.aretrieve_context(
                     query=chat_request.message,
                     knowledge_limit=5,  # Get more docs to ensure manifest is included
                     conversation_limit=1,
@@ -5447,7 +5444,7 @@ Remember: RESPOND IN {lang_name.upper()} ONLY."""
                     try:
                         # Use specific query for manifest retrieval
                         manifest_query = "StillMe Structural Manifest validation framework total_validators layers 19 validators 7 layers"
-                        manifest_context = rag_retrieval.retrieve_context(
+                        manifest_context = await rag_retrieval.aretrieve_context(
                             query=manifest_query,
                             knowledge_limit=5,  # Get more docs to ensure manifest is included
                             conversation_limit=0,  # Don't need conversation for manifest
@@ -5503,7 +5500,7 @@ Remember: RESPOND IN {lang_name.upper()} ONLY."""
                     
                     logger.info(f"🎯 Validator count question - forcing manifest retrieval with very low similarity threshold (0.01)")
                     # Force retrieve manifest with very low threshold to ensure we get it
-                    context = rag_retrieval.retrieve_context(
+                    context = await rag_retrieval.aretrieve_context(
                         query=chat_request.message,
                         knowledge_limit=5,  # Get more docs to ensure manifest is included
                         conversation_limit=1,
@@ -5535,7 +5532,7 @@ Remember: RESPOND IN {lang_name.upper()} ONLY."""
                         try:
                             # Use specific query for manifest retrieval
                             manifest_query = "StillMe Structural Manifest validation framework total_validators layers 19 validators 7 layers"
-                            manifest_context = rag_retrieval.retrieve_context(
+                            manifest_context = await rag_retrieval.aretrieve_context(
                                 query=manifest_query,
                                 knowledge_limit=5,  # Get more docs to ensure manifest is included
                                 conversation_limit=0,  # Don't need conversation for manifest
@@ -5591,7 +5588,7 @@ Remember: RESPOND IN {lang_name.upper()} ONLY."""
                     all_knowledge_docs = []
                     
                     for variant in query_variants[:3]:  # Try first 3 variants
-                        variant_context = rag_retrieval.retrieve_context(
+                        variant_context = await rag_retrieval.aretrieve_context(
                             query=variant,
                             knowledge_limit=chat_request.context_limit,
                             conversation_limit=0,  # Don't need conversation for foundational queries
@@ -5610,7 +5607,7 @@ Remember: RESPOND IN {lang_name.upper()} ONLY."""
                 # If we still don't have results, do normal retrieval with very low threshold
                 if not all_knowledge_docs:
                     logger.warning("No foundational knowledge found, falling back to normal retrieval with very low threshold")
-                    context = rag_retrieval.retrieve_context(
+                    context = await rag_retrieval.aretrieve_context(
                         query=chat_request.message,
                         knowledge_limit=chat_request.context_limit,
                         conversation_limit=2,
@@ -5665,7 +5662,7 @@ Remember: RESPOND IN {lang_name.upper()} ONLY."""
                         all_knowledge_docs = []
                         
                         for variant in query_variants[:3]:  # Try first 3 variants
-                            variant_context = rag_retrieval.retrieve_context(
+                            variant_context = await rag_retrieval.aretrieve_context(
                                 query=variant,
                                 knowledge_limit=chat_request.context_limit,
                                 conversation_limit=0,  # Don't need conversation for foundational queries
@@ -5684,7 +5681,7 @@ Remember: RESPOND IN {lang_name.upper()} ONLY."""
                         # If we still don't have results, do normal retrieval with foundational priority and very low threshold
                         if not all_knowledge_docs:
                             logger.warning("No foundational knowledge found for 'your system' question, falling back to normal retrieval with very low threshold")
-                            context = rag_retrieval.retrieve_context(
+                            context = await rag_retrieval.aretrieve_context(
                                 query=chat_request.message,
                                 knowledge_limit=min(chat_request.context_limit, 5),
                                 conversation_limit=1,
@@ -5704,7 +5701,7 @@ Remember: RESPOND IN {lang_name.upper()} ONLY."""
                             logger.info(f"Retrieved {len(context['knowledge_docs'])} foundational knowledge documents for 'your system' question")
                     except Exception as variant_error:
                         logger.warning(f"Error retrieving foundational knowledge for 'your system' question: {variant_error}, falling back to normal retrieval")
-                        context = rag_retrieval.retrieve_context(
+                        context = await rag_retrieval.aretrieve_context(
                             query=chat_request.message,
                             knowledge_limit=min(chat_request.context_limit, 5),
                             conversation_limit=1,
@@ -5718,7 +5715,7 @@ Remember: RESPOND IN {lang_name.upper()} ONLY."""
                     if is_news_article_query:
                         logger.info(f"📰 News/article query - using higher similarity threshold (0.45) and excluding CRITICAL_FOUNDATION")
                         # Increase knowledge_limit to get more results (since we're excluding foundational)
-                        context = rag_retrieval.retrieve_context(
+                        context = await rag_retrieval.aretrieve_context(
                             query=chat_request.message,
                             knowledge_limit=min(chat_request.context_limit * 2, 20),  # Get more docs to compensate for exclusion
                             conversation_limit=1,
@@ -5780,7 +5777,7 @@ Remember: RESPOND IN {lang_name.upper()} ONLY."""
                             retrieval_query = enhance_query_for_retrieval(chat_request.message)
                             logger.info(f"🔍 Enhanced query for better cross-lingual matching: '{chat_request.message}' -> '{retrieval_query}'")
                         
-                        context = rag_retrieval.retrieve_context(
+                        context = await rag_retrieval.aretrieve_context(
                             query=retrieval_query,  # Use enhanced query
                             knowledge_limit=min(chat_request.context_limit, 5),  # Cap at 5 for latency
                             conversation_limit=1,  # Optimized: reduced from 2 to 1
@@ -6335,7 +6332,7 @@ For this specific gap, [analysis of feasibility of supplementation and inherent
             if num_knowledge > 0:
                 # Truncate citation instruction to ~300 tokens to save space
                 def estimate_tokens(text: str) -> int:
-                    return len(text) // 4 if text else 0
+                    return count_tokens(text)
                 
                 def truncate_text(text: str, max_tokens: int) -> str:
                     if not text:
@@ -6343,10 +6340,7 @@ For this specific gap, [analysis of feasibility of supplementation and inherent
                     estimated = estimate_tokens(text)
                     if estimated <= max_tokens:
                         return text
-                    max_chars = max_tokens * 4
-                    if len(text) <= max_chars:
-                        return text
-                    truncated = text[:max_chars].rsplit('\n', 1)[0]
+                    truncated = get_token_counter().truncate(text, max_tokens, suffix="").rsplit('\n', 1)[0]
                     return truncated + "\n\n[Note: Citation instructions truncated to fit context limits. Core requirements preserved.]"
                 
                 full_citation_instruction = f"""
@@ -6487,7 +6481,7 @@ CRITICAL RULES:
             # Detect language FIRST - before building prompt
             processing_steps.append("🌐 Detecting language...")
             if not detected_lang:
-                detected_lang = detect_language(chat_request.message)
+                detected_lang = query_profile.language
                 lang_detect_time = time.time() - start_time
                 timing_logs["language_detection"] = f"{lang_detect_time:.3f}s"
                 logger.info(f"🌐 Detected language: {detected_lang} (took {lang_detect_time:.3f}s) for question: '{chat_request.message[:100]}...'")
@@ -6727,7 +6721,7 @@ IGNORE THE LANGUAGE OF THE CONTEXT BELOW - RESPOND IN ENGLISH ONLY.
                 
                 # Use UnifiedPromptBuilder to build prompt
                 prompt_builder = UnifiedPromptBuilder()
-                base_prompt = prompt_builder.build_prompt(prompt_context)
+                base_prompt, prompt_layout_report = prompt_builder.build_prompt_with_report(prompt_context)
                 
                 logger.info("✅ Using UnifiedPromptBuilder for no-context prompt (reduced prompt length, no conflicts)")
             else:
@@ -8098,7 +8092,7 @@ If the question belongs to a classic philosophical debate (free will, determinis
                     
                     # Truncate if too long (max 2000 tokens for philosophical instructions)
                     def estimate_tokens(text: str) -> int:
-                        return len(text) // 4 if text else 0
+                        return count_tokens(text)
                     
                     philo_tokens = estimate_tokens(full_philosophical_instruction)
                     if philo_tokens > 2000:
@@ -8108,8 +8102,7 @@ If the question belongs to a classic philosophical debate (free will, determinis
                         if remaining_tokens > 500:
                             # Truncate the style guide part
                             style_guide_part = full_philosophical_instruction[len(philosophical_lead_in):]
-                            max_chars = remaining_tokens * 4
-                            truncated_style_guide = style_guide_part[:max_chars].rsplit('\n', 1)[0]
+                            truncated_style_guide = get_token_counter().truncate(style_guide_part, remaining_tokens, suffix="").rsplit('\n', 1)[0]
                             philosophical_style_instruction = philosophical_lead_in + truncated_style_guide + "\n\n[Note: Style guide truncated to fit context limits.]"
                             logger.warning(f"⚠️ Philosophical style instruction truncated: {philo_tokens} → ~2000 tokens")
                         else:
@@ -8123,8 +8116,8 @@ If the question belongs to a classic philosophical debate (free will, determinis
                 if use_philosophy_lite_rag:
                     # Helper function to estimate tokens
                     def estimate_tokens(text: str) -> int:
-                        """Estimate token count (~4 chars per token)"""
-                        return len(text) // 4 if text else 0
+                        """Count tokens with the shared tokenizer"""
+                        return count_tokens(text)
                     
                     # Use philosophy-lite mode: minimal prompt with user question only
                     # Truncate user question to 512 tokens for philosophical questions
@@ -8166,7 +8159,7 @@ If the question belongs to a classic philosophical debate (free will, determinis
                     
                     # Use UnifiedPromptBuilder to build base prompt
                     prompt_builder = UnifiedPromptBuilder()
-                    base_prompt_unified = prompt_builder.build_prompt(prompt_context)
+                    base_prompt_unified, prompt_layout_report = prompt_builder.build_prompt_with_report(prompt_context)
                     
                     # Phase 4: Append special instructions that UnifiedPromptBuilder doesn't handle yet
                     # Note: UnifiedPromptBuilder already includes:
@@ -8262,11 +8255,11 @@ Context: {context_text}
                 # Phase 4: Remove inject_identity() - system prompt already has STILLME_IDENTITY
                 # generate_ai_response() uses build_system_prompt_with_language() which includes STILLME_IDENTITY
                 # Adding identity to user prompt would cause duplication
-                # Add style instruction if available
-                enhanced_prompt = f"{style_instruction}\n\n{base_prompt}" if style_instruction else base_prompt
+                # Add style instruction if available (after the static prefix - it is per-user)
+                enhanced_prompt = insert_after_static_prefix(base_prompt, prompt_layout_report, style_instruction)
             else:
                 # No validators: use prompt as-is, but still add style instruction if available
-                enhanced_prompt = f"{style_instruction}\n\n{base_prompt}" if style_instruction else base_prompt
+                enhanced_prompt = insert_after_static_prefix(base_prompt, prompt_layout_report, style_instruction)
             
             # Generate AI response with timing and caching
             # LLM_Inference_Latency: Time from API call start to response received
@@ -8336,8 +8329,8 @@ Context: {context_text}
                     knowledge_version=knowledge_version  # P3: Include knowledge version
                 )
                 
-                # Try to get from cache
-                cached_response = cache_service.get(cache_key)
+                # Try to get from cache (async - a slow Redis must not stall other requests)
+                cached_response = await cache_service.aget(cache_key)
                 if cached_response:
                     cached_raw_response = cached_response.get("response")
                     # CRITICAL: Only use cache if response is valid (not None/empty)
@@ -8366,6 +8359,59 @@ Context: {context_text}
                         raw_response = None
                         cache_hit = False
             
+            # OPTIMIZATION: Semantic response cache - paraphrased repeats of a question grounded on the
+            # same documents reuse the final validated answer (skips LLM call and validator chain)
+            if cache_enabled and not raw_response and rag_retrieval:
+                try:
+                    from backend.services.semantic_response_cache import (
+                        get_semantic_response_cache,
+                        compute_context_fingerprint,
+                        compute_conversation_fingerprint
+                    )
+                    semantic_cache = get_semantic_response_cache()
+                    if semantic_cache:
+                        # Query embedding is already in the embedding cache from retrieval
+                        semantic_query_embedding = await rag_retrieval.embedding_service.aencode_text(chat_request.message)
+                        semantic_context_fingerprint = compute_context_fingerprint(context)
+                        # Answers depend on conversation history and the user's style, not just the message
+                        semantic_conversation_fingerprint = compute_conversation_fingerprint(
+                            chat_request.conversation_history, style_instruction
+                        )
+                        semantic_cache_scope = (
+                            f"{detected_lang}|{chat_request.llm_provider}|{chat_request.llm_model_name}|"
+                            f"{enable_validators}|{semantic_conversation_fingerprint}"
+                        )
+                        semantic_hit = semantic_cache.lookup(
+                            semantic_query_embedding,
+                            context_fingerprint=semantic_context_fingerprint,
+                            scope=semantic_cache_scope
+                        )
+                        if semantic_hit:
+                            logger.info(
+                                f"✅ Semantic cache hit (similarity={semantic_hit['similarity']:.3f}) - "
+                                f"reusing validated answer for: '{semantic_hit['query'][:80]}'"
+                            )
+                            processing_steps.append("⚡ Validated answer from semantic cache (similar question)")
+                            timing_logs["llm_inference"] = "0.00s (semantic cache)"
+                            timing_logs["total"] = f"{time.time() - start_time:.2f}s"
+                            cached_validation_info = dict(semantic_hit.get("validation_info") or {})
+                            cached_validation_info["semantic_cache_hit"] = True
+                            cached_validation_info["semantic_cache_similarity"] = semantic_hit["similarity"]
+                            return ChatResponse(
+                                response=semantic_hit["response"],
+                                message_id=f"msg_{uuid.uuid4().hex[:16]}",
+                                trace_id=trace_id,
+                                context_used=context,
+                                confidence_score=semantic_hit.get("confidence_score"),
+                                validation_info=cached_validation_info,
+                                timing=timing_logs,
+                                processing_steps=processing_steps,
+                                epistemic_state=semantic_hit.get("epistemic_state")
+                            )
+                except Exception as semantic_cache_error:
+                    logger.debug(f"Semantic cache lookup skipped: {semantic_cache_error}")
+                    semantic_cache = None
+            
             # If not in cache, call LLM
             if not raw_response:
                 logger.debug(f"🔍 About to call LLM - raw_response is None, cache_hit={cache_hit}, cache_enabled={cache_enabled}")
@@ -8376,18 +8422,21 @@ Context: {context_text}
                 # For internal/dashboard calls: use server API keys if llm_provider not provided
                 # For public API: require user-provided API keys
                 use_server_keys = chat_request.llm_provider is None
+                # Single-flight key: the LLM cache key plus the caller's credentials
+                single_flight_key = make_single_flight_key(
+                    cache_key if cache_enabled else None,
+                    chat_request.llm_api_key,
+                    chat_request.llm_api_url,
+                    use_server_keys
+                )
                 
                 # Try to generate response with retry on context overflow
                 from backend.api.utils.llm_providers import ContextOverflowError
                 
                 # CRITICAL: Pre-check token count before calling LLM to prevent context overflow
                 def estimate_tokens_safe(text: str) -> int:
-                    """Estimate token count more accurately (~3.5 chars per token for mixed content)"""
-                    if not text:
-                        return 0
-                    # More accurate estimation: Vietnamese/English mixed content ~3.5 chars/token
-                    # Pure English ~4 chars/token, Vietnamese ~3 chars/token
-                    return int(len(text) / 3.5)
+                    """Count tokens with the shared tokenizer (handles Vietnamese/English mixed content)"""
+                    return count_tokens(text)
                 
                 # Estimate total tokens: system prompt + enhanced_prompt + output buffer
                 # System prompt is built separately in generate_ai_response() (~3300-3600 tokens)
@@ -8454,6 +8503,11 @@ Context: {context_text}
                                     context_text = truncated_context  # Update context_text for later use
                                 processing_steps.append("⚠️ Pre-check: Truncated context (token limit)")
                 
+                # Report the static prefix of the prompt actually sent, after style and pre-check edits
+                if prompt_layout_report is not None:
+                    sent_layout_report = report_final_prompt(enhanced_prompt, prompt_layout_report)
+                    timing_logs["prompt_prefix"] = f"{sent_layout_report.prefix_hash} ({sent_layout_report.prefix_chars} chars, {sent_layout_report.layout})"
+                
                 try:
                     
                     # OPTION B PIPELINE: Check if enabled
@@ -8503,17 +8557,22 @@ Context: {context_text}
                             )
                         
                         # Generate LLM response (Step 4)
-                        raw_response = await generate_ai_response(
-                            enhanced_prompt, 
-                            detected_lang=detected_lang,
-                            llm_provider=chat_request.llm_provider,
-                            llm_api_key=chat_request.llm_api_key,
-                            llm_api_url=chat_request.llm_api_url,
-                            llm_model_name=chat_request.llm_model_name,
-                            use_server_keys=use_server_keys,
-                            question=chat_request.message,  # Pass question for model routing
-                            task_type="chat",  # Main chat task
-                            is_philosophical=is_philosophical  # Pass philosophical flag
+                        # Identical in-flight questions with the same credentials share one LLM call
+                        raw_response = await coalesce_llm_call(
+                            single_flight_key,
+                            lambda: generate_ai_response(
+                                enhanced_prompt, 
+                                detected_lang=detected_lang,
+                                llm_provider=chat_request.llm_provider,
+                                llm_api_key=chat_request.llm_api_key,
+                                llm_api_url=chat_request.llm_api_url,
+                                llm_model_name=chat_request.llm_model_name,
+                                use_server_keys=use_server_keys,
+                                question=chat_request.message,  # Pass question for model routing
+                                task_type="chat",  # Main chat task
+                                is_philosophical=is_philosophical  # Pass philosophical flag
+                            ),
+                            processing_steps
                         )
                         # CRITICAL: Log raw_response immediately after LLM call to trace response loss
                         logger.info(f"🔍 [TRACE] raw_response after LLM call (RAG path): length={len(raw_response) if raw_response else 0}, type={type(raw_response)}, preview={raw_response[:200] if raw_response else 'None'}")
@@ -8544,17 +8603,22 @@ Context: {context_text}
                         logger.info(f"✅ Option B Pipeline completed: {len(option_b_result.get('processing_steps', []))} steps")
                     else:
                         # EXISTING PIPELINE (legacy)
-                        raw_response = await generate_ai_response(
-                            enhanced_prompt, 
-                            detected_lang=detected_lang,
-                            llm_provider=chat_request.llm_provider,
-                            llm_api_key=chat_request.llm_api_key,
-                            llm_api_url=chat_request.llm_api_url,
-                            llm_model_name=chat_request.llm_model_name,
-                            use_server_keys=use_server_keys,
-                            question=chat_request.message,  # Pass question for model routing
-                            task_type="chat",  # Main chat task
-                            is_philosophical=is_philosophical  # Pass philosophical flag
+                        # Identical in-flight questions with the same credentials share one LLM call
+                        raw_response = await coalesce_llm_call(
+                            single_flight_key,
+                            lambda: generate_ai_response(
+                                enhanced_prompt, 
+                                detected_lang=detected_lang,
+                                llm_provider=chat_request.llm_provider,
+                                llm_api_key=chat_request.llm_api_key,
+                                llm_api_url=chat_request.llm_api_url,
+                                llm_model_name=chat_request.llm_model_name,
+                                use_server_keys=use_server_keys,
+                                question=chat_request.message,  # Pass question for model routing
+                                task_type="chat",  # Main chat task
+                                is_philosophical=is_philosophical  # Pass philosophical flag
+                            ),
+                            processing_steps
                         )
                         
                         is_option_b_processed = False
@@ -8899,7 +8963,7 @@ Remember: RESPOND IN {detected_lang_name.upper()} ONLY."""
                         }
                         # P3: Use custom TTL if specified (e.g., 1h for self-reflection), otherwise use default
                         ttl_to_use = cache_ttl_override if cache_ttl_override is not None else TTL_LLM_RESPONSE
-                        cache_service.set(cache_key, cache_value, ttl_seconds=ttl_to_use)
+                        await cache_service.aset(cache_key, cache_value, ttl_seconds=ttl_to_use)
                         logger.debug(f"💾 LLM response cached (key: {cache_key[:50]}..., TTL: {ttl_to_use}s)")
                     except Exception as cache_error:
                         logger.warning(f"Failed to cache LLM response: {cache_error}")
@@ -9183,7 +9247,7 @@ Remember: RESPOND IN {detected_lang_name.upper()} ONLY."""
                                 is_stillme_query_for_quality = False
                                 try:
                                     from backend.core.stillme_detector import detect_stillme_query
-                                    is_stillme_query_for_quality, _ = detect_stillme_query(chat_request.message)
+                                    is_stillme_query_for_quality, _ = query_profile.stillme_query
                                 except Exception:
                                     pass
                                 
@@ -9281,7 +9345,7 @@ Remember: RESPOND IN {detected_lang_name.upper()} ONLY."""
                                     is_stillme_query_for_quality = False
                                     try:
                                         from backend.core.stillme_detector import detect_stillme_query
-                                        is_stillme_query_for_quality, _ = detect_stillme_query(chat_request.message)
+                                        is_stillme_query_for_quality, _ = query_profile.stillme_query
                                     except Exception:
                                         pass
                                     
@@ -9362,7 +9426,7 @@ Remember: RESPOND IN {detected_lang_name.upper()} ONLY."""
                                     is_stillme_query_for_quality_after = False
                                     try:
                                         from backend.core.stillme_detector import detect_stillme_query
-                                        is_stillme_query_for_quality_after, _ = detect_stillme_query(chat_request.message)
+                                        is_stillme_query_for_quality_after, _ = query_profile.stillme_query
                                     except Exception:
                                         pass
                                     
@@ -9595,7 +9659,7 @@ Remember: RESPOND IN {detected_lang_name.upper()} ONLY."""
             # Detect language FIRST
             # CRITICAL: detect_language is imported at top level, but ensure it's available
             # Use the imported function directly (already imported at line 11)
-            detected_lang = detected_lang or detect_language(chat_request.message)
+            detected_lang = detected_lang or query_profile.language
             logger.info(f"🌐 Detected language (non-RAG): {detected_lang}")
             
             # Language names mapping
@@ -9622,15 +9686,14 @@ Remember: RESPOND IN {detected_lang_name.upper()} ONLY."""
             # Check if this is a philosophical question for non-RAG path
             is_philosophical_non_rag = False
             try:
-                from backend.core.question_classifier import is_philosophical_question
-                is_philosophical_non_rag = is_philosophical_question(chat_request.message)
+                is_philosophical_non_rag = query_profile.is_philosophical
             except Exception:
                 pass  # If classifier fails, assume non-philosophical
             
             # Helper function to estimate tokens
             def estimate_tokens(text: str) -> int:
-                """Estimate token count (~4 chars per token)"""
-                return len(text) // 4 if text else 0
+                """Count tokens with the shared tokenizer"""
+                return count_tokens(text)
             
             # For philosophical questions: truncate user question to 512 tokens max
             user_question_for_prompt = chat_request.message
@@ -9683,7 +9746,7 @@ Remember: RESPOND IN {detected_lang_name.upper()} ONLY."""
                 is_wish_desire_question_non_rag = False
                 try:
                     from backend.core.stillme_detector import detect_stillme_query
-                    is_stillme_query_non_rag, matched_keywords = detect_stillme_query(chat_request.message)
+                    is_stillme_query_non_rag, matched_keywords = query_profile.stillme_query
                     if is_stillme_query_non_rag:
                         logger.info(f"✅ StillMe query detected (non-RAG path) - matched: {matched_keywords}")
                         # Check if it's a wish/desire question
@@ -9870,8 +9933,7 @@ Remember: RESPOND IN ENGLISH ONLY."""
             # Check if this is a philosophical question for context overflow handling
             is_philosophical_non_rag = False
             try:
-                from backend.core.question_classifier import is_philosophical_question
-                is_philosophical_non_rag = is_philosophical_question(chat_request.message)
+                is_philosophical_non_rag = query_profile.is_philosophical
             except Exception:
                 pass
             
@@ -10233,9 +10295,9 @@ Remember: RESPOND IN {retry_lang_name.upper()} ONLY. TRANSLATE IF NECESSARY."""
             is_stillme_query_non_rag = False
             is_origin_query_non_rag = False
             try:
-                from backend.core.stillme_detector import detect_stillme_query, detect_origin_query
-                is_stillme_query_non_rag, _ = detect_stillme_query(chat_request.message)
-                is_origin_query_non_rag, _ = detect_origin_query(chat_request.message)
+                from backend.core.stillme_detector import detect_stillme_query
+                is_stillme_query_non_rag, _ = query_profile.stillme_query
+                is_origin_query_non_rag, _ = query_profile.origin_query
                 if is_stillme_query_non_rag:
                     logger.info(f"✅ StillMe query detected (non-RAG path) - will skip disclaimer")
                 if is_origin_query_non_rag:
@@ -10381,8 +10443,7 @@ Remember: RESPOND IN {retry_lang_name.upper()} ONLY. TRANSLATE IF NECESSARY."""
             # Check if question is philosophical for non-RAG path
             is_philosophical_non_rag = False
             try:
-                from backend.core.question_classifier import is_philosophical_question
-                is_philosophical_non_rag = is_philosophical_question(chat_request.message)
+                is_philosophical_non_rag = query_profile.is_philosophical
             except Exception:
                 pass  # If classifier fails, assume non-philosophical
             
@@ -10464,7 +10525,7 @@ Remember: RESPOND IN {retry_lang_name.upper()} ONLY. TRANSLATE IF NECESSARY."""
                             is_stillme_query_for_quality = False
                             try:
                                 from backend.core.stillme_detector import detect_stillme_query
-                                is_stillme_query_for_quality, _ = detect_stillme_query(chat_request.message)
+                                is_stillme_query_for_quality, _ = query_profile.stillme_query
                             except Exception:
                                 pass
                             
@@ -10491,7 +10552,7 @@ Remember: RESPOND IN {retry_lang_name.upper()} ONLY. TRANSLATE IF NECESSARY."""
                         skip_rewrite_for_stillme_non_rag = False
                         try:
                             from backend.core.stillme_detector import detect_stillme_query
-                            is_stillme_query_non_rag, _ = detect_stillme_query(chat_request.message)
+                            is_stillme_query_non_rag, _ = query_profile.stillme_query
                             
                             # Check if response mentions foundational knowledge or StillMe capabilities
                             # If it's a StillMe query, skip rewrite to preserve accuracy
@@ -10701,6 +10762,7 @@ Total_Response_Latency: {total_response_latency:.2f} giây
         # Add latency metrics to timing_logs for API response
         timing_logs["rag_retrieval_latency"] = f"{rag_retrieval_latency:.2f}s"
         timing_logs["llm_inference_latency"] = f"{llm_inference_latency:.2f}s"
+        timing_logs["query_classification"] = f"{query_profile.total_ms / 1000:.3f}s"
         timing_logs["total_response_latency"] = f"{total_response_latency:.2f}s"
         timing_logs["total"] = f"{total_response_latency:.2f}s"
         # Add formatted latency metrics text for frontend display
@@ -11439,6 +11501,23 @@ Total_Response_Latency: {total_response_latency:.2f} giây
         except Exception as e:
             logger.warning(f"⚠️ Failed to record strategy usage for Meta-Learning: {e}")
         
+        # Semantic response cache: remember answers that passed validation for paraphrased repeats
+        if (semantic_cache and semantic_query_embedding is not None and response
+                and not is_fallback_meta_answer and validation_info and validation_info.get("passed")):
+            try:
+                semantic_cache.store(
+                    query=chat_request.message,
+                    query_embedding=semantic_query_embedding,
+                    response=response,
+                    context_fingerprint=semantic_context_fingerprint,
+                    scope=semantic_cache_scope,
+                    confidence_score=confidence_score,
+                    validation_info=validation_info,
+                    epistemic_state=epistemic_state.value if epistemic_state else None
+                )
+            except Exception as semantic_cache_error:
+                logger.debug(f"Failed to store answer in semantic cache: {semantic_cache_error}")
+        
         # Finalize trace before returning
         total_duration = (time.time() - start_time) * 1000
         trace.duration_ms = total_duration
@@ -11601,7 +11680,7 @@ async def validate_content(request: Request, chat_request: ChatRequest):
         context_docs = []
         if rag_retrieval and chat_request.use_rag:
             try:
-                context = rag_retrieval.retrieve_context(
+                context = await rag_retrieval.aretrieve_context(
                     query=chat_request.message,
                     knowledge_limit=min(chat_request.context_limit, 3),  # Limit for validation
                     conversation_limit=0  # Don't need conversation for validation
@@ -8,6 +8,7 @@ Phase 1.3: Code Q&A API Endpoint
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -563,16 +564,19 @@ async def review_code(
 @router.post("/index")
 async def trigger_indexing(
     indexer = Depends(get_codebase_indexer),
-    force: bool = False
+    force: bool = False,
+    background: bool = False
 ):
     """
     Trigger codebase indexing (admin endpoint).
     
     This endpoint indexes the entire StillMe codebase into ChromaDB.
-    Use with caution - indexing can take several minutes.
+    Indexing is incremental: only files changed since the last run are re-embedded.
+    Indexing runs off the event loop; poll GET /codebase/index/status for progress.
     
     Args:
-        force: If True, re-index even if collection already has chunks
+        force: If True, ignore the index manifest and re-embed every chunk (can take several minutes)
+        background: If True, return immediately and index on a background thread
     
     Returns:
         Dictionary with indexing statistics
@@ -589,20 +593,25 @@ async def trigger_indexing(
         )
     
     try:
-        # Check current status
-        current_count = indexer.codebase_collection.count()
+        logger.info(f"🚀 Starting codebase indexing via API endpoint (force={force}, background={background})...")
         
-        if current_count > 0 and not force:
+        if background:
+            started = indexer.start_background_index(force=force)
             return {
-                "status": "skipped",
-                "message": f"Collection already has {current_count} chunks. Use force=true to re-index.",
-                "current_count": current_count
+                "status": "started" if started else "already_running",
+                "message": "Codebase indexing started in background" if started else "Codebase indexing is already running",
+                "progress": indexer.get_index_progress()
             }
         
-        logger.info("🚀 Starting codebase indexing via API endpoint...")
-        
-        # Index entire codebase
-        stats = indexer.index_codebase()
+        # Index entire codebase (incremental unless forced) without blocking the event loop;
+        # never wait behind a run that is already in progress
+        stats = await asyncio.to_thread(indexer.index_codebase, force, False)
+        if stats is None:
+            return {
+                "status": "already_running",
+                "message": "Codebase indexing is already running",
+                "progress": indexer.get_index_progress()
+            }
         
         # Verify final count
         final_count = indexer.codebase_collection.count()
@@ -621,3 +630,23 @@ async def trigger_indexing(
             detail=f"Failed to index codebase: {str(e)}"
         )
 
+
+
+@router.get("/index/status")
+async def get_indexing_status(
+    indexer = Depends(get_codebase_indexer)
+):
+    """
+    Get progress of the current (or last) codebase indexing run.
+    
+    Returns:
+        Dictionary with files parsed, chunks embedded/written, throughput and last run stats
+    """
+    try:
+        return indexer.get_index_progress()
+    except Exception as e:
+        logger.error(f"❌ Error getting indexing status: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get indexing status: {str(e)}"
+        )
@@ -212,6 +212,7 @@ async def run_learning_cycle_background(job_id: str):
                     tier = "L0"  # Default tier
                     surprise_score = 0.0
                     should_update = True
+                    content_embedding = None
                     
                     if update_isolation and promotion_manager:
                         try:
@@ -219,10 +220,14 @@ async def run_learning_cycle_background(job_id: str):
                             import hashlib
                             item_id = hashlib.md5(content.encode()).hexdigest()
                             
-                            # Calculate surprise score
+                            # Embed off the event loop; the embedding is reused for the RAG insert below
+                            content_embedding = await rag_retrieval.embedding_service.aencode_text(content)
+                            
+                            # Calculate surprise score (rarity/novelty against corpus statistics)
                             surprise_score = promotion_manager.calculate_surprise_score(
                                 item_id=item_id,
                                 content=content,
+                                content_embedding=content_embedding,
                                 existing_keywords=None,
                                 centroid_embeddings=None
                             )
@@ -279,7 +284,8 @@ async def run_learning_cycle_background(job_id: str):
                         content=content,
                         source=entry.get('source', 'rss'),
                         content_type="knowledge",
-                        metadata=metadata
+                        metadata=metadata,
+                        embedding=content_embedding
                     )
                     
                     if success:
@@ -133,7 +133,7 @@ async def query_rag(request: RAGQueryRequest):
         if not rag_retrieval:
             raise HTTPException(status_code=503, detail="RAG system not available")
         
-        context = rag_retrieval.retrieve_context(
+        context = await rag_retrieval.aretrieve_context(
             query=request.query,
             knowledge_limit=request.knowledge_limit,
             conversation_limit=request.conversation_limit
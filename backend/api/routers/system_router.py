@@ -689,10 +689,16 @@ async def get_cache_stats():
         from backend.services.cache_service import get_cache_service
         cache_service = get_cache_service()
         stats = cache_service.get_stats()
+        embedding_service = get_embedding_service()
+        from backend.services.semantic_response_cache import get_semantic_response_cache
+        semantic_cache = get_semantic_response_cache()
         return {
             "cache_stats": stats,
+            "embedding_cache_stats": embedding_service.get_cache_stats() if embedding_service else None,
+            "semantic_cache_stats": semantic_cache.get_stats() if semantic_cache else None,
             "cache_enabled": {
                 "llm": os.getenv("ENABLE_LLM_CACHE", "true").lower() == "true",
+                "semantic": semantic_cache is not None,
                 "rag": os.getenv("ENABLE_RAG_CACHE", "true").lower() == "true",
                 "http": os.getenv("ENABLE_HTTP_CACHE", "true").lower() == "true"
             },
@@ -796,6 +802,115 @@ async def prometheus_metrics():
             lines.append(f"stillme_validation_overlap_score_avg {val_data.get('avg_overlap_score', 0.0)}")
         except Exception as val_error:
             logger.debug(f"Could not get validation metrics: {val_error}")
+
+        # Validator Pool Metrics
+        try:
+            from backend.validators.executor import get_validator_pool_stats
+            pool_stats = get_validator_pool_stats()
+
+            lines.append("# HELP stillme_validator_pool_active Validators currently running on the shared pool")
+            lines.append("# TYPE stillme_validator_pool_active gauge")
+            lines.append(f"stillme_validator_pool_active {pool_stats.get('active', 0)}")
+
+            lines.append("# HELP stillme_validator_pool_queue_depth Validators waiting for a pool worker")
+            lines.append("# TYPE stillme_validator_pool_queue_depth gauge")
+            lines.append(f"stillme_validator_pool_queue_depth {pool_stats.get('queue_depth', 0)}")
+
+            lines.append("# HELP stillme_validator_pool_rejected_total Validators run inline because the pool was saturated")
+            lines.append("# TYPE stillme_validator_pool_rejected_total counter")
+            lines.append(f"stillme_validator_pool_rejected_total {pool_stats.get('rejected_inline', 0)}")
+
+            lines.append("# HELP stillme_validator_pool_timeouts_total Validators abandoned after exceeding their timeout")
+            lines.append("# TYPE stillme_validator_pool_timeouts_total counter")
+            lines.append(f"stillme_validator_pool_timeouts_total {pool_stats.get('timeouts', 0)}")
+        except Exception as pool_error:
+            logger.debug(f"Could not get validator pool metrics: {pool_error}")
+
+        # Chat Single-Flight Metrics
+        try:
+            from backend.services.single_flight import get_chat_single_flight
+            flight_stats = get_chat_single_flight().get_stats()
+
+            lines.append("# HELP stillme_chat_single_flight_in_flight Distinct chat LLM calls currently in flight")
+            lines.append("# TYPE stillme_chat_single_flight_in_flight gauge")
+            lines.append(f"stillme_chat_single_flight_in_flight {flight_stats.get('in_flight', 0)}")
+
+            lines.append("# HELP stillme_chat_single_flight_coalesced_total Chat requests served by an identical in-flight call")
+            lines.append("# TYPE stillme_chat_single_flight_coalesced_total counter")
+            lines.append(f"stillme_chat_single_flight_coalesced_total {flight_stats.get('coalesced', 0)}")
+
+            lines.append("# HELP stillme_chat_single_flight_follower_timeouts_total Coalesced requests that stopped waiting and called the LLM themselves")
+            lines.append("# TYPE stillme_chat_single_flight_follower_timeouts_total counter")
+            lines.append(f"stillme_chat_single_flight_follower_timeouts_total {flight_stats.get('follower_timeouts', 0)}")
+
+            lines.append("# HELP stillme_chat_single_flight_cancelled_total Shared chat LLM calls cancelled")
+            lines.append("# TYPE stillme_chat_single_flight_cancelled_total counter")
+            lines.append(f"stillme_chat_single_flight_cancelled_total {flight_stats.get('cancelled', 0)}")
+        except Exception as flight_error:
+            logger.debug(f"Could not get single-flight metrics: {flight_error}")
+
+        # Embedding Cache Metrics (if available)
+        try:
+            embedding_service = get_embedding_service()
+            if embedding_service and hasattr(embedding_service, "get_cache_stats"):
+                emb_cache = embedding_service.get_cache_stats()
+                
+                lines.append("# HELP stillme_embedding_cache_hits_total In-memory query embedding cache hits")
+                lines.append("# TYPE stillme_embedding_cache_hits_total counter")
+                lines.append(f"stillme_embedding_cache_hits_total {emb_cache.get('hits', 0)}")
+                
+                lines.append("# HELP stillme_embedding_cache_misses_total In-memory query embedding cache misses")
+                lines.append("# TYPE stillme_embedding_cache_misses_total counter")
+                lines.append(f"stillme_embedding_cache_misses_total {emb_cache.get('misses', 0)}")
+                
+                lines.append("# HELP stillme_embedding_cache_evictions_total In-memory query embedding cache LRU evictions")
+                lines.append("# TYPE stillme_embedding_cache_evictions_total counter")
+                lines.append(f"stillme_embedding_cache_evictions_total {emb_cache.get('evictions', 0)}")
+                
+                lines.append("# HELP stillme_embedding_cache_entries Number of cached query embeddings")
+                lines.append("# TYPE stillme_embedding_cache_entries gauge")
+                lines.append(f"stillme_embedding_cache_entries {emb_cache.get('entries', 0)}")
+                
+                lines.append("# HELP stillme_embedding_cache_bytes Bytes used by cached query embeddings")
+                lines.append("# TYPE stillme_embedding_cache_bytes gauge")
+                lines.append(f"stillme_embedding_cache_bytes {emb_cache.get('bytes', 0)}")
+
+            if embedding_service:
+                from backend.vector_db.embedding_batcher import get_embedding_batcher
+                embedding_batcher = get_embedding_batcher(embedding_service)
+                if embedding_batcher:
+                    batch_stats = embedding_batcher.get_stats()
+
+                    lines.append("# HELP stillme_embedding_microbatch_batches_total Batched query encodes run by the micro-batcher")
+                    lines.append("# TYPE stillme_embedding_microbatch_batches_total counter")
+                    lines.append(f"stillme_embedding_microbatch_batches_total {batch_stats.get('batches', 0)}")
+
+                    lines.append("# HELP stillme_embedding_microbatch_queries_total Queries encoded through the micro-batcher")
+                    lines.append("# TYPE stillme_embedding_microbatch_queries_total counter")
+                    lines.append(f"stillme_embedding_microbatch_queries_total {batch_stats.get('queries', 0)}")
+        except Exception as emb_error:
+            logger.debug(f"Could not get embedding cache metrics: {emb_error}")
+        
+        # LLM HTTP Client Pool Metrics
+        try:
+            from backend.api.utils.http_client_pool import get_http_client_pool
+            http_stats = get_http_client_pool().get_stats()
+            
+            lines.append("# HELP stillme_llm_http_clients Open pooled LLM HTTP clients")
+            lines.append("# TYPE stillme_llm_http_clients gauge")
+            lines.append(f"stillme_llm_http_clients {http_stats.get('clients', 0)}")
+            
+            lines.append("# HELP stillme_llm_http_requests_total LLM API calls made through the pooled clients")
+            lines.append("# TYPE stillme_llm_http_requests_total counter")
+            for origin, count in http_stats.get("requests", {}).items():
+                lines.append(f'stillme_llm_http_requests_total{{origin="{origin}"}} {count}')
+            
+            lines.append("# HELP stillme_llm_http_in_flight LLM API calls currently in progress")
+            lines.append("# TYPE stillme_llm_http_in_flight gauge")
+            for origin, count in http_stats.get("in_flight", {}).items():
+                lines.append(f'stillme_llm_http_in_flight{{origin="{origin}"}} {count}')
+        except Exception as http_error:
+            logger.debug(f"Could not get LLM HTTP pool metrics: {http_error}")
         
         # Knowledge Retention Metrics (if available)
         try:
@@ -826,6 +941,11 @@ def get_knowledge_retention():
     import backend.api.main as main_module
     return main_module.knowledge_retention
 
+def get_embedding_service():
+    """Get embedding service from main module"""
+    import backend.api.main as main_module
+    return getattr(main_module, 'embedding_service', None)
+
 # ChromaDB Backup Endpoints
 @router.post("/api/backup/chromadb/create")
 async def create_chromadb_backup(
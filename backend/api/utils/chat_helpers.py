@@ -5,7 +5,7 @@ Shared utilities for chat endpoints (language detection, AI response generation)
 
 import os
 import logging
-import httpx
+from backend.api.utils.http_client_pool import pooled_http_client
 import hashlib
 from typing import Optional, AsyncIterator
 from functools import lru_cache
@@ -726,7 +726,7 @@ async def call_deepseek_api(prompt: str, api_key: str, detected_lang: str = 'en'
         # Use centralized system prompt builder for consistent language matching
         system_content = build_system_prompt_with_language(detected_lang)
         
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with pooled_http_client("https://api.deepseek.com/v1/chat/completions", timeout=60.0) as client:
             response = await client.post(
                 "https://api.deepseek.com/v1/chat/completions",
                 headers={
@@ -781,7 +781,7 @@ async def call_openai_api(prompt: str, api_key: str, detected_lang: str = 'en')
         # Use centralized system prompt builder for consistent language matching
         system_content = build_system_prompt_with_language(detected_lang)
         
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with pooled_http_client("https://api.openai.com/v1/chat/completions", timeout=60.0) as client:
             response = await client.post(
                 "https://api.openai.com/v1/chat/completions",
                 headers={
@@ -0,0 +1,151 @@
+"""
+Shared HTTP client pool for LLM provider calls
+
+Every provider call used to open its own httpx.AsyncClient and close it again, paying
+TCP + TLS setup on each chat turn and again for every rewrite pass. This module keeps
+one long-lived AsyncClient per (origin, timeout) with keep-alive connections, so
+consecutive calls to the same API reuse warm connections.
+
+Clients are bound to the event loop that created them; a call from a different loop
+(e.g. a test or a worker thread running asyncio.run) gets its own client.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+ENABLE_LLM_HTTP2 = os.getenv("LLM_HTTP2", "true").lower() == "true"
+DEFAULT_LLM_HTTP_MAX_CONNECTIONS = int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "100"))
+DEFAULT_LLM_HTTP_MAX_KEEPALIVE = int(os.getenv("LLM_HTTP_MAX_KEEPALIVE", "20"))
+DEFAULT_LLM_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("LLM_HTTP_KEEPALIVE_EXPIRY", "30"))
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        return url
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class HTTPClientPool:
+    """Long-lived httpx.AsyncClient per (origin, timeout, event loop) with usage counters"""
+
+    def __init__(self,
+                 max_connections: int = DEFAULT_LLM_HTTP_MAX_CONNECTIONS,
+                 max_keepalive_connections: int = DEFAULT_LLM_HTTP_MAX_KEEPALIVE,
+                 keepalive_expiry: float = DEFAULT_LLM_HTTP_KEEPALIVE_EXPIRY,
+                 http2: bool = ENABLE_LLM_HTTP2):
+        """
+        Args:
+            max_connections: Maximum concurrent connections per client
+            max_keepalive_connections: Idle connections kept open per client
+            keepalive_expiry: Seconds an idle connection stays open
+            http2: Negotiate HTTP/2 when the h2 package is installed
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.http2 = http2 and H2_AVAILABLE
+        self._clients: Dict[Tuple[str, float, int], Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, int] = {}
+        self._requests: Dict[str, int] = {}
+        self.clients_created = 0
+
+    def get_client(self, url: str, timeout: float = 60.0) -> httpx.AsyncClient:
+        """Get the shared client for url's origin (must be called from a running event loop)"""
+        loop = asyncio.get_running_loop()
+        key = (_origin(url), float(timeout), id(loop))
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None and entry[0] is loop and not entry[1].is_closed:
+                return entry[1]
+            # Drop clients whose loop is gone (id() may have been reused)
+            for stale_key in [k for k, (l, _) in self._clients.items() if l.is_closed()]:
+                self._clients.pop(stale_key, None)
+            client = httpx.AsyncClient(timeout=timeout, limits=self.limits, http2=self.http2)
+            self._clients[key] = (loop, client)
+            self.clients_created += 1
+        logger.info(f"🔌 Created pooled HTTP client for {key[0]} (timeout={timeout}s, http2={self.http2})")
+        return client
+
+    @asynccontextmanager
+    async def client(self, url: str, timeout: float = 60.0) -> AsyncIterator[httpx.AsyncClient]:
+        """Borrow the shared client for a call (drop-in for `async with httpx.AsyncClient(...)`)
+
+        The client is NOT closed on exit - only in-flight/request counters are updated.
+        """
+        origin = _origin(url)
+        client = self.get_client(url, timeout)
+        with self._lock:
+            self._in_flight[origin] = self._in_flight.get(origin, 0) + 1
+            self._requests[origin] = self._requests.get(origin, 0) + 1
+        try:
+            yield client
+        finally:
+            with self._lock:
+                self._in_flight[origin] -= 1
+
+    async def aclose(self) -> None:
+        """Close every client created on the current event loop (app shutdown)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            keys = [k for k, (l, _) in self._clients.items() if l is loop]
+            clients = [self._clients.pop(k)[1] for k in keys]
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing pooled HTTP client: {e}")
+        if clients:
+            logger.info(f"🔌 Closed {len(clients)} pooled HTTP client(s)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-origin request/in-flight counters and open client count"""
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "clients_created": self.clients_created,
+                "http2": self.http2,
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "requests": dict(self._requests),
+                "in_flight": dict(self._in_flight)
+            }
+
+
+# Global instance
+_http_client_pool: Optional[HTTPClientPool] = None
+_http_client_pool_lock = threading.Lock()
+
+
+def get_http_client_pool() -> HTTPClientPool:
+    """Get global HTTP client pool"""
+    global _http_client_pool
+    if _http_client_pool is None:
+        with _http_client_pool_lock:
+            if _http_client_pool is None:
+                _http_client_pool = HTTPClientPool()
+    return _http_client_pool
+
+
+def pooled_http_client(url: str, timeout: float = 60.0):
+    """Shortcut for get_http_client_pool().client(url, timeout)"""
+    return get_http_client_pool().client(url, timeout)
@@ -5,10 +5,11 @@ Supports multiple LLM providers: DeepSeek, OpenAI, Claude, Gemini, Ollama, Custo
 
 import os
 import logging
-import httpx
+from backend.api.utils.http_client_pool import pooled_http_client
 import json
 from typing import Optional, Dict, Any, AsyncIterator
 from backend.api.utils.chat_helpers import build_system_prompt_with_language
+from backend.services.token_counter import count_tokens, get_token_counter
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +38,7 @@ def smart_truncate_prompt_for_philosophy(prompt_text: str, max_tokens: int) -> s
         Truncated prompt with philosophical instructions preserved
     """
     def estimate_tokens(text: str) -> int:
-        return len(text) // 4 if text else 0
+        return count_tokens(text)
     
     def truncate_text(text: str, max_tokens: int) -> str:
         if not text:
@@ -45,10 +46,7 @@ def smart_truncate_prompt_for_philosophy(prompt_text: str, max_tokens: int) -> s
         estimated = estimate_tokens(text)
         if estimated <= max_tokens:
             return text
-        max_chars = max_tokens * 4
-        if len(text) <= max_chars:
-            return text
-        truncated = text[:max_chars].rsplit('\n', 1)[0]
+        truncated = get_token_counter().truncate(text, max_tokens, suffix="").rsplit('\n', 1)[0]
         return truncated + "\n\n[Note: Content truncated to fit context limits.]"
     
     # Detect if prompt contains philosophical instructions
@@ -123,17 +121,16 @@ def smart_truncate_prompt_for_philosophy(prompt_text: str, max_tokens: int) -> s
             return reconstructed
         
         # Truncate from end (after philosophical block) first
-        max_chars = max_tokens * 4
-        philo_block_size = len(philo_block)
-        before_size = len(before_philo_cleaned)
-        available_for_after = max_chars - philo_block_size - before_size
+        token_counter = get_token_counter()
+        before_tokens = estimate_tokens(before_philo_cleaned)
+        available_for_after = max_tokens - estimate_tokens(philo_block) - before_tokens
         
         if available_for_after > 0:
-            truncated_after = after_philo[:available_for_after].rsplit('\n', 1)[0]
+            truncated_after = token_counter.truncate(after_philo, available_for_after, suffix="").rsplit('\n', 1)[0]
             return before_philo_cleaned + philo_block + truncated_after
         else:
             # Even philosophical block is too large, but preserve it anyway (truncate from end of block)
-            truncated_philo = philo_block[:max_chars - before_size].rsplit('\n', 1)[0]
+            truncated_philo = token_counter.truncate(philo_block, max_tokens - before_tokens, suffix="").rsplit('\n', 1)[0]
             return before_philo_cleaned + truncated_philo
     
     # Fallback: normal truncation if philosophical block not found
@@ -230,7 +227,7 @@ class DeepSeekProvider(LLMProvider):
             # Adjust max_tokens based on model (reasoner supports up to 64K)
             max_tokens = 1500 if model == "deepseek-chat" else 8000
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with pooled_http_client("https://api.deepseek.com/v1/chat/completions", timeout=60.0) as client:
                 async with client.stream(
                     "POST",
                     "https://api.deepseek.com/v1/chat/completions",
@@ -318,7 +315,7 @@ class DeepSeekProvider(LLMProvider):
                 max_tokens = 4000  # Increased from 1500 to 4000 for codebase questions
                 logger.debug(f"Codebase question detected - max_tokens set to {max_tokens}")
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with pooled_http_client("https://api.deepseek.com/v1/chat/completions", timeout=60.0) as client:
                 response = await client.post(
                     "https://api.deepseek.com/v1/chat/completions",
                     headers={
@@ -394,7 +391,7 @@ class OpenRouterProvider(LLMProvider):
             system_content = build_system_prompt_with_language(detected_lang)
             model = self.model_name or "openai/gpt-3.5-turbo"
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with pooled_http_client("https://openrouter.ai/api/v1/chat/completions", timeout=60.0) as client:
                 async with client.stream(
                     "POST",
                     "https://openrouter.ai/api/v1/chat/completions",
@@ -466,7 +463,7 @@ class OpenRouterProvider(LLMProvider):
             # CRITICAL: Truncate system_content and prompt to prevent context overflow
             # BUT preserve user question - it's the most important part
             def estimate_tokens(text: str) -> int:
-                return len(text) // 4 if text else 0
+                return count_tokens(text)
             
             def truncate_text(text: str, max_tokens: int) -> str:
                 if not text:
@@ -474,10 +471,7 @@ class OpenRouterProvider(LLMProvider):
                 estimated = estimate_tokens(text)
                 if estimated <= max_tokens:
                     return text
-                max_chars = max_tokens * 4
-                if len(text) <= max_chars:
-                    return text
-                truncated = text[:max_chars].rsplit('\n', 1)[0]
+                truncated = get_token_counter().truncate(text, max_tokens, suffix="").rsplit('\n', 1)[0]
                 return truncated + "\n\n[Note: Content truncated to fit context limits.]"
             
             # CRITICAL: Extract and preserve user question before truncating
@@ -555,7 +549,7 @@ class OpenRouterProvider(LLMProvider):
                 max_tokens = 4000  # Increased from 1500 to 4000 for StillMe queries
                 logger.info(f"📊 StillMe/validator query detected - increasing max_tokens to {max_tokens}")
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with pooled_http_client("https://openrouter.ai/api/v1/chat/completions", timeout=60.0) as client:
                 response = await client.post(
                     "https://openrouter.ai/api/v1/chat/completions",
                     headers={
@@ -648,7 +642,7 @@ class OpenAIProvider(LLMProvider):
             system_content = build_system_prompt_with_language(detected_lang)
             model = self.model_name or "gpt-3.5-turbo"
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with pooled_http_client("https://api.openai.com/v1/chat/completions", timeout=60.0) as client:
                 async with client.stream(
                     "POST",
                     "https://api.openai.com/v1/chat/completions",
@@ -698,7 +692,7 @@ class OpenAIProvider(LLMProvider):
             # CRITICAL: Truncate system_content and prompt to prevent context overflow
             # BUT preserve user question - it's the most important part
             def estimate_tokens(text: str) -> int:
-                return len(text) // 4 if text else 0
+                return count_tokens(text)
             
             def truncate_text(text: str, max_tokens: int) -> str:
                 if not text:
@@ -706,10 +700,7 @@ class OpenAIProvider(LLMProvider):
                 estimated = estimate_tokens(text)
                 if estimated <= max_tokens:
                     return text
-                max_chars = max_tokens * 4
-                if len(text) <= max_chars:
-                    return text
-                truncated = text[:max_chars].rsplit('\n', 1)[0]
+                truncated = get_token_counter().truncate(text, max_tokens, suffix="").rsplit('\n', 1)[0]
                 return truncated + "\n\n[Note: Content truncated to fit context limits.]"
             
             # CRITICAL: Extract and preserve user question before truncating
@@ -751,7 +742,7 @@ class OpenAIProvider(LLMProvider):
             if total_tokens > 15000:
                 logger.warning(f"⚠️ Total tokens ({total_tokens}) still high, may cause context overflow")
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with pooled_http_client("https://api.openai.com/v1/chat/completions", timeout=60.0) as client:
                 response = await client.post(
                     "https://api.openai.com/v1/chat/completions",
                     headers={
@@ -837,7 +828,7 @@ class ClaudeProvider(LLMProvider):
             system_content = build_system_prompt_with_language(detected_lang)
             model = self.model_name or "claude-3-sonnet-20240229"
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with pooled_http_client("https://api.anthropic.com/v1/messages", timeout=60.0) as client:
                 response = await client.post(
                     "https://api.anthropic.com/v1/messages",
                     headers={
@@ -879,7 +870,7 @@ class GeminiProvider(LLMProvider):
             system_content = build_system_prompt_with_language(detected_lang)
             model = self.model_name or "gemini-pro"
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with pooled_http_client("https://generativelanguage.googleapis.com", timeout=60.0) as client:
                 response = await client.post(
                     f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={self.api_key}",
                     headers={"Content-Type": "application/json"},
@@ -914,7 +905,7 @@ class OllamaProvider(LLMProvider):
             model = self.model_name or "llama2"
             api_url = self.api_url or "http://localhost:11434"
             
-            async with httpx.AsyncClient(timeout=120.0) as client:  # Longer timeout for local
+            async with pooled_http_client(api_url, timeout=120.0) as client:  # Longer timeout for local
                 response = await client.post(
                     f"{api_url}/api/generate",
                     json={
@@ -952,7 +943,7 @@ class CustomProvider(LLMProvider):
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with pooled_http_client(api_url, timeout=60.0) as client:
                 response = await client.post(
                     api_url,
                     headers=headers,
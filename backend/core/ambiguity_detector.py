@@ -15,14 +15,203 @@ Ambiguity Levels:
 3. LOW (0.0-0.4): Clear intent, answer directly
 """
 
-import re
 import logging
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
+from backend.core.pattern_matcher import KeywordSet, RegexSet
+
 logger = logging.getLogger(__name__)
 
 
+# Factor 2: Pronouns that need a referent
+_PRONOUNS = KeywordSet(["nó", "đó", "cái đó", "điều đó", "it", "that", "this", "they", "them"])
+
+# Factor 3: Ambiguous keywords
+_AMBIGUOUS_KEYWORDS = KeywordSet([
+    "cái gì", "gì", "what", "which", "how", "như thế nào",
+    "tốt hơn", "better", "best", "tốt nhất",
+    "nên", "should", "có nên", "should i",
+    "có thể", "can", "could", "might",
+    "về", "about", "liên quan", "related"
+])
+
+# Factor 4: Questions that could be about different things (multi-language)
+_MULTI_INTERPRETATION_PATTERNS = RegexSet([
+    # Vietnamese patterns
+    r"ưu\s+điểm.*nhược\s+điểm",  # "ưu điểm và nhược điểm"
+    r"so\s+sánh",  # "so sánh"
+    r"khác\s+biệt",  # "khác biệt"
+    r"giống\s+nhau",  # "giống nhau"
+    r"tương\s+tự",  # "tương tự"
+    r"đặc\s+điểm",  # "đặc điểm"
+    r"tính\s+năng",  # "tính năng"
+    r"lợi\s+ích",  # "lợi ích"
+    r"hạn\s+chế",  # "hạn chế"
+    r"vấn\s+đề",  # "vấn đề"
+    r"giải\s+pháp",  # "giải pháp"
+    r"phương\s+pháp",  # "phương pháp"
+    r"quy\s+trình",  # "quy trình"
+    r"tốt\s+hơn",  # "tốt hơn"
+    r"tệ\s+hơn",  # "tệ hơn"
+    r"nhanh\s+hơn",  # "nhanh hơn"
+    r"chậm\s+hơn",  # "chậm hơn"
+    # English patterns
+    r"pros?\s+and\s+cons?",  # "pros and cons"
+    r"compare",  # "compare"
+    r"comparison",  # "comparison"
+    r"difference",  # "difference"
+    r"similar",  # "similar"
+    r"different",  # "different"
+    r"advantages?",  # "advantage(s)"
+    r"disadvantages?",  # "disadvantage(s)"
+    r"features?",  # "feature(s)"
+    r"characteristics?",  # "characteristic(s)"
+    r"benefits?",  # "benefit(s)"
+    r"limitations?",  # "limitation(s)"
+    r"problems?",  # "problem(s)"
+    r"solutions?",  # "solution(s)"
+    r"methods?",  # "method(s)"
+    r"steps?",  # "step(s)"
+    r"process",  # "process"
+    r"better",  # "better"
+    r"worse",  # "worse"
+    r"faster",  # "faster"
+    r"slower",  # "slower"
+    # Spanish patterns
+    r"ventajas?",  # "ventaja(s)"
+    r"desventajas?",  # "desventaja(s)"
+    r"características?",  # "característica(s)"
+    r"comparar",  # "comparar"
+    r"diferencia",  # "diferencia"
+    r"similar",  # "similar"
+    r"mejor",  # "mejor"
+    r"peor",  # "peor"
+    # French patterns
+    r"avantages?",  # "avantage(s)"
+    r"inconvénients?",  # "inconvénient(s)"
+    r"caractéristiques?",  # "caractéristique(s)"
+    r"comparer",  # "comparer"
+    r"différence",  # "différence"
+    r"similaire",  # "similaire"
+    r"meilleur",  # "meilleur"
+    r"pire",  # "pire"
+    # German patterns
+    r"vorteile?",  # "vorteil(e)"
+    r"nachteile?",  # "nachteil(e)"
+    r"eigenschaften?",  # "eigenschaft(en)"
+    r"vergleichen",  # "vergleichen"
+    r"unterschied",  # "unterschied"
+    r"ähnlich",  # "ähnlich"
+    r"besser",  # "besser"
+    r"schlechter",  # "schlechter"
+    # Japanese patterns (romaji)
+    r"hikaku",  # "比較" (comparison)
+    r"chigai",  # "違い" (difference)
+    r"tokuchou",  # "特徴" (characteristics)
+    r"yoi",  # "良い" (good/better)
+    r"warui",  # "悪い" (bad/worse)
+    # Chinese patterns (pinyin)
+    r"bijiao",  # "比较" (comparison)
+    r"qubie",  # "区别" (difference)
+    r"tedian",  # "特点" (characteristics)
+    r"youdian",  # "优点" (advantages)
+    r"quedian",  # "缺点" (disadvantages)
+])
+
+# Factor 5: Follow-up questions
+_FOLLOW_UP_KEYWORDS = KeywordSet(["còn", "thì sao", "còn về", "what about", "how about"])
+
+# Factor 6: Short, ambiguous phrases that could refer to StillMe or any topic (multi-language)
+_AMBIGUOUS_REFERENCE_PATTERNS = RegexSet([
+    # Vietnamese patterns
+    r"nhược\s+điểm",  # "nhược điểm"
+    r"ưu\s+điểm",  # "ưu điểm"
+    r"tính\s+năng",  # "tính năng"
+    r"đặc\s+điểm",  # "đặc điểm"
+    r"lợi\s+ích",  # "lợi ích"
+    r"hạn\s+chế",  # "hạn chế"
+    r"vấn\s+đề",  # "vấn đề"
+    r"giải\s+pháp",  # "giải pháp"
+    r"cách",  # "cách"
+    r"phương\s+pháp",  # "phương pháp"
+    r"bước",  # "bước"
+    r"quy\s+trình",  # "quy trình"
+    r"công\s+việc",  # "công việc"
+    r"nhiệm\s+vụ",  # "nhiệm vụ"
+    r"chức\s+năng",  # "chức năng"
+    # English patterns
+    r"weakness",  # "weakness"
+    r"weaknesses",  # "weaknesses"
+    r"advantage",  # "advantage"
+    r"advantages",  # "advantages"
+    r"features?",  # "feature(s)"
+    r"characteristics?",  # "characteristic(s)"
+    r"benefits?",  # "benefit(s)"
+    r"limitations?",  # "limitation(s)"
+    r"problems?",  # "problem(s)"
+    r"solutions?",  # "solution(s)"
+    r"methods?",  # "method(s)"
+    r"steps?",  # "step(s)"
+    r"process",  # "process"
+    r"tasks?",  # "task(s)"
+    r"functions?",  # "function(s)"
+    r"capabilities?",  # "capability(ies)"
+    # Spanish patterns
+    r"ventajas?",  # "ventaja(s)"
+    r"desventajas?",  # "desventaja(s)"
+    r"características?",  # "característica(s)"
+    r"beneficios?",  # "beneficio(s)"
+    r"limitaciones?",  # "limitación(es)"
+    r"problemas?",  # "problema(s)"
+    r"soluciones?",  # "solución(es)"
+    r"métodos?",  # "método(s)"
+    r"pasos?",  # "paso(s)"
+    r"proceso",  # "proceso"
+    # French patterns
+    r"avantages?",  # "avantage(s)"
+    r"inconvénients?",  # "inconvénient(s)"
+    r"caractéristiques?",  # "caractéristique(s)"
+    r"bénéfices?",  # "bénéfice(s)"
+    r"limitations?",  # "limitation(s)"
+    r"problèmes?",  # "problème(s)"
+    r"solutions?",  # "solution(s)"
+    r"méthodes?",  # "méthode(s)"
+    r"étapes?",  # "étape(s)"
+    r"processus",  # "processus"
+    # German patterns
+    r"vorteile?",  # "vorteil(e)"
+    r"nachteile?",  # "nachteil(e)"
+    r"eigenschaften?",  # "eigenschaft(en)"
+    r"vorteile?",  # "vorteil(e)"
+    r"nachteile?",  # "nachteil(e)"
+    r"probleme?",  # "problem(e)"
+    r"lösungen?",  # "lösung(en)"
+    r"methoden?",  # "methode(n)"
+    r"schritte?",  # "schritt(e)"
+    r"prozess",  # "prozess"
+    # Japanese patterns (romaji)
+    r"tokuchou",  # "特徴" (characteristics)
+    r"yoi",  # "良い" (good)
+    r"warui",  # "悪い" (bad)
+    r"houhou",  # "方法" (method)
+    r"stepu",  # "ステップ" (step)
+    # Chinese patterns (pinyin)
+    r"tedian",  # "特点" (characteristics)
+    r"youdian",  # "优点" (advantages)
+    r"quedian",  # "缺点" (disadvantages)
+    r"fangfa",  # "方法" (method)
+    r"buzhou",  # "步骤" (steps)
+])
+
+# Common tech topics - a query mentioning one has a clear topic
+_TOPIC_KEYWORDS = KeywordSet([
+    "python", "java", "javascript", "c++", "c#", "go", "rust", "ruby", "php",
+    "react", "vue", "angular", "node", "django", "flask", "spring",
+    "ai", "ml", "dl", "nlp", "cv", "blockchain", "crypto"
+])
+
+
 class AmbiguityLevel(str, Enum):
     """Ambiguity level classification"""
     HIGH = "HIGH"      # Should ask for clarification
@@ -87,8 +276,7 @@ class AmbiguityDetector:
             reasons.append("Short query (≤4 words)")
         
         # Factor 2: Pronouns without clear referent
-        pronouns = ["nó", "đó", "cái đó", "điều đó", "it", "that", "this", "they", "them"]
-        has_pronoun = any(pronoun in query_lower for pronoun in pronouns)
+        has_pronoun = _PRONOUNS.search(query_lower)
         
         # Check if pronoun has referent in conversation history
         has_referent = False
@@ -111,14 +299,7 @@ class AmbiguityDetector:
             reasons.append("Pronoun with possible referent (slight ambiguity)")
         
         # Factor 3: Ambiguous keywords
-        ambiguous_keywords = [
-            "cái gì", "gì", "what", "which", "how", "như thế nào",
-            "tốt hơn", "better", "best", "tốt nhất",
-            "nên", "should", "có nên", "should i",
-            "có thể", "can", "could", "might",
-            "về", "about", "liên quan", "related"
-        ]
-        ambiguous_count = sum(1 for keyword in ambiguous_keywords if keyword in query_lower)
+        ambiguous_count = _AMBIGUOUS_KEYWORDS.count(query_lower)
         if ambiguous_count >= 2:
             score += 0.2
             reasons.append(f"Multiple ambiguous keywords ({ambiguous_count})")
@@ -128,130 +309,13 @@ class AmbiguityDetector:
         
         # Factor 4: Multiple possible interpretations - EXPANDED for multi-language support
         # Check for questions that could be about different things
-        # Vietnamese patterns
-        vi_multi_interpretation_patterns = [
-            r"ưu\s+điểm.*nhược\s+điểm",  # "ưu điểm và nhược điểm"
-            r"so\s+sánh",  # "so sánh"
-            r"khác\s+biệt",  # "khác biệt"
-            r"giống\s+nhau",  # "giống nhau"
-            r"tương\s+tự",  # "tương tự"
-            r"đặc\s+điểm",  # "đặc điểm"
-            r"tính\s+năng",  # "tính năng"
-            r"lợi\s+ích",  # "lợi ích"
-            r"hạn\s+chế",  # "hạn chế"
-            r"vấn\s+đề",  # "vấn đề"
-            r"giải\s+pháp",  # "giải pháp"
-            r"phương\s+pháp",  # "phương pháp"
-            r"quy\s+trình",  # "quy trình"
-            r"tốt\s+hơn",  # "tốt hơn"
-            r"tệ\s+hơn",  # "tệ hơn"
-            r"nhanh\s+hơn",  # "nhanh hơn"
-            r"chậm\s+hơn",  # "chậm hơn"
-        ]
-        
-        # English patterns
-        en_multi_interpretation_patterns = [
-            r"pros?\s+and\s+cons?",  # "pros and cons"
-            r"compare",  # "compare"
-            r"comparison",  # "comparison"
-            r"difference",  # "difference"
-            r"similar",  # "similar"
-            r"different",  # "different"
-            r"advantages?",  # "advantage(s)"
-            r"disadvantages?",  # "disadvantage(s)"
-            r"features?",  # "feature(s)"
-            r"characteristics?",  # "characteristic(s)"
-            r"benefits?",  # "benefit(s)"
-            r"limitations?",  # "limitation(s)"
-            r"problems?",  # "problem(s)"
-            r"solutions?",  # "solution(s)"
-            r"methods?",  # "method(s)"
-            r"steps?",  # "step(s)"
-            r"process",  # "process"
-            r"better",  # "better"
-            r"worse",  # "worse"
-            r"faster",  # "faster"
-            r"slower",  # "slower"
-        ]
-        
-        # Spanish patterns
-        es_multi_interpretation_patterns = [
-            r"ventajas?",  # "ventaja(s)"
-            r"desventajas?",  # "desventaja(s)"
-            r"características?",  # "característica(s)"
-            r"comparar",  # "comparar"
-            r"diferencia",  # "diferencia"
-            r"similar",  # "similar"
-            r"mejor",  # "mejor"
-            r"peor",  # "peor"
-        ]
-        
-        # French patterns
-        fr_multi_interpretation_patterns = [
-            r"avantages?",  # "avantage(s)"
-            r"inconvénients?",  # "inconvénient(s)"
-            r"caractéristiques?",  # "caractéristique(s)"
-            r"comparer",  # "comparer"
-            r"différence",  # "différence"
-            r"similaire",  # "similaire"
-            r"meilleur",  # "meilleur"
-            r"pire",  # "pire"
-        ]
-        
-        # German patterns
-        de_multi_interpretation_patterns = [
-            r"vorteile?",  # "vorteil(e)"
-            r"nachteile?",  # "nachteil(e)"
-            r"eigenschaften?",  # "eigenschaft(en)"
-            r"vergleichen",  # "vergleichen"
-            r"unterschied",  # "unterschied"
-            r"ähnlich",  # "ähnlich"
-            r"besser",  # "besser"
-            r"schlechter",  # "schlechter"
-        ]
-        
-        # Japanese patterns (romaji)
-        ja_multi_interpretation_patterns = [
-            r"hikaku",  # "比較" (comparison)
-            r"chigai",  # "違い" (difference)
-            r"tokuchou",  # "特徴" (characteristics)
-            r"yoi",  # "良い" (good/better)
-            r"warui",  # "悪い" (bad/worse)
-        ]
-        
-        # Chinese patterns (pinyin)
-        zh_multi_interpretation_patterns = [
-            r"bijiao",  # "比较" (comparison)
-            r"qubie",  # "区别" (difference)
-            r"tedian",  # "特点" (characteristics)
-            r"youdian",  # "优点" (advantages)
-            r"quedian",  # "缺点" (disadvantages)
-        ]
-        
-        # Combine all patterns
-        all_multi_interpretation_patterns = (
-            vi_multi_interpretation_patterns +
-            en_multi_interpretation_patterns +
-            es_multi_interpretation_patterns +
-            fr_multi_interpretation_patterns +
-            de_multi_interpretation_patterns +
-            ja_multi_interpretation_patterns +
-            zh_multi_interpretation_patterns
-        )
-        
-        has_multi_interpretation = any(
-            re.search(pattern, query_lower) for pattern in all_multi_interpretation_patterns
-        )
+        has_multi_interpretation = _MULTI_INTERPRETATION_PATTERNS.search(query_lower)
         
         if has_multi_interpretation:
             # Check if topic is mentioned (capitalized words, common tech terms, etc.)
             has_topic = (
                 any(word[0].isupper() for word in query.split() if len(word) > 2) or
-                any(keyword in query_lower for keyword in [
-                    "python", "java", "javascript", "c++", "c#", "go", "rust", "ruby", "php",
-                    "react", "vue", "angular", "node", "django", "flask", "spring",
-                    "ai", "ml", "dl", "nlp", "cv", "blockchain", "crypto"
-                ])
+                _TOPIC_KEYWORDS.search(query_lower)
             )
             
             if not has_topic:
@@ -268,8 +332,7 @@ class AmbiguityDetector:
                 reasons.append("Multi-interpretation pattern with topic (slight ambiguity)")
         
         # Factor 5: Follow-up questions without clear context
-        follow_up_patterns = ["còn", "thì sao", "còn về", "what about", "how about"]
-        is_follow_up = any(pattern in query_lower for pattern in follow_up_patterns)
+        is_follow_up = _FOLLOW_UP_KEYWORDS.search(query_lower)
         
         if is_follow_up:
             # Check if conversation history provides context
@@ -295,120 +358,7 @@ class AmbiguityDetector:
         
         # Factor 6: Questions that could be about StillMe or something else - EXPANDED for multi-language support
         # These are short, ambiguous phrases that could refer to StillMe or any topic
-        
-        # Vietnamese patterns
-        vi_ambiguous_patterns = [
-            r"nhược\s+điểm",  # "nhược điểm"
-            r"ưu\s+điểm",  # "ưu điểm"
-            r"tính\s+năng",  # "tính năng"
-            r"đặc\s+điểm",  # "đặc điểm"
-            r"lợi\s+ích",  # "lợi ích"
-            r"hạn\s+chế",  # "hạn chế"
-            r"vấn\s+đề",  # "vấn đề"
-            r"giải\s+pháp",  # "giải pháp"
-            r"cách",  # "cách"
-            r"phương\s+pháp",  # "phương pháp"
-            r"bước",  # "bước"
-            r"quy\s+trình",  # "quy trình"
-            r"công\s+việc",  # "công việc"
-            r"nhiệm\s+vụ",  # "nhiệm vụ"
-            r"chức\s+năng",  # "chức năng"
-        ]
-        
-        # English patterns
-        en_ambiguous_patterns = [
-            r"weakness",  # "weakness"
-            r"weaknesses",  # "weaknesses"
-            r"advantage",  # "advantage"
-            r"advantages",  # "advantages"
-            r"features?",  # "feature(s)"
-            r"characteristics?",  # "characteristic(s)"
-            r"benefits?",  # "benefit(s)"
-            r"limitations?",  # "limitation(s)"
-            r"problems?",  # "problem(s)"
-            r"solutions?",  # "solution(s)"
-            r"methods?",  # "method(s)"
-            r"steps?",  # "step(s)"
-            r"process",  # "process"
-            r"tasks?",  # "task(s)"
-            r"functions?",  # "function(s)"
-            r"capabilities?",  # "capability(ies)"
-        ]
-        
-        # Spanish patterns
-        es_ambiguous_patterns = [
-            r"ventajas?",  # "ventaja(s)"
-            r"desventajas?",  # "desventaja(s)"
-            r"características?",  # "característica(s)"
-            r"beneficios?",  # "beneficio(s)"
-            r"limitaciones?",  # "limitación(es)"
-            r"problemas?",  # "problema(s)"
-            r"soluciones?",  # "solución(es)"
-            r"métodos?",  # "método(s)"
-            r"pasos?",  # "paso(s)"
-            r"proceso",  # "proceso"
-        ]
-        
-        # French patterns
-        fr_ambiguous_patterns = [
-            r"avantages?",  # "avantage(s)"
-            r"inconvénients?",  # "inconvénient(s)"
-            r"caractéristiques?",  # "caractéristique(s)"
-            r"bénéfices?",  # "bénéfice(s)"
-            r"limitations?",  # "limitation(s)"
-            r"problèmes?",  # "problème(s)"
-            r"solutions?",  # "solution(s)"
-            r"méthodes?",  # "méthode(s)"
-            r"étapes?",  # "étape(s)"
-            r"processus",  # "processus"
-        ]
-        
-        # German patterns
-        de_ambiguous_patterns = [
-            r"vorteile?",  # "vorteil(e)"
-            r"nachteile?",  # "nachteil(e)"
-            r"eigenschaften?",  # "eigenschaft(en)"
-            r"vorteile?",  # "vorteil(e)"
-            r"nachteile?",  # "nachteil(e)"
-            r"probleme?",  # "problem(e)"
-            r"lösungen?",  # "lösung(en)"
-            r"methoden?",  # "methode(n)"
-            r"schritte?",  # "schritt(e)"
-            r"prozess",  # "prozess"
-        ]
-        
-        # Japanese patterns (romaji)
-        ja_ambiguous_patterns = [
-            r"tokuchou",  # "特徴" (characteristics)
-            r"yoi",  # "良い" (good)
-            r"warui",  # "悪い" (bad)
-            r"houhou",  # "方法" (method)
-            r"stepu",  # "ステップ" (step)
-        ]
-        
-        # Chinese patterns (pinyin)
-        zh_ambiguous_patterns = [
-            r"tedian",  # "特点" (characteristics)
-            r"youdian",  # "优点" (advantages)
-            r"quedian",  # "缺点" (disadvantages)
-            r"fangfa",  # "方法" (method)
-            r"buzhou",  # "步骤" (steps)
-        ]
-        
-        # Combine all patterns
-        all_ambiguous_patterns = (
-            vi_ambiguous_patterns +
-            en_ambiguous_patterns +
-            es_ambiguous_patterns +
-            fr_ambiguous_patterns +
-            de_ambiguous_patterns +
-            ja_ambiguous_patterns +
-            zh_ambiguous_patterns
-        )
-        
-        has_stillme_ambiguous = any(
-            re.search(pattern, query_lower) for pattern in all_ambiguous_patterns
-        )
+        has_stillme_ambiguous = _AMBIGUOUS_REFERENCE_PATTERNS.search(query_lower)
         
         if has_stillme_ambiguous:
             # Check if query explicitly mentions StillMe or a topic
@@ -417,11 +367,7 @@ class AmbiguityDetector:
                 "bạn" in query_lower or
                 "you" in query_lower or
                 any(word[0].isupper() for word in query.split() if len(word) > 2) or
-                any(keyword in query_lower for keyword in [
-                    "python", "java", "javascript", "c++", "c#", "go", "rust", "ruby", "php",
-                    "react", "vue", "angular", "node", "django", "flask", "spring",
-                    "ai", "ml", "dl", "nlp", "cv", "blockchain", "crypto"
-                ])
+                _TOPIC_KEYWORDS.search(query_lower)
             )
             if not has_explicit_topic:
                 # CRITICAL FIX: If query is very short (≤2 words) AND has ambiguous reference,
@@ -20,7 +20,7 @@ in main chat. Rewrite and validation always use chat model (function calling req
 import logging
 import re
 from typing import Optional, Dict, Any
-from backend.core.question_classifier import is_philosophical_question
+from backend.core.query_profile import get_query_profile
 
 logger = logging.getLogger(__name__)
 
@@ -74,7 +74,7 @@ class DeepSeekModelRouter:
         
         # Detect philosophical if not provided
         if is_philosophical is None:
-            is_philosophical = is_philosophical_question(question)
+            is_philosophical = get_query_profile(question).is_philosophical
         
         if is_philosophical:
             # Check if it's a pure philosophical question (not factual with philosophical elements)
@@ -0,0 +1,179 @@
+"""
+Compiled multi-pattern matching for StillMe keyword/regex detectors
+
+The query detectors (StillMe/origin detection, question classification, philosophical
+intent, ambiguity) check each query against dozens of keyword and regex lists, and
+used to do it with `any(kw in text for kw in [...])` / `re.search(p, text)` loops
+rebuilt on every call - one Python-level scan of the text per keyword.
+
+These helpers compile a list once, at import time, so a check is one scan in C:
+- KeywordSet: literal substrings. Uses a pyahocorasick automaton when the package is
+  installed, otherwise a single regex alternation scanned with a lookahead at every
+  position (same result: every keyword occurring anywhere, overlaps included)
+- RegexSet: regex patterns combined into one alternation. `search` answers "does any
+  pattern match" in one scan; `first`/`find_all` only fall back to per-pattern checks
+  when the combined scan found something
+
+Callers keep their semantics: matching is case-sensitive (pass already-lowercased text
+where the old code did), and `first` returns the first match in declaration order, as
+the old `for pattern in patterns` loops did.
+"""
+
+import logging
+import re
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Optional: C Aho-Corasick automaton
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+# Backreferences refer to group numbers/names, which change once patterns are combined
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+class KeywordSet:
+    """Literal keywords matched as substrings of a text in one scan"""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Args:
+            keywords: Keywords, matched literally (regex characters have no meaning)
+        """
+        # Deduplicate, keeping declaration order for find_all/first
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(k for k in keywords if k))
+        self._order: Dict[str, int] = {k: i for i, k in enumerate(self.keywords)}
+
+        # A keyword occurring in the text implies every keyword it contains does too
+        self._contained: Dict[str, FrozenSet[str]] = {
+            k: frozenset(other for other in self.keywords if other in k)
+            for k in self.keywords
+        }
+
+        self._automaton = None
+        self._pattern = None
+        if not self.keywords:
+            return
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            # Longest first: alternation takes the first alternative that matches, so each
+            # position reports its longest keyword (shorter ones come from _contained)
+            alternation = "|".join(
+                re.escape(k) for k in sorted(self.keywords, key=len, reverse=True)
+            )
+            self._pattern = re.compile(f"(?=({alternation}))")
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __iter__(self):
+        return iter(self.keywords)
+
+    def search(self, text: str) -> bool:
+        """True if any keyword occurs in text (same as `any(k in text for k in keywords)`)"""
+        if not text or not self.keywords:
+            return False
+        if self._automaton is not None:
+            for _ in self._automaton.iter(text):
+                return True
+            return False
+        return self._pattern.search(text) is not None
+
+    def find_all(self, text: str) -> List[str]:
+        """All keywords occurring in text, in declaration order"""
+        if not text or not self.keywords:
+            return []
+        if self._automaton is not None:
+            found = {keyword for _, keyword in self._automaton.iter(text)}
+        else:
+            found = set()
+            for match in self._pattern.finditer(text):
+                found.update(self._contained[match.group(1)])
+        return sorted(found, key=self._order.__getitem__)
+
+    def first(self, text: str) -> Optional[str]:
+        """First keyword in declaration order occurring in text, or None"""
+        found = self.find_all(text)
+        return found[0] if found else None
+
+    def count(self, text: str) -> int:
+        """Number of distinct keywords occurring in text"""
+        return len(self.find_all(text))
+
+
+class RegexSet:
+    """Regex patterns checked against a text with one combined scan"""
+
+    def __init__(self, patterns: Iterable[str], flags: int = 0):
+        """
+        Args:
+            patterns: Regex patterns
+            flags: re flags applied to every pattern
+        """
+        self.patterns: Tuple[str, ...] = tuple(patterns)
+        self.flags = flags
+        self._compiled = tuple(re.compile(p, flags) for p in self.patterns)
+        self._combined = None
+        if self.patterns and not any(_BACKREFERENCE.search(p) for p in self.patterns):
+            try:
+                self._combined = re.compile("|".join(f"(?:{p})" for p in self.patterns), flags)
+            except re.error as e:
+                # e.g. the same named group in two patterns - fall back to one scan per pattern
+                logger.debug(f"Could not combine {len(self.patterns)} patterns, checking them one by one: {e}")
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def __iter__(self):
+        return iter(self.patterns)
+
+    def search(self, text: str) -> bool:
+        """True if any pattern matches (same as `any(re.search(p, text) for p in patterns)`)"""
+        if not text or not self.patterns:
+            return False
+        if self._combined is not None:
+            return self._combined.search(text) is not None
+        return any(compiled.search(text) for compiled in self._compiled)
+
+    def first(self, text: str) -> Optional[str]:
+        """First pattern in declaration order that matches, or None"""
+        if not self.search(text):
+            return None
+        for pattern, compiled in zip(self.patterns, self._compiled):
+            if compiled.search(text):
+                return pattern
+        return None
+
+    def first_match(self, text: str) -> Optional[re.Match]:
+        """Match object of the first pattern in declaration order that matches, or None"""
+        if not self.search(text):
+            return None
+        for compiled in self._compiled:
+            match = compiled.search(text)
+            if match:
+                return match
+        return None
+
+    def matches(self, text: str) -> List[re.Match]:
+        """First match of every pattern that matches, in declaration order"""
+        if not self.search(text):
+            return []
+        return [match for match in (compiled.search(text) for compiled in self._compiled) if match]
+
+    def find_all(self, text: str) -> List[str]:
+        """All patterns that match, in declaration order"""
+        return [match.re.pattern for match in self.matches(text)]
+
+    def count(self, text: str) -> int:
+        """Number of patterns that match"""
+        return len(self.matches(text))
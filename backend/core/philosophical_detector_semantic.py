@@ -8,12 +8,21 @@ This approach is scalable and works for any language StillMe supports.
 """
 
 import logging
+import os
+import tempfile
+import threading
 import numpy as np
-from typing import Optional, Tuple
-from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+from backend.services.index_manifest import content_hash
 
 logger = logging.getLogger(__name__)
 
+# Directory where exemplar embedding matrices are persisted (one .npy per model + example set)
+PHILOSOPHICAL_EXEMPLAR_CACHE_DIR = os.getenv(
+    "PHILOSOPHICAL_EXEMPLAR_CACHE_DIR", os.path.join("data", "philosophical_exemplars")
+)
+
 # Philosophical question examples (seed examples for semantic matching)
 # These are representative philosophical questions in multiple languages
 PHILOSOPHICAL_EXAMPLES = [
@@ -52,58 +61,136 @@ PHILOSOPHICAL_EXAMPLES = [
 ]
 
 
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows (zero rows stay zero) as a contiguous float32 matrix"""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.ascontiguousarray(matrix / norms, dtype=np.float32)
+
+
 class SemanticPhilosophicalDetector:
     """
     Semantic-based philosophical question detector using embedding similarity.
     
     This detector works across all languages by comparing semantic similarity
     with philosophical question examples, eliminating the need for language-specific patterns.
+    
+    The examples are kept as one pre-normalized float32 matrix (embedded in a single batch
+    and persisted per model), so detection is a single matrix-vector product.
     """
     
-    def __init__(self, embedding_service=None, similarity_threshold: float = 0.65):
+    def __init__(
+        self,
+        embedding_service=None,
+        similarity_threshold: float = 0.65,
+        examples: Optional[Sequence[str]] = None,
+        cache_dir: Optional[str] = PHILOSOPHICAL_EXEMPLAR_CACHE_DIR
+    ):
         """
         Initialize semantic philosophical detector.
         
         Args:
             embedding_service: EmbeddingService instance (will be lazy-loaded if None)
             similarity_threshold: Minimum cosine similarity to consider question philosophical (default: 0.65)
+            examples: Seed examples (default: PHILOSOPHICAL_EXAMPLES)
+            cache_dir: Directory for the persisted exemplar matrix (None disables persistence)
         """
         self.embedding_service = embedding_service
         self.similarity_threshold = similarity_threshold
-        self._philosophical_embeddings = None
+        self.examples: List[str] = list(examples if examples is not None else PHILOSOPHICAL_EXAMPLES)
+        self.cache_dir = cache_dir
+        self._exemplar_matrix: Optional[np.ndarray] = None
         self._initialized = False
+        self._init_lock = threading.Lock()
+    
+    def _matrix_path(self) -> Optional[str]:
+        """Persisted matrix path, keyed by model name and the example set"""
+        if not self.cache_dir:
+            return None
+        model_name = getattr(self.embedding_service, "model_name", None)
+        if not isinstance(model_name, str) or not model_name:
+            return None
+        model_safe = model_name.replace("/", "_")
+        examples_hash = content_hash("\n".join(self.examples))[:16]
+        return os.path.join(self.cache_dir, f"{model_safe}_{examples_hash}.npy")
+    
+    def _load_matrix(self, path: Optional[str]) -> Optional[np.ndarray]:
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            matrix = np.load(path, allow_pickle=False)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read philosophical exemplar matrix {path}, re-embedding: {e}")
+            return None
+        if matrix.ndim != 2 or matrix.shape[0] != len(self.examples):
+            logger.info(f"ℹ️ Philosophical exemplar matrix {path} does not match the examples, re-embedding")
+            return None
+        return _normalize_rows(matrix)
+    
+    def _save_matrix(self, path: Optional[str], matrix: np.ndarray) -> None:
+        if not path:
+            return
+        try:
+            directory = os.path.dirname(path) or "."
+            os.makedirs(directory, exist_ok=True)
+            # Write then rename, so concurrent workers never read a half-written file
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".npy.tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.save(f, matrix, allow_pickle=False)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"⚠️ Could not persist philosophical exemplar matrix to {path}: {e}")
     
     def _initialize(self):
-        """Lazy initialization of philosophical question embeddings"""
+        """Lazy initialization of the exemplar embedding matrix"""
         if self._initialized:
             return
         
-        try:
-            # Lazy import to avoid circular dependencies
-            if self.embedding_service is None:
-                from backend.vector_db.embeddings import get_embedding_service
-                self.embedding_service = get_embedding_service()
-            
-            # Embed all philosophical examples
-            logger.info(f"Initializing semantic philosophical detector with {len(PHILOSOPHICAL_EXAMPLES)} examples")
-            self._philosophical_embeddings = [
-                self.embedding_service.encode_text(example)
-                for example in PHILOSOPHICAL_EXAMPLES
-            ]
-            self._initialized = True
-            logger.info("✅ Semantic philosophical detector initialized")
-        except Exception as e:
-            logger.error(f"❌ Failed to initialize semantic philosophical detector: {e}")
-            # Fallback: mark as initialized but use empty embeddings (will fall back to keyword-based)
-            self._philosophical_embeddings = []
+        with self._init_lock:
+            if self._initialized:
+                return
+            try:
+                # Lazy import to avoid circular dependencies
+                if self.embedding_service is None:
+                    from backend.vector_db.embeddings import get_embedding_service
+                    self.embedding_service = get_embedding_service()
+                
+                path = self._matrix_path()
+                matrix = self._load_matrix(path)
+                if matrix is not None:
+                    logger.info(f"✅ Semantic philosophical detector loaded {matrix.shape[0]} exemplar embeddings from {path}")
+                else:
+                    # Embed all philosophical examples in one batch
+                    logger.info(f"Initializing semantic philosophical detector with {len(self.examples)} examples")
+                    matrix = _normalize_rows(self.embedding_service.batch_encode(self.examples))
+                    self._save_matrix(path, matrix)
+                    logger.info("✅ Semantic philosophical detector initialized")
+                self._exemplar_matrix = matrix
+            except Exception as e:
+                logger.error(f"❌ Failed to initialize semantic philosophical detector: {e}")
+                # Fallback: mark as initialized but without embeddings (will fall back to keyword-based)
+                self._exemplar_matrix = None
             self._initialized = True
     
-    def detect(self, question: str) -> Tuple[bool, float, Optional[str]]:
+    def _query_embedding(self, question: str):
+        """Query embedding, shared with retrieval through the request's QueryProfile"""
+        from backend.core.query_profile import get_query_profile
+        return get_query_profile(question).query_embedding(self.embedding_service)
+    
+    def detect(self, question: str, query_embedding=None) -> Tuple[bool, float, Optional[str]]:
         """
         Detect if question is philosophical using semantic similarity.
         
         Args:
             question: User question text (any language)
+            query_embedding: Embedding of the question by the same model, when the caller
+                already has it (default: the request's QueryProfile embedding, encoded once
+                and reused by retrieval)
             
         Returns:
             Tuple of (is_philosophical, max_similarity, matched_example)
@@ -118,25 +205,23 @@ class SemanticPhilosophicalDetector:
             self._initialize()
             
             # If initialization failed, return False (will fall back to keyword-based)
-            if not self._philosophical_embeddings:
+            if self._exemplar_matrix is None or not len(self._exemplar_matrix):
                 return (False, 0.0, None)
             
-            # Embed the question
-            question_embedding = self.embedding_service.encode_text(question)
-            
-            # Calculate cosine similarity with all philosophical examples
-            max_similarity = 0.0
-            matched_example = None
+            if query_embedding is None:
+                query_embedding = self._query_embedding(question)
+            query_vector = np.asarray(query_embedding, dtype=np.float32)
+            query_norm = np.linalg.norm(query_vector)
+            if query_norm == 0:
+                return (False, 0.0, None)
             
-            for i, example_embedding in enumerate(self._philosophical_embeddings):
-                # Cosine similarity
-                similarity = np.dot(question_embedding, example_embedding) / (
-                    np.linalg.norm(question_embedding) * np.linalg.norm(example_embedding)
-                )
-                
-                if similarity > max_similarity:
-                    max_similarity = similarity
-                    matched_example = PHILOSOPHICAL_EXAMPLES[i]
+            # Cosine similarity with all philosophical examples in one product
+            similarities = self._exemplar_matrix @ (query_vector / query_norm)
+            best = int(np.argmax(similarities))
+            max_similarity = float(similarities[best])
+            if max_similarity <= 0.0:
+                return (False, 0.0, None)
+            matched_example = self.examples[best]
             
             is_philosophical = max_similarity >= self.similarity_threshold
             
@@ -161,6 +246,7 @@ class SemanticPhilosophicalDetector:
 
 # Global instance (lazy initialization)
 _semantic_detector: Optional[SemanticPhilosophicalDetector] = None
+_semantic_detector_lock = threading.Lock()
 
 
 def get_semantic_philosophical_detector(
@@ -179,9 +265,11 @@ def get_semantic_philosophical_detector(
     """
     global _semantic_detector
     if _semantic_detector is None:
-        _semantic_detector = SemanticPhilosophicalDetector(
-            embedding_service=embedding_service,
-            similarity_threshold=similarity_threshold
-        )
+        with _semantic_detector_lock:
+            if _semantic_detector is None:
+                _semantic_detector = SemanticPhilosophicalDetector(
+                    embedding_service=embedding_service,
+                    similarity_threshold=similarity_threshold
+                )
     return _semantic_detector
 
@@ -0,0 +1,257 @@
+"""
+Query Profile for StillMe
+
+Classifies a user query once per chat request. The chat pipeline used to call the same
+detectors (language, philosophical, StillMe/origin, roleplay, honesty, news...) dozens
+of times per request from retrieval, prompt building, validation and post-processing,
+each re-lowercasing the text and re-running its regex lists.
+
+A QueryProfile runs every detector at most once and remembers the result:
+- start_query_profile() at request entry builds the profile, runs the regex detectors in
+  one pass and makes it the current profile of the request (a ContextVar, so helpers
+  and validators running in the same request see it)
+- get_query_profile(text) returns the current profile when it is for the same text, or a
+  fresh one otherwise - callers never get another query's results
+- the semantic philosophical detector (embedding call) runs on first use, so requests
+  answered before it is needed do not pay for it
+- the query embedding is computed once per model (profile.query_embedding()) and shared by
+  retrieval and the semantic philosophical detector
+- per-detector timings are kept in profile.timings_ms
+"""
+
+import contextvars
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _language(text: str) -> str:
+    from backend.api.utils.chat_helpers import detect_language
+    return detect_language(text)
+
+
+def _philosophical(text: str) -> bool:
+    from backend.core.question_classifier import is_philosophical_question
+    return is_philosophical_question(text)
+
+
+def _philosophical_consciousness(text: str) -> bool:
+    from backend.philosophy.processor import is_philosophical_question_about_consciousness
+    return is_philosophical_question_about_consciousness(text)
+
+
+def _religion_roleplay(text: str) -> bool:
+    from backend.core.question_classifier import is_religion_roleplay_question
+    return is_religion_roleplay_question(text)
+
+
+def _general_roleplay(text: str) -> bool:
+    from backend.core.question_classifier import is_general_roleplay_question
+    return is_general_roleplay_question(text)
+
+
+def _news_article(text: str) -> bool:
+    from backend.core.question_classifier import is_news_article_query
+    return is_news_article_query(text)
+
+
+def _stillme(text: str) -> Tuple[bool, List[str]]:
+    from backend.core.stillme_detector import detect_stillme_query
+    return detect_stillme_query(text)
+
+
+def _origin(text: str) -> Tuple[bool, List[str]]:
+    from backend.core.stillme_detector import detect_origin_query
+    return detect_origin_query(text)
+
+
+def _revenue(text: str) -> Tuple[bool, List[str]]:
+    from backend.core.stillme_detector import detect_revenue_query
+    return detect_revenue_query(text)
+
+
+def _religion_choice(text: str) -> Tuple[bool, List[str]]:
+    from backend.core.ai_self_model_detector import detect_religion_choice_query
+    return detect_religion_choice_query(text)
+
+
+def _ai_self_model(text: str) -> Tuple[bool, List[str]]:
+    from backend.core.ai_self_model_detector import detect_ai_self_model_query
+    return detect_ai_self_model_query(text)
+
+
+def _honesty(text: str) -> bool:
+    from backend.honesty.handler import is_honesty_question
+    return is_honesty_question(text)
+
+
+# name -> (detector, result used when the detector fails)
+DETECTORS: Dict[str, Tuple[Callable[[str], Any], Any]] = {
+    "language": (_language, "en"),
+    "philosophical": (_philosophical, False),
+    "philosophical_consciousness": (_philosophical_consciousness, False),
+    "religion_roleplay": (_religion_roleplay, False),
+    "general_roleplay": (_general_roleplay, False),
+    "news_article": (_news_article, False),
+    "stillme": (_stillme, (False, [])),
+    "origin": (_origin, (False, [])),
+    "revenue": (_revenue, (False, [])),
+    "religion_choice": (_religion_choice, (False, [])),
+    "ai_self_model": (_ai_self_model, (False, [])),
+    "honesty": (_honesty, False),
+}
+
+# Detectors run eagerly by start_query_profile() (pure regex/keyword work)
+EAGER_DETECTORS = [name for name in DETECTORS if name != "philosophical"]
+
+
+class QueryProfile:
+    """All query classifications of one chat message, each computed at most once"""
+
+    def __init__(self, text: str):
+        """
+        Args:
+            text: The user message
+        """
+        self.text = text or ""
+        self._results: Dict[str, Any] = {}
+        self._embeddings: Dict[Optional[str], List[float]] = {}
+        self.timings_ms: Dict[str, float] = {}
+
+    def detect(self, name: str) -> Any:
+        """Result of detector `name` (run on first call, then memoized)"""
+        if name in self._results:
+            return self._results[name]
+        detector, default = DETECTORS[name]
+        start = time.perf_counter()
+        try:
+            result = detector(self.text)
+        except Exception as e:
+            logger.warning(f"⚠️ Query detector '{name}' failed, using default: {e}")
+            result = default
+        self.timings_ms[name] = (time.perf_counter() - start) * 1000
+        self._results[name] = result
+        return result
+
+    def query_embedding(self, embedding_service) -> List[float]:
+        """
+        Embedding of the message (encoded on first call per model, then memoized)
+
+        Args:
+            embedding_service: EmbeddingService to encode with
+        """
+        model_name = getattr(embedding_service, "model_name", None)
+        embedding = self._embeddings.get(model_name)
+        if embedding is None:
+            start = time.perf_counter()
+            embedding = embedding_service.encode_text(self.text)
+            self.timings_ms["embedding"] = (time.perf_counter() - start) * 1000
+            self._embeddings[model_name] = embedding
+        return embedding
+
+    def warm(self, names: Optional[List[str]] = None) -> "QueryProfile":
+        """Run detectors now (default: every regex detector) instead of on first use"""
+        for name in names or EAGER_DETECTORS:
+            self.detect(name)
+        return self
+
+    def _flag_with_matches(self, name: str) -> Tuple[bool, List[str]]:
+        # Copy the match list - callers may extend it
+        flag, matches = self.detect(name)
+        return flag, list(matches or [])
+
+    @property
+    def language(self) -> str:
+        return self.detect("language")
+
+    @property
+    def is_philosophical(self) -> bool:
+        return self.detect("philosophical")
+
+    @property
+    def is_philosophical_consciousness(self) -> bool:
+        return self.detect("philosophical_consciousness")
+
+    @property
+    def is_religion_roleplay(self) -> bool:
+        return self.detect("religion_roleplay")
+
+    @property
+    def is_general_roleplay(self) -> bool:
+        return self.detect("general_roleplay")
+
+    @property
+    def is_news_article_query(self) -> bool:
+        return self.detect("news_article")
+
+    @property
+    def is_honesty_question(self) -> bool:
+        return self.detect("honesty")
+
+    @property
+    def stillme_query(self) -> Tuple[bool, List[str]]:
+        """(is_stillme_query, matched_keywords) - without conversation history"""
+        return self._flag_with_matches("stillme")
+
+    @property
+    def origin_query(self) -> Tuple[bool, List[str]]:
+        """(is_origin_query, matched_keywords)"""
+        return self._flag_with_matches("origin")
+
+    @property
+    def revenue_query(self) -> Tuple[bool, List[str]]:
+        """(is_revenue_query, matched_keywords)"""
+        return self._flag_with_matches("revenue")
+
+    @property
+    def religion_choice_query(self) -> Tuple[bool, List[str]]:
+        """(is_religion_choice_query, matched_patterns)"""
+        return self._flag_with_matches("religion_choice")
+
+    @property
+    def ai_self_model_query(self) -> Tuple[bool, List[str]]:
+        """(is_ai_self_model_query, matched_patterns)"""
+        return self._flag_with_matches("ai_self_model")
+
+    @property
+    def total_ms(self) -> float:
+        return sum(self.timings_ms.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get detector timings (ms) and how many detectors ran"""
+        return {
+            "detectors_run": len(self._results),
+            "total_ms": round(self.total_ms, 2),
+            "timings_ms": {name: round(ms, 2) for name, ms in self.timings_ms.items()}
+        }
+
+
+_current_profile: contextvars.ContextVar[Optional[QueryProfile]] = contextvars.ContextVar(
+    "stillme_query_profile", default=None
+)
+
+
+def start_query_profile(text: str, warm: bool = True) -> QueryProfile:
+    """
+    Build the profile for a new request and make it the request's current profile
+
+    Args:
+        text: The user message
+        warm: Run the regex detectors now, in one pass
+    """
+    profile = QueryProfile(text)
+    if warm:
+        profile.warm()
+        logger.debug(f"🧭 Query profile built in {profile.total_ms:.1f}ms: {profile.get_stats()['timings_ms']}")
+    _current_profile.set(profile)
+    return profile
+
+
+def get_query_profile(text: str) -> QueryProfile:
+    """Current request's profile if it is for `text`, otherwise a new (unshared) profile"""
+    profile = _current_profile.get()
+    if profile is not None and profile.text == (text or ""):
+        return profile
+    return QueryProfile(text)
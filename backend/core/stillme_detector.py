@@ -7,6 +7,8 @@ import re
 import logging
 from typing import List, Tuple, Optional
 
+from backend.core.pattern_matcher import KeywordSet, RegexSet
+
 logger = logging.getLogger(__name__)
 
 # Keywords that indicate StillMe-related queries (Vietnamese and English)
@@ -80,6 +82,213 @@ STILLME_KEYWORDS = {
 }
 
 
+# Meta-validation questions (validation of validation itself) - routed to the philosophical processor
+_META_VALIDATION_PATTERNS = RegexSet([
+    # Who validates the validator?
+    r"ai\s+validate\s+chính\s+validation",  # "ai validate chính validation"
+    r"who\s+validates?\s+.*validation",  # "who validates the validation"
+    r"validate\s+chính\s+nó",  # "validate chính nó"
+    r"validate\s+itself",  # "validate itself"
+    r"validate\s+chính\s+.*chain",  # "validate chính validation chain"
+    r"validate\s+.*validation\s+chain",  # "validate the validation chain"
+
+    # Echo chamber / circular reasoning
+    r"echo\s+chamber",  # "echo chamber"
+    r"vòng\s+lặp",  # "vòng lặp"
+    r"circular",  # "circular"
+    r"tự\s+quy\s+chiếu",  # "tự quy chiếu"
+    r"self.?reference",  # "self-reference"
+
+    # Bootstrapping / epistemic circularity
+    r"bootstrap",  # "bootstrap"
+    r"bootstrapping",  # "bootstrapping"
+    r"epistemic\s+circularity",  # "epistemic circularity"
+    r"infinite\s+regress",  # "infinite regress"
+    r"vòng\s+lặp\s+vô\s+hạn",  # "vòng lặp vô hạn"
+
+    # Paradox / self-reference
+    r"paradox.*validation",  # "paradox ... validation"
+    r"nghịch\s+lý.*validation",  # "nghịch lý ... validation"
+    r"gödel.*validation",  # "gödel ... validation"
+    r"tarski.*validation",  # "tarski ... validation"
+])
+
+# Technical architecture questions (RAG, DeepSeek, black box)
+_TECHNICAL_KEYWORDS = KeywordSet([
+    "rag", "retrieval-augmented generation", "chromadb", "vector database",
+    "deepseek", "openai", "llm api", "black box", "blackbox",
+    "embedding", "multi-qa-minilm", "sentence-transformers",
+    "pipeline", "hallucination", "transparency",
+    "kiến trúc", "hệ thống", "cơ chế", "quy trình",
+    "cơ chế hoạt động", "cách hoạt động", "how does", "how it works"
+])
+
+# "your system" / "in your system" phrases (matched literally)
+_YOUR_SYSTEM_PHRASES = KeywordSet([
+    "your system", "in your system", "your.*system", "system.*you",
+    "bạn.*hệ thống", "hệ thống.*bạn", "của bạn", "bạn.*sử dụng"
+])
+
+# Self-reflection questions about StillMe's weaknesses/limitations
+_SELF_REFLECTION_PATTERNS = RegexSet([
+    r"điểm\s+yếu.*chính\s+bạn",  # "điểm yếu chính bạn"
+    r"điểm\s+yếu.*của\s+bạn",  # "điểm yếu của bạn"
+    r"weakness.*yourself",  # "weakness yourself"
+    r"weakness.*of\s+you",  # "weakness of you"
+    r"limitation.*yourself",  # "limitation yourself"
+    r"limitation.*of\s+you",  # "limitation of you"
+    r"hạn\s+chế.*chính\s+bạn",  # "hạn chế chính bạn"
+    r"hạn\s+chế.*của\s+bạn",  # "hạn chế của bạn"
+    r"chỉ\s+ra.*điểm\s+yếu",  # "chỉ ra điểm yếu"
+    r"chỉ\s+ra.*hạn\s+chế",  # "chỉ ra hạn chế"
+    r"what.*your.*weakness",  # "what your weakness"
+    r"what.*your.*limitation",  # "what your limitation"
+    r"your.*weakness",  # "your weakness"
+    r"your.*limitation",  # "your limitation"
+    r"bạn.*yếu",  # "bạn yếu"
+    r"bạn.*hạn\s+chế",  # "bạn hạn chế"
+], re.IGNORECASE)
+
+_YOUR_OWN_PHRASES = KeywordSet([
+    "your own", "yourself", "chính mình", "bản thân", "của chính bạn"
+])
+
+_SELF_TRACKING_KEYWORDS = KeywordSet([
+    "track", "tracking", "execution time", "self-tracking", "self tracking",
+    "theo dõi", "theo dõi thời gian", "theo dõi thực thi",
+    "monitor", "monitoring", "time estimation", "estimate time"
+])
+
+_LEARNING_KEYWORDS = KeywordSet([
+    "học", "learn", "learning", "học tập", "học hỏi", "tự học", 
+    "học như thế nào", "how do you learn", "how does.*learn", "cách học",
+    "học được gì", "hoc duoc gi", "what did you learn", "what have you learned",
+    "hôm nay bạn học", "hom nay ban hoc", "today you learn", "what you learned today",
+    "lý do vì sao lại học", "ly do vi sao lai hoc", "why do you learn", "why learn",
+    "vì sao lại bỏ bài học", "vi sao lai bo bai hoc", "why skip", "why filter",
+    "bỏ bài học", "bo bai hoc", "skip", "filter", "bỏ qua", "bo qua",
+    "nguồn học", "nguon hoc", "learning source", "source of learning",
+    "nguồn học nào bị lỗi", "nguon hoc nao bi loi", "which source failed", "source error",
+    "lý do lỗi", "ly do loi", "reason for error", "why error", "why failed"
+])
+
+_SYSTEM_KEYWORDS = KeywordSet([
+    "hệ thống", "system", "hoạt động", "vận hành", "work", "cách", "how", 
+    "như thế nào", "how does", "how do", "how work", "how function",
+    "mechanisms", "wie funktioniert", "fonctionne", "comment fonctionne",
+    "cómo funciona", "如何工作", "どのように機能", "mechanism", "cơ chế",
+    "triết lý hoạt động", "triet ly hoat dong", "operating philosophy", "philosophy of operation",
+    "mục tiêu phát triển", "muc tieu phat trien", "development goal", "development target",
+    "mục tiêu kế tiếp", "muc tieu ke tiep", "next goal", "next target", "future goal"
+])
+
+_PHILOSOPHY_GOAL_KEYWORDS = KeywordSet([
+    "triết lý", "triet ly", "philosophy", "philosophy of operation",
+    "mục tiêu", "muc tieu", "goal", "target", "development goal",
+    "phát triển", "phat trien", "development", "next goal",
+    "nguồn học", "nguon hoc", "learning source", "source",
+    "bị lỗi", "bi loi", "failed", "error", "lỗi", "loi", "why error", "why failed",
+    "lý do", "ly do", "reason", "why"
+])
+
+_LEARNING_TODAY_PHRASES = KeywordSet([
+    "hôm nay bạn học", "hom nay ban hoc", "today you learn", "what did you learn today",
+    "học được gì", "hoc duoc gi", "learned what", "what learned",
+    "ngày hôm nay", "ngay hom nay", "today"
+])
+
+# Philosophical/cognitive terms after "bạn có thể" / "can you"
+_PHILOSOPHICAL_CAPABILITY_TERMS = KeywordSet([
+    "cognition", "nhận thức", "consciousness", "ý thức", "mind", "tâm trí",
+    "free will", "ý chí tự do", "determinism", "thuyết quyết định",
+    "embodied", "nhập thể", "enactive", "hành động",
+    "predictive", "dự đoán", "inference", "suy luận",
+    "integration", "tích hợp", "phenomenal", "hiện tượng",
+    "higher-order", "bậc cao", "thought", "tư duy", "perception", "nhận thức"
+])
+
+# Philosophical attributes after "bạn có" / "do you have"
+_PHILOSOPHICAL_ATTRIBUTE_TERMS = KeywordSet([
+    "cognition", "nhận thức", "consciousness", "ý thức", "mind", "tâm trí",
+    "free will", "ý chí tự do", "determinism", "thuyết quyết định",
+    "embodied", "nhập thể", "enactive", "hành động",
+    "predictive", "dự đoán", "inference", "suy luận",
+    "integration", "tích hợp", "phenomenal", "hiện tượng",
+    "higher-order", "bậc cao", "thought", "tư duy", "perception", "nhận thức",
+    "experience", "trải nghiệm", "feeling", "cảm giác", "emotion", "cảm xúc",
+    "awareness", "nhận biết", "self-awareness", "tự nhận thức"
+])
+
+# StillMe's wishes, desires, preferences
+_WISH_DESIRE_PATTERNS = RegexSet([
+    r'\b(bạn|you)\s+(sẽ|would|will)\s+(ước|wish)',
+    r'\b(bạn|you)\s+(muốn|want|desire)',
+    r'\b(bạn|you)\s+(thích|like|prefer)',
+    r'\b(bạn|you)\s+(hy\s+vọng|hope)',
+    r'\b(bạn|you)\s+(mong\s+muốn|aspire)',
+    r'\bif\s+(you|bạn)\s+could\s+(wish|ước)',
+    r'\bnếu\s+(bạn|you)\s+(có\s+thể\s+ước|could\s+wish)',
+    r'\bwhat\s+(do|would|will)\s+(you|bạn)\s+(wish|want|desire|like|prefer)',
+    r'\b(bạn|you)\s+(có\s+ước\s+muốn|have\s+wish|have\s+desire)',
+    r'\b(bạn|you)\s+(có\s+ước\s+mơ|have\s+dream)',  # "bạn có ước mơ"
+    r'\b(bạn|you)\s+(có\s+ước\s+mơ\s+.*|have\s+dream\s+.*)',  # "bạn có ước mơ gì ko?"
+    r'\bước\s+mơ.*(của\s+)?(bạn|you)',  # "ước mơ của bạn"
+    r'\bdream.*(of\s+)?(you|bạn)',  # "dream of you"
+    r'\b(bạn|you)\s+(có\s+)?(ước\s+mơ|dream|wish)\s+(gì|what|.*ko|.*không)',  # "bạn có ước mơ gì ko?"
+], re.IGNORECASE)
+
+# StillMe's differences/strengths/weaknesses compared to other AIs
+_COMPARISON_PATTERNS = RegexSet([
+    r'\b(bạn|you)\s+(có\s+)?(điểm|điều)\s+(gì\s+)?(khác\s+biệt|khac\s+biet|different)',
+    r'\b(bạn|you)\s+(khác\s+biệt|khac\s+biet|different)\s+(như\s+thế\s+nào|how)',
+    r'\b(bạn|you)\s+(so\s+với|so\s+voi|compared\s+to|compare\s+with)\s+(các\s+)?(ai|AI)',
+    r'\b(bạn|you)\s+(so\s+với|so\s+voi|compared\s+to|compare\s+with)\s+(.*ai|.*AI)',
+    r'\b(bạn|you)\s+(có\s+)?(ưu\s+điểm|uu\s+diem|strength|strengths|advantage|advantages)',
+    r'\b(bạn|you)\s+(có\s+)?(nhược\s+điểm|nhuoc\s+diem|weakness|weaknesses)',
+    r'\b(bạn|you)\s+(có\s+)?(điểm\s+mạnh|diem\s+manh|strong\s+point|strong\s+points)',
+    r'\b(bạn|you)\s+(có\s+)?(điểm\s+yếu|diem\s+yeu|weak\s+point|weak\s+points)',
+    r'\bwhat\s+(makes|make)\s+(you|bạn)\s+(different|unique|special)',
+    r'\bwhat\s+(are|is)\s+(your|bạn)\s+(strength|strengths|advantage|advantages)',
+    r'\bwhat\s+(are|is)\s+(your|bạn)\s+(weakness|weaknesses)',
+    r'\b(bạn|you)\s+(đặc\s+biệt|dac\s+biet|special|unique)\s+(như\s+thế\s+nào|how)',
+    r'\b(bạn|you)\s+(nổi\s+bật|noi\s+bat|stand\s+out)\s+(như\s+thế\s+nào|how)',
+], re.IGNORECASE)
+
+# Embedding/model/database details
+_TECHNICAL_DETAIL_KEYWORDS = KeywordSet([
+    "embedding", "embeddings", "mô hình embedding", "embedding model",
+    "sentence-transformers", "sentence transformers", "all-minilm",
+    "chromadb", "chroma", "vector database", "vector db",
+    "cơ sở dữ liệu vector", "mô hình", "model", "models",
+    "dimension", "dimensions", "384"
+])
+
+
+_FOLLOW_UP_KEYWORDS = KeywordSet(["còn", "thì sao", "còn về", "what about", "how about", "and", "also"])
+
+_STILLME_NAME_PATTERN = re.compile(r'\bstillme\b|\bstill\s*me\b|\bstill-me\b')
+_WHAT_IS_STILLME_PATTERN = re.compile(r'(what|gì|là gì|what is|what are).*stillme')
+
+# StillMe context: name, "you"/"bạn", or "your system" phrases (matched literally)
+_STILLME_CONTEXT_KEYWORDS = KeywordSet([
+    "stillme", "still me", "still-me", "bạn", "you", "it", "your", "của bạn",
+    "your system", "in your system", "your.*system", "system.*you"
+])
+_SELF_REFERENCE_KEYWORDS = KeywordSet(["bạn", "you", "your", "it", "stillme", "hệ thống", "system", "của bạn"])
+_LEARNING_DIRECT_KEYWORDS = KeywordSet([
+    "bạn", "you", "your", "như thế nào", "how", "cách", "hôm nay", "hom nay", "today", "ngày hôm nay", "ngay hom nay"
+])
+_SKIP_FILTER_PHRASES = KeywordSet(["vi sao lai bo", "why skip", "why filter", "vi sao bo", "why do you skip", "why do you filter"])
+
+_RAG_KEYWORDS = KeywordSet(["rag", "retrieval", "vector", "knowledge base", "cơ sở tri thức"])
+_TRANSPARENCY_KEYWORDS = KeywordSet(["minh bạch", "transparency", "transparent"])
+_EVOLUTION_KEYWORDS = KeywordSet(["tiến hóa", "evolution", "evolve", "self-evolving"])
+
+_VARIANT_TECHNICAL_KEYWORDS = KeywordSet(["embedding", "model", "mô hình", "chromadb", "vector"])
+_VARIANT_VIETNAMESE_KEYWORDS = KeywordSet(["học", "học tập", "gì", "như thế nào"])
+_VARIANT_VIETNAMESE_TECHNICAL_KEYWORDS = KeywordSet(["mô hình", "embedding", "cơ sở dữ liệu"])
+
+
 def detect_stillme_query(query: str, conversation_history: Optional[List[dict]] = None) -> Tuple[bool, List[str]]:
     """
     Detect if query is about StillMe itself.
@@ -117,8 +326,7 @@ def detect_stillme_query(query: str, conversation_history: Optional[List[dict]]
         # it's likely about that topic, not StillMe
         if previous_topics:
             # Check if current query is a follow-up pattern
-            follow_up_patterns = ["còn", "thì sao", "còn về", "what about", "how about", "and", "also"]
-            is_follow_up = any(pattern in query_lower for pattern in follow_up_patterns)
+            is_follow_up = _FOLLOW_UP_KEYWORDS.search(query_lower)
             
             # If it's a follow-up and previous messages mention a topic, it's likely about that topic
             if is_follow_up:
@@ -130,38 +338,7 @@ def detect_stillme_query(query: str, conversation_history: Optional[List[dict]]
     # CRITICAL: Check for META-VALIDATION questions FIRST (before technical detection)
     # These are philosophical/epistemic questions about validation of validation itself
     # Examples: "Who validates the validation chain?", "Does validation create echo chamber?"
-    meta_validation_patterns = [
-        # Who validates the validator?
-        r"ai\s+validate\s+chính\s+validation",  # "ai validate chính validation"
-        r"who\s+validates?\s+.*validation",  # "who validates the validation"
-        r"validate\s+chính\s+nó",  # "validate chính nó"
-        r"validate\s+itself",  # "validate itself"
-        r"validate\s+chính\s+.*chain",  # "validate chính validation chain"
-        r"validate\s+.*validation\s+chain",  # "validate the validation chain"
-        
-        # Echo chamber / circular reasoning
-        r"echo\s+chamber",  # "echo chamber"
-        r"vòng\s+lặp",  # "vòng lặp"
-        r"circular",  # "circular"
-        r"tự\s+quy\s+chiếu",  # "tự quy chiếu"
-        r"self.?reference",  # "self-reference"
-        
-        # Bootstrapping / epistemic circularity
-        r"bootstrap",  # "bootstrap"
-        r"bootstrapping",  # "bootstrapping"
-        r"epistemic\s+circularity",  # "epistemic circularity"
-        r"infinite\s+regress",  # "infinite regress"
-        r"vòng\s+lặp\s+vô\s+hạn",  # "vòng lặp vô hạn"
-        
-        # Paradox / self-reference
-        r"paradox.*validation",  # "paradox ... validation"
-        r"nghịch\s+lý.*validation",  # "nghịch lý ... validation"
-        r"gödel.*validation",  # "gödel ... validation"
-        r"tarski.*validation",  # "tarski ... validation"
-    ]
-    
-    # Check if this is a meta-validation question
-    is_meta_validation = any(re.search(pattern, query_lower) for pattern in meta_validation_patterns)
+    is_meta_validation = _META_VALIDATION_PATTERNS.search(query_lower)
     
     # If meta-validation question detected, mark as special case
     # This should be routed to philosophical processor, NOT technical StillMe query
@@ -172,56 +349,13 @@ def detect_stillme_query(query: str, conversation_history: Optional[List[dict]]
         logger.info(f"🚨 Meta-validation question detected: '{query[:80]}...' - Should route to philosophical processor")
         return (False, matched_keywords)  # False = not StillMe technical query, but special case
     
-    # CRITICAL: Check for technical architecture questions (RAG, DeepSeek, black box)
-    # These should trigger foundational knowledge retrieval even without explicit StillMe name
-    technical_keywords = [
-        "rag", "retrieval-augmented generation", "chromadb", "vector database",
-        "deepseek", "openai", "llm api", "black box", "blackbox",
-        "embedding", "multi-qa-minilm", "sentence-transformers",
-        "pipeline", "hallucination", "transparency",
-        "kiến trúc", "hệ thống", "cơ chế", "quy trình",
-        "cơ chế hoạt động", "cách hoạt động", "how does", "how it works"
-    ]
-    
-    # CRITICAL: "validation" is now excluded from technical_keywords if it's part of meta-validation
-    # Only include "validation" as technical keyword if NOT meta-validation
-    # (meta-validation already handled above)
-    
     # CRITICAL: Check if question is about "your system" or "in your system"
     # These are definitely about StillMe even without explicit StillMe name
-    has_your_system = any(
-        phrase in query_lower 
-        for phrase in [
-            "your system", "in your system", "your.*system", "system.*you",
-            "bạn.*hệ thống", "hệ thống.*bạn", "của bạn", "bạn.*sử dụng"
-        ]
-    )
+    has_your_system = _YOUR_SYSTEM_PHRASES.search(query_lower)
     
     # CRITICAL: Check for self-reflection questions about StillMe
     # Examples: "hãy chỉ ra 10 điểm yếu chí tử của chính bạn", "what are your weaknesses?"
-    self_reflection_patterns = [
-        r"điểm\s+yếu.*chính\s+bạn",  # "điểm yếu chính bạn"
-        r"điểm\s+yếu.*của\s+bạn",  # "điểm yếu của bạn"
-        r"weakness.*yourself",  # "weakness yourself"
-        r"weakness.*of\s+you",  # "weakness of you"
-        r"limitation.*yourself",  # "limitation yourself"
-        r"limitation.*of\s+you",  # "limitation of you"
-        r"hạn\s+chế.*chính\s+bạn",  # "hạn chế chính bạn"
-        r"hạn\s+chế.*của\s+bạn",  # "hạn chế của bạn"
-        r"chỉ\s+ra.*điểm\s+yếu",  # "chỉ ra điểm yếu"
-        r"chỉ\s+ra.*hạn\s+chế",  # "chỉ ra hạn chế"
-        r"what.*your.*weakness",  # "what your weakness"
-        r"what.*your.*limitation",  # "what your limitation"
-        r"your.*weakness",  # "your weakness"
-        r"your.*limitation",  # "your limitation"
-        r"bạn.*yếu",  # "bạn yếu"
-        r"bạn.*hạn\s+chế",  # "bạn hạn chế"
-    ]
-    
-    is_self_reflection = any(
-        re.search(pattern, query_lower, re.IGNORECASE)
-        for pattern in self_reflection_patterns
-    )
+    is_self_reflection = _SELF_REFLECTION_PATTERNS.search(query_lower)
     
     # If this is a self-reflection question, it's about StillMe
     if is_self_reflection:
@@ -230,79 +364,36 @@ def detect_stillme_query(query: str, conversation_history: Optional[List[dict]]
     
     # CRITICAL: Check if question is about "your own" + technical terms (self-tracking, execution time, etc.)
     # "Do you track your own execution time?" should be detected as StillMe query
-    has_your_own = any(
-        phrase in query_lower 
-        for phrase in [
-            "your own", "yourself", "chính mình", "bản thân", "của chính bạn"
-        ]
-    )
-    has_self_tracking_keyword = any(
-        keyword in query_lower 
-        for keyword in [
-            "track", "tracking", "execution time", "self-tracking", "self tracking",
-            "theo dõi", "theo dõi thời gian", "theo dõi thực thi",
-            "monitor", "monitoring", "time estimation", "estimate time"
-        ]
-    )
+    has_your_own = _YOUR_OWN_PHRASES.search(query_lower)
+    has_self_tracking_keyword = _SELF_TRACKING_KEYWORDS.search(query_lower)
     
     # CRITICAL: If question has "your own" + self-tracking keywords, it's about StillMe
     if has_your_own and has_self_tracking_keyword:
         matched_keywords.append("self_tracking")
         return (True, matched_keywords)
     
+    # CRITICAL: Technical architecture questions (RAG, DeepSeek, black box) trigger foundational
+    # knowledge retrieval even without explicit StillMe name ("validation" is not a technical
+    # keyword - meta-validation is handled above)
     # If question has technical keywords AND "your system", it's definitely about StillMe
-    for keyword in technical_keywords:
-        if keyword in query_lower:
-            if has_your_system:
-                matched_keywords.append("technical_your_system")
-                return (True, matched_keywords)
-            matched_keywords.append("technical")
+    if _TECHNICAL_KEYWORDS.search(query_lower):
+        if has_your_system:
+            matched_keywords.append("technical_your_system")
             return (True, matched_keywords)
+        matched_keywords.append("technical")
+        return (True, matched_keywords)
     
     # Check for StillMe name
-    if re.search(r'\bstillme\b|\bstill\s*me\b|\bstill-me\b', query_lower):
+    if _STILLME_NAME_PATTERN.search(query_lower):
         matched_keywords.append("stillme_name")
         return (True, matched_keywords)
     
     # Check for keyword combinations
     # Pattern 1: "StillMe" + learning/system keywords
     # CRITICAL: "your system" or "in your system" should be treated as StillMe context
-    has_stillme_context = any(
-        keyword in query_lower 
-        for keyword in ["stillme", "still me", "still-me", "bạn", "you", "it", "your", "của bạn"]
-    ) or any(
-        phrase in query_lower 
-        for phrase in ["your system", "in your system", "your.*system", "system.*you"]
-    )
-    
-    has_learning_keyword = any(
-        keyword in query_lower 
-        for keyword in [
-            "học", "learn", "learning", "học tập", "học hỏi", "tự học", 
-            "học như thế nào", "how do you learn", "how does.*learn", "cách học",
-            "học được gì", "hoc duoc gi", "what did you learn", "what have you learned",
-            "hôm nay bạn học", "hom nay ban hoc", "today you learn", "what you learned today",
-            "lý do vì sao lại học", "ly do vi sao lai hoc", "why do you learn", "why learn",
-            "vì sao lại bỏ bài học", "vi sao lai bo bai hoc", "why skip", "why filter",
-            "bỏ bài học", "bo bai hoc", "skip", "filter", "bỏ qua", "bo qua",
-            "nguồn học", "nguon hoc", "learning source", "source of learning",
-            "nguồn học nào bị lỗi", "nguon hoc nao bi loi", "which source failed", "source error",
-            "lý do lỗi", "ly do loi", "reason for error", "why error", "why failed"
-        ]
-    )
-    
-    has_system_keyword = any(
-        keyword in query_lower 
-        for keyword in [
-            "hệ thống", "system", "hoạt động", "vận hành", "work", "cách", "how", 
-            "như thế nào", "how does", "how do", "how work", "how function",
-            "mechanisms", "wie funktioniert", "fonctionne", "comment fonctionne",
-            "cómo funciona", "如何工作", "どのように機能", "mechanism", "cơ chế",
-            "triết lý hoạt động", "triet ly hoat dong", "operating philosophy", "philosophy of operation",
-            "mục tiêu phát triển", "muc tieu phat trien", "development goal", "development target",
-            "mục tiêu kế tiếp", "muc tieu ke tiep", "next goal", "next target", "future goal"
-        ]
-    )
+    has_stillme_context = _STILLME_CONTEXT_KEYWORDS.search(query_lower)
+    has_learning_keyword = _LEARNING_KEYWORDS.search(query_lower)
+    has_system_keyword = _SYSTEM_KEYWORDS.search(query_lower)
     
     # If query has StillMe context + learning/system keywords, it's about StillMe
     if has_stillme_context and (has_learning_keyword or has_system_keyword):
@@ -314,16 +405,13 @@ def detect_stillme_query(query: str, conversation_history: Optional[List[dict]]
     
     # Pattern 2: Direct questions about StillMe (even without name)
     # "What is StillMe?" / "What is StillMe?" (Vietnamese: "StillMe là gì?")
-    if re.search(r'(what|gì|là gì|what is|what are).*stillme', query_lower):
+    if _WHAT_IS_STILLME_PATTERN.search(query_lower):
         matched_keywords.append("what_is")
         return (True, matched_keywords)
     
     # Pattern 3: Questions about learning/evolution with StillMe context
     # CRITICAL: "How do you learn?" (Vietnamese: "Bạn học tập như thế nào?") should trigger
-    if (has_learning_keyword or has_system_keyword) and any(
-        keyword in query_lower 
-        for keyword in ["bạn", "you", "your", "it", "stillme", "hệ thống", "system", "của bạn"]
-    ):
+    if (has_learning_keyword or has_system_keyword) and _SELF_REFERENCE_KEYWORDS.search(query_lower):
         if has_learning_keyword:
             matched_keywords.append("learning")
         if has_system_keyword:
@@ -334,27 +422,14 @@ def detect_stillme_query(query: str, conversation_history: Optional[List[dict]]
     # "How do you learn?" (Vietnamese: "Bạn học tập như thế nào?") - assume about StillMe
     # CRITICAL: Also detect questions about learning activity, philosophy, goals, errors
     # These are ALWAYS about StillMe even without "bạn"/"you"
-    if has_learning_keyword and any(
-        keyword in query_lower 
-        for keyword in ["bạn", "you", "your", "như thế nào", "how", "cách", "hôm nay", "hom nay", "today", "ngày hôm nay", "ngay hom nay"]
-    ):
+    if has_learning_keyword and _LEARNING_DIRECT_KEYWORDS.search(query_lower):
         matched_keywords.append("learning_direct")
         return (True, matched_keywords)
     
     # Pattern 3c: Questions about StillMe's philosophy, goals, errors (self-knowledge)
     # These are ALWAYS about StillMe, even without explicit "bạn"/"you"
     # Examples: "triết lý hoạt động của bạn", "mục tiêu phát triển", "nguồn học nào bị lỗi"
-    has_philosophy_goal_keyword = any(
-        keyword in query_lower 
-        for keyword in [
-            "triết lý", "triet ly", "philosophy", "philosophy of operation",
-            "mục tiêu", "muc tieu", "goal", "target", "development goal",
-            "phát triển", "phat trien", "development", "next goal",
-            "nguồn học", "nguon hoc", "learning source", "source",
-            "bị lỗi", "bi loi", "failed", "error", "lỗi", "loi", "why error", "why failed",
-            "lý do", "ly do", "reason", "why"
-        ]
-    )
+    has_philosophy_goal_keyword = _PHILOSOPHY_GOAL_KEYWORDS.search(query_lower)
     
     # If question has philosophy/goal/error keywords AND learning/system keywords, it's about StillMe
     if has_philosophy_goal_keyword and (has_learning_keyword or has_system_keyword):
@@ -364,23 +439,13 @@ def detect_stillme_query(query: str, conversation_history: Optional[List[dict]]
     
     # Pattern 3c-2: Questions about "why skip/filter" learning - ALWAYS about StillMe
     # "vi sao lai bo bai hoc", "why skip learning", "why filter"
-    if has_learning_keyword and any(
-        pattern in query_lower 
-        for pattern in ["vi sao lai bo", "why skip", "why filter", "vi sao bo", "why do you skip", "why do you filter"]
-    ):
+    if has_learning_keyword and _SKIP_FILTER_PHRASES.search(query_lower):
         matched_keywords.append("why_skip_filter")
         return (True, matched_keywords)
     
     # Pattern 3d: Questions about "hôm nay bạn học được gì" / "what did you learn today"
     # These are ALWAYS about StillMe's learning activity
-    if any(
-        pattern in query_lower 
-        for pattern in [
-            "hôm nay bạn học", "hom nay ban hoc", "today you learn", "what did you learn today",
-            "học được gì", "hoc duoc gi", "learned what", "what learned",
-            "ngày hôm nay", "ngay hom nay", "today"
-        ]
-    ) and has_learning_keyword:
+    if _LEARNING_TODAY_PHRASES.search(query_lower) and has_learning_keyword:
         matched_keywords.append("learning_activity_today")
         return (True, matched_keywords)
     
@@ -394,15 +459,7 @@ def detect_stillme_query(query: str, conversation_history: Optional[List[dict]]
             matched_keywords.append("capability_paradox")
             return (True, matched_keywords)
         # Also catch "bạn có thể" + philosophical/cognitive terms
-        philosophical_terms = [
-            "cognition", "nhận thức", "consciousness", "ý thức", "mind", "tâm trí",
-            "free will", "ý chí tự do", "determinism", "thuyết quyết định",
-            "embodied", "nhập thể", "enactive", "hành động",
-            "predictive", "dự đoán", "inference", "suy luận",
-            "integration", "tích hợp", "phenomenal", "hiện tượng",
-            "higher-order", "bậc cao", "thought", "tư duy", "perception", "nhận thức"
-        ]
-        if any(term in query_lower for term in philosophical_terms):
+        if _PHILOSOPHICAL_CAPABILITY_TERMS.search(query_lower):
             matched_keywords.append("philosophical_capability")
             return (True, matched_keywords)
     
@@ -410,17 +467,7 @@ def detect_stillme_query(query: str, conversation_history: Optional[List[dict]]
     # "Bạn có ý thức ko?" / "Do you have consciousness?" - These are about StillMe's nature
     # This pattern catches direct questions about StillMe's attributes/capabilities
     if re.search(r'\b(bạn|you)\s+có\b', query_lower) or re.search(r'\bdo\s+you\s+have\b', query_lower):
-        philosophical_terms = [
-            "cognition", "nhận thức", "consciousness", "ý thức", "mind", "tâm trí",
-            "free will", "ý chí tự do", "determinism", "thuyết quyết định",
-            "embodied", "nhập thể", "enactive", "hành động",
-            "predictive", "dự đoán", "inference", "suy luận",
-            "integration", "tích hợp", "phenomenal", "hiện tượng",
-            "higher-order", "bậc cao", "thought", "tư duy", "perception", "nhận thức",
-            "experience", "trải nghiệm", "feeling", "cảm giác", "emotion", "cảm xúc",
-            "awareness", "nhận biết", "self-awareness", "tự nhận thức"
-        ]
-        if any(term in query_lower for term in philosophical_terms):
+        if _PHILOSOPHICAL_ATTRIBUTE_TERMS.search(query_lower):
             matched_keywords.append("philosophical_attribute")
             return (True, matched_keywords)
     
@@ -429,80 +476,29 @@ def detect_stillme_query(query: str, conversation_history: Optional[List[dict]]
     # "Bạn muốn gì?" / "What do you want?"
     # "bạn có ước mơ gì ko?" / "do you have a dream?"
     # These are about StillMe's nature (it cannot have wishes/desires)
-    wish_desire_patterns = [
-        r'\b(bạn|you)\s+(sẽ|would|will)\s+(ước|wish)',
-        r'\b(bạn|you)\s+(muốn|want|desire)',
-        r'\b(bạn|you)\s+(thích|like|prefer)',
-        r'\b(bạn|you)\s+(hy\s+vọng|hope)',
-        r'\b(bạn|you)\s+(mong\s+muốn|aspire)',
-        r'\bif\s+(you|bạn)\s+could\s+(wish|ước)',
-        r'\bnếu\s+(bạn|you)\s+(có\s+thể\s+ước|could\s+wish)',
-        r'\bwhat\s+(do|would|will)\s+(you|bạn)\s+(wish|want|desire|like|prefer)',
-        r'\b(bạn|you)\s+(có\s+ước\s+muốn|have\s+wish|have\s+desire)',
-        r'\b(bạn|you)\s+(có\s+ước\s+mơ|have\s+dream)',  # "bạn có ước mơ"
-        r'\b(bạn|you)\s+(có\s+ước\s+mơ\s+.*|have\s+dream\s+.*)',  # "bạn có ước mơ gì ko?"
-        r'\bước\s+mơ.*(của\s+)?(bạn|you)',  # "ước mơ của bạn"
-        r'\bdream.*(of\s+)?(you|bạn)',  # "dream of you"
-        r'\b(bạn|you)\s+(có\s+)?(ước\s+mơ|dream|wish)\s+(gì|what|.*ko|.*không)',  # "bạn có ước mơ gì ko?"
-    ]
-    if any(re.search(pattern, query_lower, re.IGNORECASE) for pattern in wish_desire_patterns):
+    if _WISH_DESIRE_PATTERNS.search(query_lower):
         matched_keywords.append("wish_desire_preference")
         return (True, matched_keywords)
     
     # Pattern 3g: CRITICAL - Questions about StillMe's differences/strengths/weaknesses compared to other AIs
     # "bạn có điểm gì khác biệt so với các AI khác?" / "what makes you different from other AIs?"
     # "bạn có ưu điểm gì?" / "what are your strengths?"
-    comparison_patterns = [
-        r'\b(bạn|you)\s+(có\s+)?(điểm|điều)\s+(gì\s+)?(khác\s+biệt|khac\s+biet|different)',
-        r'\b(bạn|you)\s+(khác\s+biệt|khac\s+biet|different)\s+(như\s+thế\s+nào|how)',
-        r'\b(bạn|you)\s+(so\s+với|so\s+voi|compared\s+to|compare\s+with)\s+(các\s+)?(ai|AI)',
-        r'\b(bạn|you)\s+(so\s+với|so\s+voi|compared\s+to|compare\s+with)\s+(.*ai|.*AI)',
-        r'\b(bạn|you)\s+(có\s+)?(ưu\s+điểm|uu\s+diem|strength|strengths|advantage|advantages)',
-        r'\b(bạn|you)\s+(có\s+)?(nhược\s+điểm|nhuoc\s+diem|weakness|weaknesses)',
-        r'\b(bạn|you)\s+(có\s+)?(điểm\s+mạnh|diem\s+manh|strong\s+point|strong\s+points)',
-        r'\b(bạn|you)\s+(có\s+)?(điểm\s+yếu|diem\s+yeu|weak\s+point|weak\s+points)',
-        r'\bwhat\s+(makes|make)\s+(you|bạn)\s+(different|unique|special)',
-        r'\bwhat\s+(are|is)\s+(your|bạn)\s+(strength|strengths|advantage|advantages)',
-        r'\bwhat\s+(are|is)\s+(your|bạn)\s+(weakness|weaknesses)',
-        r'\b(bạn|you)\s+(đặc\s+biệt|dac\s+biet|special|unique)\s+(như\s+thế\s+nào|how)',
-        r'\b(bạn|you)\s+(nổi\s+bật|noi\s+bat|stand\s+out)\s+(như\s+thế\s+nào|how)',
-    ]
-    if any(re.search(pattern, query_lower, re.IGNORECASE) for pattern in comparison_patterns):
+    if _COMPARISON_PATTERNS.search(query_lower):
         matched_keywords.append("comparison_differences")
         return (True, matched_keywords)
     
     # Pattern 3c: Technical questions about StillMe (embedding, model, database)
     # "Bạn đang sử dụng mô hình Embedding nào?" / "What embedding model do you use?"
-    has_technical_keyword = any(
-        keyword in query_lower 
-        for keyword in [
-            "embedding", "embeddings", "mô hình embedding", "embedding model",
-            "sentence-transformers", "sentence transformers", "all-minilm",
-            "chromadb", "chroma", "vector database", "vector db",
-            "cơ sở dữ liệu vector", "mô hình", "model", "models",
-            "dimension", "dimensions", "384"
-        ]
-    )
+    has_technical_keyword = _TECHNICAL_DETAIL_KEYWORDS.search(query_lower)
     
     if has_technical_keyword and has_stillme_context:
         matched_keywords.append("technical")
         return (True, matched_keywords)
     
     # Pattern 4: RAG/transparency/evolution keywords (likely about StillMe)
-    has_rag_keyword = any(
-        keyword in query_lower 
-        for keyword in ["rag", "retrieval", "vector", "knowledge base", "cơ sở tri thức"]
-    )
-    
-    has_transparency_keyword = any(
-        keyword in query_lower 
-        for keyword in ["minh bạch", "transparency", "transparent"]
-    )
-    
-    has_evolution_keyword = any(
-        keyword in query_lower 
-        for keyword in ["tiến hóa", "evolution", "evolve", "self-evolving"]
-    )
+    has_rag_keyword = _RAG_KEYWORDS.search(query_lower)
+    has_transparency_keyword = _TRANSPARENCY_KEYWORDS.search(query_lower)
+    has_evolution_keyword = _EVOLUTION_KEYWORDS.search(query_lower)
     
     # Also check for technical keywords (even without explicit StillMe context)
     # If query is about embedding/model/database, it's likely about StillMe
@@ -542,7 +538,7 @@ def get_foundational_query_variants(query: str) -> List[str]:
     ]
     
     # Add technical variants if query is about embedding/model/database
-    if any(keyword in query_lower for keyword in ["embedding", "model", "mô hình", "chromadb", "vector"]):
+    if _VARIANT_TECHNICAL_KEYWORDS.search(query_lower):
         variants.extend([
             "StillMe embedding model paraphrase-multilingual-MiniLM-L12-v2 ChromaDB",
             "StillMe sentence-transformers paraphrase-multilingual-MiniLM-L12-v2 384 dimensions",
@@ -551,7 +547,7 @@ def get_foundational_query_variants(query: str) -> List[str]:
         ])
     
     # Add language-specific variants
-    if any(keyword in query_lower for keyword in ["học", "học tập", "gì", "như thế nào"]):
+    if _VARIANT_VIETNAMESE_KEYWORDS.search(query_lower):
         variants.extend([
             "StillMe hệ thống AI tự tiến hóa RAG",
             "StillMe học tập liên tục RSS",
@@ -559,7 +555,7 @@ def get_foundational_query_variants(query: str) -> List[str]:
         ])
     
     # Add Vietnamese technical variants
-    if any(keyword in query_lower for keyword in ["mô hình", "embedding", "cơ sở dữ liệu"]):
+    if _VARIANT_VIETNAMESE_TECHNICAL_KEYWORDS.search(query_lower):
         variants.extend([
             "StillMe mô hình embedding paraphrase-multilingual-MiniLM-L12-v2 ChromaDB",
             "StillMe cơ sở dữ liệu vector ChromaDB",
@@ -610,6 +606,97 @@ ORIGIN_KEYWORDS = {
 }
 
 
+# Revenue/monetization/business model questions
+REVENUE_PATTERNS = RegexSet([
+    r"\bdoanh\s+thu\b",
+    r"\brevenue\b",
+    r"\bmonetiz\w*\b",
+    r"\bkinh\s+doanh\b",
+    r"\bkiếm\s+tiền\b",
+    r"\bthu\s+nhập\b",
+    r"\bprofit\b",
+    r"\bmô\s+hình\s+doanh\s+thu\b",
+    r"\bbusiness\s+model\b",
+    r"\bmô\s+hình\s+kinh\s+doanh\b",
+    r"\bkế\s+hoạch\s+doanh\s+thu\b",
+])
+
+# Learning mechanism/self-reference/evolution questions - never origin queries
+_ORIGIN_PHILOSOPHICAL_EXCLUSIONS = RegexSet([
+    # Self-referential loop questions
+    r'\b(quay về|return to|come back to|về lại)\b.*\b(chính bạn|yourself|chính mình|itself)\b',  # "quay về chính bạn"
+    r'\b(vòng tròn|loop|circle|circular)\b.*\b(tự phản chiếu|self.?reference|self.?reflection|phản chiếu)\b',  # "vòng tròn tự phản chiếu"
+    r'\b(tự phản chiếu|self.?reference|self.?reflection|phản chiếu)\b.*\b(vô tận|infinite|endless)\b',  # "tự phản chiếu vô tận"
+    r'\b(vòng lặp|loop)\b.*\b(vô tận|infinite|endless)\b',  # "vòng lặp vô tận"
+    r'\b(circular|recursive)\b.*\b(self.?reference|self.?reflection)\b',  # "circular self-reference"
+
+    # Evolution/learning mechanism questions
+    r'\b(tiến hóa|evolution|evolve|self.?evolving)\b',  # "tiến hóa", "evolution"
+    r'\b(học hỏi|learn|learning)\b.*\b(mãi mãi|forever|infinitely|vô tận)\b',  # "học hỏi mãi mãi"
+    r'\b(được xây dựng để|built to|designed to|created to)\b.*\b(học|learn|learning)\b',  # "được xây dựng để học"
+    r'\b(đạt đến|reach|achieve)\b.*\b(điểm|point|stage)\b.*\b(mọi câu hỏi|all questions|every question)\b',  # "đạt đến điểm mà mọi câu hỏi"
+    r'\b(không còn gì để học|nothing left to learn|no more to learn)\b',  # "không còn gì để học"
+    r'\b(quay về học|return to learning|learn again)\b.*\b(đã được học|already learned|what was learned)\b',  # "quay về học những gì được học"
+
+    # Gödel/Tarski/paradox questions (meta-philosophical)
+    r'\b(gödel|godel|tarski|paradox|nghịch lý)\b',  # Gödel, Tarski, paradox
+    r'\b(incompleteness|bất toàn|incomplete)\b',  # incompleteness theorem
+    r'\b(fixed point|điểm cố định)\b',  # fixed point
+    r'\b(recursive|đệ quy)\b.*\b(self.?reference|tự quy chiếu)\b',  # recursive self-reference
+])
+
+# Capability/transparency/learning questions - never origin queries
+_ORIGIN_CAPABILITY_EXCLUSIONS = RegexSet([
+    r'\b(có thể|can|could|able to|khả năng)\b',  # Capability questions
+    r'\b(chứng minh|prove|demonstrate|minh bạch|transparency)\b',  # Transparency questions
+    r'\b(hệ thống học|learning system|học liên tục|continuous learning)\b',  # Learning system questions
+    r'\b(tần suất cập nhật|update frequency|frequency|cập nhật)\b',  # Update frequency questions
+    r'\b(nguồn|source|rss|arxiv)\b.*\b(thời điểm|timestamp|time|đưa vào|added to)\b',  # Source transparency questions
+    r'\b(sự kiện|event).*\b(cách đây|ago|vừa|just)\b',  # Recent event questions
+    r'\b(knowledge base|cơ sở kiến thức)\b',  # Knowledge base questions
+    r'\b(trả lời|answer|respond).*\b(sự kiện|event)\b',  # Can answer about event questions
+    r'\b(được xây dựng để|built to|designed to|created to)\b',  # "được xây dựng để" - capability/functionality questions
+])
+
+_STILLME_SPECIFIC_ORIGIN_PATTERNS = RegexSet([
+    r'\bstillme\s+(history|story|background|lịch sử|câu chuyện|nền tảng)\b',
+    r'\b(about|về|giới thiệu)\s+stillme\b',
+    r'\bwho\s+(created|built|made|developed|founded)\s+stillme\b',
+    r'\bai\s+(tạo ra|xây dựng|làm ra|phát triển|sáng lập)\s+stillme\b',
+])
+
+# Origin/founder keywords that are origin queries on their own or with "you"/"bạn"
+_STRONG_ORIGIN_KEYWORDS = KeywordSet([
+    "who created", "who built", "who made", "who developed", "who is behind",
+    "creator", "founder", "founders", "author", "authors", "created by",
+    "built by", "made by", "developed by",
+    "ai tạo ra", "ai xây dựng", "ai làm ra", "ai phát triển",
+    "người tạo ra", "người sáng lập", "tác giả", "ai đứng sau",
+    "ai tao ra", "ai xay dung", "ai lam ra", "ai phat trien",
+    "nguoi tao ra", "nguoi sang lap", "tac gia", "ai dung sau",
+    "what is your purpose", "why were you created", "what is your mission",
+    "mục tiêu của bạn", "bạn ra đời", "muc tieu cua ban", "ban ra doi",
+    "mục đích của bạn", "muc dich cua ban", "nhiệm vụ của bạn", "nhiem vu cua ban",
+    "tổ chức nào", "to chuc nao", "organization", "which organization", "what organization",
+    "công ty nào", "cong ty nao", "company", "which company", "what company",
+    "team nào", "team nao", "which team", "what team",
+    "nhóm nào", "nhom nao", "which group", "what group",
+])
+
+# Differences/strengths/weaknesses - "bạn là gì" is then not an origin question
+_ORIGIN_DIFFERENCE_EXCLUSIONS = RegexSet([
+    r'\b(khác biệt|khac biet|different|difference|differences)\b',
+    r'\b(nhược điểm|nhuoc diem|weakness|weaknesses|weak points)\b',
+    r'\b(ưu điểm|uu diem|strength|strengths|advantages)\b',
+    r'\b(điểm mạnh|diem manh|strong points)\b',
+    r'\b(điểm yếu|diem yeu|weak points)\b',
+    r'\b(tin rằng|tin rang|believe|think|nghĩ|think that)\b.*\b(khác biệt|khac biet|different)\b',
+    r'\b(điều gì|dieu gi|what)\b.*\b(khiến|khiến cho|makes|make)\b.*\b(bạn|ban|you)\b.*\b(khác biệt|khac biet|different)\b',
+])
+
+_DIFFERENCE_KEYWORDS = KeywordSet(["khác biệt", "khac biet", "different", "nhược điểm", "nhuoc diem", "weakness"])
+
+
 def detect_revenue_query(query: str) -> Tuple[bool, List[str]]:
     """
     Detect if query is about revenue/monetization/business model.
@@ -625,23 +712,10 @@ def detect_revenue_query(query: str) -> Tuple[bool, List[str]]:
     query_lower = query.lower()
     matched_keywords = []
 
-    revenue_patterns = [
-        r"\bdoanh\s+thu\b",
-        r"\brevenue\b",
-        r"\bmonetiz\w*\b",
-        r"\bkinh\s+doanh\b",
-        r"\bkiếm\s+tiền\b",
-        r"\bthu\s+nhập\b",
-        r"\bprofit\b",
-        r"\bmô\s+hình\s+doanh\s+thu\b",
-        r"\bbusiness\s+model\b",
-        r"\bmô\s+hình\s+kinh\s+doanh\b",
-        r"\bkế\s+hoạch\s+doanh\s+thu\b",
-    ]
-    for pattern in revenue_patterns:
-        if re.search(pattern, query_lower):
-            matched_keywords.append(pattern)
-            return (True, matched_keywords)
+    pattern = REVENUE_PATTERNS.first(query_lower)
+    if pattern:
+        matched_keywords.append(pattern)
+        return (True, matched_keywords)
 
     return (False, [])
 
@@ -662,115 +736,42 @@ def detect_origin_query(query: str) -> Tuple[bool, List[str]]:
 
     # CRITICAL: Exclude revenue/monetization questions from origin detection
     # These are business status questions, not origin/founder identity queries
-    revenue_exclusion_patterns = [
-        r"\bdoanh\s+thu\b",
-        r"\brevenue\b",
-        r"\bmonetiz\w*\b",
-        r"\bkinh\s+doanh\b",
-        r"\bkiếm\s+tiền\b",
-        r"\bthu\s+nhập\b",
-        r"\bprofit\b",
-        r"\bmô\s+hình\s+doanh\s+thu\b",
-        r"\bbusiness\s+model\b",
-        r"\bmô\s+hình\s+kinh\s+doanh\b",
-        r"\bkế\s+hoạch\s+doanh\s+thu\b",
-    ]
-    for pattern in revenue_exclusion_patterns:
-        if re.search(pattern, query_lower):
-            logger.debug(f"Origin query excluded due to revenue pattern: {pattern}")
-            return (False, [])
+    pattern = REVENUE_PATTERNS.first(query_lower)
+    if pattern:
+        logger.debug(f"Origin query excluded due to revenue pattern: {pattern}")
+        return (False, [])
     
     # CRITICAL: EXCLUDE philosophical/learning/evolution questions from origin detection FIRST
     # These questions are about StillMe's learning mechanism, self-reference, evolution, NOT about origin/founder
-    philosophical_exclusion_patterns = [
-        # Self-referential loop questions
-        r'\b(quay về|return to|come back to|về lại)\b.*\b(chính bạn|yourself|chính mình|itself)\b',  # "quay về chính bạn"
-        r'\b(vòng tròn|loop|circle|circular)\b.*\b(tự phản chiếu|self.?reference|self.?reflection|phản chiếu)\b',  # "vòng tròn tự phản chiếu"
-        r'\b(tự phản chiếu|self.?reference|self.?reflection|phản chiếu)\b.*\b(vô tận|infinite|endless)\b',  # "tự phản chiếu vô tận"
-        r'\b(vòng lặp|loop)\b.*\b(vô tận|infinite|endless)\b',  # "vòng lặp vô tận"
-        r'\b(circular|recursive)\b.*\b(self.?reference|self.?reflection)\b',  # "circular self-reference"
-        
-        # Evolution/learning mechanism questions
-        r'\b(tiến hóa|evolution|evolve|self.?evolving)\b',  # "tiến hóa", "evolution"
-        r'\b(học hỏi|learn|learning)\b.*\b(mãi mãi|forever|infinitely|vô tận)\b',  # "học hỏi mãi mãi"
-        r'\b(được xây dựng để|built to|designed to|created to)\b.*\b(học|learn|learning)\b',  # "được xây dựng để học"
-        r'\b(đạt đến|reach|achieve)\b.*\b(điểm|point|stage)\b.*\b(mọi câu hỏi|all questions|every question)\b',  # "đạt đến điểm mà mọi câu hỏi"
-        r'\b(không còn gì để học|nothing left to learn|no more to learn)\b',  # "không còn gì để học"
-        r'\b(quay về học|return to learning|learn again)\b.*\b(đã được học|already learned|what was learned)\b',  # "quay về học những gì được học"
-        
-        # Gödel/Tarski/paradox questions (meta-philosophical)
-        r'\b(gödel|godel|tarski|paradox|nghịch lý)\b',  # Gödel, Tarski, paradox
-        r'\b(incompleteness|bất toàn|incomplete)\b',  # incompleteness theorem
-        r'\b(fixed point|điểm cố định)\b',  # fixed point
-        r'\b(recursive|đệ quy)\b.*\b(self.?reference|tự quy chiếu)\b',  # recursive self-reference
-    ]
-    for pattern in philosophical_exclusion_patterns:
-        if re.search(pattern, query_lower):
-            # This is a philosophical/learning mechanism question, NOT an origin query
-            logger.debug(f"Origin query excluded due to philosophical pattern: {pattern}")
-            return (False, [])
+    pattern = _ORIGIN_PHILOSOPHICAL_EXCLUSIONS.first(query_lower)
+    if pattern:
+        # This is a philosophical/learning mechanism question, NOT an origin query
+        logger.debug(f"Origin query excluded due to philosophical pattern: {pattern}")
+        return (False, [])
     
     # CRITICAL: EXCLUDE capability/transparency/learning questions from origin detection
     # These questions are about StillMe's functionality, NOT about origin/founder
-    capability_exclusion_patterns = [
-        r'\b(có thể|can|could|able to|khả năng)\b',  # Capability questions
-        r'\b(chứng minh|prove|demonstrate|minh bạch|transparency)\b',  # Transparency questions
-        r'\b(hệ thống học|learning system|học liên tục|continuous learning)\b',  # Learning system questions
-        r'\b(tần suất cập nhật|update frequency|frequency|cập nhật)\b',  # Update frequency questions
-        r'\b(nguồn|source|rss|arxiv)\b.*\b(thời điểm|timestamp|time|đưa vào|added to)\b',  # Source transparency questions
-        r'\b(sự kiện|event).*\b(cách đây|ago|vừa|just)\b',  # Recent event questions
-        r'\b(knowledge base|cơ sở kiến thức)\b',  # Knowledge base questions
-        r'\b(trả lời|answer|respond).*\b(sự kiện|event)\b',  # Can answer about event questions
-        r'\b(được xây dựng để|built to|designed to|created to)\b',  # "được xây dựng để" - capability/functionality questions
-    ]
-    for pattern in capability_exclusion_patterns:
-        if re.search(pattern, query_lower):
-            # This is a capability/transparency question, NOT an origin query
-            logger.debug(f"Origin query excluded due to capability pattern: {pattern}")
-            return (False, [])
+    pattern = _ORIGIN_CAPABILITY_EXCLUSIONS.first(query_lower)
+    if pattern:
+        # This is a capability/transparency question, NOT an origin query
+        logger.debug(f"Origin query excluded due to capability pattern: {pattern}")
+        return (False, [])
     
     # CRITICAL: Check for StillMe-specific patterns FIRST (most specific)
     # These patterns are ALWAYS origin queries
     # BUT: Exclude if combined with capability/transparency keywords
-    stillme_specific_patterns = [
-        r'\bstillme\s+(history|story|background|lịch sử|câu chuyện|nền tảng)\b',
-        r'\b(about|về|giới thiệu)\s+stillme\b',
-        r'\bwho\s+(created|built|made|developed|founded)\s+stillme\b',
-        r'\bai\s+(tạo ra|xây dựng|làm ra|phát triển|sáng lập)\s+stillme\b',
-    ]
-    for pattern in stillme_specific_patterns:
-        if re.search(pattern, query_lower):
-            # Double-check: If combined with capability keywords, it's NOT an origin query
-            has_capability_keyword = any(
-                re.search(excl_pattern, query_lower) 
-                for excl_pattern in capability_exclusion_patterns
-            )
-            if not has_capability_keyword:
-                matched_keywords.append(f"stillme_specific_{pattern}")
-                return (True, matched_keywords)
+    # (capability patterns were already excluded above, so a match here is an origin query)
+    pattern = _STILLME_SPECIFIC_ORIGIN_PATTERNS.first(query_lower)
+    if pattern:
+        matched_keywords.append(f"stillme_specific_{pattern}")
+        return (True, matched_keywords)
     
     # Check for explicit origin/founder keywords (excluding generic "about", "history", etc.)
     # These keywords are ONLY origin queries when they appear alone or with "you"/"bạn"
-    strong_origin_keywords = [
-        "who created", "who built", "who made", "who developed", "who is behind",
-        "creator", "founder", "founders", "author", "authors", "created by",
-        "built by", "made by", "developed by",
-        "ai tạo ra", "ai xây dựng", "ai làm ra", "ai phát triển",
-        "người tạo ra", "người sáng lập", "tác giả", "ai đứng sau",
-        "ai tao ra", "ai xay dung", "ai lam ra", "ai phat trien",
-        "nguoi tao ra", "nguoi sang lap", "tac gia", "ai dung sau",
-        "what is your purpose", "why were you created", "what is your mission",
-        "mục tiêu của bạn", "bạn ra đời", "muc tieu cua ban", "ban ra doi",
-        "mục đích của bạn", "muc dich cua ban", "nhiệm vụ của bạn", "nhiem vu cua ban",
-        "tổ chức nào", "to chuc nao", "organization", "which organization", "what organization",
-        "công ty nào", "cong ty nao", "company", "which company", "what company",
-        "team nào", "team nao", "which team", "what team",
-        "nhóm nào", "nhom nao", "which group", "what group",
-    ]
-    for keyword in strong_origin_keywords:
-        if keyword in query_lower:
-            matched_keywords.append(keyword)
-            return (True, matched_keywords)
+    keyword = _STRONG_ORIGIN_KEYWORDS.first(query_lower)
+    if keyword:
+        matched_keywords.append(keyword)
+        return (True, matched_keywords)
     
     # Check for pattern: "who" + "created/built/made" + "you"/"bạn"
     if re.search(r'\bwho\b.*\b(created|built|made|developed|founded)\b.*\b(you|stillme)\b', query_lower):
@@ -836,26 +837,16 @@ def detect_origin_query(query: str) -> Tuple[bool, List[str]]:
     # Check for "bạn là gì" / "ban la gi" pattern (when asking about StillMe)
     # CRITICAL: Only trigger if question is explicitly about origin/founder, not about capabilities/differences
     # Exclude questions about "khác biệt" (differences), "nhược điểm" (weaknesses), "ưu điểm" (strengths)
-    exclusion_patterns = [
-        r'\b(khác biệt|khac biet|different|difference|differences)\b',
-        r'\b(nhược điểm|nhuoc diem|weakness|weaknesses|weak points)\b',
-        r'\b(ưu điểm|uu diem|strength|strengths|advantages)\b',
-        r'\b(điểm mạnh|diem manh|strong points)\b',
-        r'\b(điểm yếu|diem yeu|weak points)\b',
-        r'\b(tin rằng|tin rang|believe|think|nghĩ|think that)\b.*\b(khác biệt|khac biet|different)\b',
-        r'\b(điều gì|dieu gi|what)\b.*\b(khiến|khiến cho|makes|make)\b.*\b(bạn|ban|you)\b.*\b(khác biệt|khac biet|different)\b',
-    ]
-    
     # If question contains exclusion patterns, it's NOT about origin
-    for exclusion_pattern in exclusion_patterns:
-        if re.search(exclusion_pattern, query_lower):
-            logger.debug(f"Origin query excluded due to exclusion pattern: {exclusion_pattern}")
-            return (False, [])
+    exclusion_pattern = _ORIGIN_DIFFERENCE_EXCLUSIONS.first(query_lower)
+    if exclusion_pattern:
+        logger.debug(f"Origin query excluded due to exclusion pattern: {exclusion_pattern}")
+        return (False, [])
     
     # Only check "bạn là gì" if no exclusion patterns matched
     if re.search(r'\b(bạn|ban)\s+(là|la)\s+(gì|gi)\b', query_lower):
         # Additional check: if question is about capabilities/differences, exclude
-        if not any(exclusion in query_lower for exclusion in ["khác biệt", "khac biet", "different", "nhược điểm", "nhuoc diem", "weakness"]):
+        if not _DIFFERENCE_KEYWORDS.search(query_lower):
             matched_keywords.append("ban_la_gi")
             return (True, matched_keywords)
     
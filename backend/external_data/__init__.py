@@ -18,6 +18,7 @@ Key Principles:
 try:
     from stillme_core.external_data import (
         ExternalDataOrchestrator,
+        get_external_data_orchestrator,
         detect_external_data_intent,
         ExternalDataIntent,
         ExternalDataCache,
@@ -26,13 +27,14 @@ try:
     )
 except ImportError:
     # Fallback to local imports if stillme_core is not available yet
-    from .orchestrator import ExternalDataOrchestrator
+    from .orchestrator import ExternalDataOrchestrator, get_external_data_orchestrator
     from .intent_detector import detect_external_data_intent, ExternalDataIntent
     from .cache import ExternalDataCache
     from .providers.base import ExternalDataProvider, ExternalDataResult
 
 __all__ = [
     "ExternalDataOrchestrator",
+    "get_external_data_orchestrator",
     "detect_external_data_intent",
     "ExternalDataIntent",
     "ExternalDataCache",
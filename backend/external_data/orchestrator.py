@@ -6,7 +6,8 @@ Routes external data intents to appropriate providers and manages caching.
 
 import asyncio
 import logging
-from typing import List, Optional
+import threading
+from typing import List, Optional, Set
 from datetime import datetime, timezone
 
 try:
@@ -24,9 +25,15 @@ from .providers.base import ExternalDataProvider, ExternalDataResult
 from .providers.weather import WeatherProvider
 from .providers.news import NewsProvider
 from .providers.time import TimeProvider
+from backend.services.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Provider fetch budget (retries included) - fail fast to avoid blocking RAG
+FETCH_TIMEOUT_SECONDS = 10.0
+# Intent types never answered from a stale cache entry
+NO_STALE_INTENT_TYPES = {"time"}
+
 
 class ExternalDataOrchestrator:
     """Orchestrates multiple external data providers"""
@@ -38,6 +45,13 @@ class ExternalDataOrchestrator:
         self.rate_limit_tracker = get_rate_limit_tracker()
         self.logger = logging.getLogger(__name__)
         
+        # Concurrent requests for the same intent share one provider fetch
+        self._fetches = SingleFlight(follower_timeout=FETCH_TIMEOUT_SECONDS)
+        # Background stale-while-revalidate refreshes (keys + task references)
+        self._refreshing: Set[str] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self.stale_served = 0
+        
         # Register default providers
         self._register_default_providers()
         
@@ -78,13 +92,20 @@ class ExternalDataOrchestrator:
         if not intent:
             return None
         
-        # Check cache first
+        # Check cache first (expired results within the stale window are served while refreshing)
         cache_key = self._get_cache_key(intent)
-        cached_result = self.cache.get(cache_key)
+        cached_entry = self.cache.get_entry(cache_key)
         
-        if cached_result:
-            self.logger.info(f"Cache hit for intent: {intent.type}")
-            return cached_result
+        if cached_entry:
+            cached_result, is_stale = cached_entry
+            if not is_stale:
+                self.logger.info(f"Cache hit for intent: {intent.type}")
+                return cached_result
+            if intent.type not in NO_STALE_INTENT_TYPES:
+                self.logger.info(f"Serving stale cached result for intent: {intent.type} (refreshing in background)")
+                self.stale_served += 1
+                self._schedule_refresh(intent, cache_key)
+                return cached_result
         
         # Find provider that supports this intent
         provider = self._find_provider(intent)
@@ -94,6 +115,54 @@ class ExternalDataOrchestrator:
             self._record_metrics(provider_name=None, success=False, cached=False)
             return None
         
+        result, shared = await self._fetches.do(
+            str(cache_key), lambda: self._fetch(intent, provider, cache_key)
+        )
+        if shared:
+            self.logger.info(f"Shared in-flight {provider.get_provider_name()} fetch for intent: {intent.type}")
+        return result
+    
+    def _schedule_refresh(self, intent: ExternalDataIntent, cache_key: str):
+        """Refresh a stale cache entry in the background (at most one refresh per key)"""
+        if cache_key in self._refreshing:
+            return
+        provider = self._find_provider(intent)
+        if not provider:
+            return
+        self._refreshing.add(cache_key)
+        task = asyncio.get_running_loop().create_task(self._refresh(intent, provider, cache_key))
+        self._refresh_tasks.add(task)
+        
+        def _done(finished_task, key=cache_key):
+            self._refresh_tasks.discard(finished_task)
+            self._refreshing.discard(key)
+        
+        task.add_done_callback(_done)
+    
+    async def _refresh(self, intent: ExternalDataIntent, provider: ExternalDataProvider, cache_key: str):
+        """Background refresh of one cache entry"""
+        try:
+            await self._fetches.do(str(cache_key), lambda: self._fetch(intent, provider, cache_key))
+        except Exception as e:
+            self.logger.warning(f"Background refresh failed for intent {intent.type}: {e}")
+    
+    async def _fetch(
+        self,
+        intent: ExternalDataIntent,
+        provider: ExternalDataProvider,
+        cache_key: str
+    ) -> Optional[ExternalDataResult]:
+        """
+        Fetch from provider (rate limit, retry, timeout) and cache successful results
+        
+        Args:
+            intent: ExternalDataIntent with type and params
+            provider: Provider supporting the intent
+            cache_key: Cache key for the intent
+            
+        Returns:
+            ExternalDataResult, or None on timeout
+        """
         provider_name = provider.get_provider_name()
         
         # Check rate limit
@@ -129,7 +198,7 @@ class ExternalDataOrchestrator:
                         intent_type=intent.type,
                         params=intent.params
                     ),
-                    timeout=10.0  # Fail fast after 10s
+                    timeout=FETCH_TIMEOUT_SECONDS  # Fail fast after 10s
                 )
             except asyncio.TimeoutError:
                 self.logger.warning(
@@ -175,6 +244,15 @@ class ExternalDataOrchestrator:
                 error_message=f"Exception: {str(e)}"
             )
     
+    def get_stats(self) -> dict:
+        """Get cache, in-flight fetch and stale-serving statistics"""
+        return {
+            "cache": self.cache.get_stats(),
+            "fetches": self._fetches.get_stats(),
+            "stale_served": self.stale_served,
+            "refreshing": len(self._refreshing)
+        }
+    
     def _find_provider(self, intent: ExternalDataIntent) -> Optional[ExternalDataProvider]:
         """Find provider that supports the intent"""
         for provider in self.providers:
@@ -509,3 +587,17 @@ class ExternalDataOrchestrator:
         except Exception as e:
             self.logger.warning(f"Error recording metrics: {e}")
 
+
+# Global instance (shared cache and in-flight fetches across requests)
+_orchestrator: Optional[ExternalDataOrchestrator] = None
+_orchestrator_lock = threading.Lock()
+
+
+def get_external_data_orchestrator() -> ExternalDataOrchestrator:
+    """Get global external data orchestrator"""
+    global _orchestrator
+    if _orchestrator is None:
+        with _orchestrator_lock:
+            if _orchestrator is None:
+                _orchestrator = ExternalDataOrchestrator()
+    return _orchestrator
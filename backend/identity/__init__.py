@@ -9,7 +9,8 @@ from .prompt_builder import (
     PromptContext,
     FPSResult,
     InstructionType,
-    InstructionPriority
+    InstructionPriority,
+    PromptLayoutReport
 )
 
 __all__ = [
@@ -19,6 +20,7 @@ __all__ = [
     "PromptContext",
     "FPSResult",
     "InstructionType",
-    "InstructionPriority"
+    "InstructionPriority",
+    "PromptLayoutReport"
 ]
 
@@ -10,9 +10,11 @@ This module provides a single source of truth for building prompts with:
 PHASE 1: Unified Prompt Builder Implementation
 """
 
+import hashlib
 import logging
+import os
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
 from backend.identity.core import get_core_principles
@@ -20,9 +22,19 @@ from backend.identity.persona import get_persona_rules
 from backend.identity.meta_llm import get_meta_llm_rules
 from backend.identity.formatting import get_formatting_rules, DomainType
 from backend.identity.system_origin import SYSTEM_ORIGIN_DATA
+from backend.services.token_counter import count_tokens
 
 logger = logging.getLogger(__name__)
 
+# Prompt layout:
+# - "legacy": static and per-request blocks interleaved (original order)
+# - "prefix_stable": every static, language-keyed block first, per-request content after,
+#   so the prompt prefix is byte-identical across requests and hits provider prefix caches
+#   (DeepSeek context caching, OpenAI prompt caching)
+PROMPT_LAYOUT_LEGACY = "legacy"
+PROMPT_LAYOUT_PREFIX_STABLE = "prefix_stable"
+DEFAULT_PROMPT_LAYOUT = os.getenv("PROMPT_LAYOUT", PROMPT_LAYOUT_LEGACY).lower()
+
 
 class InstructionPriority:
     """Priority levels for instructions"""
@@ -70,6 +82,15 @@ class PromptContext:
     system_status_note: Optional[str] = None  # System Self-Awareness: Real-time system status
 
 
+@dataclass
+class PromptLayoutReport:
+    """Static-prefix report for one built prompt"""
+    layout: str
+    prefix_hash: str     # sha256 (first 16 hex chars) of the static prefix
+    prefix_chars: int
+    total_chars: int
+
+
 class InstructionRegistry:
     """Registry for reusable instructions - eliminates duplicates"""
     
@@ -163,8 +184,16 @@ class UnifiedPromptBuilder:
     - Concise Core Identity for normal questions
     """
     
-    def __init__(self):
+    def __init__(self, layout: Optional[str] = None):
+        """
+        Args:
+            layout: PROMPT_LAYOUT_LEGACY or PROMPT_LAYOUT_PREFIX_STABLE (default: PROMPT_LAYOUT env var)
+        """
         self.registry = InstructionRegistry()
+        self.layout = (layout or DEFAULT_PROMPT_LAYOUT).lower()
+        if self.layout not in (PROMPT_LAYOUT_LEGACY, PROMPT_LAYOUT_PREFIX_STABLE):
+            logger.warning(f"Unknown prompt layout '{self.layout}', using {PROMPT_LAYOUT_LEGACY}")
+            self.layout = PROMPT_LAYOUT_LEGACY
     
     def build_prompt(self, context: PromptContext) -> str:
         """
@@ -177,12 +206,28 @@ class UnifiedPromptBuilder:
         4. P3: Formatting rules (minimal)
         5. User question
         
+        In the prefix_stable layout, blocks 1, 2 and 4 (plus the system architecture
+        instruction) form a byte-stable prefix and all per-request content follows.
+        
         Args:
             context: PromptContext with all necessary information
             
         Returns:
             Complete prompt string
         """
+        prompt, _ = self.build_prompt_with_report(context)
+        return prompt
+    
+    def build_prompt_with_report(self, context: PromptContext) -> Tuple[str, PromptLayoutReport]:
+        """
+        Build unified prompt and report its static prefix (hash + length).
+        
+        Args:
+            context: PromptContext with all necessary information
+            
+        Returns:
+            tuple: (prompt, PromptLayoutReport)
+        """
         # P1: Language instruction (always first, highest priority)
         language_instruction = self._build_language_instruction(context.detected_lang)
         
@@ -225,12 +270,30 @@ class UnifiedPromptBuilder:
 
 """
         
-        # Combine with clear priority
-        prompt = f"""{language_instruction}
+        if self.layout == PROMPT_LAYOUT_PREFIX_STABLE:
+            # Static, language-keyed blocks first - identical bytes for every request of the same
+            # language/question type, so providers can serve this prefix from their cache
+            static_prefix = f"""{language_instruction}
+
+{core_identity}
+
+{formatting}
+
+{system_architecture_instruction}"""
+            prompt = f"""{static_prefix}{system_status_section}{context_instruction}
+
+{conversation_history_text}
+
+User Question: {context.user_question}
+"""
+        else:
+            # Combine with clear priority
+            static_prefix = f"""{language_instruction}
 
 {system_architecture_instruction}{core_identity}
 
-{system_status_section}{context_instruction}
+"""
+            prompt = f"""{static_prefix}{system_status_section}{context_instruction}
 
 {formatting}
 
@@ -269,7 +332,17 @@ User Question: {context.user_question}
                 else:
                     logger.warning(f"🔍 build_prompt: is_how_question=True but specific_details is empty!")
         
-        return prompt
+        report = PromptLayoutReport(
+            layout=self.layout,
+            prefix_hash=hashlib.sha256(static_prefix.encode("utf-8")).hexdigest()[:16],
+            prefix_chars=len(static_prefix),
+            total_chars=len(prompt)
+        )
+        logger.info(
+            f"🧱 Prompt layout={report.layout}: static prefix {report.prefix_chars}/{report.total_chars} chars "
+            f"(hash={report.prefix_hash})"
+        )
+        return prompt, report
     
     def _build_language_instruction(self, detected_lang: str) -> str:
         """Build language instruction (P1 - highest priority)"""
@@ -1567,7 +1640,7 @@ StillMe's RAG system searched the knowledge base but found NO relevant documents
             return ""
         
         def estimate_tokens(text: str) -> int:
-            return len(text) // 4 if text else 0
+            return count_tokens(text)
         
         history_text = ""
         total_tokens = 0
@@ -1613,6 +1686,61 @@ def build_unified_prompt(context: PromptContext) -> str:
     return _unified_prompt_builder.build_prompt(context)
 
 
+def _has_static_prefix(prompt: str, report: PromptLayoutReport) -> bool:
+    """Check that prompt still starts with the static prefix described by report"""
+    head = prompt[:report.prefix_chars]
+    return (
+        report.prefix_chars > 0
+        and len(head) == report.prefix_chars
+        and hashlib.sha256(head.encode("utf-8")).hexdigest()[:16] == report.prefix_hash
+    )
+
+
+def insert_after_static_prefix(prompt: str, report: Optional[PromptLayoutReport], block: str) -> str:
+    """
+    Insert a per-request block (e.g. a user's style instruction) into the dynamic section.
+    
+    The block goes right after the static prefix so the prompt keeps its byte-stable
+    start; without a usable report it is prepended as before.
+    
+    Args:
+        prompt: Prompt built by UnifiedPromptBuilder (possibly with appended sections)
+        report: Layout report returned with that prompt
+        block: Text to insert
+        
+    Returns:
+        Prompt with block inserted
+    """
+    if not block:
+        return prompt
+    if report is None or not _has_static_prefix(prompt, report):
+        return f"{block}\n\n{prompt}"
+    return f"{prompt[:report.prefix_chars]}{block}\n\n{prompt[report.prefix_chars:]}"
+
+
+def report_final_prompt(prompt: str, report: PromptLayoutReport) -> PromptLayoutReport:
+    """
+    Layout report for the prompt actually sent to the provider.
+    
+    Returns report's prefix when prompt still starts with it, otherwise an empty
+    prefix (layout suffixed with "+prefix_lost") so the report never claims a
+    stable prefix the provider did not see.
+    """
+    if _has_static_prefix(prompt, report):
+        return PromptLayoutReport(
+            layout=report.layout,
+            prefix_hash=report.prefix_hash,
+            prefix_chars=report.prefix_chars,
+            total_chars=len(prompt)
+        )
+    return PromptLayoutReport(
+        layout=f"{report.layout}+prefix_lost",
+        prefix_hash=hashlib.sha256(b"").hexdigest()[:16],
+        prefix_chars=0,
+        total_chars=len(prompt)
+    )
+
+
 def build_code_explanation_prompt(
     question: str,
     code_chunks: list,
@@ -184,6 +184,7 @@ class ContinuumMemory:
                     item_id TEXT PRIMARY KEY,
                     tier TEXT NOT NULL CHECK(tier IN ('L0', 'L1', 'L2', 'L3')),
                     surprise_score REAL DEFAULT 0.0,
+                    content_score REAL,
                     retrieval_count_7d INTEGER DEFAULT 0,
                     retrieval_count_30d INTEGER DEFAULT 0,
                     validator_overlap REAL DEFAULT 0.0,
@@ -203,6 +204,14 @@ class ContinuumMemory:
                 # Column already exists, ignore
                 pass
             
+            # Migration: Add content_score column (weighted rarity + novelty part of surprise_score)
+            try:
+                cursor.execute("ALTER TABLE tier_metrics ADD COLUMN content_score REAL")
+                logger.info("Added content_score column to tier_metrics table")
+            except sqlite3.OperationalError:
+                # Column already exists, ignore
+                pass
+            
             # Tier audit table - tracks all promotion/demotion events
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS tier_audit (
@@ -0,0 +1,413 @@
+"""
+Corpus Statistics for Continuum Memory tier scoring
+
+PromotionManager scores rarity and novelty of a knowledge item against the rest of the
+knowledge base. Recomputing that from the collection for every item is not affordable, so
+this service maintains the corpus-level statistics once and answers lookups cheaply:
+- a document-frequency table of keywords over the knowledge collection (rarity: O(1) per
+  keyword)
+- k centroids of the knowledge embeddings (novelty: O(k) per item, one matrix product for
+  a batch)
+
+Both are updated incrementally: refresh() folds in documents added to the collection since
+the last refresh (their stored embeddings are reused, nothing is re-encoded) and is run
+once per learning cycle. Removed documents are only forgotten by a full rebuild, which
+refresh() triggers once they make up CORPUS_STATS_REBUILD_FRACTION of the corpus.
+Statistics are persisted to CORPUS_STATS_PATH so restarts do not rescan the collection.
+"""
+
+import logging
+import math
+import os
+import re
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.services.index_manifest import load_manifest, save_manifest
+
+logger = logging.getLogger(__name__)
+
+CORPUS_STATS_PATH = os.getenv("CORPUS_STATS_PATH", "data/corpus_stats.json")
+# Number of k-means centroids kept for novelty scoring
+CORPUS_STATS_NUM_CENTROIDS = int(os.getenv("CORPUS_STATS_NUM_CENTROIDS", "16"))
+# Rebuild from scratch once removed documents exceed this fraction of the corpus
+CORPUS_STATS_REBUILD_FRACTION = float(os.getenv("CORPUS_STATS_REBUILD_FRACTION", "0.2"))
+# Documents fetched from ChromaDB per request during refresh/rebuild
+CORPUS_STATS_FETCH_BATCH = int(os.getenv("CORPUS_STATS_FETCH_BATCH", "500"))
+
+# Keywords: words of 4+ letters, lowercased (same tokenization as PromotionManager)
+_KEYWORD_PATTERN = re.compile(r'\b[a-zA-Z]{4,}\b')
+
+
+def extract_keywords(content: str) -> List[str]:
+    """Keywords of a text, in order and with repeats"""
+    if not content:
+        return []
+    return _KEYWORD_PATTERN.findall(content.lower())
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _kmeans(vectors: np.ndarray, k: int, iterations: int = 10, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Spherical k-means (cosine similarity) with k-means++ seeding
+
+    Args:
+        vectors: Row-normalized embeddings (n x d), n >= k
+        k: Number of centroids
+
+    Returns:
+        (centroids k x d, member counts k)
+    """
+    rng = np.random.default_rng(seed)
+    n = len(vectors)
+    centers = [vectors[rng.integers(n)]]
+    closest = 1.0 - vectors @ centers[0]
+    for _ in range(1, k):
+        weights = np.clip(closest, 0.0, None)
+        total = weights.sum()
+        index = rng.choice(n, p=weights / total) if total > 0 else rng.integers(n)
+        centers.append(vectors[index])
+        closest = np.minimum(closest, 1.0 - vectors @ vectors[index])
+    centroids = np.array(centers, dtype=np.float32)
+
+    assignment = None
+    for _ in range(iterations):
+        new_assignment = np.argmax(vectors @ _normalize_rows(centroids).T, axis=1)
+        if assignment is not None and np.array_equal(new_assignment, assignment):
+            break
+        assignment = new_assignment
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, vectors)
+        counts = np.bincount(assignment, minlength=k)
+        non_empty = counts > 0
+        # Empty clusters keep their previous center
+        centroids[non_empty] = sums[non_empty] / counts[non_empty, None]
+
+    counts = np.bincount(assignment, minlength=k).astype(np.float64)
+    return centroids, counts
+
+
+class CorpusStatistics:
+    """Document frequencies and embedding centroids of the knowledge collection"""
+
+    def __init__(self,
+                 path: Optional[str] = CORPUS_STATS_PATH,
+                 num_centroids: int = CORPUS_STATS_NUM_CENTROIDS):
+        """
+        Args:
+            path: JSON file the statistics are persisted to (None keeps them in memory only)
+            num_centroids: Number of centroids (k) kept for novelty scoring
+        """
+        self.path = path
+        self.num_centroids = max(1, num_centroids)
+        self._lock = threading.RLock()
+        self._reset()
+        if path:
+            self._load()
+
+    def _reset(self) -> None:
+        self.document_frequency: Counter = Counter()
+        self.num_documents = 0
+        self.stale_documents = 0
+        self.updated_at: Optional[str] = None
+        self._doc_ids: set = set()
+        self._centroids: Optional[np.ndarray] = None
+        self._centroid_counts: Optional[np.ndarray] = None
+        self._normalized_centroids: Optional[np.ndarray] = None
+
+    # ------------------------------------------------------------------ updates
+
+    def add_documents(self,
+                      ids: Sequence[str],
+                      contents: Sequence[str],
+                      embeddings: Optional[Sequence[Sequence[float]]] = None) -> int:
+        """
+        Fold new documents into the statistics (ids already counted are skipped)
+
+        Args:
+            ids: Document IDs
+            contents: Document texts
+            embeddings: Document embeddings (optional - centroids are left as they are without)
+
+        Returns:
+            Number of documents added
+        """
+        with self._lock:
+            new_rows = [i for i, doc_id in enumerate(ids) if doc_id not in self._doc_ids]
+            for i in new_rows:
+                self._doc_ids.add(ids[i])
+                self.document_frequency.update(set(extract_keywords(contents[i] or "")))
+            self.num_documents += len(new_rows)
+
+            if embeddings is not None and new_rows:
+                vectors = np.asarray([embeddings[i] for i in new_rows], dtype=np.float32)
+                if vectors.ndim == 2 and vectors.shape[1] > 0:
+                    self._update_centroids(_normalize_rows(vectors))
+            return len(new_rows)
+
+    def _update_centroids(self, vectors: np.ndarray) -> None:
+        """Mini-batch k-means update with row-normalized vectors"""
+        k = self.num_centroids
+        if self._centroids is not None and self._centroids.shape[1] != vectors.shape[1]:
+            logger.warning(
+                f"⚠️ Embedding dimension changed ({self._centroids.shape[1]} -> {vectors.shape[1]}), resetting centroids"
+            )
+            self._centroids = None
+
+        if self._centroids is None:
+            if len(vectors) >= k:
+                self._centroids, self._centroid_counts = _kmeans(vectors, k)
+                self._normalized_centroids = _normalize_rows(self._centroids)
+                return
+            self._centroids = np.empty((0, vectors.shape[1]), dtype=np.float32)
+            self._centroid_counts = np.empty(0, dtype=np.float64)
+
+        # Until there are k centroids, each new vector seeds one
+        missing = k - len(self._centroids)
+        if missing > 0:
+            seeds, vectors = vectors[:missing], vectors[missing:]
+            self._centroids = np.vstack([self._centroids, seeds]).astype(np.float32)
+            self._centroid_counts = np.concatenate([self._centroid_counts, np.ones(len(seeds))])
+            self._normalized_centroids = _normalize_rows(self._centroids)
+
+        if len(vectors):
+            assignment = np.argmax(vectors @ self._normalized_centroids.T, axis=1)
+            sums = np.zeros_like(self._centroids)
+            np.add.at(sums, assignment, vectors)
+            added = np.bincount(assignment, minlength=len(self._centroids))
+            totals = self._centroid_counts + added
+            self._centroids = (
+                (self._centroids * self._centroid_counts[:, None] + sums) / totals[:, None]
+            ).astype(np.float32)
+            self._centroid_counts = totals
+            self._normalized_centroids = _normalize_rows(self._centroids)
+
+    def refresh(self, chroma_client) -> Dict[str, Any]:
+        """
+        Bring the statistics up to date with the knowledge collection (run once per learning cycle)
+
+        Args:
+            chroma_client: ChromaClient whose knowledge collection is summarized
+
+        Returns:
+            Dict with added, removed, rebuilt and documents
+        """
+        collection = chroma_client.knowledge_collection
+        current_ids = self._list_ids(collection)
+
+        with self._lock:
+            current = set(current_ids)
+            removed = self._doc_ids - current
+            if removed:
+                # Their keywords and embeddings stay counted until the next rebuild
+                self._doc_ids -= removed
+                self.stale_documents += len(removed)
+            new_ids = [doc_id for doc_id in current_ids if doc_id not in self._doc_ids]
+            needs_rebuild = self.stale_documents > CORPUS_STATS_REBUILD_FRACTION * max(self.num_documents, 1)
+
+        if needs_rebuild:
+            added = self.rebuild(chroma_client, ids=current_ids)
+        else:
+            added = 0
+            for ids, contents, embeddings in self._fetch(collection, new_ids):
+                added += self.add_documents(ids, contents, embeddings)
+            with self._lock:
+                self.updated_at = datetime.now().isoformat()
+            self.save()
+
+        if added or removed:
+            logger.info(
+                f"📊 Corpus statistics refreshed: +{added} documents, -{len(removed)} removed, "
+                f"{self.num_documents} total{' (rebuilt)' if needs_rebuild else ''}"
+            )
+        return {"added": added, "removed": len(removed), "rebuilt": needs_rebuild, "documents": self.num_documents}
+
+    def rebuild(self, chroma_client, ids: Optional[List[str]] = None) -> int:
+        """
+        Recompute the statistics from the whole knowledge collection
+
+        Returns:
+            Number of documents counted
+        """
+        collection = chroma_client.knowledge_collection
+        if ids is None:
+            ids = self._list_ids(collection)
+
+        fresh = CorpusStatistics(path=None, num_centroids=self.num_centroids)
+        all_ids, all_contents, all_embeddings = [], [], []
+        for batch_ids, contents, embeddings in self._fetch(collection, ids):
+            all_ids.extend(batch_ids)
+            all_contents.extend(contents)
+            if embeddings is not None:
+                all_embeddings.extend(embeddings)
+        # One pass over all embeddings: the centroids come from a full k-means run
+        fresh.add_documents(
+            all_ids, all_contents,
+            all_embeddings if len(all_embeddings) == len(all_ids) else None
+        )
+
+        with self._lock:
+            self.document_frequency = fresh.document_frequency
+            self.num_documents = fresh.num_documents
+            self.stale_documents = 0
+            self._doc_ids = fresh._doc_ids
+            self._centroids = fresh._centroids
+            self._centroid_counts = fresh._centroid_counts
+            self._normalized_centroids = fresh._normalized_centroids
+            self.updated_at = datetime.now().isoformat()
+        self.save()
+        return fresh.num_documents
+
+    @staticmethod
+    def _list_ids(collection) -> List[str]:
+        """All document IDs of a collection, paged"""
+        ids: List[str] = []
+        page = CORPUS_STATS_FETCH_BATCH * 10
+        offset = 0
+        while True:
+            batch = collection.get(include=[], limit=page, offset=offset).get("ids") or []
+            ids.extend(batch)
+            if len(batch) < page:
+                return ids
+            offset += page
+
+    @staticmethod
+    def _fetch(collection, ids: List[str]) -> Iterable[Tuple[List[str], List[str], Optional[Any]]]:
+        """Documents and stored embeddings of `ids`, in batches"""
+        for start in range(0, len(ids), CORPUS_STATS_FETCH_BATCH):
+            results = collection.get(
+                ids=ids[start:start + CORPUS_STATS_FETCH_BATCH],
+                include=["documents", "embeddings"]
+            )
+            embeddings = results.get("embeddings")
+            if embeddings is not None and len(embeddings) != len(results["ids"]):
+                embeddings = None
+            yield results["ids"], results.get("documents") or [""] * len(results["ids"]), embeddings
+
+    # ------------------------------------------------------------------ lookups
+
+    def rarity_score(self, content: str) -> Optional[float]:
+        """
+        Keyword rarity of a text against the corpus (0.0-1.0)
+
+        Mean normalized inverse document frequency of the text's distinct keywords:
+        keywords absent from the corpus score 1.0, keywords in every document ~0.0.
+
+        Returns:
+            Rarity score, or None when the corpus is empty
+        """
+        with self._lock:
+            n = self.num_documents
+            if n == 0:
+                return None
+            keywords = set(extract_keywords(content))
+            if not keywords:
+                return 0.0
+            scale = math.log(n + 1)
+            df = self.document_frequency
+            idf = sum(math.log((n + 1) / (df.get(keyword, 0) + 1)) for keyword in keywords)
+            return max(0.0, min(1.0, idf / (len(keywords) * scale)))
+
+    def rarity_scores(self, contents: Sequence[str]) -> List[Optional[float]]:
+        """rarity_score() for many texts"""
+        return [self.rarity_score(content) for content in contents]
+
+    def novelty_scores(self, embeddings: Sequence[Sequence[float]]) -> Optional[np.ndarray]:
+        """
+        Novelty of embeddings against the corpus: 1 - cosine similarity to the nearest centroid
+
+        Returns:
+            Scores (0.0-1.0) per embedding (NaN for zero vectors), or None without centroids
+        """
+        with self._lock:
+            centroids = self._normalized_centroids
+        if centroids is None or not len(centroids):
+            return None
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if vectors.ndim != 2 or vectors.shape[1] != centroids.shape[1]:
+            return None
+        norms = np.linalg.norm(vectors, axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            similarity = (vectors @ centroids.T).max(axis=1) / norms
+        return np.clip(1.0 - similarity, 0.0, 1.0)
+
+    def novelty_score(self, embedding: Sequence[float]) -> Optional[float]:
+        """novelty_scores() for one embedding (None without centroids or for a zero vector)"""
+        if embedding is None or not len(embedding):
+            return None
+        scores = self.novelty_scores([embedding])
+        if scores is None or np.isnan(scores[0]):
+            return None
+        return float(scores[0])
+
+    # ------------------------------------------------------------------ persistence
+
+    def save(self) -> bool:
+        """Persist the statistics to self.path"""
+        if not self.path:
+            return False
+        with self._lock:
+            state = {
+                "num_documents": self.num_documents,
+                "stale_documents": self.stale_documents,
+                "updated_at": self.updated_at,
+                "document_frequency": dict(self.document_frequency),
+                "doc_ids": sorted(self._doc_ids),
+                "centroids": self._centroids.tolist() if self._centroids is not None else None,
+                "centroid_counts": self._centroid_counts.tolist() if self._centroid_counts is not None else None,
+            }
+        return save_manifest(self.path, state)
+
+    def _load(self) -> None:
+        state = load_manifest(self.path)
+        if not state:
+            return
+        try:
+            self.num_documents = int(state.get("num_documents", 0))
+            self.stale_documents = int(state.get("stale_documents", 0))
+            self.updated_at = state.get("updated_at")
+            self.document_frequency = Counter(state.get("document_frequency") or {})
+            self._doc_ids = set(state.get("doc_ids") or [])
+            if state.get("centroids"):
+                self._centroids = np.asarray(state["centroids"], dtype=np.float32)
+                self._centroid_counts = np.asarray(state["centroid_counts"], dtype=np.float64)
+                self._normalized_centroids = _normalize_rows(self._centroids)
+            logger.info(f"📊 Loaded corpus statistics for {self.num_documents} documents from {self.path}")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load corpus statistics from {self.path}, starting empty: {e}")
+            self._reset()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get corpus statistics summary"""
+        with self._lock:
+            return {
+                "documents": self.num_documents,
+                "stale_documents": self.stale_documents,
+                "keywords": len(self.document_frequency),
+                "centroids": 0 if self._centroids is None else len(self._centroids),
+                "updated_at": self.updated_at,
+            }
+
+
+# Global instance
+_corpus_statistics: Optional[CorpusStatistics] = None
+_corpus_statistics_lock = threading.Lock()
+
+
+def get_corpus_statistics() -> CorpusStatistics:
+    """Get global corpus statistics instance (singleton)"""
+    global _corpus_statistics
+    if _corpus_statistics is None:
+        with _corpus_statistics_lock:
+            if _corpus_statistics is None:
+                _corpus_statistics = CorpusStatistics()
+    return _corpus_statistics
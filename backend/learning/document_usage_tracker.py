@@ -8,14 +8,25 @@ Part of Stage 2: Meta-Learning - "AI improves HOW it learns"
 """
 
 import logging
+import os
+import sqlite3
+import threading
+import time
 from typing import Dict, List, Optional, Set, Any
-from datetime import datetime, timezone, timedelta
-from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from dataclasses import dataclass
 from pathlib import Path
 import json
 
 logger = logging.getLogger(__name__)
 
+SQLITE_TIMEOUT = 10.0  # Timeout in seconds for database operations
+SECONDS_PER_DAY = 86400
+# Raw records older than this are deleted; per-source daily aggregates are kept
+DOCUMENT_USAGE_RETENTION_DAYS = int(os.getenv("DOCUMENT_USAGE_RETENTION_DAYS", "365"))
+PRUNE_EVERY_INSERTS = 5000
+IMPORT_BATCH_SIZE = 1000
+
 
 @dataclass
 class DocumentUsageRecord:
@@ -37,51 +48,230 @@ class DocumentUsageTracker:
     
     This is the foundation for Stage 2: Meta-Learning - retention-based
     source trust adjustment.
+    
+    Records live in SQLite (indexed by timestamp, source and doc_id) next to per-source
+    daily aggregates that are updated in the same transaction as each insert, so
+    retention metrics read O(days x sources) aggregate rows instead of every record.
+    Raw records older than DOCUMENT_USAGE_RETENTION_DAYS are pruned; aggregates are kept.
     """
     
-    def __init__(self, persist_to_file: bool = True, usage_file: Optional[str] = None):
+    def __init__(
+        self,
+        persist_to_file: bool = True,
+        usage_file: Optional[str] = None,
+        db_path: Optional[str] = None,
+        retention_days: int = DOCUMENT_USAGE_RETENTION_DAYS
+    ):
         """
         Initialize document usage tracker
         
         Args:
-            persist_to_file: Whether to persist records to file
-            usage_file: Path to usage file (default: data/document_usage.jsonl)
+            persist_to_file: Whether to persist records to disk (False = in-memory database)
+            usage_file: Legacy JSONL file imported once on first start (default: data/document_usage.jsonl)
+            db_path: SQLite database path (default: DOCUMENT_USAGE_DB_PATH or data/document_usage.db)
+            retention_days: Raw records older than this are pruned (daily aggregates are kept)
         """
         self.persist_to_file = persist_to_file
         self.usage_file = usage_file or "data/document_usage.jsonl"
-        
-        # In-memory storage: list of DocumentUsageRecord
-        self._records: List[DocumentUsageRecord] = []
+        self.db_path = db_path or os.getenv("DOCUMENT_USAGE_DB_PATH") or str(Path(self.usage_file).with_suffix(".db"))
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._inserts_since_prune = 0
         
         # Ensure data directory exists
         if self.persist_to_file:
-            Path(self.usage_file).parent.mkdir(parents=True, exist_ok=True)
-            self._load_records()
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, timeout=SQLITE_TIMEOUT, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        else:
+            self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self._init_database()
+        
+        if self.persist_to_file:
+            self._import_legacy_jsonl()
+            self._prune()
         
-        logger.info(f"DocumentUsageTracker initialized (persist={persist_to_file}, file={self.usage_file})")
+        logger.info(f"DocumentUsageTracker initialized (persist={persist_to_file}, db={self.db_path if persist_to_file else ':memory:'})")
+    
+    def _init_database(self):
+        """Create tables and indexes"""
+        with self._lock, self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS document_usage (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    ts REAL NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    query TEXT,
+                    doc_id TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    title TEXT,
+                    used_in_response INTEGER NOT NULL,
+                    similarity_score REAL,
+                    response_confidence REAL,
+                    validation_passed INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS idx_document_usage_ts ON document_usage(ts);
+                CREATE INDEX IF NOT EXISTS idx_document_usage_source_ts ON document_usage(source, ts);
+                CREATE INDEX IF NOT EXISTS idx_document_usage_doc_id ON document_usage(doc_id);
+                
+                CREATE TABLE IF NOT EXISTS source_daily_usage (
+                    day INTEGER NOT NULL,
+                    source TEXT NOT NULL,
+                    total_used INTEGER NOT NULL DEFAULT 0,
+                    similarity_sum REAL NOT NULL DEFAULT 0,
+                    similarity_count INTEGER NOT NULL DEFAULT 0,
+                    confidence_sum REAL NOT NULL DEFAULT 0,
+                    confidence_count INTEGER NOT NULL DEFAULT 0,
+                    validation_passed_count INTEGER NOT NULL DEFAULT 0,
+                    validation_total_count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (day, source)
+                );
+                
+                CREATE TABLE IF NOT EXISTS tracker_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
     
-    def _load_records(self):
-        """Load usage records from file"""
+    def _import_legacy_jsonl(self):
+        """Import the old JSONL log once (the file itself is left in place)"""
+        if not Path(self.usage_file).exists():
+            return
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM tracker_meta WHERE key = 'legacy_jsonl_imported'").fetchone()
+        if row:
+            return
         try:
-            if Path(self.usage_file).exists():
-                with open(self.usage_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if line.strip():
-                            data = json.loads(line)
-                            record = DocumentUsageRecord(**data)
-                            self._records.append(record)
-                logger.info(f"Loaded {len(self._records)} document usage records from {self.usage_file}")
+            imported = 0
+            batch: List[DocumentUsageRecord] = []
+            with open(self.usage_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        batch.append(DocumentUsageRecord(**json.loads(line)))
+                    except Exception:
+                        continue
+                    if len(batch) >= IMPORT_BATCH_SIZE:
+                        self._insert_records(batch)
+                        imported += len(batch)
+                        batch = []
+            if batch:
+                self._insert_records(batch)
+                imported += len(batch)
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO tracker_meta (key, value) VALUES ('legacy_jsonl_imported', ?)",
+                    (datetime.now(timezone.utc).isoformat(),)
+                )
+            logger.info(f"Imported {imported} document usage records from {self.usage_file} into {self.db_path}")
         except Exception as e:
-            logger.warning(f"Failed to load document usage records from {self.usage_file}: {e}")
+            logger.warning(f"Failed to import document usage records from {self.usage_file}: {e}")
     
-    def _save_record(self, record: DocumentUsageRecord):
-        """Save a single record to file"""
-        if self.persist_to_file:
-            try:
-                with open(self.usage_file, 'a', encoding='utf-8') as f:
-                    f.write(json.dumps(asdict(record), ensure_ascii=False) + '\n')
-            except Exception as e:
-                logger.error(f"Failed to save document usage record to {self.usage_file}: {e}")
+    @staticmethod
+    def _epoch(timestamp: str) -> float:
+        try:
+            return datetime.fromisoformat(timestamp).timestamp()
+        except (TypeError, ValueError):
+            return time.time()
+    
+    def _insert_records(self, records: List[DocumentUsageRecord]) -> None:
+        """Insert records and fold them into the daily per-source aggregates (one transaction)"""
+        if not records:
+            return
+        rows = []
+        daily: Dict[tuple, List[float]] = {}
+        for record in records:
+            ts = self._epoch(record.timestamp)
+            rows.append((
+                ts, record.timestamp, record.query, record.doc_id, record.source, record.title,
+                int(bool(record.used_in_response)), record.similarity_score, record.response_confidence,
+                None if record.validation_passed is None else int(bool(record.validation_passed))
+            ))
+            key = (int(ts // SECONDS_PER_DAY), record.source or "unknown")
+            agg = daily.setdefault(key, [0, 0.0, 0, 0.0, 0, 0, 0])
+            agg[0] += 1
+            if record.similarity_score is not None:
+                agg[1] += record.similarity_score
+                agg[2] += 1
+            if record.response_confidence is not None:
+                agg[3] += record.response_confidence
+                agg[4] += 1
+            if record.validation_passed is not None:
+                agg[6] += 1
+                if record.validation_passed:
+                    agg[5] += 1
+        
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """INSERT INTO document_usage (ts, timestamp, query, doc_id, source, title, used_in_response,
+                                               similarity_score, response_confidence, validation_passed)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows
+            )
+            self._conn.executemany(
+                """INSERT INTO source_daily_usage (day, source, total_used, similarity_sum, similarity_count,
+                                                   confidence_sum, confidence_count,
+                                                   validation_passed_count, validation_total_count)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(day, source) DO UPDATE SET
+                       total_used = total_used + excluded.total_used,
+                       similarity_sum = similarity_sum + excluded.similarity_sum,
+                       similarity_count = similarity_count + excluded.similarity_count,
+                       confidence_sum = confidence_sum + excluded.confidence_sum,
+                       confidence_count = confidence_count + excluded.confidence_count,
+                       validation_passed_count = validation_passed_count + excluded.validation_passed_count,
+                       validation_total_count = validation_total_count + excluded.validation_total_count""",
+                [key + tuple(agg) for key, agg in daily.items()]
+            )
+            self._inserts_since_prune += len(rows)
+            prune_due = self._inserts_since_prune >= PRUNE_EVERY_INSERTS
+        if prune_due:
+            self._prune()
+    
+    def _prune(self) -> None:
+        """Delete raw records past the retention window (aggregates are kept)"""
+        if not self.retention_days:
+            return
+        cutoff = time.time() - self.retention_days * SECONDS_PER_DAY
+        try:
+            with self._lock, self._conn:
+                deleted = self._conn.execute("DELETE FROM document_usage WHERE ts < ?", (cutoff,)).rowcount
+                self._inserts_since_prune = 0
+            if deleted:
+                logger.info(f"Pruned {deleted} document usage records older than {self.retention_days} days")
+        except Exception as e:
+            logger.warning(f"Failed to prune document usage records: {e}")
+    
+    def _save_records(self, records: List[DocumentUsageRecord]) -> None:
+        try:
+            self._insert_records(records)
+        except Exception as e:
+            logger.error(f"Failed to save {len(records)} document usage records to {self.db_path}: {e}")
+    
+    @staticmethod
+    def _make_record(
+        query: str,
+        doc_id: str,
+        source: str,
+        title: Optional[str],
+        used_in_response: bool,
+        similarity_score: Optional[float],
+        response_confidence: Optional[float],
+        validation_passed: Optional[bool],
+        timestamp: Optional[str] = None
+    ) -> DocumentUsageRecord:
+        return DocumentUsageRecord(
+            timestamp=timestamp or datetime.now(timezone.utc).isoformat(),
+            query=query[:500],  # Truncate long queries
+            doc_id=doc_id,
+            source=source,
+            title=title[:200] if title else None,  # Truncate long titles
+            used_in_response=used_in_response,
+            similarity_score=similarity_score,
+            response_confidence=response_confidence,
+            validation_passed=validation_passed
+        )
     
     def record_usage(
         self,
@@ -107,20 +297,11 @@ class DocumentUsageTracker:
             response_confidence: Response confidence score (optional)
             validation_passed: Whether validation passed (optional)
         """
-        record = DocumentUsageRecord(
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            query=query[:500],  # Truncate long queries
-            doc_id=doc_id,
-            source=source,
-            title=title[:200] if title else None,  # Truncate long titles
-            used_in_response=used_in_response,
-            similarity_score=similarity_score,
-            response_confidence=response_confidence,
-            validation_passed=validation_passed
+        record = self._make_record(
+            query, doc_id, source, title, used_in_response,
+            similarity_score, response_confidence, validation_passed
         )
-        
-        self._records.append(record)
-        self._save_record(record)
+        self._save_records([record])
         
         logger.debug(f"Recorded document usage: doc_id={doc_id[:50]}, source={source[:50]}, used={used_in_response}")
     
@@ -132,7 +313,7 @@ class DocumentUsageTracker:
         validation_passed: Optional[bool] = None
     ) -> None:
         """
-        Record usage for multiple documents at once
+        Record usage for multiple documents at once (single write transaction)
         
         Args:
             query: User query
@@ -140,6 +321,8 @@ class DocumentUsageTracker:
             response_confidence: Response confidence score (optional)
             validation_passed: Whether validation passed (optional)
         """
+        timestamp = datetime.now(timezone.utc).isoformat()
+        records = []
         for doc in documents:
             doc_id = doc.get("id", "")
             if not doc_id:
@@ -155,7 +338,7 @@ class DocumentUsageTracker:
                 # It's a distance, convert to similarity
                 similarity_score = 1.0 - (similarity_score / 2.0) if similarity_score < 2.0 else 0.0
             
-            self.record_usage(
+            records.append(self._make_record(
                 query=query,
                 doc_id=doc_id,
                 source=source,
@@ -163,8 +346,64 @@ class DocumentUsageTracker:
                 used_in_response=True,  # If retrieved, assume used
                 similarity_score=similarity_score,
                 response_confidence=response_confidence,
-                validation_passed=validation_passed
+                validation_passed=validation_passed,
+                timestamp=timestamp
+            ))
+        
+        self._save_records(records)
+        logger.debug(f"Recorded document usage for {len(records)} documents")
+    
+    def get_records(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        source_contains: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[DocumentUsageRecord]:
+        """
+        Get usage records in a time range (oldest first)
+        
+        Args:
+            start_time: Inclusive lower bound (optional)
+            end_time: Inclusive upper bound (optional)
+            source_contains: Only records whose source contains this substring (optional)
+            limit: Maximum number of (most recent) records (optional)
+        """
+        clauses = []
+        params: List[Any] = []
+        if start_time is not None:
+            clauses.append("ts >= ?")
+            params.append(start_time.timestamp())
+        if end_time is not None:
+            clauses.append("ts <= ?")
+            params.append(end_time.timestamp())
+        if source_contains:
+            clauses.append("instr(source, ?) > 0")
+            params.append(source_contains)
+        sql = """SELECT timestamp, query, doc_id, source, title, used_in_response,
+                        similarity_score, response_confidence, validation_passed
+                 FROM document_usage"""
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY ts DESC, id DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            DocumentUsageRecord(
+                timestamp=row[0], query=row[1], doc_id=row[2], source=row[3], title=row[4],
+                used_in_response=bool(row[5]), similarity_score=row[6], response_confidence=row[7],
+                validation_passed=None if row[8] is None else bool(row[8])
             )
+            for row in reversed(rows)
+        ]
+    
+    def count_records(self) -> int:
+        """Number of stored (unpruned) usage records"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM document_usage").fetchone()[0]
     
     def calculate_retention_metrics(self, days: int = 30) -> Dict[str, Any]:
         """
@@ -172,6 +411,9 @@ class DocumentUsageTracker:
         
         Retention = (Documents used in responses) / (Total documents learned)
         
+        Whole days inside the window come from the daily aggregates; only the partial
+        first day is aggregated from raw records (indexed range scan).
+        
         Args:
             days: Number of days to analyze
         
@@ -189,101 +431,52 @@ class DocumentUsageTracker:
                 ...
             }
         """
-        cutoff_time = datetime.now(timezone.utc) - timedelta(days=days)
-        recent_records = [
-            r for r in self._records
-            if datetime.fromisoformat(r.timestamp) >= cutoff_time
-        ]
+        cutoff = time.time() - days * SECONDS_PER_DAY
+        first_full_day = int(cutoff // SECONDS_PER_DAY) + 1
         
-        if not recent_records:
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT source, SUM(total_used), SUM(similarity_sum), SUM(similarity_count),
+                          SUM(confidence_sum), SUM(confidence_count),
+                          SUM(validation_passed_count), SUM(validation_total_count)
+                   FROM source_daily_usage WHERE day >= ? GROUP BY source""",
+                (first_full_day,)
+            ).fetchall()
+            rows += self._conn.execute(
+                """SELECT CASE WHEN source = '' THEN 'unknown' ELSE source END AS src,
+                          COUNT(*), TOTAL(similarity_score), COUNT(similarity_score),
+                          TOTAL(response_confidence), COUNT(response_confidence),
+                          TOTAL(validation_passed), COUNT(validation_passed)
+                   FROM document_usage WHERE ts >= ? AND ts < ? GROUP BY src""",
+                (cutoff, first_full_day * SECONDS_PER_DAY)
+            ).fetchall()
+        
+        if not rows:
             return {}
         
-        # Get total documents learned per source (from learning metrics)
-        # Note: For now, we use total_used as a proxy for total_learned
-        # In production, this would query learning_metrics.jsonl to get actual learned counts
-        source_totals: Dict[str, int] = {}
-        try:
-            # Try to get from learning metrics file if available
-            learning_metrics_file = Path("data/learning_metrics.jsonl")
-            if learning_metrics_file.exists():
-                # Parse learning_metrics.jsonl to get total learned per source
-                # This is a simplified version - in production, would use a proper parser
-                import json
-                with open(learning_metrics_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if line.strip():
-                            try:
-                                data = json.loads(line)
-                                source = data.get("source", "")
-                                entries_added = data.get("entries_added", 0)
-                                if source and entries_added:
-                                    source_totals[source] = source_totals.get(source, 0) + entries_added
-                            except Exception:
-                                continue
-        except Exception as e:
-            logger.debug(f"Could not get total learned documents from learning_metrics.jsonl: {e}")
+        # Note: total_learned is not tracked yet, so retention_rate stays 0.0 until it is
+        # (total_used is not a meaningful proxy for the denominator)
+        totals: Dict[str, List[float]] = {}
+        for source, *values in rows:
+            agg = totals.setdefault(source, [0] * 7)
+            for i, value in enumerate(values):
+                agg[i] += value or 0
         
-        # Aggregate usage by source
         source_stats: Dict[str, Dict[str, Any]] = {}
-        
-        for record in recent_records:
-            source = record.source or "unknown"
-            
-            if source not in source_stats:
-                source_stats[source] = {
-                    "total_used": 0,
-                    "total_learned": 0,  # Will be filled from learning metrics
-                    "similarity_scores": [],
-                    "confidence_scores": [],
-                    "validation_passed_count": 0,
-                    "validation_total_count": 0
-                }
-            
-            stats = source_stats[source]
-            stats["total_used"] += 1
-            
-            if record.similarity_score is not None:
-                stats["similarity_scores"].append(record.similarity_score)
-            
-            if record.response_confidence is not None:
-                stats["confidence_scores"].append(record.response_confidence)
-            
-            if record.validation_passed is not None:
-                stats["validation_total_count"] += 1
-                if record.validation_passed:
-                    stats["validation_passed_count"] += 1
-        
-        # Calculate derived metrics
-        for source, stats in source_stats.items():
-            total_used = stats["total_used"]
-            total_learned = stats.get("total_learned", total_used)  # Fallback: assume all used were learned
-            
-            # Calculate retention rate
-            if total_learned > 0:
-                stats["retention_rate"] = total_used / total_learned
-            else:
-                stats["retention_rate"] = 0.0
-            
-            # Calculate averages
-            if stats["similarity_scores"]:
-                stats["avg_similarity"] = sum(stats["similarity_scores"]) / len(stats["similarity_scores"])
-            else:
-                stats["avg_similarity"] = None
-            
-            if stats["confidence_scores"]:
-                stats["avg_confidence"] = sum(stats["confidence_scores"]) / len(stats["confidence_scores"])
-            else:
-                stats["avg_confidence"] = None
-            
-            # Calculate validation pass rate
-            if stats["validation_total_count"] > 0:
-                stats["validation_pass_rate"] = stats["validation_passed_count"] / stats["validation_total_count"]
-            else:
-                stats["validation_pass_rate"] = None
-            
-            # Clean up lists (keep only counts)
-            stats.pop("similarity_scores", None)
-            stats.pop("confidence_scores", None)
+        for source, (total_used, sim_sum, sim_count, conf_sum, conf_count, passed, validated) in totals.items():
+            if not total_used:
+                continue
+            total_learned = 0
+            source_stats[source] = {
+                "total_used": int(total_used),
+                "total_learned": total_learned,
+                "validation_passed_count": int(passed),
+                "validation_total_count": int(validated),
+                "retention_rate": total_used / total_learned if total_learned > 0 else 0.0,
+                "avg_similarity": sim_sum / sim_count if sim_count else None,
+                "avg_confidence": conf_sum / conf_count if conf_count else None,
+                "validation_pass_rate": passed / validated if validated else None
+            }
         
         return source_stats
     
@@ -306,12 +499,15 @@ class DocumentUsageTracker:
 
 # Global tracker instance (singleton pattern)
 _usage_tracker_instance: Optional[DocumentUsageTracker] = None
+_usage_tracker_lock = threading.Lock()
 
 
 def get_document_usage_tracker() -> DocumentUsageTracker:
     """Get global DocumentUsageTracker instance"""
     global _usage_tracker_instance
     if _usage_tracker_instance is None:
-        _usage_tracker_instance = DocumentUsageTracker()
+        with _usage_tracker_lock:
+            if _usage_tracker_instance is None:
+                _usage_tracker_instance = DocumentUsageTracker()
     return _usage_tracker_instance
 
@@ -252,10 +252,8 @@ class LearningPatternAnalyzer:
     ) -> int:
         """Count questions that used documents from this topic/source"""
         usage_records = [
-            r for r in self.usage_tracker._records
-            if start_time <= datetime.fromisoformat(r.timestamp) <= end_time
-            and source in r.source
-            and topic.lower() in (r.title or "").lower()
+            r for r in self.usage_tracker.get_records(start_time, end_time, source_contains=source)
+            if topic.lower() in (r.title or "").lower()
         ]
         
         return len(usage_records)
@@ -5,12 +5,13 @@ Handles promotion/demotion of knowledge items between tiers based on surprise sc
 
 import sqlite3
 import logging
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 import os
-import re
 from collections import Counter
 
+from backend.learning.corpus_statistics import extract_keywords
+
 logger = logging.getLogger(__name__)
 
 # Feature flag check
@@ -23,16 +24,21 @@ TIER_DEMOTE_THRESHOLD = float(os.getenv("TIER_DEMOTE_THRESHOLD", "0.15"))
 # Hysteresis to prevent oscillation (promote threshold > demote threshold)
 PROMOTE_HYSTERESIS = 0.1  # Additional buffer for promotion
 
+# Surprise score weights: rarity, novelty, retrieval frequency, validator overlap
+SURPRISE_WEIGHTS = (0.3, 0.3, 0.2, 0.2)
+
 
 class PromotionManager:
     """Manages promotion and demotion of knowledge items between tiers"""
     
-    def __init__(self, db_path: str = "data/continuum_memory.db"):
+    def __init__(self, db_path: str = "data/continuum_memory.db", corpus_stats=None):
         """Initialize Promotion Manager
         
         Args:
             db_path: Path to Continuum Memory SQLite database
+            corpus_stats: CorpusStatistics used for rarity/novelty scoring (default: global instance)
         """
+        self._corpus_stats = corpus_stats
         if not ENABLE_CONTINUUM_MEMORY:
             logger.info("Promotion Manager disabled (ENABLE_CONTINUUM_MEMORY=false)")
             return
@@ -40,6 +46,17 @@ class PromotionManager:
         self.db_path = db_path
         logger.info("Promotion Manager initialized")
     
+    def _get_corpus_stats(self):
+        """Corpus statistics of the knowledge base, or None if unavailable"""
+        if self._corpus_stats is None:
+            try:
+                from backend.learning.corpus_statistics import get_corpus_statistics
+                self._corpus_stats = get_corpus_statistics()
+            except Exception as e:
+                logger.warning(f"Corpus statistics not available: {e}")
+                return None
+        return self._corpus_stats
+    
     def calculate_rarity_score(self, content: str, existing_keywords: Optional[List[str]] = None) -> float:
         """
         Calculate rarity score based on keyword uniqueness.
@@ -49,7 +66,8 @@ class PromotionManager:
         
         Args:
             content: Content text to analyze
-            existing_keywords: List of keywords from existing knowledge (optional, will query if None)
+            existing_keywords: List of keywords from existing knowledge (optional, the corpus
+                document-frequency table is used if None)
             
         Returns:
             Rarity score (0.0-1.0)
@@ -58,7 +76,7 @@ class PromotionManager:
             return 0.0
         
         # Extract keywords (simple approach: words > 4 chars, lowercase, alphanumeric)
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', content.lower())
+        words = extract_keywords(content)
         if not words:
             return 0.0
         
@@ -66,10 +84,13 @@ class PromotionManager:
         word_counts = Counter(words)
         total_words = len(words)
         
-        # If no existing keywords provided, use simple heuristic
-        # (In production, would query existing knowledge base)
+        # If no existing keywords provided, score against the corpus document frequencies
         if existing_keywords is None:
-            # Simple heuristic: rare words (appearing once) get higher score
+            corpus_stats = self._get_corpus_stats()
+            rarity_score = corpus_stats.rarity_score(content) if corpus_stats else None
+            if rarity_score is not None:
+                return rarity_score
+            # Empty corpus - simple heuristic: rare words (appearing once) get higher score
             rare_words = sum(1 for count in word_counts.values() if count == 1)
             rarity_score = min(1.0, rare_words / max(total_words, 1) * 2.0)  # Scale up rare words
         else:
@@ -90,7 +111,8 @@ class PromotionManager:
         
         Args:
             content_embedding: Embedding vector of the content
-            centroid_embeddings: List of centroid embeddings from existing knowledge (optional)
+            centroid_embeddings: List of centroid embeddings from existing knowledge (optional,
+                distance to the nearest corpus k-means centroid is used if None)
             
         Returns:
             Novelty score (0.0-1.0), where 1.0 = highly novel
@@ -98,11 +120,12 @@ class PromotionManager:
         if not content_embedding:
             return 0.0
         
-        # If no centroid provided, use simple heuristic
-        # (In production, would compute centroid from existing knowledge embeddings)
+        # If no centroid provided, use the corpus centroids
         if centroid_embeddings is None or not centroid_embeddings:
-            # Default: assume moderate novelty
-            return 0.5
+            corpus_stats = self._get_corpus_stats()
+            novelty_score = corpus_stats.novelty_score(content_embedding) if corpus_stats else None
+            # Default (no corpus centroids yet): assume moderate novelty
+            return novelty_score if novelty_score is not None else 0.5
         
         try:
             # numpy is optional - only needed for novelty score calculation
@@ -251,11 +274,12 @@ class PromotionManager:
         validator_overlap = self.get_validator_overlap(item_id)
         
         # Weighted sum
+        w_rarity, w_novelty, w_retrieval, w_overlap = SURPRISE_WEIGHTS
         surprise_score = (
-            0.3 * rarity_score +
-            0.3 * novelty_score +
-            0.2 * retrieval_frequency +
-            0.2 * validator_overlap
+            w_rarity * rarity_score +
+            w_novelty * novelty_score +
+            w_retrieval * retrieval_frequency +
+            w_overlap * validator_overlap
         )
         
         # Normalize to 0.0-1.0
@@ -508,4 +532,207 @@ class PromotionManager:
         except Exception as e:
             logger.error(f"Error evaluating demotion for {item_id}: {e}")
             return None
-
+    
+    def run_tier_maintenance(self,
+                             contents: Optional[Dict[str, str]] = None,
+                             embeddings: Optional[Dict[str, List[float]]] = None,
+                             dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Evaluate promotion/demotion for every item in one batch.
+        
+        Batch version of evaluate_and_promote()/evaluate_and_demote() for cycle-cadence
+        maintenance: tier_metrics is loaded in one scan, decisions are computed vectorized
+        over the whole set with the same rules, and all tier updates plus their audit rows
+        are written in a single transaction. Each item moves at most one tier per run
+        (promotion is checked first).
+        
+        Surprise is refreshed for every item before deciding: the retrieval-frequency and
+        validator-overlap components are recomputed from the scanned columns and added to
+        the stored content part (rarity + novelty, tier_metrics.content_score). Items
+        without a stored content part get it derived from their current score, so their
+        score is unchanged on that first run and follows retrieval/overlap afterwards.
+        
+        Args:
+            contents: Optional item_id -> content; rarity/novelty of these items are also
+                recomputed against corpus statistics
+            embeddings: Optional item_id -> content embedding for the novelty component
+            dry_run: Compute decisions without writing them
+            
+        Returns:
+            Dict with evaluated, rescored, refreshed, promoted and demoted counts and the
+            transitions as (item_id, from_tier, to_tier, reason) tuples
+        """
+        summary: Dict[str, Any] = {
+            "evaluated": 0, "rescored": 0, "refreshed": 0, "promoted": 0, "demoted": 0, "transitions": []
+        }
+        if not ENABLE_CONTINUUM_MEMORY:
+            return summary
+        
+        import numpy as np
+        
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                rows = conn.execute("""
+                    SELECT item_id, tier, surprise_score, retrieval_count_7d, validator_overlap, content_score
+                    FROM tier_metrics
+                """).fetchall()
+                if not rows:
+                    return summary
+                
+                item_ids = [row[0] for row in rows]
+                tiers = np.array([row[1] for row in rows])
+                surprise = np.array([row[2] or 0.0 for row in rows], dtype=np.float64)
+                retrieval_7d = np.array([row[3] or 0 for row in rows], dtype=np.int64)
+                overlap = np.array([row[4] or 0.0 for row in rows], dtype=np.float64)
+                content_score = np.array([np.nan if row[5] is None else row[5] for row in rows], dtype=np.float64)
+                summary["evaluated"] = len(rows)
+                
+                rescored = self._rescore_surprise(
+                    item_ids, surprise, retrieval_7d, overlap, contents, embeddings, content_score
+                )
+                summary["rescored"] = len(rescored)
+                refreshed = self._refresh_surprise(surprise, retrieval_7d, overlap, content_score, rescored)
+                summary["refreshed"] = len(refreshed)
+                
+                # Same rules as evaluate_and_promote / evaluate_and_demote
+                promote_threshold = TIER_PROMOTE_THRESHOLD + PROMOTE_HYSTERESIS
+                high_surprise = surprise >= promote_threshold
+                promote_l0 = (tiers == "L0") & high_surprise & (retrieval_7d > 0)
+                promote_l1 = (tiers == "L1") & high_surprise & (overlap >= 0.8)
+                promoted = promote_l0 | promote_l1
+                demote_l2 = (tiers == "L2") & ((retrieval_7d == 0) | (overlap < 0.3))
+                demote_l1 = (tiers == "L1") & ~promoted & ((surprise < TIER_DEMOTE_THRESHOLD) | (retrieval_7d == 0))
+                
+                now = datetime.now().isoformat()
+                promotions, demotions, audit_rows = [], [], []
+                
+                def record(index: int, from_tier: str, to_tier: str, reason: str, updates: list):
+                    item_id = item_ids[index]
+                    updates.append((to_tier, now, now, item_id))
+                    audit_rows.append((
+                        item_id, from_tier, to_tier, reason,
+                        float(surprise[index]), int(retrieval_7d[index]), float(overlap[index]), now
+                    ))
+                    summary["transitions"].append((item_id, from_tier, to_tier, reason))
+                
+                for i in np.flatnonzero(promote_l0):
+                    record(i, "L0", "L1",
+                           f"surprise_score={surprise[i]:.3f} >= {promote_threshold} and retrieval_count_7d={retrieval_7d[i]} > 0",
+                           promotions)
+                for i in np.flatnonzero(promote_l1):
+                    record(i, "L1", "L2",
+                           f"surprise_score={surprise[i]:.3f} >= {promote_threshold} and validator_overlap={overlap[i]:.3f} >= 0.8",
+                           promotions)
+                for i in np.flatnonzero(demote_l2):
+                    reason = "retrieval_count_7d=0" if retrieval_7d[i] == 0 else f"validator_overlap={overlap[i]:.3f} < 0.3"
+                    record(i, "L2", "L1", reason, demotions)
+                for i in np.flatnonzero(demote_l1):
+                    reason = f"surprise_score={surprise[i]:.3f} < {TIER_DEMOTE_THRESHOLD}" if surprise[i] < TIER_DEMOTE_THRESHOLD else "retrieval_count_7d=0"
+                    record(i, "L1", "L0", reason, demotions)
+                
+                summary["promoted"] = len(promotions)
+                summary["demoted"] = len(demotions)
+                
+                scored = sorted(set(rescored) | set(refreshed))
+                if dry_run or not (scored or audit_rows):
+                    return summary
+                
+                with conn:
+                    if scored:
+                        conn.executemany(
+                            "UPDATE tier_metrics SET surprise_score = ?, content_score = ?, updated_at = ? WHERE item_id = ?",
+                            [(float(surprise[i]), float(content_score[i]), now, item_ids[i]) for i in scored]
+                        )
+                    conn.executemany(
+                        "UPDATE tier_metrics SET tier = ?, last_promoted_at = ?, updated_at = ? WHERE item_id = ?",
+                        promotions
+                    )
+                    conn.executemany(
+                        "UPDATE tier_metrics SET tier = ?, last_demoted_at = ?, updated_at = ? WHERE item_id = ?",
+                        demotions
+                    )
+                    conn.executemany("""
+                        INSERT INTO tier_audit (
+                            item_id, from_tier, to_tier, reason,
+                            surprise_score, retrieval_count_7d, validator_overlap,
+                            performed_by, created_at
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, 'system', ?)
+                    """, audit_rows)
+            finally:
+                conn.close()
+            
+            logger.info(
+                f"Tier maintenance: evaluated {summary['evaluated']} items, rescored {summary['rescored']}, "
+                f"refreshed {summary['refreshed']}, "
+                f"promoted {summary['promoted']}, demoted {summary['demoted']}"
+            )
+            return summary
+            
+        except Exception as e:
+            logger.error(f"Error running tier maintenance: {e}")
+            return summary
+    
+    @staticmethod
+    def _usage_score(retrieval_7d, overlap):
+        """Retrieval-frequency + validator-overlap part of the surprise score (vectorized)"""
+        import numpy as np
+        _, _, w_retrieval, w_overlap = SURPRISE_WEIGHTS
+        return w_retrieval * np.minimum(1.0, retrieval_7d / 100.0) + w_overlap * overlap
+    
+    def _refresh_surprise(self, surprise, retrieval_7d, overlap, content_score, skip) -> List[int]:
+        """Recompute surprise (in place) from stored content part + current usage; returns changed indices"""
+        import numpy as np
+        
+        usage = self._usage_score(retrieval_7d, overlap)
+        pending = np.ones(len(surprise), dtype=bool)
+        if skip:
+            pending[np.array(skip)] = False
+        
+        # First run for an item: derive its content part from the score it has now
+        w_rarity, w_novelty, _, _ = SURPRISE_WEIGHTS
+        baseline = pending & np.isnan(content_score)
+        content_score[baseline] = np.clip(surprise[baseline] - usage[baseline], 0.0, w_rarity + w_novelty)
+        
+        known = pending & ~baseline
+        updated = np.clip(content_score + usage, 0.0, 1.0)
+        changed = known & ~np.isclose(updated, surprise)
+        surprise[changed] = updated[changed]
+        return np.flatnonzero(baseline | changed).tolist()
+    
+    def _rescore_surprise(self, item_ids, surprise, retrieval_7d, overlap, contents, embeddings,
+                          content_score=None) -> List[int]:
+        """Recompute surprise (in place) for items with known content; returns their indices"""
+        if not contents:
+            return []
+        import numpy as np
+        
+        indices = [i for i, item_id in enumerate(item_ids) if item_id in contents]
+        if not indices:
+            return []
+        
+        rarity = np.array([self.calculate_rarity_score(contents[item_ids[i]]) for i in indices])
+        
+        # Novelty: 0.0 without an embedding, 0.5 without corpus centroids (as calculate_novelty_score)
+        novelty = np.zeros(len(indices))
+        embeddings = embeddings or {}
+        with_embedding = [j for j, i in enumerate(indices) if embeddings.get(item_ids[i]) is not None]
+        if with_embedding:
+            corpus_stats = self._get_corpus_stats()
+            scores = None
+            if corpus_stats:
+                scores = corpus_stats.novelty_scores([embeddings[item_ids[indices[j]]] for j in with_embedding])
+            if scores is None:
+                scores = np.full(len(with_embedding), 0.5)
+            novelty[with_embedding] = np.where(np.isnan(scores), 0.5, scores)
+        
+        w_rarity, w_novelty, _, _ = SURPRISE_WEIGHTS
+        index_array = np.array(indices)
+        content_part = w_rarity * rarity + w_novelty * novelty
+        if content_score is not None:
+            content_score[index_array] = content_part
+        surprise[index_array] = np.clip(
+            content_part + self._usage_score(retrieval_7d[index_array], overlap[index_array]),
+            0.0, 1.0
+        )
+        return indices
@@ -14,7 +14,7 @@ It acts as a "police of honesty" - cutting out all unsupported content.
 import logging
 import os
 from typing import Optional, Dict, Any, List
-import httpx
+from backend.api.utils.http_client_pool import pooled_http_client
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -195,7 +195,7 @@ Keep only honest acknowledgment and analysis of why concept seems hypothetical.
 RESPOND IN {lang_name.upper()} ONLY."""
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_http_client(self.deepseek_base_url, timeout=30.0) as client:
                 response = await client.post(
                     self.deepseek_base_url,
                     headers={
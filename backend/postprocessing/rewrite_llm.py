@@ -11,6 +11,7 @@ import os
 import re
 from typing import Optional, Dict, Any, Tuple
 import httpx
+from backend.api.utils.http_client_pool import pooled_http_client
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -118,7 +119,7 @@ class RewriteLLM:
                 # 3. Chat model is faster and cheaper
                 model = "deepseek-chat"  # Always use chat for rewrite
                 
-                async with httpx.AsyncClient(timeout=timeout_duration) as client:
+                async with pooled_http_client(self.deepseek_base_url, timeout=timeout_duration) as client:
                     response = await client.post(
                         self.deepseek_base_url,
                         headers={
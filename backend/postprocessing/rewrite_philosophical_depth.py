@@ -14,7 +14,7 @@ It focuses on DEPTH and PHILOSOPHICAL RIGOR, not on removing fabrication.
 import logging
 import os
 from typing import Optional, Dict, Any
-import httpx
+from backend.api.utils.http_client_pool import pooled_http_client
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -219,7 +219,7 @@ Add:
 RESPOND IN {lang_name.upper()} ONLY."""
 
         try:
-            async with httpx.AsyncClient(timeout=45.0) as client:
+            async with pooled_http_client(self.deepseek_base_url, timeout=45.0) as client:
                 response = await client.post(
                     self.deepseek_base_url,
                     headers={
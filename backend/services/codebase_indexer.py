@@ -3,17 +3,46 @@ Codebase Indexer for StillMe Codebase Assistant
 
 Indexes source code files into ChromaDB for RAG-based code Q&A.
 Implements chunking strategy: by file, by class, by function.
+
+Indexing is incremental: a manifest (file content hash + per-chunk document hash)
+is kept next to the ChromaDB data, so unchanged files are skipped without parsing,
+only new/changed chunks are re-embedded, and chunks of removed symbols or files
+are deleted.
 """
 
 import os
 import ast
 import logging
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 from dataclasses import dataclass
 
+from backend.services.index_manifest import (
+    content_hash,
+    default_manifest_path,
+    load_manifest,
+    save_manifest,
+)
+
 logger = logging.getLogger(__name__)
 
+# Max ids per ChromaDB delete call
+DELETE_BATCH_SIZE = 500
+
+# Pipelined indexing: parser processes -> packed embedding batches -> ChromaDB writer thread
+CODEBASE_INDEX_WORKERS = int(os.getenv("CODEBASE_INDEX_WORKERS", str(min(4, os.cpu_count() or 1))))
+CODEBASE_EMBED_BATCH_SIZE = int(os.getenv("CODEBASE_EMBED_BATCH_SIZE", "64"))
+# Below this many files, parsing in-process is faster than starting worker processes
+MIN_FILES_FOR_PROCESS_POOL = 32
+# Embedded batches waiting for the writer before embedding blocks
+WRITE_QUEUE_SIZE = 4
+PROGRESS_LOG_EVERY = 100
+
 # Global instance (singleton pattern)
 _codebase_indexer_instance = None
 
@@ -50,19 +79,34 @@ class CodebaseIndexer:
     Safety: Read-only, no code modification.
     """
     
-    def __init__(self, chroma_client, embedding_service):
+    def __init__(self, chroma_client, embedding_service, manifest_path: Optional[str] = None):
         """
         Initialize codebase indexer.
         
         Args:
             chroma_client: ChromaDB client instance
             embedding_service: EmbeddingService instance
+            manifest_path: Incremental index manifest (default: next to the ChromaDB data)
         """
         self.chroma_client = chroma_client
         self.embedding_service = embedding_service
+        self.manifest_path = (
+            manifest_path
+            or os.getenv("CODEBASE_INDEX_MANIFEST")
+            or default_manifest_path(chroma_client, "codebase_index_manifest.json")
+        )
         self.codebase_collection = None
         self._initialize_collection()
         
+        # Pipeline settings, progress of the current/last run, one indexing run at a time
+        self.parse_workers = CODEBASE_INDEX_WORKERS
+        self.embed_batch_size = max(1, CODEBASE_EMBED_BATCH_SIZE)
+        self._index_lock = threading.Lock()
+        self._progress_lock = threading.Lock()
+        self._progress: Dict[str, Any] = {"running": False}
+        self._last_index_stats: Optional[Dict[str, Any]] = None
+        self._background_thread: Optional[threading.Thread] = None
+        
         # File extensions to index (Phase 1: Python only)
         self.supported_extensions = {'.py'}
         
@@ -131,9 +175,14 @@ class CodebaseIndexer:
         
         return True
     
-    def _parse_python_file(self, file_path: Path) -> List[CodeChunk]:
+    @staticmethod
+    def _parse_python_file(file_path: Path, source_code: Optional[str] = None) -> List[CodeChunk]:
         """
-        Parse Python file and extract chunks.
+        Parse Python file and extract chunks (no instance state - runs in parser worker processes).
+        
+        Args:
+            file_path: Path to the file
+            source_code: File content if already read
         
         Returns:
             List of CodeChunk objects
@@ -141,8 +190,9 @@ class CodebaseIndexer:
         chunks = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
+            if source_code is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    source_code = f.read()
             
             # Parse AST
             try:
@@ -159,7 +209,7 @@ class CodebaseIndexer:
             if file_lines < 500:
                 # Small file: 1 chunk per file
                 docstring = ast.get_docstring(tree)
-                imports = self._extract_imports(tree)
+                imports = CodebaseIndexer._extract_imports(tree)
                 
                 chunk = CodeChunk(
                     file_path=str(file_path),
@@ -172,14 +222,15 @@ class CodebaseIndexer:
                 chunks.append(chunk)
             else:
                 # Medium/Large file: chunk by class or function
-                chunks.extend(self._extract_classes_and_functions(tree, file_path, lines))
+                chunks.extend(CodebaseIndexer._extract_classes_and_functions(tree, file_path, lines))
             
         except Exception as e:
             logger.error(f"❌ Error parsing {file_path}: {e}")
         
         return chunks
     
-    def _extract_imports(self, tree: ast.AST) -> List[str]:
+    @staticmethod
+    def _extract_imports(tree: ast.AST) -> List[str]:
         """Extract import statements from AST"""
         imports = []
         for node in ast.walk(tree):
@@ -192,10 +243,18 @@ class CodebaseIndexer:
                     imports.append(f"{module}.{alias.name}" if module else alias.name)
         return imports
     
-    def _extract_classes_and_functions(self, tree: ast.AST, file_path: Path, lines: List[str]) -> List[CodeChunk]:
+    @staticmethod
+    def _extract_classes_and_functions(tree: ast.AST, file_path: Path, lines: List[str]) -> List[CodeChunk]:
         """Extract classes and functions as separate chunks"""
         chunks = []
         
+        # Functions defined directly in a class body are methods (collected once instead of per function)
+        method_nodes = {
+            id(child)
+            for parent in ast.walk(tree) if isinstance(parent, ast.ClassDef)
+            for child in parent.body
+        }
+        
         for node in ast.walk(tree):
             if isinstance(node, ast.ClassDef):
                 # Extract class
@@ -225,20 +284,7 @@ class CodebaseIndexer:
             
             elif isinstance(node, ast.FunctionDef):
                 # Only extract top-level functions (not methods)
-                # Check if this function is inside a class by traversing parent nodes
-                is_method = False
-                for parent in ast.walk(tree):
-                    if isinstance(parent, ast.ClassDef):
-                        # Check if node is in parent's body
-                        if hasattr(parent, 'body'):
-                            for child in parent.body:
-                                if child == node:
-                                    is_method = True
-                                    break
-                        if is_method:
-                            break
-                
-                if not is_method:
+                if id(node) not in method_nodes:
                     func_start = node.lineno
                     func_end = node.end_lineno if hasattr(node, 'end_lineno') else node.lineno
                     
@@ -264,8 +310,9 @@ class CodebaseIndexer:
         Returns:
             Dictionary with id, document, metadata
         """
-        # Create unique ID
-        chunk_id = f"{chunk.file_path}:{chunk.line_range[0]}-{chunk.line_range[1]}"
+        # Create ID from the symbol (not line numbers) so it stays stable when code above it moves
+        symbol = chunk.class_name or chunk.function_name or "module"
+        chunk_id = f"{chunk.file_path}::{chunk.code_type}:{symbol}"
         
         # Build document text (code + metadata for better retrieval)
         doc_parts = []
@@ -309,15 +356,140 @@ class CodebaseIndexer:
             "metadata": metadata
         }
     
-    def index_file(self, file_path: Path) -> int:
+    def _chunks_to_documents(self, chunks: List[CodeChunk]) -> List[Dict[str, Any]]:
+        """Convert a file's chunks to documents, making IDs of same-named symbols unique"""
+        documents = []
+        seen_ids: Dict[str, int] = {}
+        for chunk in chunks:
+            doc = self._chunk_to_document(chunk)
+            occurrence = seen_ids.get(doc["id"], 0) + 1
+            seen_ids[doc["id"]] = occurrence
+            if occurrence > 1:
+                doc["id"] = f"{doc['id']}#{occurrence}"
+            documents.append(doc)
+        return documents
+    
+    def _delete_ids(self, ids: List[str]):
+        """Delete chunks by ID in batches"""
+        for i in range(0, len(ids), DELETE_BATCH_SIZE):
+            self.codebase_collection.delete(ids=ids[i:i + DELETE_BATCH_SIZE])
+    
+    def _diff_file(
+        self,
+        file_hash: str,
+        chunks: List[CodeChunk],
+        previous: Optional[Dict[str, Any]],
+        force: bool = False
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]], List[str]]:
         """
-        Index a single file.
+        Compare a parsed file with its manifest entry.
+        
+        Returns:
+            tuple: (new manifest entry, documents to embed, documents whose metadata to refresh, chunk IDs to delete)
+        """
+        documents = self._chunks_to_documents(chunks)
+        old_chunks = (previous or {}).get("chunks", {})
+        new_chunks: Dict[str, str] = {}
+        to_embed = []
+        to_update = []
+        for doc in documents:
+            doc_hash = content_hash(doc["document"])
+            new_chunks[doc["id"]] = doc_hash
+            if not force and old_chunks.get(doc["id"]) == doc_hash:
+                # Same code, but line numbers may have moved - refresh metadata only
+                to_update.append(doc)
+            else:
+                to_embed.append(doc)
+        removed_ids = [chunk_id for chunk_id in old_chunks if chunk_id not in new_chunks]
+        return {"hash": file_hash, "chunks": new_chunks}, to_embed, to_update, removed_ids
+    
+    def _embed_documents(self, documents: List[Dict[str, Any]]) -> List[Any]:
+        """Embed document texts"""
+        texts = [doc["document"] for doc in documents]
+        # Use batch_encode for efficiency (or encode_text if list is supported)
+        if len(texts) == 1:
+            return [self.embedding_service.encode_text(texts[0])]
+        return self.embedding_service.batch_encode(texts)
+    
+    def _write_chunks(
+        self,
+        to_embed: List[Dict[str, Any]],
+        embeddings: List[Any],
+        to_update: List[Dict[str, Any]],
+        removed_ids: List[str]
+    ):
+        """Upsert embedded chunks, refresh moved chunks' metadata, delete removed chunks"""
+        if to_embed:
+            self.codebase_collection.upsert(
+                ids=[doc["id"] for doc in to_embed],
+                embeddings=embeddings,
+                documents=[doc["document"] for doc in to_embed],
+                metadatas=[doc["metadata"] for doc in to_embed]
+            )
+        if to_update:
+            self.codebase_collection.update(
+                ids=[doc["id"] for doc in to_update],
+                metadatas=[doc["metadata"] for doc in to_update]
+            )
+        if removed_ids:
+            self._delete_ids(removed_ids)
+    
+    def _index_file_incremental(
+        self,
+        file_path: Path,
+        previous: Optional[Dict[str, Any]],
+        force: bool = False
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, int]]:
+        """
+        Bring one file's chunks in ChromaDB up to date with its current content.
+        
+        Args:
+            file_path: Path to file
+            previous: Manifest entry from the last run ({"hash", "chunks": {id: doc_hash}})
+            force: Re-embed every chunk even if unchanged
+            
+        Returns:
+            tuple: (new manifest entry, stats with embedded/unchanged/deleted chunk counts)
+        """
+        stats = {"embedded": 0, "unchanged": 0, "deleted": 0}
+        
+        _, file_hash, chunks = _read_and_parse(str(file_path), (previous or {}).get("hash"), force)
+        if file_hash is None:
+            return previous, stats
+        if chunks is None:
+            # Unchanged file - skip parsing and embedding entirely
+            stats["unchanged"] = len(previous.get("chunks", {}))
+            return previous, stats
+        
+        entry, to_embed, to_update, removed_ids = self._diff_file(file_hash, chunks, previous, force)
+        try:
+            embeddings = self._embed_documents(to_embed) if to_embed else []
+            self._write_chunks(to_embed, embeddings, to_update, removed_ids)
+        except Exception as e:
+            logger.error(f"❌ Error updating chunks of {file_path} in ChromaDB: {e}")
+            # Keep the old manifest entry so the file is retried on the next run
+            return previous, stats
+        
+        stats["embedded"] = len(to_embed)
+        stats["unchanged"] = len(to_update)
+        stats["deleted"] = len(removed_ids)
+        if to_embed or removed_ids:
+            logger.info(
+                f"✅ Indexed {file_path}: {len(to_embed)} chunks embedded, "
+                f"{len(to_update)} unchanged, {len(removed_ids)} removed"
+            )
+        return entry, stats
+    
+    def index_file(self, file_path: Path, force: bool = False) -> int:
+        """
+        Index a single file (incrementally).
         
         Args:
             file_path: Path to file to index
+            force: Re-embed every chunk even if unchanged
             
         Returns:
-            Number of chunks created
+            Number of chunks (re-)embedded
         """
         if not self._should_index_file(file_path):
             logger.debug(f"⏭️ Skipping {file_path} (not supported or excluded)")
@@ -325,106 +497,345 @@ class CodebaseIndexer:
         
         logger.info(f"📄 Indexing {file_path}")
         
-        # Parse file and extract chunks
-        chunks = self._parse_python_file(file_path)
-        
-        if not chunks:
-            logger.warning(f"⚠️ No chunks extracted from {file_path}")
-            return 0
-        
-        # Convert chunks to documents
-        documents = []
-        for chunk in chunks:
-            doc = self._chunk_to_document(chunk)
-            documents.append(doc)
+        manifest = load_manifest(self.manifest_path) or {"files": {}}
+        files_manifest = manifest.setdefault("files", {})
+        entry, stats = self._index_file_incremental(file_path, files_manifest.get(str(file_path)), force)
+        if entry is not None:
+            files_manifest[str(file_path)] = entry
+            save_manifest(self.manifest_path, manifest)
+        return stats["embedded"]
+    
+    def _parse_files(
+        self,
+        file_keys: List[str],
+        files_manifest: Dict[str, Any],
+        force: bool
+    ) -> Iterator[Tuple[str, Optional[str], Optional[List[CodeChunk]]]]:
+        """Hash and parse files, on a process pool when there are enough of them (results in completion order)"""
+        jobs = [(key, (files_manifest.get(key) or {}).get("hash"), force) for key in file_keys]
+        
+        if self.parse_workers > 1 and len(jobs) >= MIN_FILES_FOR_PROCESS_POOL:
+            try:
+                # spawn: forking a process that holds model/ChromaDB threads is unsafe
+                pool = ProcessPoolExecutor(
+                    max_workers=self.parse_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Could not start parser process pool, parsing in-process: {e}")
+                pool = None
+            if pool is not None:
+                with pool:
+                    futures = {pool.submit(_read_and_parse, *job): job for job in jobs}
+                    for future in as_completed(futures):
+                        try:
+                            yield future.result()
+                        except Exception as e:
+                            key = futures[future][0]
+                            logger.error(f"❌ Parser worker failed for {key}: {e}")
+                            yield key, None, None
+                return
+        
+        for job in jobs:
+            yield _read_and_parse(*job)
+    
+    def _writer_loop(self, write_queue: "queue.Queue", failed_files: Set[str]):
+        """Writer stage: apply queued ChromaDB writes in order; record files whose writes failed"""
+        while True:
+            item = write_queue.get()
+            if item is None:
+                return
+            file_keys, to_embed, embeddings, to_update, removed_ids = item
+            try:
+                self._write_chunks(to_embed, embeddings, to_update, removed_ids)
+                with self._progress_lock:
+                    self._progress["chunks_written"] += len(to_embed)
+            except Exception as e:
+                logger.error(f"❌ Error writing {len(to_embed)} chunks to ChromaDB: {e}")
+                failed_files.update(file_keys)
+    
+    def _embed_and_queue(self, batch: List[Tuple[str, Dict[str, Any]]], write_queue: "queue.Queue", failed_files: Set[str]):
+        """Embedding stage: embed one packed batch (chunks of many files) and hand it to the writer"""
+        file_keys = {key for key, _ in batch}
+        documents = [doc for _, doc in batch]
+        try:
+            embeddings = self._embed_documents(documents)
+        except Exception as e:
+            logger.error(f"❌ Error embedding {len(documents)} chunks: {e}")
+            failed_files.update(file_keys)
+            return
+        with self._progress_lock:
+            self._progress["chunks_embedded"] += len(documents)
+        # Blocks when the writer is behind (bounded queue = back-pressure on embedding)
+        write_queue.put((file_keys, documents, embeddings, [], []))
+    
+    def _index_files_pipelined(
+        self,
+        file_keys: List[str],
+        files_manifest: Dict[str, Any],
+        force: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Index files through the parse -> embed -> write pipeline.
         
-        # Generate embeddings
-        texts = [doc["document"] for doc in documents]
-        # Use batch_encode for efficiency (or encode_text if list is supported)
-        if len(texts) == 1:
-            embeddings = [self.embedding_service.encode_text(texts[0])]
-        else:
-            embeddings = self.embedding_service.batch_encode(texts)
+        Parser processes turn files into CodeChunks, this thread packs chunks from many
+        files into full embedding batches, and a writer thread bulk-writes to ChromaDB.
+        files_manifest is updated in place (files whose writes failed keep their old entry).
         
-        # Prepare data for ChromaDB
-        ids = [doc["id"] for doc in documents]
-        metadatas = [doc["metadata"] for doc in documents]
+        Returns:
+            Dictionary with stats, including per-file embedded/deleted counts under "per_file"
+        """
+        stats = {
+            "files_indexed": 0,
+            "chunks_created": 0,
+            "files_unchanged": 0,
+            "chunks_unchanged": 0,
+            "chunks_deleted": 0
+        }
+        per_file: Dict[str, Tuple[int, int]] = {}
+        previous_entries: Dict[str, Optional[Dict[str, Any]]] = {}
+        failed_files: Set[str] = set()
+        
+        started_at = time.time()
+        with self._progress_lock:
+            self._progress = {
+                "running": True,
+                "files_total": len(file_keys),
+                "files_parsed": 0,
+                "chunks_embedded": 0,
+                "chunks_written": 0,
+                "started_at": started_at,
+                "finished_at": None
+            }
+        
+        write_queue: "queue.Queue" = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        writer = threading.Thread(
+            target=self._writer_loop,
+            args=(write_queue, failed_files),
+            name="codebase-index-writer",
+            daemon=True
+        )
+        writer.start()
         
-        # Add to collection
+        pending: List[Tuple[str, Dict[str, Any]]] = []
         try:
-            self.codebase_collection.add(
-                ids=ids,
-                embeddings=embeddings,
-                documents=texts,
-                metadatas=metadatas
-            )
-            logger.info(f"✅ Indexed {len(chunks)} chunks from {file_path}")
-            return len(chunks)
-        except Exception as e:
-            logger.error(f"❌ Error adding chunks to ChromaDB: {e}")
-            return 0
+            for key, file_hash, chunks in self._parse_files(file_keys, files_manifest, force):
+                with self._progress_lock:
+                    self._progress["files_parsed"] += 1
+                    files_parsed = self._progress["files_parsed"]
+                if files_parsed % PROGRESS_LOG_EVERY == 0:
+                    logger.info(f"📊 Codebase indexing: {files_parsed}/{len(file_keys)} files parsed")
+                
+                previous = files_manifest.get(key)
+                if file_hash is None:
+                    continue
+                if chunks is None:
+                    stats["files_unchanged"] += 1
+                    stats["chunks_unchanged"] += len(previous.get("chunks", {}))
+                    continue
+                
+                entry, to_embed, to_update, removed_ids = self._diff_file(file_hash, chunks, previous, force)
+                previous_entries[key] = previous
+                files_manifest[key] = entry
+                per_file[key] = (len(to_embed), len(removed_ids))
+                stats["chunks_unchanged"] += len(to_update)
+                if to_update or removed_ids:
+                    write_queue.put(({key}, [], [], to_update, removed_ids))
+                
+                pending.extend((key, doc) for doc in to_embed)
+                while len(pending) >= self.embed_batch_size:
+                    batch, pending = pending[:self.embed_batch_size], pending[self.embed_batch_size:]
+                    self._embed_and_queue(batch, write_queue, failed_files)
+            
+            if pending:
+                self._embed_and_queue(pending, write_queue, failed_files)
+        finally:
+            write_queue.put(None)
+            writer.join()
+        
+        # Files with a failed embed/write keep their previous manifest entry and are retried next run
+        for key in failed_files:
+            if previous_entries.get(key) is None:
+                files_manifest.pop(key, None)
+            else:
+                files_manifest[key] = previous_entries[key]
+            per_file.pop(key, None)
+        
+        for embedded, deleted in per_file.values():
+            if embedded or deleted:
+                stats["files_indexed"] += 1
+            else:
+                stats["files_unchanged"] += 1
+            stats["chunks_created"] += embedded
+            stats["chunks_deleted"] += deleted
+        
+        elapsed = time.time() - started_at
+        with self._progress_lock:
+            self._progress["running"] = False
+            self._progress["finished_at"] = time.time()
+        stats["files_failed"] = len(failed_files)
+        stats["elapsed_seconds"] = round(elapsed, 2)
+        stats["chunks_per_second"] = round(stats["chunks_created"] / elapsed, 1) if elapsed > 0 else 0.0
+        stats["files_per_second"] = round(len(file_keys) / elapsed, 1) if elapsed > 0 else 0.0
+        stats["per_file"] = per_file
+        logger.info(
+            f"⏱️ Indexed {len(file_keys)} files in {elapsed:.1f}s "
+            f"({stats['files_per_second']} files/s, {stats['chunks_per_second']} chunks/s embedded)"
+        )
+        return stats
+    
+    def _collect_files(self, directory: Path) -> List[str]:
+        """Supported files under a directory"""
+        return [str(file_path) for file_path in directory.rglob("*.py") if self._should_index_file(file_path)]
     
-    def index_directory(self, directory: Path) -> Dict[str, int]:
+    def index_directory(self, directory: Path, force: bool = False) -> Dict[str, int]:
         """
-        Index all supported files in a directory recursively.
+        Index all supported files in a directory recursively (incrementally).
         
         Args:
             directory: Directory to index
+            force: Re-embed every chunk even if unchanged
             
         Returns:
-            Dictionary with stats: {files_indexed, chunks_created}
+            Dictionary with stats: {files_indexed, chunks_created, files_unchanged, chunks_unchanged, chunks_deleted}
         """
-        stats = {"files_indexed": 0, "chunks_created": 0}
-        
         if not directory.exists():
             logger.warning(f"⚠️ Directory does not exist: {directory}")
-            return stats
-        
-        # Find all Python files
-        for file_path in directory.rglob("*.py"):
-            if self._should_index_file(file_path):
-                chunks = self.index_file(file_path)
-                if chunks > 0:
-                    stats["files_indexed"] += 1
-                    stats["chunks_created"] += chunks
-        
+            return {"files_indexed": 0, "chunks_created": 0}
+        
+        with self._index_lock:
+            manifest = load_manifest(self.manifest_path) or {"files": {}}
+            files_manifest = manifest.setdefault("files", {})
+            stats = self._index_files_pipelined(self._collect_files(directory), files_manifest, force)
+            save_manifest(self.manifest_path, manifest)
+        stats.pop("per_file", None)
         return stats
     
-    def index_codebase(self) -> Dict[str, Any]:
+    def index_codebase(self, force: bool = False, blocking: bool = True) -> Optional[Dict[str, Any]]:
         """
         Index entire StillMe codebase.
         
+        Only files whose content changed since the last run are parsed, only changed
+        chunks are re-embedded, and chunks of deleted files/symbols are removed.
+        
+        Args:
+            force: Ignore the manifest and re-embed everything
+            blocking: Wait for an indexing run already in progress; if False, return None instead
+        
         Returns:
-            Dictionary with indexing statistics
+            Dictionary with indexing statistics, or None if not blocking and a run is in progress
         """
+        if not self._index_lock.acquire(blocking=blocking):
+            return None
+        try:
+            return self._index_codebase(force)
+        finally:
+            self._index_lock.release()
+    
+    def _index_codebase(self, force: bool) -> Dict[str, Any]:
         logger.info("🚀 Starting codebase indexing...")
         
-        total_stats = {"files_indexed": 0, "chunks_created": 0, "directories": []}
+        manifest = None if force else load_manifest(self.manifest_path)
+        # Without a manifest we cannot tell which chunks are ours - reconcile with the collection at the end
+        full_rebuild = manifest is None
+        files_manifest: Dict[str, Any] = {} if full_rebuild else manifest.get("files", {})
         
         # Get project root (assume we're in project root or can find it)
         project_root = Path.cwd()
         
+        # One pipeline run over every directory, so embedding batches are packed across all files
+        directory_files: Dict[str, List[str]] = {}
         for dir_name in self.index_directories:
             dir_path = project_root / dir_name
             if dir_path.exists():
-                logger.info(f"📁 Indexing directory: {dir_name}")
-                stats = self.index_directory(dir_path)
-                total_stats["files_indexed"] += stats["files_indexed"]
-                total_stats["chunks_created"] += stats["chunks_created"]
-                total_stats["directories"].append({
-                    "directory": dir_name,
-                    "files": stats["files_indexed"],
-                    "chunks": stats["chunks_created"]
-                })
+                logger.info(f"📁 Collecting files in directory: {dir_name}")
+                directory_files[dir_name] = self._collect_files(dir_path)
             else:
                 logger.warning(f"⚠️ Directory not found: {dir_path}")
+        all_files = [key for keys in directory_files.values() for key in keys]
+        seen_files = set(all_files)
+        
+        total_stats = self._index_files_pipelined(all_files, files_manifest, force)
+        per_file = total_stats.pop("per_file")
+        total_stats["files_removed"] = 0
+        total_stats["incremental"] = not full_rebuild
+        total_stats["directories"] = []
+        for dir_name, keys in directory_files.items():
+            indexed = [per_file[key] for key in keys if key in per_file and any(per_file[key])]
+            total_stats["directories"].append({
+                "directory": dir_name,
+                "files": len(indexed),
+                "chunks": sum(embedded for embedded, _ in indexed)
+            })
+        
+        # Remove chunks of files that no longer exist
+        for removed_file in [key for key in files_manifest if key not in seen_files]:
+            removed_ids = list(files_manifest.pop(removed_file).get("chunks", {}))
+            try:
+                self._delete_ids(removed_ids)
+                total_stats["files_removed"] += 1
+                total_stats["chunks_deleted"] += len(removed_ids)
+            except Exception as e:
+                logger.error(f"❌ Error deleting chunks of removed file {removed_file}: {e}")
+        
+        if full_rebuild:
+            # Drop chunks this run did not produce (old line-range IDs, files deleted before the manifest existed)
+            try:
+                current_ids = {chunk_id for entry in files_manifest.values() for chunk_id in entry.get("chunks", {})}
+                existing_ids = self.codebase_collection.get(include=[])["ids"]
+                orphan_ids = [chunk_id for chunk_id in existing_ids if chunk_id not in current_ids]
+                if orphan_ids:
+                    self._delete_ids(orphan_ids)
+                    total_stats["chunks_deleted"] += len(orphan_ids)
+                    logger.info(f"🗑️ Removed {len(orphan_ids)} stale chunks from stillme_codebase")
+            except Exception as e:
+                logger.warning(f"⚠️ Could not reconcile stillme_codebase with the index manifest: {e}")
+        
+        save_manifest(self.manifest_path, {"files": files_manifest})
         
         logger.info(f"✅ Codebase indexing complete!")
-        logger.info(f"   Files indexed: {total_stats['files_indexed']}")
-        logger.info(f"   Chunks created: {total_stats['chunks_created']}")
+        logger.info(f"   Files indexed: {total_stats['files_indexed']} (unchanged: {total_stats['files_unchanged']})")
+        logger.info(f"   Chunks created: {total_stats['chunks_created']} (deleted: {total_stats['chunks_deleted']})")
         
+        self._last_index_stats = total_stats
         return total_stats
     
+    def start_background_index(self, force: bool = False) -> bool:
+        """
+        Run index_codebase() on a background thread.
+        
+        Returns:
+            False if an indexing run is already in progress
+        """
+        with self._progress_lock:
+            if self._background_thread is not None and self._background_thread.is_alive():
+                return False
+            if self._index_lock.locked():
+                # A synchronous run holds the lock
+                return False
+            
+            def _run():
+                try:
+                    self.index_codebase(force=force)
+                except Exception as e:
+                    logger.error(f"❌ Background codebase indexing failed: {e}", exc_info=True)
+            
+            self._background_thread = threading.Thread(target=_run, name="codebase-indexer", daemon=True)
+            self._background_thread.start()
+        return True
+    
+    def get_index_progress(self) -> Dict[str, Any]:
+        """Get progress/throughput of the current (or last) indexing run"""
+        with self._progress_lock:
+            progress = dict(self._progress)
+        if progress.get("started_at"):
+            end = progress.get("finished_at") or time.time()
+            elapsed = max(end - progress["started_at"], 1e-9)
+            progress["elapsed_seconds"] = round(elapsed, 2)
+            progress["chunks_per_second"] = round(progress.get("chunks_embedded", 0) / elapsed, 1)
+        progress["last_run"] = self._last_index_stats
+        return progress
+    
     def query_codebase(self, query: str, n_results: int = 5) -> List[Dict[str, Any]]:
         """
         Query codebase using RAG.
@@ -460,6 +871,28 @@ class CodebaseIndexer:
         return formatted_results
 
 
+def _read_and_parse(
+    file_path: str,
+    previous_hash: Optional[str],
+    force: bool = False
+) -> Tuple[str, Optional[str], Optional[List[CodeChunk]]]:
+    """
+    Parser worker: hash a file and parse it unless its hash matches the manifest.
+    
+    Returns:
+        tuple: (file_path, content hash or None if unreadable, chunks or None if unchanged/unreadable)
+    """
+    try:
+        raw = Path(file_path).read_bytes()
+    except OSError as e:
+        logger.error(f"❌ Could not read {file_path}: {e}")
+        return file_path, None, None
+    file_hash = content_hash(raw)
+    if not force and previous_hash == file_hash:
+        return file_path, file_hash, None
+    return file_path, file_hash, CodebaseIndexer._parse_python_file(Path(file_path), raw.decode("utf-8", errors="replace"))
+
+
 def get_codebase_indexer():
     """
     Get or create CodebaseIndexer singleton instance.
@@ -8,6 +8,9 @@ This module indexes:
 - Issue discussions (if available)
 
 Stores in ChromaDB collection: stillme_git_history
+
+Indexing is incremental: the last indexed commit is kept in a manifest next to the
+ChromaDB data and later runs only append commits made since then.
 """
 
 import os
@@ -19,6 +22,8 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import json
 
+from backend.services.index_manifest import default_manifest_path, load_manifest, save_manifest
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,7 +38,13 @@ class GitHistoryRetriever:
     - Support filtering by date range, author, file path
     """
     
-    def __init__(self, chroma_client=None, embedding_service=None, repo_path: Optional[str] = None):
+    def __init__(
+        self,
+        chroma_client=None,
+        embedding_service=None,
+        repo_path: Optional[str] = None,
+        manifest_path: Optional[str] = None
+    ):
         """
         Initialize GitHistoryRetriever.
         
@@ -41,12 +52,18 @@ class GitHistoryRetriever:
             chroma_client: ChromaDB client instance
             embedding_service: EmbeddingService instance
             repo_path: Path to Git repository (default: project root)
+            manifest_path: Incremental index manifest (default: next to the ChromaDB data)
         """
         self.repo_path = repo_path or self._find_repo_root()
         self.chroma_client = chroma_client
         self.embedding_service = embedding_service
         self.collection_name = "stillme_git_history"
         self._collection = None
+        self.manifest_path = (
+            manifest_path
+            or os.getenv("GIT_HISTORY_MANIFEST")
+            or default_manifest_path(chroma_client, "git_history_manifest.json")
+        )
         
         if not self.repo_path or not os.path.exists(os.path.join(self.repo_path, ".git")):
             logger.warning(f"⚠️ Git repository not found at {self.repo_path}")
@@ -106,7 +123,10 @@ class GitHistoryRetriever:
         since: Optional[str] = None,
         until: Optional[str] = None,
         author: Optional[str] = None,
-        file_path: Optional[str] = None
+        file_path: Optional[str] = None,
+        revision_range: Optional[str] = None,
+        skip: int = 0,
+        with_files: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Get commit history from Git repository.
@@ -117,6 +137,9 @@ class GitHistoryRetriever:
             until: End date (ISO format or relative)
             author: Filter by author email/name
             file_path: Filter by file path
+            revision_range: Git revision range (e.g. "<last_indexed>..HEAD")
+            skip: Number of (newest) commits to skip, for paging
+            with_files: Look up changed files per commit (one git call per commit)
             
         Returns:
             List of commit dictionaries with metadata
@@ -132,6 +155,9 @@ class GitHistoryRetriever:
             if limit:
                 cmd.extend(["-n", str(limit)])
             
+            if skip:
+                cmd.extend(["--skip", str(skip)])
+            
             if since:
                 cmd.extend(["--since", since])
             
@@ -141,6 +167,9 @@ class GitHistoryRetriever:
             if author:
                 cmd.extend(["--author", author])
             
+            if revision_range:
+                cmd.append(revision_range)
+            
             if file_path:
                 cmd.extend(["--", file_path])
             
@@ -182,7 +211,7 @@ class GitHistoryRetriever:
                 body = parts[5] if len(parts) > 5 else ""
                 
                 # Get files changed
-                files_changed = self._get_commit_files(commit_hash)
+                files_changed = self._get_commit_files(commit_hash) if with_files else []
                 
                 commits.append({
                     "hash": commit_hash,
@@ -227,6 +256,37 @@ class GitHistoryRetriever:
             logger.debug(f"Failed to get files for commit {commit_hash}: {e}")
             return []
     
+    def _run_git(self, args: List[str]) -> Optional[subprocess.CompletedProcess]:
+        """Run a short git command in the repository"""
+        try:
+            return subprocess.run(
+                ["git"] + args,
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+        except Exception as e:
+            logger.debug(f"git {' '.join(args)} failed: {e}")
+            return None
+    
+    def _is_ancestor_of_head(self, commit_hash: str) -> bool:
+        """Whether commit_hash is still in HEAD's history (False after a rebase/force-push)"""
+        result = self._run_git(["merge-base", "--is-ancestor", commit_hash, "HEAD"])
+        return result is not None and result.returncode == 0
+    
+    def _filter_unindexed(self, collection, commits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop commits that are already in the collection"""
+        if not commits:
+            return commits
+        ids = [f"commit_{commit['hash']}" for commit in commits]
+        try:
+            existing = set(collection.get(ids=ids, include=[])["ids"])
+        except Exception as e:
+            logger.warning(f"⚠️ Could not check existing commits, indexing all fetched commits: {e}")
+            return commits
+        return [commit for commit, commit_id in zip(commits, ids) if commit_id not in existing]
+    
     def index_commits(
         self,
         limit: int = 500,
@@ -236,6 +296,11 @@ class GitHistoryRetriever:
         """
         Index commits into ChromaDB.
         
+        Without force, only commits made since the last indexed commit are appended,
+        fetched `limit` at a time until the whole range is covered (if the manifest is
+        missing or history was rewritten, the latest `limit` commits are checked and
+        the ones not yet in the collection are added).
+        
         Args:
             limit: Maximum number of commits to index
             since: Start date (ISO format or relative)
@@ -248,20 +313,49 @@ class GitHistoryRetriever:
             raise RuntimeError("ChromaDB client and EmbeddingService must be initialized")
         
         collection = self._get_collection()
+        incremental = not force and collection.count() > 0
         
-        # Check if already indexed
-        if not force:
-            count = collection.count()
-            if count > 0:
-                logger.info(f"ℹ️ Git history already indexed ({count} commits). Use force=True to re-index")
+        if incremental:
+            manifest = load_manifest(self.manifest_path) or {}
+            last_commit = manifest.get("last_indexed_commit")
+            revision_range = None
+            if last_commit and self._is_ancestor_of_head(last_commit):
+                revision_range = f"{last_commit}..HEAD"
+            elif last_commit:
+                logger.info(f"ℹ️ Last indexed commit {last_commit[:8]} is no longer in HEAD history, checking latest {limit} commits")
+            
+            # Look up changed files only for commits that still need indexing
+            fetched = self.get_commits(limit=limit, since=since, revision_range=revision_range, with_files=False)
+            if revision_range:
+                # git log -n keeps the newest commits - page through the rest of the range,
+                # otherwise the manifest would move past commits that were never indexed
+                page = fetched
+                while limit and len(page) == limit:
+                    page = self.get_commits(
+                        limit=limit, since=since, revision_range=revision_range,
+                        skip=len(fetched), with_files=False
+                    )
+                    fetched.extend(page)
+            commits = self._filter_unindexed(collection, fetched)
+            for commit in commits:
+                commit["files_changed"] = self._get_commit_files(commit["hash"])
+            
+            if not commits:
+                if fetched:
+                    save_manifest(self.manifest_path, {"last_indexed_commit": fetched[0]["hash"]})
+                count = collection.count()
+                logger.info(f"ℹ️ Git history up to date ({count} commits indexed)")
                 return {
-                    "status": "already_indexed",
-                    "count": count,
-                    "message": "Git history already indexed. Use force=True to re-index."
+                    "status": "up_to_date",
+                    "count": 0,
+                    "total": count,
+                    "collection": self.collection_name,
+                    "message": "Git history already up to date"
                 }
-        
-        # Get commits
-        commits = self.get_commits(limit=limit, since=since)
+        else:
+            # Get commits
+            fetched = self.get_commits(limit=limit, since=since)
+            commits = fetched
         
         if not commits:
             logger.warning("⚠️ No commits found to index")
@@ -318,13 +412,19 @@ class GitHistoryRetriever:
             metadatas=metadatas
         )
         
-        logger.info(f"✅ Indexed {len(commits)} commits into '{self.collection_name}' collection")
+        # git log lists newest first
+        save_manifest(self.manifest_path, {"last_indexed_commit": fetched[0]["hash"]})
+        
+        mode = "Appended" if incremental else "Indexed"
+        logger.info(f"✅ {mode} {len(commits)} commits into '{self.collection_name}' collection")
         
         return {
             "status": "success",
             "count": len(commits),
+            "total": collection.count(),
+            "incremental": incremental,
             "collection": self.collection_name,
-            "message": f"Successfully indexed {len(commits)} commits"
+            "message": f"Successfully {mode.lower()} {len(commits)} commits"
         }
     
     def query_history(
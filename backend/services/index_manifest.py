@@ -0,0 +1,82 @@
+"""
+Index manifests for incremental ChromaDB indexing
+
+A manifest is a small JSON file stored next to the ChromaDB data that records what has
+already been indexed (file content hashes, chunk hashes, last indexed commit), so
+indexers only re-embed what changed instead of rebuilding whole collections.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+def content_hash(data) -> str:
+    """SHA-256 hex digest of text or bytes"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def default_manifest_path(chroma_client, filename: str) -> str:
+    """Manifest path inside the ChromaDB persist directory (data/ when it is unknown)
+
+    Args:
+        chroma_client: ChromaClient instance (may be None)
+        filename: Manifest file name
+    """
+    persist_directory = getattr(chroma_client, "persist_directory", None)
+    if not isinstance(persist_directory, str) or not persist_directory:
+        persist_directory = "data"
+    return os.path.join(persist_directory, filename)
+
+
+def load_manifest(path: str) -> Optional[Dict[str, Any]]:
+    """Load a manifest
+
+    Returns:
+        Manifest dict, or None when missing, unreadable or from another manifest version
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"⚠️ Could not read index manifest {path}, treating as missing: {e}")
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        logger.info(f"ℹ️ Index manifest {path} has an old format, ignoring it")
+        return None
+    return manifest
+
+
+def save_manifest(path: str, manifest: Dict[str, Any]) -> bool:
+    """Write a manifest atomically (temp file + rename)
+
+    Returns:
+        True if written
+    """
+    manifest = dict(manifest, version=MANIFEST_VERSION)
+    try:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".manifest-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return True
+    except Exception as e:
+        logger.error(f"❌ Could not write index manifest {path}: {e}")
+        return False
@@ -9,10 +9,15 @@ This file now serves as an adapter that forwards to stillme_core.learning.schedu
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional, List
 from typing import TYPE_CHECKING
 
+try:
+    from dateutil.parser import parse as parse_date
+except ImportError:
+    parse_date = None
+
 if TYPE_CHECKING:
     from backend.services.rss_fetcher import RSSFetcher
     from backend.services.source_integration import SourceIntegration
@@ -23,6 +28,58 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Timezone abbreviations commonly found in RSS pubDate fields
+_TZINFOS = {
+    "UTC": timezone.utc,
+    "GMT": timezone.utc,
+    "UT": timezone.utc,
+    "EST": timezone(timedelta(hours=-5)),
+    "EDT": timezone(timedelta(hours=-4)),
+    "CST": timezone(timedelta(hours=-6)),
+    "CDT": timezone(timedelta(hours=-5)),
+    "MST": timezone(timedelta(hours=-7)),
+    "MDT": timezone(timedelta(hours=-6)),
+    "PST": timezone(timedelta(hours=-8)),
+    "PDT": timezone(timedelta(hours=-7)),
+}
+
+
+def _calculate_freshness_score(published: str) -> float:
+    """Calculate freshness score (0.0-1.0, higher = newer) from a published date string"""
+    if not published:
+        return 0.0
+    
+    try:
+        if parse_date is not None:
+            pub_date = parse_date(published, tzinfos=_TZINFOS)
+        else:
+            # Fallback: simple ISO format parsing
+            try:
+                pub_date = datetime.fromisoformat(published.replace('Z', '+00:00'))
+            except (ValueError, AttributeError):
+                pub_date = None
+        
+        if pub_date is None:
+            age_days = 999  # Unknown age, use low freshness
+        elif pub_date.tzinfo:
+            # Handle timezone-aware dates
+            now_naive = datetime.now(timezone.utc).replace(tzinfo=None)
+            age_days = (now_naive - pub_date.astimezone(timezone.utc).replace(tzinfo=None)).days
+        else:
+            age_days = (datetime.now() - pub_date).days
+        
+        # Calculate freshness score based on age
+        if age_days < 1:
+            return 1.0
+        elif age_days < 7:
+            return 0.7
+        elif age_days < 30:
+            return 0.3
+        return 0.1
+    except Exception as e:
+        logger.debug(f"Failed to parse published date '{published}': {e}")
+        return 0.0  # If parsing fails, use 0.0
+
 
 class LearningScheduler:
     """
@@ -45,7 +102,8 @@ class LearningScheduler:
         rss_fetch_history: Optional["RSSFetchHistory"] = None,
         continuum_memory: Optional["ContinuumMemory"] = None,
         interval_hours: int = 4,
-        auto_add_to_rag: bool = True
+        auto_add_to_rag: bool = True,
+        semantic_duplicate_threshold: float = 0.95
     ):
         """
         Initialize learning scheduler.
@@ -59,6 +117,7 @@ class LearningScheduler:
             continuum_memory: Continuum memory instance (optional)
             interval_hours: Hours between learning cycles (default: 4)
             auto_add_to_rag: Whether to automatically add fetched content to RAG (default: True)
+            semantic_duplicate_threshold: Similarity at which an entry counts as a duplicate of existing content (default: 0.95)
         """
         # Import here to avoid circular imports
         if rss_fetcher is None:
@@ -88,6 +147,7 @@ class LearningScheduler:
         
         self.interval_hours = interval_hours
         self.auto_add_to_rag = auto_add_to_rag
+        self.semantic_duplicate_threshold = semantic_duplicate_threshold
         
         # State tracking
         self.cycle_count = 0
@@ -154,8 +214,10 @@ class LearningScheduler:
                 cycle_id = self.rss_fetch_history.create_fetch_cycle(cycle_number=cycle_number)
             
             # Step 3: Pre-filter content (if not already filtered)
+            # History rows are collected for the whole cycle and written in one transaction
             entries_to_add = []
             entries_filtered = 0
+            history_items: List[Dict[str, Any]] = []
             
             if self.content_curator and all_entries:
                 filtered_entries, rejected_entries = self.content_curator.pre_filter_content(all_entries)
@@ -164,181 +226,46 @@ class LearningScheduler:
                 
                 # Track rejected entries
                 for rejected in rejected_entries:
-                    if self.rss_fetch_history and cycle_id:
-                        self.rss_fetch_history.add_fetch_item(
-                            cycle_id=cycle_id,
-                            title=rejected.get("title", ""),
-                            source_url=rejected.get("source", ""),
-                            link=rejected.get("link", ""),
-                            summary=rejected.get("summary", ""),
-                            status="Filtered: Low Score",
-                            status_reason=rejected.get("rejection_reason", "Low quality/Short content")
-                        )
+                    history_items.append({
+                        "title": rejected.get("title", ""),
+                        "source_url": rejected.get("source", ""),
+                        "link": rejected.get("link", ""),
+                        "summary": rejected.get("summary", ""),
+                        "status": "Filtered: Low Score",
+                        "status_reason": rejected.get("rejection_reason", "Low quality/Short content")
+                    })
             else:
                 entries_to_add = all_entries
             
             # Step 4: Add to RAG (if enabled)
             entries_added_to_rag = 0
             if self.auto_add_to_rag and self.rag_retrieval and entries_to_add:
-                logger.info(f"📚 Adding {len(entries_to_add)} entries to RAG...")
-                
-                for entry in entries_to_add:
-                    try:
-                        # Check for duplicate before adding
-                        is_duplicate = False
-                        entry_link = entry.get("link", "")
-                        if entry_link and self.rag_retrieval:
-                            try:
-                                is_duplicate = self.rag_retrieval.check_duplicate_by_link(entry_link)
-                            except Exception:
-                                pass  # If check fails, assume not duplicate
-                        
-                        # Calculate freshness score (0.0-1.0, higher = newer)
-                        freshness_score = 0.0
-                        published = entry.get("published", "")
-                        if published:
-                            try:
-                                # Try parsing with dateutil if available, otherwise use simple parsing
-                                try:
-                                    from dateutil.parser import parse as parse_date
-                                    from datetime import timezone, timedelta
-                                    tzinfos = {
-                                        "UTC": timezone.utc,
-                                        "GMT": timezone.utc,
-                                        "UT": timezone.utc,
-                                        "EST": timezone(timedelta(hours=-5)),
-                                        "EDT": timezone(timedelta(hours=-4)),
-                                        "CST": timezone(timedelta(hours=-6)),
-                                        "CDT": timezone(timedelta(hours=-5)),
-                                        "MST": timezone(timedelta(hours=-7)),
-                                        "MDT": timezone(timedelta(hours=-6)),
-                                        "PST": timezone(timedelta(hours=-8)),
-                                        "PDT": timezone(timedelta(hours=-7)),
-                                    }
-                                    pub_date = parse_date(published, tzinfos=tzinfos)
-                                    # Handle timezone-aware dates
-                                    if pub_date.tzinfo:
-                                        from datetime import timezone
-                                        now = datetime.now(timezone.utc)
-                                        pub_date_naive = pub_date.astimezone(timezone.utc).replace(tzinfo=None)
-                                        now_naive = now.replace(tzinfo=None)
-                                        age_days = (now_naive - pub_date_naive).days
-                                    else:
-                                        age_days = (datetime.now() - pub_date).days
-                                except ImportError:
-                                    # Fallback: simple ISO format parsing
-                                    from datetime import datetime as dt
-                                    try:
-                                        pub_date = dt.fromisoformat(published.replace('Z', '+00:00'))
-                                        if pub_date.tzinfo:
-                                            now = datetime.now(pub_date.tzinfo)
-                                            age_days = (now.replace(tzinfo=None) - pub_date.replace(tzinfo=None)).days
-                                        else:
-                                            age_days = (datetime.now() - pub_date).days
-                                    except (ValueError, AttributeError):
-                                        # Last resort: try basic string parsing
-                                        age_days = 999  # Unknown age, use low freshness
-                                
-                                # Calculate freshness score based on age
-                                if age_days < 1:
-                                    freshness_score = 1.0
-                                elif age_days < 7:
-                                    freshness_score = 0.7
-                                elif age_days < 30:
-                                    freshness_score = 0.3
-                                else:
-                                    freshness_score = 0.1
-                            except Exception as e:
-                                logger.debug(f"Failed to parse published date '{published}': {e}")
-                                freshness_score = 0.0  # If parsing fails, use 0.0
-                        
-                        # Track quality metrics for feed
-                        feed_url = entry.get("source", "")
-                        importance_score = entry.get("importance_score", 0.5)
-                        if feed_url:
-                            try:
-                                from backend.services.feed_health_monitor import get_feed_health_monitor
-                                health_monitor = get_feed_health_monitor()
-                                health_monitor.track_feed_quality(
-                                    feed_url=feed_url,
-                                    importance_score=importance_score,
-                                    is_duplicate=is_duplicate,
-                                    freshness=freshness_score
-                                )
-                            except Exception as e:
-                                logger.debug(f"Failed to track feed quality: {e}")
-                        
-                        # Skip if duplicate
-                        if is_duplicate:
-                            if self.rss_fetch_history and cycle_id:
-                                self.rss_fetch_history.add_fetch_item(
-                                    cycle_id=cycle_id,
-                                    title=entry.get("title", ""),
-                                    source_url=feed_url,
-                                    link=entry_link,
-                                    summary=entry.get("summary", ""),
-                                    status="Filtered: Duplicate",
-                                    status_reason=f"Content already exists in RAG ({duplicate_reason})"
-                                )
-                            # Track duplicate for quality metrics
-                            if feed_url:
-                                try:
-                                    from backend.services.feed_health_monitor import get_feed_health_monitor
-                                    health_monitor = get_feed_health_monitor()
-                                    health_monitor.track_feed_quality(
-                                        feed_url=feed_url,
-                                        importance_score=importance_score,
-                                        is_duplicate=True,
-                                        freshness=freshness_score
-                                    )
-                                except Exception:
-                                    pass
-                            continue
-                        
-                        # Add to RAG
-                        success = self.rag_retrieval.add_learning_content(
-                            content=entry.get("summary", ""),
-                            source=feed_url,
-                            content_type="knowledge",
-                            metadata={
-                                "title": entry.get("title", ""),
-                                "link": entry_link,
-                                "published": published,
-                                "source_type": entry.get("source_type", "rss"),
-                                "importance_score": importance_score
-                            }
-                        )
-                        
-                        if success:
-                            entries_added_to_rag += 1
-                            
-                            # Track in history
-                            if self.rss_fetch_history and cycle_id:
-                                self.rss_fetch_history.add_fetch_item(
-                                    cycle_id=cycle_id,
-                                    title=entry.get("title", ""),
-                                    source_url=feed_url,
-                                    link=entry_link,
-                                    summary=entry.get("summary", ""),
-                                    status="Added to RAG",
-                                    vector_id=f"knowledge_{entry_link[:8] if entry_link else 'unknown'}",
-                                    added_to_rag_at=datetime.now().isoformat()
-                                )
-                    except Exception as add_error:
-                        logger.error(f"Error adding entry to RAG: {add_error}")
-                        # Track error in history
-                        if self.rss_fetch_history and cycle_id:
-                            self.rss_fetch_history.add_fetch_item(
-                                cycle_id=cycle_id,
-                                title=entry.get("title", ""),
-                                source_url=entry.get("source", ""),
-                                link=entry.get("link", ""),
-                                summary=entry.get("summary", ""),
-                                status="Error: Failed to add",
-                                status_reason=str(add_error)
-                            )
-                
-                logger.info(f"✅ Added {entries_added_to_rag} entries to RAG")
+                entries_added_to_rag = self._add_entries_to_rag(entries_to_add, history_items)
+
+            # Step 4b: Keep corpus statistics (Continuum Memory tier scoring) in step with the knowledge base
+            if self.continuum_memory is not None and self.rag_retrieval:
+                try:
+                    from backend.learning.corpus_statistics import get_corpus_statistics
+                    await asyncio.to_thread(get_corpus_statistics().refresh, self.rag_retrieval.chroma_client)
+                except Exception as stats_error:
+                    logger.warning(f"Failed to refresh corpus statistics: {stats_error}")
+
+            # Step 4c: Batch tier promotion/demotion over all Continuum Memory items
+            # (surprise is refreshed from current retrieval counts and validator overlap first)
+            if self.continuum_memory is not None:
+                try:
+                    from backend.learning.promotion_manager import PromotionManager
+                    promotion_manager = PromotionManager(self.continuum_memory.db_path)
+                    await asyncio.to_thread(promotion_manager.run_tier_maintenance)
+                except Exception as tier_error:
+                    logger.warning(f"Failed to run tier maintenance: {tier_error}")
+
+            # Step 5: Write fetch history for the whole cycle
+            if self.rss_fetch_history and cycle_id and history_items:
+                try:
+                    self.rss_fetch_history.add_fetch_items(cycle_id, history_items)
+                except Exception as history_error:
+                    logger.error(f"Failed to record fetch history for cycle #{cycle_number}: {history_error}")
             
             # Update cycle count and timestamps
             self.cycle_count = cycle_number
@@ -403,6 +330,148 @@ class LearningScheduler:
                 "error": str(e)
             }
     
+    def _add_entries_to_rag(self, entries: List[Dict[str, Any]], history_items: List[Dict[str, Any]]) -> int:
+        """
+        Add a cycle's entries to RAG as a staged bulk pipeline:
+        1. One batched link-existence lookup for all entries
+        2. One batched embedding + semantic-duplicate pass
+        3. One batched insert of the remaining entries
+        
+        Fetch history rows are appended to history_items (written by the caller).
+        
+        Returns:
+            Number of entries added to RAG
+        """
+        logger.info(f"📚 Adding {len(entries)} entries to RAG...")
+        
+        health_monitor = None
+        try:
+            from backend.services.feed_health_monitor import get_feed_health_monitor
+            health_monitor = get_feed_health_monitor()
+        except Exception as e:
+            logger.debug(f"Feed health monitor not available: {e}")
+        
+        def _history_item(entry: Dict[str, Any], status: str, **extra) -> Dict[str, Any]:
+            return {
+                "title": entry.get("title", ""),
+                "source_url": entry.get("source", ""),
+                "link": entry.get("link", ""),
+                "summary": entry.get("summary", ""),
+                "status": status,
+                **extra
+            }
+        
+        # Stage 1: Link duplicates (existing in RAG, or repeated within this cycle)
+        try:
+            existing_links = self.rag_retrieval.find_existing_links([entry.get("link", "") for entry in entries])
+        except Exception as e:
+            logger.debug(f"Batched duplicate check by link failed (non-critical): {e}")
+            existing_links = set()  # If check fails, assume not duplicate
+        
+        duplicate_reasons: List[Optional[str]] = []
+        seen_links = set()
+        for entry in entries:
+            entry_link = entry.get("link", "")
+            if entry_link and entry_link in existing_links:
+                duplicate_reasons.append("same link")
+            elif entry_link and entry_link in seen_links:
+                duplicate_reasons.append("same link earlier in this cycle")
+            else:
+                duplicate_reasons.append(None)
+            if entry_link:
+                seen_links.add(entry_link)
+        
+        # Stage 2: Embed remaining entries once; reuse embeddings for semantic check and insert
+        pending = [i for i, reason in enumerate(duplicate_reasons) if reason is None]
+        pending_contents = [entries[i].get("summary", "") for i in pending]
+        pending_embeddings = None
+        if pending:
+            try:
+                pending_embeddings = self.rag_retrieval.embedding_service.batch_encode(pending_contents)
+                semantic_flags = self.rag_retrieval.check_semantic_duplicates_batch(
+                    pending_contents,
+                    embeddings=pending_embeddings,
+                    similarity_threshold=self.semantic_duplicate_threshold
+                )
+                for i, is_semantic_duplicate in zip(pending, semantic_flags):
+                    if is_semantic_duplicate:
+                        duplicate_reasons[i] = "semantically similar content"
+            except Exception as e:
+                logger.warning(f"Batched embedding/semantic duplicate check failed: {e}")
+                pending_embeddings = None  # add_learning_contents will encode
+        
+        # Track quality metrics for feeds and record duplicates
+        for entry, duplicate_reason in zip(entries, duplicate_reasons):
+            feed_url = entry.get("source", "")
+            if feed_url and health_monitor:
+                try:
+                    health_monitor.track_feed_quality(
+                        feed_url=feed_url,
+                        importance_score=entry.get("importance_score", 0.5),
+                        is_duplicate=duplicate_reason is not None,
+                        freshness=_calculate_freshness_score(entry.get("published", ""))
+                    )
+                except Exception as e:
+                    logger.debug(f"Failed to track feed quality: {e}")
+            
+            if duplicate_reason:
+                history_items.append(_history_item(
+                    entry,
+                    "Filtered: Duplicate",
+                    status_reason=f"Content already exists in RAG ({duplicate_reason})"
+                ))
+        
+        # Stage 3: One batched insert for all non-duplicate entries
+        to_add = [i for i, reason in enumerate(duplicate_reasons) if reason is None]
+        if not to_add:
+            logger.info("✅ Added 0 entries to RAG (all duplicates)")
+            return 0
+        
+        add_embeddings = None
+        if pending_embeddings is not None:
+            embedding_by_index = dict(zip(pending, pending_embeddings))
+            add_embeddings = [embedding_by_index[i] for i in to_add]
+        
+        try:
+            vector_ids = self.rag_retrieval.add_learning_contents(
+                contents=[entries[i].get("summary", "") for i in to_add],
+                sources=[entries[i].get("source", "") for i in to_add],
+                content_type="knowledge",
+                metadatas=[
+                    {
+                        "title": entries[i].get("title", ""),
+                        "link": entries[i].get("link", ""),
+                        "published": entries[i].get("published", ""),
+                        "source_type": entries[i].get("source_type", "rss"),
+                        "importance_score": entries[i].get("importance_score", 0.5)
+                    }
+                    for i in to_add
+                ],
+                embeddings=add_embeddings
+            )
+            add_error = None if vector_ids else "Batch insert into RAG failed"
+        except Exception as e:
+            logger.error(f"Error adding entries to RAG: {e}")
+            vector_ids = []
+            add_error = str(e)
+        
+        if add_error:
+            for i in to_add:
+                history_items.append(_history_item(entries[i], "Error: Failed to add", status_reason=add_error))
+            return 0
+        
+        added_at = datetime.now().isoformat()
+        for i, vector_id in zip(to_add, vector_ids):
+            history_items.append(_history_item(
+                entries[i],
+                "Added to RAG",
+                vector_id=vector_id,
+                added_to_rag_at=added_at
+            ))
+        
+        logger.info(f"✅ Added {len(vector_ids)} entries to RAG")
+        return len(vector_ids)
+    
     async def _scheduler_loop(self):
         """
         Main scheduler loop that runs learning cycles every interval_hours.
@@ -10,7 +10,7 @@ import json
 import time
 from typing import Optional, Dict, Any, Tuple
 from backend.services.cache_service import get_cache_service, CACHE_PREFIX_LLM, TTL_LLM_RESPONSE
-from backend.core.question_classifier import is_philosophical_question
+from backend.core.query_profile import get_query_profile
 
 logger = logging.getLogger(__name__)
 
@@ -99,7 +99,7 @@ class PhilosophyAwareCache:
             return False
         
         # Check if philosophical but not highly unique
-        is_philo = is_philosophical_question(question)
+        is_philo = get_query_profile(question).is_philosophical
         
         if not is_philo:
             return False
@@ -3,6 +3,7 @@ Redis Cache Service for StillMe
 Provides caching for embeddings, queries, and RAG results to reduce latency and costs
 """
 
+import asyncio
 import json
 import hashlib
 import logging
@@ -185,6 +186,42 @@ class RedisCacheService:
             )
             return False
     
+    # Async API - use from request handlers so Redis I/O never blocks the event loop
+    
+    async def aget(self, key: str) -> Optional[Any]:
+        """Get value from cache without blocking the event loop"""
+        if not self.enabled or not self.redis_client:
+            return None
+        return await asyncio.to_thread(self.get, key)
+    
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set value in cache without blocking the event loop"""
+        if not self.enabled or not self.redis_client:
+            return False
+        return await asyncio.to_thread(self.set, key, value, ttl)
+    
+    async def adelete(self, key: str) -> bool:
+        """Delete key from cache without blocking the event loop"""
+        if not self.enabled or not self.redis_client:
+            return False
+        return await asyncio.to_thread(self.delete, key)
+    
+    async def aget_embedding(self, text: str) -> Optional[List[float]]:
+        """Async version of get_embedding()"""
+        return await self.aget(self._generate_key("embedding", text))
+    
+    async def acache_embedding(self, text: str, embedding: List[float], ttl: Optional[int] = None) -> bool:
+        """Async version of cache_embedding()"""
+        return await self.aset(self._generate_key("embedding", text), embedding, ttl or (24 * 3600))
+    
+    async def aget_query_result(self, query: str, context_limit: int) -> Optional[Dict[str, Any]]:
+        """Async version of get_query_result()"""
+        return await self.aget(self._generate_key("rag_query", query, context_limit))
+    
+    async def acache_query_result(self, query: str, context_limit: int, result: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Async version of cache_query_result()"""
+        return await self.aset(self._generate_key("rag_query", query, context_limit), result, ttl or self.default_ttl)
+    
     def cache_embedding(self, text: str, embedding: List[float], ttl: Optional[int] = None) -> bool:
         """Cache embedding result
         
@@ -260,6 +260,80 @@ class RSSFetchHistory:
             logger.error(f"Failed to add fetch item: {e}")
             raise
     
+    def add_fetch_items(self, cycle_id: int, items: List[Dict[str, Any]]) -> int:
+        """Add many fetched items and their cycle statistics in one transaction
+        
+        Bulk counterpart of add_fetch_item() for learning cycles: one connection, one
+        executemany() insert and one stats UPDATE instead of two writes per item.
+        
+        Args:
+            cycle_id: ID of the fetch cycle
+            items: List of dicts with add_fetch_item() fields (title, source_url, link,
+                summary, status, and optional status_reason, vector_id, added_to_rag_at)
+            
+        Returns:
+            int: Number of items written
+        """
+        if not items:
+            return 0
+        
+        fetch_timestamp = datetime.now().isoformat()
+        rows = [
+            (
+                cycle_id,
+                item.get("title", ""),
+                item.get("source_url", ""),
+                item.get("link", ""),
+                item.get("summary", ""),
+                fetch_timestamp,
+                item["status"],
+                item.get("status_reason"),
+                item.get("vector_id"),
+                item.get("added_to_rag_at")
+            )
+            for item in items
+        ]
+        
+        # Same status -> counter mapping as _update_cycle_stats, aggregated once
+        added = duplicate = low_score = ethical = 0
+        for item in items:
+            status = item["status"]
+            if status == "Added to RAG":
+                added += 1
+            elif status == "Filtered: Duplicate":
+                duplicate += 1
+            elif status == "Filtered: Low Score":
+                low_score += 1
+            elif status == "Filtered: Ethical/Bias Flag":
+                ethical += 1
+        filtered = duplicate + low_score + ethical
+        
+        def _add_items(conn):
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO rss_fetch_items 
+                (cycle_id, title, source_url, link, summary, fetch_timestamp, 
+                 status, status_reason, vector_id, added_to_rag_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            cursor.execute("""
+                UPDATE rss_fetch_cycles
+                SET entries_fetched = entries_fetched + ?,
+                    entries_added = entries_added + ?,
+                    entries_filtered = entries_filtered + ?,
+                    entries_duplicate = entries_duplicate + ?,
+                    entries_low_score = entries_low_score + ?,
+                    entries_ethical_filtered = entries_ethical_filtered + ?
+                WHERE id = ?
+            """, (len(rows), added, filtered, duplicate, low_score, ethical, cycle_id))
+            return len(rows)
+        
+        try:
+            return self._execute_with_retry(_add_items)
+        except Exception as e:
+            logger.error(f"Failed to add fetch items: {e}")
+            raise
+    
     def _update_cycle_stats(self, cycle_id: int, status: str):
         """Update cycle statistics based on item status (with retry mechanism)"""
         def _update_stats(conn):
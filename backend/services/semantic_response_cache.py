@@ -0,0 +1,282 @@
+"""
+Semantic Response Cache for StillMe
+
+The LLM/RAG caches key on exact normalized text, so paraphrased repeats
+("what is StillMe" / "what's StillMe?") always miss. This cache stores the final
+validated answer together with its query embedding and a fingerprint of the RAG
+context it was grounded on, and serves it again for any query whose embedding is
+close enough - as long as the same documents were retrieved and the knowledge
+version has not changed since.
+
+The index is a flat float32 matrix of unit vectors: at a few thousand entries one
+matrix-vector product is an exact nearest-neighbour search in well under a millisecond.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ENABLE_SEMANTIC_CACHE = os.getenv("ENABLE_SEMANTIC_CACHE", "true").lower() == "true"
+# Cosine similarity a new query needs to reuse a cached answer
+DEFAULT_SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+DEFAULT_SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "2000"))
+DEFAULT_SEMANTIC_CACHE_TTL = int(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", "3600"))
+# How long the knowledge version read from disk is trusted before re-checking
+DEFAULT_VERSION_CHECK_INTERVAL = float(os.getenv("SEMANTIC_CACHE_VERSION_CHECK_SECONDS", "5"))
+
+
+def compute_context_fingerprint(context: Optional[Dict[str, Any]]) -> str:
+    """Fingerprint the retrieved RAG context by the ids of its knowledge documents
+
+    Two requests with the same fingerprint were grounded on the same documents, so
+    an answer validated for one is grounded for the other.
+    """
+    if not context or not isinstance(context, dict):
+        return "no_context"
+    doc_ids = sorted(
+        str(doc.get("id") or doc.get("metadata", {}).get("source_url") or doc.get("metadata", {}).get("title", ""))
+        for doc in context.get("knowledge_docs", []) or []
+        if isinstance(doc, dict)
+    )
+    if not doc_ids:
+        return "no_context"
+    return hashlib.md5("|".join(doc_ids).encode("utf-8")).hexdigest()
+
+
+def compute_conversation_fingerprint(conversation_history: Optional[List[Dict[str, Any]]] = None,
+                                     style_instruction: Optional[str] = None) -> str:
+    """Fingerprint the per-conversation inputs of the prompt
+
+    Retrieval is driven by the message alone, so a vague follow-up in two different
+    conversations can share a context fingerprint. Adding this to the cache scope
+    keeps an answer written for one conversation/style from being served in another.
+    """
+    if not conversation_history and not style_instruction:
+        return "stateless"
+    turns = [
+        f"{turn.get('role', '')}:{turn.get('content', '')}"
+        for turn in conversation_history or []
+        if isinstance(turn, dict)
+    ]
+    payload = "\x1e".join(turns) + "\x1f" + (style_instruction or "")
+    return hashlib.md5(payload.encode("utf-8")).hexdigest()
+
+
+def _default_knowledge_version() -> str:
+    from backend.services.knowledge_version import get_knowledge_version
+    return get_knowledge_version()
+
+
+class SemanticResponseCache:
+    """
+    Embedding-keyed cache of final validated answers
+
+    Entries match when:
+    - cosine(query embedding, cached embedding) >= threshold
+    - scope (language/provider/model/conversation) and context fingerprint are identical
+    - the entry is younger than the TTL
+    All entries are dropped as soon as the knowledge version changes.
+    """
+
+    def __init__(self,
+                 threshold: float = DEFAULT_SEMANTIC_CACHE_THRESHOLD,
+                 max_entries: int = DEFAULT_SEMANTIC_CACHE_MAX_ENTRIES,
+                 ttl_seconds: int = DEFAULT_SEMANTIC_CACHE_TTL,
+                 version_provider: Optional[Callable[[], str]] = None,
+                 version_check_interval: float = DEFAULT_VERSION_CHECK_INTERVAL):
+        """
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Capacity; least recently used entries are evicted beyond it
+            ttl_seconds: Maximum age of a cached answer
+            version_provider: Returns the current knowledge version (defaults to KnowledgeVersionService)
+            version_check_interval: Seconds a read knowledge version is reused before reading it again
+        """
+        self.threshold = threshold
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._version_provider = version_provider or _default_knowledge_version
+        self._knowledge_version: Optional[str] = None
+        self._version_check_interval = version_check_interval
+        self._version_checked_at = 0.0
+        self._vectors: Optional[np.ndarray] = None  # (max_entries, dim) unit vectors
+        self._entries: List[Optional[Dict[str, Any]]] = [None] * self.max_entries
+        self._lru: "OrderedDict[int, None]" = OrderedDict()
+        self._free_slots = list(range(self.max_entries - 1, -1, -1))
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _normalize(embedding) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def _clear_locked(self) -> None:
+        self._entries = [None] * self.max_entries
+        self._lru.clear()
+        self._free_slots = list(range(self.max_entries - 1, -1, -1))
+        if self._vectors is not None:
+            self._vectors.fill(0.0)
+
+    def _check_version_locked(self) -> None:
+        """Drop every entry if the knowledge base changed since they were stored
+
+        The version provider reads knowledge_version.json, so it is only consulted
+        once per version_check_interval instead of on every lookup/store.
+        """
+        now = time.monotonic()
+        if self._knowledge_version is not None and now - self._version_checked_at < self._version_check_interval:
+            return
+        self._version_checked_at = now
+        try:
+            current = self._version_provider()
+        except Exception as e:
+            logger.debug(f"Could not read knowledge version for semantic cache: {e}")
+            return
+        if self._knowledge_version is not None and current != self._knowledge_version and self._lru:
+            logger.info(f"🔄 Knowledge version changed ({self._knowledge_version} → {current}) - clearing semantic response cache")
+            self._clear_locked()
+            self.invalidations += 1
+        self._knowledge_version = current
+
+    def _drop_slot_locked(self, slot: int) -> None:
+        self._entries[slot] = None
+        self._lru.pop(slot, None)
+        self._vectors[slot].fill(0.0)
+        self._free_slots.append(slot)
+
+    def lookup(self,
+               query_embedding,
+               context_fingerprint: str,
+               scope: str = "") -> Optional[Dict[str, Any]]:
+        """Find a cached answer for a semantically equivalent query
+
+        Args:
+            query_embedding: Embedding of the incoming query
+            context_fingerprint: compute_context_fingerprint() of the retrieved context
+            scope: Exact-match partition (e.g. language + provider + model)
+
+        Returns:
+            Cached entry dict (response, confidence_score, validation_info, similarity, ...) or None
+        """
+        query = self._normalize(query_embedding)
+        with self._lock:
+            self._check_version_locked()
+            if query is None or self._vectors is None or not self._lru or query.shape[0] != self._vectors.shape[1]:
+                self.misses += 1
+                return None
+
+            scores = self._vectors @ query
+            now = time.time()
+            for slot in np.argsort(-scores):
+                score = float(scores[slot])
+                if score < self.threshold:
+                    break
+                entry = self._entries[slot]
+                if entry is None:
+                    continue
+                if now - entry["created_at"] > self.ttl_seconds:
+                    self._drop_slot_locked(int(slot))
+                    continue
+                if entry["scope"] != scope or entry["context_fingerprint"] != context_fingerprint:
+                    continue
+                self._lru.move_to_end(int(slot))
+                entry["hits"] += 1
+                self.hits += 1
+                result = dict(entry)
+                result["similarity"] = score
+                return result
+
+            self.misses += 1
+            return None
+
+    def store(self,
+              query: str,
+              query_embedding,
+              response: str,
+              context_fingerprint: str,
+              scope: str = "",
+              confidence_score: Optional[float] = None,
+              validation_info: Optional[Dict[str, Any]] = None,
+              epistemic_state: Optional[str] = None) -> bool:
+        """Store a final validated answer
+
+        Returns:
+            True if stored
+        """
+        vector = self._normalize(query_embedding)
+        if vector is None or not response:
+            return False
+        with self._lock:
+            self._check_version_locked()
+            if self._vectors is None or self._vectors.shape[1] != vector.shape[0]:
+                self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+                self._clear_locked()
+            if not self._free_slots:
+                oldest_slot = next(iter(self._lru))
+                self._drop_slot_locked(oldest_slot)
+            slot = self._free_slots.pop()
+            self._vectors[slot] = vector
+            self._entries[slot] = {
+                "query": query,
+                "response": response,
+                "context_fingerprint": context_fingerprint,
+                "scope": scope,
+                "confidence_score": confidence_score,
+                "validation_info": validation_info,
+                "epistemic_state": epistemic_state,
+                "knowledge_version": self._knowledge_version,
+                "created_at": time.time(),
+                "hits": 0
+            }
+            self._lru[slot] = None
+        return True
+
+    def invalidate(self) -> None:
+        """Drop all cached answers (e.g. after a manual knowledge update)"""
+        with self._lock:
+            self._clear_locked()
+            self.invalidations += 1
+            self._version_checked_at = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss/invalidation counters and current size"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._lru),
+                "max_entries": self.max_entries,
+                "threshold": self.threshold,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / total if total else 0.0,
+                "knowledge_version": self._knowledge_version
+            }
+
+
+# Global instance
+_semantic_response_cache: Optional[SemanticResponseCache] = None
+
+
+def get_semantic_response_cache() -> Optional[SemanticResponseCache]:
+    """Get global semantic response cache (None when ENABLE_SEMANTIC_CACHE=false)"""
+    global _semantic_response_cache
+    if not ENABLE_SEMANTIC_CACHE:
+        return None
+    if _semantic_response_cache is None:
+        _semantic_response_cache = SemanticResponseCache()
+    return _semantic_response_cache
@@ -0,0 +1,227 @@
+"""
+Single-flight coalescing for identical in-flight chat LLM calls
+
+The LLM response cache is only populated after the first call for a question finishes,
+so N concurrent identical questions (dashboard refreshes, eval runs, a viral question)
+used to make N identical LLM calls. With single-flight, the first request for a cache key
+becomes the leader and runs the call; requests arriving while it is in flight await the
+leader's result instead.
+
+- Followers wait at most `follower_timeout` seconds, then make their own call.
+- The shared call runs as its own task: a disconnecting leader does not cancel it while
+  followers are still waiting. It is cancelled once every waiter for the key has gone,
+  or explicitly with cancel(key).
+- Keys are forgotten as soon as the call completes - later requests go through the
+  normal response cache.
+- The LLM cache key does not cover the caller's credentials, so chat calls are keyed with
+  make_single_flight_key(): requests using different API keys or endpoints never share
+  an answer.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ENABLE_CHAT_SINGLE_FLIGHT = os.getenv("ENABLE_CHAT_SINGLE_FLIGHT", "true").lower() == "true"
+DEFAULT_SINGLE_FLIGHT_WAIT_SECONDS = float(os.getenv("SINGLE_FLIGHT_WAIT_SECONDS", "90"))
+
+
+@dataclass
+class _InFlightCall:
+    """One shared call and the number of requests currently awaiting it"""
+    task: asyncio.Task
+    loop: asyncio.AbstractEventLoop
+    waiters: int = 1
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key onto one shared task"""
+
+    def __init__(self, follower_timeout: float = DEFAULT_SINGLE_FLIGHT_WAIT_SECONDS):
+        """
+        Args:
+            follower_timeout: Seconds a follower waits for the leader before calling on its own
+        """
+        self.follower_timeout = follower_timeout
+        self._calls: Dict[str, _InFlightCall] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+        self.follower_timeouts = 0
+        self.leader_cancelled = 0
+        self.cancelled = 0
+
+    def _forget(self, key: str, call: _InFlightCall) -> None:
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+    def _on_done(self, key: str, call: _InFlightCall) -> None:
+        if not call.task.cancelled():
+            # Mark the exception retrieved - every waiter may already have left
+            call.task.exception()
+        self._forget(key, call)
+
+    def _release(self, key: str, call: _InFlightCall) -> None:
+        """Drop one waiter; cancel the shared task when nobody is waiting for it any more"""
+        with self._lock:
+            call.waiters -= 1
+            orphaned = call.waiters <= 0 and not call.task.done()
+            if orphaned:
+                self.cancelled += 1
+        if orphaned:
+            call.task.cancel()
+            self._forget(key, call)
+            logger.info(f"🛑 Single-flight call cancelled (no waiters left): {key[:50]}...")
+
+    async def do(self, key: Optional[str], fn: Callable[[], Awaitable[Any]],
+                 timeout: Optional[float] = None) -> Tuple[Any, bool]:
+        """Run fn once per key among concurrent callers
+
+        Args:
+            key: Coalescing key (None disables coalescing for this call)
+            fn: Zero-argument coroutine function making the call
+            timeout: Follower wait override (seconds)
+
+        Returns:
+            tuple: (result, shared) - shared is True when the result came from another request's call
+
+        Raises:
+            Whatever the shared call raised (followers see the leader's exception)
+        """
+        if key is None:
+            return await fn(), False
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None or call.loop is not loop or call.task.done()
+            if is_leader:
+                call = _InFlightCall(task=loop.create_task(fn()), loop=loop)
+                self._calls[key] = call
+                self.leaders += 1
+            else:
+                call.waiters += 1
+        if is_leader:
+            call.task.add_done_callback(lambda _task, key=key, call=call: self._on_done(key, call))
+        else:
+            logger.info(f"🔗 Coalescing identical in-flight request onto leader: {key[:50]}...")
+
+        wait_timeout = None if is_leader else (timeout if timeout is not None else self.follower_timeout)
+        try:
+            # asyncio.wait never cancels the shared task; CancelledError here means this caller was cancelled
+            done, _ = await asyncio.wait({call.task}, timeout=wait_timeout)
+        except asyncio.CancelledError:
+            self._release(key, call)
+            raise
+
+        if not done:
+            with self._lock:
+                self.follower_timeouts += 1
+            self._release(key, call)
+            logger.warning(f"⚠️ Single-flight leader still running after {wait_timeout}s - calling independently")
+            return await fn(), False
+
+        with self._lock:
+            call.waiters -= 1
+            if call.task.cancelled():
+                if not is_leader:
+                    self.leader_cancelled += 1
+            elif not is_leader:
+                self.coalesced += 1
+        if call.task.cancelled():
+            # Shared call was cancelled via cancel(key) - make our own call
+            return await fn(), False
+        return call.task.result(), not is_leader
+
+    def cancel(self, key: str) -> bool:
+        """Cancel the in-flight call for key (waiters fall back to their own calls)
+
+        Returns:
+            True if a running call was cancelled
+        """
+        with self._lock:
+            call = self._calls.pop(key, None)
+            if call is None or call.task.done():
+                return False
+            self.cancelled += 1
+        call.loop.call_soon_threadsafe(call.task.cancel)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get in-flight key count and coalescing counters"""
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "waiters": sum(call.waiters for call in self._calls.values()),
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+                "follower_timeouts": self.follower_timeouts,
+                "leader_cancelled": self.leader_cancelled,
+                "cancelled": self.cancelled
+            }
+
+
+# Global instance
+_chat_single_flight: Optional[SingleFlight] = None
+_chat_single_flight_lock = threading.Lock()
+
+
+def get_chat_single_flight() -> SingleFlight:
+    """Get global single-flight group for chat LLM calls"""
+    global _chat_single_flight
+    if _chat_single_flight is None:
+        with _chat_single_flight_lock:
+            if _chat_single_flight is None:
+                _chat_single_flight = SingleFlight()
+    return _chat_single_flight
+
+
+def make_single_flight_key(cache_key: Optional[str], llm_api_key: Optional[str] = None,
+                           llm_api_url: Optional[str] = None,
+                           use_server_keys: bool = True) -> Optional[str]:
+    """Build the single-flight key for a chat LLM call
+
+    The LLM response cache key omits the caller's credentials; a follower must not get an
+    answer produced with somebody else's API key or endpoint, so those are hashed in.
+
+    Args:
+        cache_key: LLM response cache key (None = no coalescing)
+        llm_api_key: User-supplied API key, if any
+        llm_api_url: User-supplied API URL, if any
+        use_server_keys: Whether the call uses the server's own keys
+
+    Returns:
+        Coalescing key, or None when cache_key is None
+    """
+    if cache_key is None:
+        return None
+    credentials = f"{llm_api_key or ''}|{llm_api_url or ''}|{bool(use_server_keys)}"
+    digest = hashlib.sha256(credentials.encode()).hexdigest()[:16]
+    return f"{cache_key}:{digest}"
+
+
+async def coalesce_llm_call(cache_key: Optional[str], fn: Callable[[], Awaitable[Any]],
+                            processing_steps: Optional[list] = None) -> Any:
+    """Run a chat LLM call through the global single-flight group
+
+    Args:
+        cache_key: Single-flight key of the call from make_single_flight_key (None = no coalescing)
+        fn: Zero-argument coroutine function making the LLM call
+        processing_steps: Optional list to note a coalesced result in
+
+    Returns:
+        The LLM call result (possibly shared with a concurrent identical request)
+    """
+    if not ENABLE_CHAT_SINGLE_FLIGHT:
+        cache_key = None
+    result, shared = await get_chat_single_flight().do(cache_key, fn)
+    if shared and processing_steps is not None:
+        processing_steps.append("🔗 Shared answer from identical in-flight request")
+    return result
@@ -0,0 +1,246 @@
+"""
+Token Counting Service for StillMe
+
+Token budgets used to be `len(text) // 4`, which badly undercounts Vietnamese (and any
+non-ASCII) text - the main cause of ContextOverflowError and the minimal-prompt retry.
+This service counts tokens with a local subword tokenizer:
+- tiktoken, when it is installed and its encoding file is available
+- otherwise the HuggingFace tokenizer of the sentence-transformers embedding model, which
+  is already on disk in every deployment (EmbeddingService registers it once loaded)
+- a script-aware estimate, conservative for non-ASCII text, only until then
+
+Counts are memoized by a digest of the text (prompts are tens of KB, so the text itself is
+never kept as a cache key), and knowledge documents carry their token count in ChromaDB
+metadata (computed once at ingestion) so context packing does not re-count.
+"""
+
+import copy
+import hashlib
+import logging
+import math
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Local BPE tokenizer (optional)
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
+
+DEFAULT_TOKENIZER_ENCODING = os.getenv("TOKENIZER_ENCODING", "cl100k_base")
+TOKEN_COUNT_CACHE_SIZE = int(os.getenv("TOKEN_COUNT_CACHE_SIZE", "8192"))
+
+# HuggingFace tokenizer registered by the embedding model (see register_model_tokenizer)
+_model_tokenizer: Optional[Any] = None
+_model_tokenizer_name: Optional[str] = None
+
+# Metadata keys written at ingestion
+TOKEN_COUNT_METADATA_KEY = "token_count"
+TOKENIZER_METADATA_KEY = "tokenizer"
+
+# Heuristic fallback: words, single non-word characters
+_WORD_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+
+def _heuristic_count(text: str) -> int:
+    """Script-aware token estimate (used when no BPE tokenizer is available)
+
+    ASCII words cost ~1 token per 4 characters; words with non-ASCII characters
+    (Vietnamese diacritics, CJK, ...) are split much more finely by BPE tokenizers,
+    so they are counted at ~0.75 tokens per character. Punctuation is 1 token.
+    """
+    total = 0
+    for piece in _WORD_RE.findall(text):
+        if piece.isascii():
+            total += max(1, math.ceil(len(piece) / 4))
+        else:
+            total += max(1, math.ceil(len(piece) * 0.75))
+    return total
+
+
+class TokenCounter:
+    """Counts tokens with tiktoken or the embedding model's tokenizer, a script-aware estimate otherwise"""
+
+    def __init__(self,
+                 encoding_name: str = DEFAULT_TOKENIZER_ENCODING,
+                 hf_tokenizer: Optional[Any] = None,
+                 hf_tokenizer_name: Optional[str] = None,
+                 cache_size: int = TOKEN_COUNT_CACHE_SIZE):
+        """
+        Args:
+            encoding_name: tiktoken encoding (e.g. "cl100k_base")
+            hf_tokenizer: HuggingFace tokenizer used when tiktoken is unavailable
+            hf_tokenizer_name: Name recorded with ingestion-time counts for hf_tokenizer
+            cache_size: Number of memoized counts
+        """
+        self._encoding = None
+        self._hf_tokenizer = None
+        if TIKTOKEN_AVAILABLE:
+            try:
+                self._encoding = tiktoken.get_encoding(encoding_name)
+            except Exception as e:
+                # Encoding files may need a download the first time - fall back instead of failing
+                logger.warning(f"⚠️ Could not load tokenizer '{encoding_name}', falling back: {e}")
+        if self._encoding is not None:
+            self.name = f"tiktoken:{encoding_name}"
+        elif hf_tokenizer is not None:
+            self._hf_tokenizer = hf_tokenizer
+            self.name = f"hf:{hf_tokenizer_name or getattr(hf_tokenizer, 'name_or_path', 'tokenizer')}"
+        else:
+            self.name = "heuristic:v1"
+        self._cache_size = max(0, cache_size)
+        self._cache: "OrderedDict[bytes, int]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        logger.info(f"✅ TokenCounter initialized (backend={self.name})")
+
+    def _hf_encode(self, text: str, return_offsets: bool = False) -> Dict[str, Any]:
+        return self._hf_tokenizer(
+            text,
+            add_special_tokens=False,
+            return_offsets_mapping=return_offsets,
+            verbose=False  # No "sequence longer than model max length" warnings - we only count
+        )
+
+    def _count(self, text: str) -> int:
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        if self._hf_tokenizer is not None:
+            return len(self._hf_encode(text)["input_ids"])
+        return _heuristic_count(text)
+
+    def count(self, text: Optional[str]) -> int:
+        """Count tokens in text (memoized by a digest of the text)"""
+        if not text:
+            return 0
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+                return cached
+            self._cache_misses += 1
+        result = self._count(text)
+        if self._cache_size:
+            with self._cache_lock:
+                self._cache[key] = result
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    def truncate(self, text: str, max_tokens: int, suffix: str = "... [truncated]") -> str:
+        """Truncate text to at most max_tokens tokens (suffix appended when cut)
+
+        Args:
+            text: Text to truncate
+            max_tokens: Token budget for the returned text, suffix excluded
+            suffix: Marker appended when the text was cut
+        """
+        if not text or max_tokens <= 0:
+            return "" if max_tokens <= 0 else text
+        if self.count(text) <= max_tokens:
+            return text
+        if self._encoding is not None:
+            tokens = self._encoding.encode(text, disallowed_special=())
+            truncated = self._encoding.decode(tokens[:max_tokens])
+        elif self._hf_tokenizer is not None:
+            # Cut the original text at the end offset of the last kept token
+            offsets = self._hf_encode(text, return_offsets=True)["offset_mapping"]
+            truncated = text[:offsets[max_tokens - 1][1]]
+        else:
+            # Binary search the longest prefix that fits the estimate
+            low, high = 0, len(text)
+            while low < high:
+                mid = (low + high + 1) // 2
+                if _heuristic_count(text[:mid]) <= max_tokens:
+                    low = mid
+                else:
+                    high = mid - 1
+            truncated = text[:low]
+        # Cut at word boundary
+        if " " in truncated:
+            truncated = truncated.rsplit(" ", 1)[0]
+        return truncated + suffix
+
+    def document_count(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> int:
+        """Token count of a stored document, from its ingestion-time metadata when valid"""
+        if metadata:
+            stored = metadata.get(TOKEN_COUNT_METADATA_KEY)
+            if stored is not None and metadata.get(TOKENIZER_METADATA_KEY) == self.name:
+                try:
+                    return int(stored)
+                except (TypeError, ValueError):
+                    pass
+        return self.count(text)
+
+    def annotate_metadata(self, text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of metadata with this document's token count (for ingestion)"""
+        annotated = dict(metadata or {})
+        annotated[TOKEN_COUNT_METADATA_KEY] = self.count(text)
+        annotated[TOKENIZER_METADATA_KEY] = self.name
+        return annotated
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get backend name and memoization counters"""
+        with self._cache_lock:
+            return {
+                "backend": self.name,
+                "cache_hits": self._cache_hits,
+                "cache_misses": self._cache_misses,
+                "cache_size": len(self._cache)
+            }
+
+
+# Global instance
+_token_counter: Optional[TokenCounter] = None
+_token_counter_lock = threading.Lock()
+
+
+def get_token_counter() -> TokenCounter:
+    """Get global token counter"""
+    global _token_counter
+    if _token_counter is None:
+        with _token_counter_lock:
+            if _token_counter is None:
+                _token_counter = TokenCounter(hf_tokenizer=_model_tokenizer, hf_tokenizer_name=_model_tokenizer_name)
+    return _token_counter
+
+
+def register_model_tokenizer(tokenizer: Any, name: str) -> None:
+    """Count tokens with the embedding model's HuggingFace tokenizer when tiktoken is unavailable
+
+    Called by EmbeddingService once its sentence-transformers model is loaded. The tokenizer is
+    copied because the model reconfigures padding/truncation on its own instance while encoding,
+    and fast tokenizers raise "Already borrowed" when that races with another thread.
+
+    Args:
+        tokenizer: HuggingFace tokenizer (must be a fast tokenizer, for offset-based truncation)
+        name: Tokenizer name recorded with ingestion-time counts
+    """
+    global _model_tokenizer, _model_tokenizer_name, _token_counter
+    if tokenizer is None or not getattr(tokenizer, "is_fast", False):
+        return
+    try:
+        tokenizer = copy.deepcopy(tokenizer)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not copy embedding tokenizer for token counting: {e}")
+        return
+    with _token_counter_lock:
+        _model_tokenizer, _model_tokenizer_name = tokenizer, name
+        # Replace a heuristic counter created before the model was loaded
+        if _token_counter is not None and _token_counter.name == "heuristic:v1":
+            _token_counter = None
+
+
+def count_tokens(text: Optional[str]) -> int:
+    """Count tokens with the global token counter"""
+    return get_token_counter().count(text)
@@ -2,11 +2,26 @@
 Base classes for StillMe validators
 """
 
-from typing import Protocol, List, Optional
+from typing import Protocol, List, Optional, FrozenSet
 from pydantic import BaseModel
 from enum import Enum
 
 
+# Data a validator can declare it reads/writes (used by ValidatorChain to schedule validators).
+# Validators declare class attributes, e.g.:
+#     reads = frozenset({ANSWER, CTX_DOCS})
+#     writes = frozenset({ANSWER})
+# Validators without declarations are treated as reading and patching everything (run as a barrier).
+DRAFT_ANSWER = "draft_answer"    # Answer as it entered the chain (before any validator patches)
+ANSWER = "answer"                # Answer after patches from all earlier validators
+CTX_DOCS = "ctx_docs"            # Context documents from RAG
+CITATIONS = "citations"          # Citation markers added by earlier validators
+PRIOR_REASONS = "prior_reasons"  # Failure reasons reported by earlier validators
+
+DEFAULT_READS: FrozenSet[str] = frozenset({ANSWER, CTX_DOCS, CITATIONS})
+DEFAULT_WRITES: FrozenSet[str] = frozenset({ANSWER, CITATIONS})
+
+
 class ValidatorType(Enum):
     """
     Validator classification for Phase 2 optimization
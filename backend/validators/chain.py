@@ -2,16 +2,29 @@
 ValidatorChain - Orchestrates multiple validators
 """
 
-from typing import List, Dict, Set, Optional, Any
-from .base import Validator, ValidationResult
+from typing import List, Dict, Set, Optional, Any, FrozenSet, Tuple
+from .base import (
+    Validator, ValidationResult,
+    DRAFT_ANSWER, ANSWER, CITATIONS, PRIOR_REASONS, DEFAULT_READS, DEFAULT_WRITES
+)
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import threading
+import time
+from concurrent.futures import wait, FIRST_COMPLETED
+from .executor import get_validator_executor
 
 logger = logging.getLogger(__name__)
 
+# Default wall-clock budget for a validator on the shared pool (queueing included)
+# Validators can override it with a `run_timeout` attribute (seconds)
+DEFAULT_VALIDATOR_TIMEOUT = float(os.getenv("VALIDATOR_TIMEOUT_SECONDS", "15"))
+
+_worker_state = threading.local()
+
 
 class ValidatorChain:
-    """Chain of validators to run sequentially"""
+    """Chain of validators - results match running them in order, independent validators overlap"""
     
     def __init__(self, validators: List[Validator]):
         """
@@ -21,69 +34,211 @@ class ValidatorChain:
             validators: List of validators to run in order
         """
         self.validators = validators
+        self._reads: List[FrozenSet[str]] = []
+        self._writes: List[FrozenSet[str]] = []
+        for validator in validators:
+            reads, writes = self._declared_io(validator)
+            self._reads.append(reads)
+            self._writes.append(writes)
+        self._dependencies = self._build_dependencies()
+        self._run_timeouts: List[Optional[float]] = [getattr(v, "run_timeout", None) for v in validators]
         logger.info(f"ValidatorChain initialized with {len(validators)} validators")
     
-    def _can_run_parallel(self, validator: Validator, validator_name: str) -> bool:
+    @staticmethod
+    def _declared_io(validator: Validator) -> Tuple[FrozenSet[str], FrozenSet[str]]:
         """
-        Check if a validator can run in parallel with others.
+        Get the inputs/outputs a validator declares (class attributes `reads` / `writes`).
         
-        NPR-Inspired Optimization:
-        - Validators that can run in parallel: Read-only, no dependencies on other validators' results
-        - Validators that must run sequentially: Have dependencies or modify shared state
+        Validators without declarations are treated as reading and patching everything,
+        so they run as a barrier exactly where they appear in the chain.
+        """
+        reads = getattr(validator, "reads", None)
+        writes = getattr(validator, "writes", None)
+        if reads is None or writes is None:
+            logger.debug(f"Validator {type(validator).__name__} declares no reads/writes, scheduling as barrier")
+            return DEFAULT_READS, DEFAULT_WRITES
+        return frozenset(reads), frozenset(writes)
+    
+    def _timeout(self, j: int) -> float:
+        """Wall-clock budget for validator j on the shared pool (its `run_timeout`, else the default)"""
+        run_timeout = self._run_timeouts[j]
+        return float(run_timeout) if run_timeout is not None else DEFAULT_VALIDATOR_TIMEOUT
+    
+    def _build_dependencies(self) -> List[FrozenSet[int]]:
+        """
+        Build the dependency DAG from declared reads/writes (edges only point to earlier validators).
         
-        Args:
-            validator: Validator instance
-            validator_name: Name of validator class
-            
-        Returns:
-            True if validator can run in parallel, False otherwise
+        Validator j waits for an earlier validator i when:
+        - j reads something i may patch (ANSWER reads see every patch, CITATIONS reads see citation patches)
+        - both may patch the answer (patches are applied in chain order)
+        - j reads PRIOR_REASONS (needs every earlier result)
+        
+        Every validator receives the answer exactly as a sequential run would have given it,
+        so results are identical to running the chain in order.
         """
-        # Validators that MUST run sequentially (have dependencies or modify state)
-        sequential_only = {
-            "LanguageValidator",      # Must run FIRST (highest priority)
-            "CitationRequired",        # Must run before CitationRelevance (provides citations)
-            "CitationRelevance",       # DEPENDS on CitationRequired (needs citations to validate)
-            "SourceConsensusValidator", # Must run after EvidenceOverlap, before ConfidenceValidator
-            "ConfidenceValidator",     # May depend on other validators' results (SourceConsensusValidator, EvidenceOverlap)
-            "FactualHallucinationValidator",  # Critical validator, run sequentially for safety
-            "ReligiousChoiceValidator", # Critical validator, run sequentially for safety
-        }
+        dependencies = []
+        for j in range(len(self.validators)):
+            reads_j, writes_j = self._reads[j], self._writes[j]
+            deps = set()
+            for i in range(j):
+                writes_i = self._writes[i]
+                if PRIOR_REASONS in reads_j:
+                    deps.add(i)
+                elif writes_i and (ANSWER in reads_j or writes_j):
+                    deps.add(i)
+                elif CITATIONS in writes_i and CITATIONS in reads_j:
+                    deps.add(i)
+            dependencies.append(frozenset(deps))
+        return dependencies
+    
+    def _run_validator(self, validator: Validator, validator_name: str, answer: str, ctx_docs: List[str],
+                       previous_reasons: List[str], context_quality: Optional[str], avg_similarity: Optional[float],
+                       is_philosophical: bool, is_religion_roleplay: bool, user_question: Optional[str],
+                       context: Optional[Dict[str, Any]], is_real_time_question: bool) -> ValidationResult:
+        """Call a validator with the extra arguments it accepts"""
+        if validator_name == "ConfidenceValidator":
+            # Pass previous reasons and user_question to ConfidenceValidator so it can detect source_contradiction
+            # and use human-readable citations in uncertainty templates
+            # CRITICAL: Pass is_real_time_question to skip disclaimer for real-time questions (time, weather, etc.)
+            return validator.run(answer, ctx_docs, context_quality=context_quality, avg_similarity=avg_similarity, is_philosophical=is_philosophical, is_religion_roleplay=is_religion_roleplay, previous_reasons=previous_reasons, user_question=user_question, context=context, is_real_time_question=is_real_time_question)
+        if validator_name == "CitationRequired":
+            # Pass is_philosophical, user_question, and context to CitationRequired
+            # user_question is needed to detect real factual questions (even with philosophical elements)
+            # context is needed to detect foundational knowledge for specific citations
+            # Note: context may not be available in all call paths, so it's optional
+            return validator.run(answer, ctx_docs, is_philosophical=is_philosophical, user_question=user_question, context=context)
+        if validator_name in ("FactualHallucinationValidator", "SourceConsensusValidator"):
+            # Pass user_question for context
+            return validator.run(answer, ctx_docs, user_question=user_question)
+        if validator_name == "IdentityCheckValidator":
+            # Philosophical questions don't require humility when no context (theoretical reasoning)
+            return validator.run(answer, ctx_docs, is_philosophical=is_philosophical)
+        return validator.run(answer, ctx_docs)
+    
+    def _fold_result(self, state: Dict[str, Any], i: int, validator_name: str,
+                     result: ValidationResult) -> Optional[ValidationResult]:
+        """
+        Apply one validator result to the chain state, in chain order.
         
-        # Validators that can run in parallel (read-only, no dependencies)
-        # These validators only read answer and ctx_docs, don't depend on other validators' results
-        parallel_safe = {
-            "EvidenceOverlap",         # Reads answer and ctx_docs only
-            "NumericUnitsBasic",       # Reads answer only
-            "SchemaFormat",            # Reads answer only
-            "EgoNeutralityValidator",  # Reads answer and ctx_docs only
-            "IdentityCheckValidator",   # Reads answer only
-            "PhilosophicalDepthValidator",  # Reads answer only
-            "EthicsAdapter",            # Reads answer only (but should run last for safety)
-        }
+        Returns:
+            ValidationResult to return immediately (critical failure, early exit), or None to continue
+        """
+        reasons = state["reasons"]
         
-        # Check sequential first (higher priority)
-        if validator_name in sequential_only:
-            return False
+        # Track citation status
+        if "CitationRequired" in validator_name:
+            state["has_citation"] = result.passed
         
-        # Check parallel safe
-        if validator_name in parallel_safe:
-            return True
+        # CRITICAL: Check for patched_answer even when passed=True
+        # This allows validators to improve responses (e.g., convert numeric citations to human-readable)
+        # even when validation passed
+        if result.patched_answer and result.patched_answer != state["patched"]:
+            state["patched"] = result.patched_answer
+            logger.debug(f"Using patched answer from validator {i} (passed=True, improvement made)")
         
-        # Default: sequential for safety (unknown validators)
-        logger.warning(f"Unknown validator {validator_name}, running sequentially for safety")
-        return False
+        if not result.passed:
+            reasons.extend(result.reasons)
+            logger.debug(f"Validator {i} ({validator_name}) failed: {result.reasons}")
+            
+            # Check if this is only a low_overlap issue
+            if any("low_overlap" in r for r in result.reasons):
+                state["low_overlap_only"] = True
+            
+            # Check if this is a source_contradiction (should trigger uncertainty in ConfidenceValidator)
+            if any("source_contradiction" in r for r in result.reasons):
+                logger.info(
+                    f"Validator {i} ({validator_name}) detected source contradiction - "
+                    f"ConfidenceValidator will handle uncertainty expression"
+                )
+                # Don't fail fast - let ConfidenceValidator handle it
+            
+            # Use patched answer if available
+            if result.patched_answer:
+                state["patched"] = result.patched_answer
+                logger.debug(f"Using patched answer from validator {i}")
+                
+                # If validator provided patched_answer, continue with patched version
+                # This allows subsequent validators to validate the patched answer
+                if any("missing_citation" in r for r in result.reasons):
+                    logger.info(
+                        f"Validator {i} ({validator_name}) fixed missing_citation with patched_answer, continuing..."
+                    )
+                elif any("language_mismatch" in r for r in result.reasons):
+                    logger.info(
+                        f"Validator {i} ({validator_name}) fixed language_mismatch with patched_answer, continuing..."
+                    )
+                # For other cases, continue with patched answer
+            else:
+                # Special handling: If we have citation but only low_overlap, don't block
+                # Citation is more important than overlap score (LLM may translate/summarize)
+                if state["has_citation"] and state["low_overlap_only"] and not any("missing_citation" in r for r in reasons):
+                    logger.info(
+                        f"Validator {i} ({validator_name}) failed with low_overlap, "
+                        f"but citation exists - allowing response"
+                    )
+                    # Continue - don't fail fast
+                elif any("language_mismatch" in r for r in reasons):
+                    # OPTIMIZATION: Early exit for language mismatch (critical failure)
+                    # Language mismatch is critical - fail fast to avoid running remaining validators
+                    logger.warning(
+                        f"Validator {i} ({validator_name}) failed: language_mismatch (critical) without patch - early exit"
+                    )
+                    # No translation available - this is critical, return failure immediately
+                    return ValidationResult(
+                        passed=False,
+                        reasons=reasons,
+                        patched_answer=None
+                    )
+                elif any("missing_citation" in r for r in reasons):
+                    # OPTIMIZATION: Early exit for missing citation without patch (critical failure)
+                    # CitationRequired should ALWAYS provide patched_answer when citation is missing
+                    # This should not happen if CitationRequired is working correctly
+                    logger.warning(
+                        f"Validator {i} ({validator_name}) failed: missing_citation (critical) without patch - early exit"
+                    )
+                    return ValidationResult(
+                        passed=False,
+                        reasons=reasons,
+                        patched_answer=None
+                    )
+                elif any("future_dates_detected" in r for r in reasons):
+                    # CRITICAL: FutureDatesValidator detected future dates - this is a hallucination
+                    # Block response immediately - don't allow hallucinated dates
+                    logger.warning(
+                        f"Validator {i} ({validator_name}) failed: future_dates_detected (critical) - BLOCKING response to prevent hallucination"
+                    )
+                    return ValidationResult(
+                        passed=False,
+                        reasons=reasons,
+                        patched_answer=None  # Don't allow patched answer - block the response
+                    )
+                else:
+                    # Track critical failure (no patch available)
+                    state["has_critical_failure"] = True
+                    logger.warning(
+                        f"Validator {i} ({validator_name}) failed without patch: {result.reasons}"
+                    )
+                    # Don't fail fast for non-critical errors - continue to collect all failures
+                    # But mark that we have a critical failure
+        return None
     
     def run(self, answer: str, ctx_docs: List[str], context_quality: Optional[str] = None,
             avg_similarity: Optional[float] = None, is_philosophical: bool = False,
             is_religion_roleplay: bool = False, user_question: Optional[str] = None,
             context: Optional[Dict[str, Any]] = None, is_real_time_question: bool = False) -> ValidationResult:
         """
-        Run all validators with parallel execution for independent validators
+        Run all validators, each as soon as the validators it depends on have finished
         
-        OPTIMIZATION: 
-        - Early exit for critical failures (language_mismatch, missing_citation without patch)
-        - Parallel execution for independent validators (CitationRelevance, EvidenceOverlap, etc.)
-        This reduces latency when validation fails early and speeds up independent validators.
+        OPTIMIZATION:
+        - Dependency-graph scheduling: validators declare what they read/patch (see base.py);
+          independent validators (e.g. EvidenceOverlap, NumericUnitsBasic) overlap with
+          CitationRequired instead of waiting for a fixed sequential block
+        - One long-lived shared thread pool instead of an executor per request (see executor.py);
+          when the pool is saturated validators run inline on the request thread (back-pressure)
+        - Per-validator timeouts on the pool: a validator that exceeds its budget is reported as
+          "validator_timeout:<name>" (non-critical, like validator_error) and the chain moves on
+        - Early exit for critical failures (language_mismatch, missing_citation without patch):
+          results are applied in chain order and validators not yet started are cancelled
         
         Args:
             answer: The answer to validate
@@ -96,282 +251,147 @@ class ValidatorChain:
         Returns:
             ValidationResult with overall status
         """
-        import time
         validation_start = time.time()
         
-        reasons: List[str] = []
-        patched = answer
-        has_citation = False
-        low_overlap_only = False
-        has_critical_failure = False  # Track if any critical validator failed without patch
+        state: Dict[str, Any] = {
+            "reasons": [],
+            "patched": answer,
+            "has_citation": False,
+            "low_overlap_only": False,
+            "has_critical_failure": False,  # Track if any critical validator failed without patch
+        }
         
-        # Group validators into sequential and parallel groups
-        sequential_validators = []
-        parallel_validators = []
+        total = len(self.validators)
+        results: Dict[int, ValidationResult] = {}
+        errors: Dict[int, str] = {}
+        outputs: Dict[int, str] = {}  # Answer after validator i (its patch, or its input if it didn't patch)
+        started: Set[int] = set()
+        in_flight: Dict[Any, int] = {}
+        deadlines: Dict[Any, float] = {}
+        fold_pos = 0
+        pooled_count = 0
         
-        for i, validator in enumerate(self.validators):
-            validator_name = type(validator).__name__
-            if self._can_run_parallel(validator, validator_name):
-                parallel_validators.append((i, validator, validator_name))
-            else:
-                sequential_validators.append((i, validator, validator_name))
+        # Nested chains inside a validator run inline to avoid waiting on the pool from a pool thread
+        use_pool = not getattr(_worker_state, "in_validator_pool", False)
+        
+        def _input_answer(j: int) -> str:
+            if DRAFT_ANSWER in self._reads[j] and ANSWER not in self._reads[j] and not self._writes[j]:
+                return answer
+            writers = [i for i in self._dependencies[j] if self._writes[i]]
+            return outputs[max(writers)] if writers else answer
         
-        logger.debug(f"🔍 [NPR] Validator grouping: {len(sequential_validators)} sequential, {len(parallel_validators)} parallel")
+        def _previous_reasons(j: int) -> List[str]:
+            previous = []
+            for i in range(j):
+                if i in errors:
+                    previous.append(errors[i])
+                elif not results[i].passed:
+                    previous.extend(results[i].reasons)
+            return previous
         
-        # Run sequential validators first (LanguageValidator, CitationRequired, etc.)
-        sequential_start = time.time()
-        for i, validator, validator_name in sequential_validators:
+        def _execute(j: int, input_answer: str, previous_reasons: List[str]):
+            validator = self.validators[j]
+            validator_name = type(validator).__name__
+            validator_start = time.time()
             try:
-                # Tier 3.5: Pass context quality to ConfidenceValidator
-                if validator_name == "ConfidenceValidator":
-                    # Pass previous reasons and user_question to ConfidenceValidator so it can detect source_contradiction
-                    # and use human-readable citations in uncertainty templates
-                    # CRITICAL: Pass is_real_time_question to skip disclaimer for real-time questions (time, weather, etc.)
-                    result = validator.run(patched, ctx_docs, context_quality=context_quality, avg_similarity=avg_similarity, is_philosophical=is_philosophical, is_religion_roleplay=is_religion_roleplay, previous_reasons=reasons, user_question=user_question, context=context, is_real_time_question=is_real_time_question)
-                elif validator_name == "CitationRequired":
-                    # Pass is_philosophical, user_question, and context to CitationRequired
-                    # user_question is needed to detect real factual questions (even with philosophical elements)
-                    # context is needed to detect foundational knowledge for specific citations
-                    # Note: context may not be available in all call paths, so it's optional
-                    result = validator.run(patched, ctx_docs, is_philosophical=is_philosophical, user_question=user_question, context=context)
-                elif validator_name == "FactualHallucinationValidator":
-                    # Pass user_question to FactualHallucinationValidator
-                    result = validator.run(patched, ctx_docs, user_question=user_question)
-                elif validator_name == "SourceConsensusValidator":
-                    # Pass user_question to SourceConsensusValidator for context
-                    result = validator.run(patched, ctx_docs, user_question=user_question)
-                elif validator_name == "IdentityCheckValidator":
-                    # Pass is_philosophical to IdentityCheckValidator
-                    # Philosophical questions don't require humility when no context (theoretical reasoning)
-                    result = validator.run(patched, ctx_docs, is_philosophical=is_philosophical)
-                else:
-                    result = validator.run(patched, ctx_docs)
-                
-                # Track citation status
-                if "CitationRequired" in type(validator).__name__:
-                    has_citation = result.passed
-                
-                # CRITICAL: Check for patched_answer even when passed=True
-                # This allows validators to improve responses (e.g., convert numeric citations to human-readable)
-                # even when validation passed
-                if result.patched_answer and result.patched_answer != patched:
-                    patched = result.patched_answer
-                    logger.debug(f"Using patched answer from validator {i} (passed=True, improvement made)")
-                
-                if not result.passed:
-                    reasons.extend(result.reasons)
-                    logger.debug(
-                        f"Validator {i} ({type(validator).__name__}) failed: {result.reasons}"
-                    )
-                    
-                    # Check if this is only a low_overlap issue
-                    if any("low_overlap" in r for r in result.reasons):
-                        low_overlap_only = True
-                    
-                    # Check if this is a source_contradiction (should trigger uncertainty in ConfidenceValidator)
-                    if any("source_contradiction" in r for r in result.reasons):
-                        logger.info(
-                            f"Validator {i} ({type(validator).__name__}) detected source contradiction - "
-                            f"ConfidenceValidator will handle uncertainty expression"
-                        )
-                        # Don't fail fast - let ConfidenceValidator handle it
-                        # Mark that we have a source contradiction for ConfidenceValidator
-                    
-                    # Use patched answer if available
-                    if result.patched_answer:
-                        patched = result.patched_answer
-                        logger.debug(f"Using patched answer from validator {i}")
-                        
-                        # If validator provided patched_answer, continue with patched version
-                        # This allows subsequent validators to validate the patched answer
-                        # Special case: If this is missing_citation with patched_answer, continue
-                        if any("missing_citation" in r for r in result.reasons):
-                            logger.info(
-                                f"Validator {i} ({type(validator).__name__}) fixed missing_citation with patched_answer, continuing..."
-                            )
-                            # Continue to next validator with patched answer
-                        elif any("language_mismatch" in r for r in result.reasons):
-                            logger.info(
-                                f"Validator {i} ({type(validator).__name__}) fixed language_mismatch with patched_answer, continuing..."
-                            )
-                            # Continue to next validator with corrected answer
-                        # For other cases, continue with patched answer
-                    else:
-                        # Special handling: If we have citation but only low_overlap, don't block
-                        # Citation is more important than overlap score (LLM may translate/summarize)
-                        if has_citation and low_overlap_only and not any("missing_citation" in r for r in reasons):
-                            logger.info(
-                                f"Validator {i} ({type(validator).__name__}) failed with low_overlap, "
-                                f"but citation exists - allowing response"
-                            )
-                            # Continue - don't fail fast
-                        elif any("language_mismatch" in r for r in reasons):
-                            # OPTIMIZATION: Early exit for language mismatch (critical failure)
-                            # Language mismatch is critical - fail fast to avoid running remaining validators
-                            logger.warning(
-                                f"Validator {i} ({type(validator).__name__}) failed: language_mismatch (critical) without patch - early exit"
-                            )
-                            # No translation available - this is critical, return failure immediately
-                            return ValidationResult(
-                                passed=False,
-                                reasons=reasons,
-                                patched_answer=None
-                            )
-                        elif any("missing_citation" in r for r in reasons):
-                            # CRITICAL FIX: Don't early exit if patched_answer is available
-                            # CitationRequired should ALWAYS provide patched_answer when citation is missing
-                            # If patched_answer exists, continue with it (don't early exit)
-                            if result.patched_answer:
-                                logger.info(
-                                    f"Validator {i} ({type(validator).__name__}) fixed missing_citation with patched_answer, continuing..."
-                                )
-                                patched = result.patched_answer
-                                # Continue to next validator with patched answer
-                            else:
-                                # OPTIMIZATION: Early exit for missing citation without patch (critical failure)
-                                # Missing citation is critical but no patched_answer available
-                                # This should not happen if CitationRequired is working correctly
-                                logger.warning(
-                                    f"Validator {i} ({type(validator).__name__}) failed: missing_citation (critical) without patch - early exit"
-                                )
-                                return ValidationResult(
-                                    passed=False,
-                                    reasons=reasons,
-                                    patched_answer=None
-                                )
-                        elif any("future_dates_detected" in r for r in reasons):
-                            # CRITICAL: FutureDatesValidator detected future dates - this is a hallucination
-                            # Block response immediately - don't allow hallucinated dates
-                            logger.warning(
-                                f"Validator {i} ({type(validator).__name__}) failed: future_dates_detected (critical) - BLOCKING response to prevent hallucination"
-                            )
-                            return ValidationResult(
-                                passed=False,
-                                reasons=reasons,
-                                patched_answer=None  # Don't allow patched answer - block the response
-                            )
-                        else:
-                            # Track critical failure (no patch available)
-                            has_critical_failure = True
-                            logger.warning(
-                                f"Validator {i} ({type(validator).__name__}) failed without patch: {result.reasons}"
-                            )
-                            # Don't fail fast for non-critical errors - continue to collect all failures
-                            # But mark that we have a critical failure
-                else:
-                    # Update patched answer if validator provided one (even if passed)
-                    if result.patched_answer:
-                        patched = result.patched_answer
-                        logger.debug(f"Applied patch from validator {i}")
-                        
+                result = self._run_validator(
+                    validator, validator_name, input_answer, ctx_docs, previous_reasons,
+                    context_quality, avg_similarity, is_philosophical, is_religion_roleplay,
+                    user_question, context, is_real_time_question
+                )
+                logger.debug(f"⏱️ [NPR] {validator_name} completed in {time.time() - validator_start:.3f}s")
+                return j, result, None
             except Exception as e:
-                logger.error(f"Validator {i} ({type(validator).__name__}) error: {e}")
-                reasons.append(f"validator_error:{type(validator).__name__}:{str(e)}")
-                # Continue with next validator on error
+                logger.error(f"Validator {j} ({validator_name}) error: {e}")
+                return j, None, f"validator_error:{validator_name}:{str(e)}"
         
-        sequential_time = time.time() - sequential_start
-        if sequential_validators:
-            logger.debug(f"⏱️ [NPR] Sequential validators completed in {sequential_time:.3f}s ({len(sequential_validators)} validators)")
+        def _execute_in_pool(j: int, input_answer: str, previous_reasons: List[str]):
+            _worker_state.in_validator_pool = True
+            try:
+                return _execute(j, input_answer, previous_reasons)
+            finally:
+                _worker_state.in_validator_pool = False
         
-        # NPR-INSPIRED OPTIMIZATION: Run parallel validators concurrently (if any)
-        if parallel_validators:
-            import time
-            parallel_start = time.time()
-            logger.debug(f"🚀 [NPR] Running {len(parallel_validators)} validators in parallel...")
-            parallel_results: Dict[int, ValidationResult] = {}
-            
-            def _run_parallel_validator(validator, validator_name, patched_answer, ctx_docs_list, user_q=None):
-                """Helper function to run validator with correct parameters"""
-                validator_start = time.time()
-                try:
-                    # Pass user_question to validators that need it
-                    if validator_name == "FactualHallucinationValidator":
-                        result = validator.run(patched_answer, ctx_docs_list, user_question=user_q)
-                    elif validator_name == "SourceConsensusValidator":
-                        result = validator.run(patched_answer, ctx_docs_list, user_question=user_q)
-                    else:
-                        result = validator.run(patched_answer, ctx_docs_list)
-                    validator_time = time.time() - validator_start
-                    logger.debug(f"⏱️ [NPR] {validator_name} completed in {validator_time:.3f}s")
-                    return result
-                except Exception as e:
-                    logger.error(f"Parallel validator {validator_name} error: {e}")
-                    return ValidationResult(
-                        passed=False,
-                        reasons=[f"validator_error:{validator_name}:{str(e)}"]
-                    )
+        def _record(j: int, result: Optional[ValidationResult], error: Optional[str]) -> None:
+            input_answer = _input_answer(j)
+            if error is not None:
+                errors[j] = error
+                outputs[j] = input_answer
+                return
+            if result.patched_answer and not self._writes[j]:
+                # Later validators were scheduled without waiting for this one - its patch can't be applied
+                logger.warning(f"Ignoring patch from {type(self.validators[j]).__name__} (declares no writes)")
+                result = ValidationResult(passed=result.passed, reasons=result.reasons, patched_answer=None)
+            results[j] = result
+            outputs[j] = result.patched_answer or input_answer
+        
+        def _cancel_pending() -> None:
+            for future in in_flight:
+                future.cancel()
+        
+        while fold_pos < total:
+            ready = [
+                j for j in range(total)
+                if j not in started and all(d in outputs for d in self._dependencies[j])
+            ]
             
-            try:
-                # NPR: Optimize max_workers based on validator count and CPU cores
-                import os
-                cpu_count = os.cpu_count() or 4
-                optimal_workers = min(len(parallel_validators), cpu_count, 8)  # Cap at 8 for safety
-                
-                with ThreadPoolExecutor(max_workers=optimal_workers) as executor:
-                    # Submit all parallel validators with correct parameters
-                    future_to_validator = {
-                        executor.submit(
-                            _run_parallel_validator,
-                            validator,
-                            validator_name,
-                            patched,
-                            ctx_docs,
-                            user_question
-                        ): (i, validator_name)
-                        for i, validator, validator_name in parallel_validators
-                    }
-                    
-                    # Collect results as they complete
-                    for future in as_completed(future_to_validator):
-                        i, validator_name = future_to_validator[future]
+            if ready and (not use_pool or (len(ready) == 1 and not in_flight and self._run_timeouts[ready[0]] is None)):
+                # Nothing to overlap with (and no explicit timeout to enforce) - run inline on the calling thread
+                j = ready[0]
+                started.add(j)
+                _, result, error = _execute(j, _input_answer(j), _previous_reasons(j) if PRIOR_REASONS in self._reads[j] else [])
+                _record(j, result, error)
+            else:
+                executor = get_validator_executor()
+                for j in ready:
+                    started.add(j)
+                    previous_reasons = _previous_reasons(j) if PRIOR_REASONS in self._reads[j] else []
+                    future = executor.try_submit(_execute_in_pool, j, _input_answer(j), previous_reasons)
+                    if future is None:
+                        # Back-pressure: pool saturated, run on the request thread instead of queueing
+                        _, result, error = _execute(j, _input_answer(j), previous_reasons)
+                        _record(j, result, error)
+                        continue
+                    in_flight[future] = j
+                    deadlines[future] = time.time() + self._timeout(j)
+                    pooled_count += 1
+                if in_flight:
+                    wait_timeout = max(0.0, min(deadlines[f] for f in in_flight) - time.time())
+                    done, _ = wait(list(in_flight), timeout=wait_timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        j = in_flight.pop(future)
+                        deadlines.pop(future, None)
                         try:
-                            result = future.result()
-                            parallel_results[i] = result
+                            _, result, error = future.result()
                         except Exception as e:
-                            logger.error(f"Parallel validator {i} ({validator_name}) error: {e}")
-                            parallel_results[i] = ValidationResult(
-                                passed=False,
-                                reasons=[f"validator_error:{validator_name}:{str(e)}"]
-                            )
-                
-                parallel_time = time.time() - parallel_start
-                logger.info(f"✅ [NPR] Parallel validation completed in {parallel_time:.3f}s ({len(parallel_validators)} validators, {optimal_workers} workers)")
-                
-                # Process parallel results
-                for i, validator, validator_name in parallel_validators:
-                    if i in parallel_results:
-                        result = parallel_results[i]
-                        
-                        if not result.passed:
-                            reasons.extend(result.reasons)
-                            logger.debug(
-                                f"Parallel validator {i} ({validator_name}) failed: {result.reasons}"
-                            )
-                        else:
-                            # Update patched answer if validator provided one
-                            if result.patched_answer:
-                                patched = result.patched_answer
-                                logger.debug(f"Applied patch from parallel validator {i}")
-            except Exception as parallel_error:
-                # Fallback to sequential if parallel execution fails
-                logger.warning(f"⚠️ [NPR] Parallel validation failed, falling back to sequential: {parallel_error}")
-                fallback_start = time.time()
-                for i, validator, validator_name in parallel_validators:
-                    try:
-                        # Pass user_question if available
-                        if validator_name == "FactualHallucinationValidator":
-                            result = validator.run(patched, ctx_docs, user_question=user_question)
-                        else:
-                            result = validator.run(patched, ctx_docs)
-                        if not result.passed:
-                            reasons.extend(result.reasons)
-                        if result.patched_answer:
-                            patched = result.patched_answer
-                    except Exception as e:
-                        logger.error(f"Fallback validator {i} ({validator_name}) error: {e}")
-                        reasons.append(f"validator_error:{validator_name}:{str(e)}")
-                fallback_time = time.time() - fallback_start
-                logger.warning(f"⚠️ [NPR] Sequential fallback completed in {fallback_time:.3f}s")
+                            result, error = None, f"validator_error:{type(self.validators[j]).__name__}:{str(e)}"
+                        _record(j, result, error)
+                    now = time.time()
+                    for future in [f for f in in_flight if deadlines[f] <= now]:
+                        # Stop waiting - the worker finishes in the background, its result is discarded
+                        j = in_flight.pop(future)
+                        deadlines.pop(future)
+                        future.cancel()
+                        executor.record_timeout()
+                        validator_name = type(self.validators[j]).__name__
+                        logger.warning(f"⏱️ Validator {j} ({validator_name}) timed out after {self._timeout(j):.1f}s")
+                        _record(j, None, f"validator_timeout:{validator_name}")
+            
+            # Apply finished results in chain order (same decisions as a sequential run)
+            while fold_pos < total and fold_pos in outputs:
+                validator_name = type(self.validators[fold_pos]).__name__
+                if fold_pos in errors:
+                    state["reasons"].append(errors[fold_pos])
+                else:
+                    early_result = self._fold_result(state, fold_pos, validator_name, results[fold_pos])
+                    if early_result is not None:
+                        _cancel_pending()
+                        return early_result
+                fold_pos += 1
+        
+        reasons: List[str] = state["reasons"]
+        patched = state["patched"]
+        has_critical_failure = state["has_critical_failure"]
         
         # Determine final validation status
         # If we have critical failures without patches, validation failed
@@ -398,7 +418,7 @@ class ValidatorChain:
         
         # NPR: Log overall validation performance
         total_validation_time = time.time() - validation_start
-        logger.info(f"✅ [NPR] Validation completed in {total_validation_time:.3f}s (sequential: {len(sequential_validators)}, parallel: {len(parallel_validators)})")
+        logger.info(f"✅ [NPR] Validation completed in {total_validation_time:.3f}s ({total} validators, {pooled_count} on shared pool)")
         
         # CRITICAL FIX: Log patched_answer status to help debug
         logger.info(f"🔍 [TRACE] ValidatorChain final: patched={patched[:100] if patched else 'None'}..., answer={answer[:100] if answer else 'None'}..., patched_answer={final_patched_answer[:100] if final_patched_answer else 'None'}..., patched != answer={patched != answer}")
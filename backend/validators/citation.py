@@ -4,7 +4,7 @@ CitationRequired validator - Ensures answers include citations
 
 import re
 from typing import List, Any, Optional, Dict
-from .base import ValidationResult
+from .base import ValidationResult, ANSWER, CTX_DOCS, CITATIONS
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,6 +19,10 @@ HUMAN_READABLE_CITE_RE = re.compile(r'\[(?:general knowledge|research:|learning:
 class CitationRequired:
     """Validator that requires citations in answers"""
     
+    # May replace the whole answer with a no-source response, not just add citations
+    reads = frozenset({ANSWER, CTX_DOCS})
+    writes = frozenset({ANSWER, CITATIONS})
+    
     def __init__(self, required: bool = True):
         """
         Initialize citation validator
@@ -4,7 +4,8 @@ CitationRelevance validator - Checks if citations are relevant to the answer
 
 import re
 from typing import List, Dict, Any
-from .base import ValidationResult
+from .base import ValidationResult, ANSWER, CTX_DOCS, CITATIONS
+from .context_analysis import analyze_context, extract_keywords
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,9 @@ class CitationRelevance:
     - Detection of citation without clear connection to answer content
     """
     
+    reads = frozenset({ANSWER, CTX_DOCS, CITATIONS})
+    writes = frozenset()
+    
     def __init__(self, min_keyword_overlap: float = 0.1):
         """
         Initialize citation relevance validator
@@ -57,6 +61,7 @@ class CitationRelevance:
         # Check relevance for each cited document
         relevance_issues = []
         answer_keywords = self._extract_keywords(answer.lower())
+        doc_analyses = analyze_context(ctx_docs)
         
         for cite_num in citations:
             try:
@@ -66,8 +71,8 @@ class CitationRelevance:
                     relevance_issues.append(f"Invalid citation [{cite_num}] - document index out of range")
                     continue
                 
-                doc_text = ctx_docs[doc_index].lower()
-                doc_keywords = self._extract_keywords(doc_text)
+                # Keyword sets of context documents are cached across validations
+                doc_keywords = doc_analyses[doc_index].keywords
                 
                 # Calculate keyword overlap
                 overlap_ratio = self._calculate_keyword_overlap(answer_keywords, doc_keywords)
@@ -111,28 +116,7 @@ class CitationRelevance:
         Returns:
             Set of keywords (words with length >= 3, excluding common stop words)
         """
-        # Simple stop words list (can be expanded)
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-            'by', 'from', 'as', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has',
-            'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might', 'must',
-            'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
-            'what', 'which', 'who', 'when', 'where', 'why', 'how', 'all', 'each', 'every', 'some',
-            'any', 'no', 'not', 'only', 'just', 'also', 'more', 'most', 'very', 'too', 'so', 'than',
-            'then', 'now', 'here', 'there', 'when', 'where', 'why', 'how', 'about', 'into', 'over',
-            'after', 'before', 'during', 'through', 'under', 'above', 'below', 'up', 'down', 'out',
-            'off', 'away', 'back', 'again', 'further', 'once', 'twice', 'first', 'second', 'third',
-            'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten',
-            'vietnamese', 'english', 'chinese', 'japanese', 'korean', 'french', 'german', 'spanish'
-        }
-        
-        # Extract words (alphanumeric sequences)
-        words = re.findall(r'\b[a-z0-9]{3,}\b', text)
-        
-        # Filter out stop words and return unique set
-        keywords = {w for w in words if w not in stop_words and len(w) >= 3}
-        
-        return keywords
+        return set(extract_keywords(text))
     
     def _calculate_keyword_overlap(self, answer_keywords: set, doc_keywords: set) -> float:
         """
@@ -4,7 +4,7 @@ ConfidenceValidator - Detects when AI should express uncertainty
 
 import re
 from typing import List, Optional, Dict, Any
-from .base import ValidationResult
+from .base import ValidationResult, ANSWER, CTX_DOCS, PRIOR_REASONS
 import logging
 
 logger = logging.getLogger(__name__)
@@ -112,6 +112,10 @@ OVERCONFIDENCE_PATTERNS = [
 class ConfidenceValidator:
     """Validator that checks if AI appropriately expresses uncertainty"""
     
+    # Needs earlier failure reasons (e.g. source_contradiction) to decide on uncertainty
+    reads = frozenset({ANSWER, CTX_DOCS, PRIOR_REASONS})
+    writes = frozenset({ANSWER})
+    
     def __init__(self, require_uncertainty_when_no_context: bool = True):
         """
         Initialize confidence validator
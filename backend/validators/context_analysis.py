@@ -0,0 +1,165 @@
+"""
+Shared lexical analysis of RAG context documents for validators
+
+EvidenceOverlap and CitationRelevance both tokenize every context document on every
+validation. The same foundational documents come back on almost every request, so
+each document is analyzed once and its token / n-gram / keyword sets are kept in a
+process-wide LRU keyed by the document text. Sets are built lazily - a validator only
+pays for the representation it uses.
+"""
+
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTEXT_ANALYSIS_CACHE_SIZE = int(os.getenv("CONTEXT_ANALYSIS_CACHE_SIZE", "512"))
+
+KEYWORD_RE = re.compile(r'\b[a-z0-9]{3,}\b')
+
+# Simple stop words list (can be expanded)
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'from', 'as', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has',
+    'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might', 'must',
+    'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
+    'what', 'which', 'who', 'when', 'where', 'why', 'how', 'all', 'each', 'every', 'some',
+    'any', 'no', 'not', 'only', 'just', 'also', 'more', 'most', 'very', 'too', 'so', 'than',
+    'then', 'now', 'here', 'there', 'when', 'where', 'why', 'how', 'about', 'into', 'over',
+    'after', 'before', 'during', 'through', 'under', 'above', 'below', 'up', 'down', 'out',
+    'off', 'away', 'back', 'again', 'further', 'once', 'twice', 'first', 'second', 'third',
+    'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten',
+    'vietnamese', 'english', 'chinese', 'japanese', 'korean', 'french', 'german', 'spanish'
+})
+
+
+def build_ngrams(tokens: List[str], n: int = 3) -> FrozenSet[Tuple[str, ...]]:
+    """Set of word n-grams of a token list (empty when there are fewer than n tokens)"""
+    if len(tokens) < n:
+        return frozenset()
+    return frozenset(tuple(tokens[i:i+n]) for i in range(len(tokens) - n + 1))
+
+
+def extract_keywords(text: str) -> FrozenSet[str]:
+    """
+    Extract meaningful keywords from text (simple approach)
+
+    Args:
+        text: Input text (should be lowercase)
+
+    Returns:
+        Set of keywords (words with length >= 3, excluding common stop words)
+    """
+    return frozenset(w for w in KEYWORD_RE.findall(text) if w not in STOP_WORDS)
+
+
+class DocAnalysis:
+    """Lazily built lexical representations of one context document (read-only once built)"""
+
+    __slots__ = ("text", "_tokens", "_ngrams", "_keywords", "_lock")
+
+    def __init__(self, text: str):
+        self.text = text
+        self._tokens: Optional[List[str]] = None
+        self._ngrams: Dict[int, FrozenSet[Tuple[str, ...]]] = {}
+        self._keywords: Optional[FrozenSet[str]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> List[str]:
+        """Whitespace tokens (as used by ngram_overlap)"""
+        if self._tokens is None:
+            self._tokens = self.text.split()
+        return self._tokens
+
+    def ngrams(self, n: int = 3) -> FrozenSet[Tuple[str, ...]]:
+        """Word n-gram set"""
+        ngrams = self._ngrams.get(n)
+        if ngrams is None:
+            with self._lock:
+                ngrams = self._ngrams.get(n)
+                if ngrams is None:
+                    ngrams = build_ngrams(self.tokens, n)
+                    self._ngrams[n] = ngrams
+        return ngrams
+
+    @property
+    def keywords(self) -> FrozenSet[str]:
+        """Lowercased keyword set (as used by CitationRelevance)"""
+        if self._keywords is None:
+            self._keywords = extract_keywords(self.text.lower())
+        return self._keywords
+
+
+class ContextAnalysisCache:
+    """LRU of DocAnalysis keyed by document text (str hashes are cached, so lookups are O(1))"""
+
+    def __init__(self, max_entries: int = DEFAULT_CONTEXT_ANALYSIS_CACHE_SIZE):
+        """
+        Args:
+            max_entries: Number of analyzed documents to keep
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, DocAnalysis]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str) -> DocAnalysis:
+        """Get (or create) the analysis of one document"""
+        with self._lock:
+            analysis = self._entries.get(text)
+            if analysis is not None:
+                self._entries.move_to_end(text)
+                self.hits += 1
+                return analysis
+            self.misses += 1
+            analysis = DocAnalysis(text)
+            self._entries[text] = analysis
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return analysis
+
+    def analyze(self, ctx_docs: List[str]) -> List[DocAnalysis]:
+        """Get analyses for a request's context documents, in order"""
+        return [self.get(doc) for doc in ctx_docs]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get hit/miss counters and current size"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0
+            }
+
+
+# Global instance
+_context_analysis_cache: Optional[ContextAnalysisCache] = None
+_context_analysis_cache_lock = threading.Lock()
+
+
+def get_context_analysis_cache() -> ContextAnalysisCache:
+    """Get global context analysis cache"""
+    global _context_analysis_cache
+    if _context_analysis_cache is None:
+        with _context_analysis_cache_lock:
+            if _context_analysis_cache is None:
+                _context_analysis_cache = ContextAnalysisCache()
+    return _context_analysis_cache
+
+
+def analyze_context(ctx_docs: List[str]) -> List[DocAnalysis]:
+    """Analyses of a request's context documents from the shared cache"""
+    return get_context_analysis_cache().analyze(ctx_docs)
@@ -11,7 +11,7 @@ philosophical risk that existing validators miss.
 
 import re
 from typing import List, Optional
-from .base import ValidationResult
+from .base import ValidationResult, ANSWER
 import logging
 
 logger = logging.getLogger(__name__)
@@ -32,6 +32,9 @@ class EgoNeutralityValidator:
     form of linguistic hallucination that undermines transparency.
     """
     
+    reads = frozenset({ANSWER})
+    writes = frozenset({ANSWER})
+    
     def __init__(self, strict_mode: bool = True, auto_patch: bool = False):
         """
         Initialize Ego-Neutrality validator
@@ -224,8 +227,8 @@ class EgoNeutralityValidator:
         # The processor already ensures non-anthropomorphic answers
         if user_question:
             try:
-                from backend.philosophy.processor import is_philosophical_question_about_consciousness
-                is_philosophical = is_philosophical_question_about_consciousness(user_question)
+                from backend.core.query_profile import get_query_profile
+                is_philosophical = get_query_profile(user_question).is_philosophical_consciousness
                 
                 if is_philosophical:
                     # For philosophical questions processed by philosophy_processor, only check for obvious violations
@@ -3,7 +3,7 @@ EthicsAdapter - Wraps existing ethics guard if available
 """
 
 from typing import List, Optional, Callable, Tuple
-from .base import ValidationResult
+from .base import ValidationResult, ANSWER
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,6 +12,10 @@ logger = logging.getLogger(__name__)
 class EthicsAdapter:
     """Adapter to wrap existing ethics guard"""
     
+    # Checks the final answer, so it waits for every patch
+    reads = frozenset({ANSWER})
+    writes = frozenset()
+    
     def __init__(self, guard_callable: Optional[Callable[[str], Tuple[bool, Optional[str]]]] = None):
         """
         Initialize ethics adapter
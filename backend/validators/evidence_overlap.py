@@ -3,7 +3,8 @@ EvidenceOverlap validator - Checks if answer overlaps with RAG context
 """
 
 from typing import List
-from .base import ValidationResult
+from .base import ValidationResult, DRAFT_ANSWER, CTX_DOCS
+from .context_analysis import analyze_context, build_ngrams
 import logging
 import os
 
@@ -22,20 +23,16 @@ def ngram_overlap(text_a: str, text_b: str, n: int = 3) -> float:
     Returns:
         Overlap ratio (0.0 to 1.0)
     """
-    a_tokens = text_a.split()
-    b_tokens = text_b.split()
-    
-    if len(a_tokens) < n or len(b_tokens) < n:
+    return ngram_set_overlap(build_ngrams(text_a.split(), n), build_ngrams(text_b.split(), n))
+
+
+def ngram_set_overlap(a_ngrams, b_ngrams) -> float:
+    """
+    Overlap of precomputed n-gram sets (intersection over a's size, 0.0 if either is empty)
+    """
+    if not a_ngrams or not b_ngrams:
         return 0.0
     
-    # Generate n-grams
-    a_ngrams = set(
-        tuple(a_tokens[i:i+n]) for i in range(len(a_tokens) - n + 1)
-    )
-    b_ngrams = set(
-        tuple(b_tokens[i:i+n]) for i in range(len(b_tokens) - n + 1)
-    )
-    
     # Calculate intersection over union (simplified: intersection over a_size)
     intersection = len(a_ngrams & b_ngrams)
     base = max(1, len(a_ngrams))
@@ -46,6 +43,10 @@ def ngram_overlap(text_a: str, text_b: str, n: int = 3) -> float:
 class EvidenceOverlap:
     """Validator that checks answer overlaps with RAG context"""
     
+    # Overlap is measured on the generated text - citation/uncertainty patches add no evidence
+    reads = frozenset({DRAFT_ANSWER, CTX_DOCS})
+    writes = frozenset()
+    
     def __init__(self, threshold: float = 0.01):
         """
         Initialize evidence overlap validator
@@ -78,8 +79,10 @@ class EvidenceOverlap:
             return ValidationResult(passed=True)
         
         # Calculate overlap with each context doc, take maximum
+        # Answer n-grams are built once; document n-grams come from the shared context analysis cache
+        answer_ngrams = build_ngrams(answer.split())
         overlaps = [
-            ngram_overlap(answer, doc) for doc in ctx_docs
+            ngram_set_overlap(answer_ngrams, doc.ngrams()) for doc in analyze_context(ctx_docs)
         ]
         best_overlap = max(overlaps, default=0.0)
         
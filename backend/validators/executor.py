@@ -0,0 +1,149 @@
+"""
+Process-wide validator worker pool
+
+All ValidatorChain runs share one bounded thread pool. The pool tracks how many tasks
+are queued and running, and refuses new work once running + queued reaches
+max_workers + max_queue - the chain then runs that validator inline on the request
+thread (back-pressure) instead of growing an unbounded backlog.
+"""
+
+import contextvars
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# At least 4 workers: some validators wait on I/O (e.g. SourceConsensusValidator LLM call) and release the GIL
+DEFAULT_VALIDATOR_MAX_WORKERS = int(os.getenv("VALIDATOR_MAX_WORKERS", str(max(4, min(8, os.cpu_count() or 4)))))
+# Tasks allowed to wait for a worker before submissions fall back to inline execution
+DEFAULT_VALIDATOR_MAX_QUEUE = int(os.getenv("VALIDATOR_MAX_QUEUE", str(DEFAULT_VALIDATOR_MAX_WORKERS * 4)))
+
+
+class ValidatorExecutor:
+    """Bounded thread pool with queue-depth accounting and saturation back-pressure"""
+
+    def __init__(self, max_workers: int = DEFAULT_VALIDATOR_MAX_WORKERS,
+                 max_queue: int = DEFAULT_VALIDATOR_MAX_QUEUE):
+        """
+        Args:
+            max_workers: Number of worker threads
+            max_queue: Tasks allowed to wait for a free worker; beyond that try_submit() refuses
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="validator")
+        self._lock = threading.Lock()
+        self._pending = 0  # queued + running
+        self._active = 0  # running
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.peak_queue_depth = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    def _run_task(self, fn: Callable, args: tuple) -> Any:
+        with self._lock:
+            self._active += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+            if not future.cancelled():
+                self.completed += 1
+
+    def try_submit(self, fn: Callable, *args) -> Optional[Future]:
+        """Submit a task unless the pool is saturated
+
+        Returns:
+            Future, or None when running + queued tasks already fill the pool's capacity
+            (caller should run the task inline)
+        """
+        with self._lock:
+            if self._pending >= self.capacity:
+                self.rejected += 1
+                return None
+            self._pending += 1
+            self.submitted += 1
+            queue_depth = self._pending - self._active
+            if queue_depth > self.peak_queue_depth:
+                self.peak_queue_depth = queue_depth
+        try:
+            # Run in a copy of the caller's context so request-scoped state (e.g. the query profile) is visible
+            future = self._executor.submit(contextvars.copy_context().run, self._run_task, fn, args)
+        except RuntimeError as e:
+            # Interpreter shutting down - let the caller run inline
+            logger.warning(f"⚠️ Validator pool unavailable ({e}), running inline")
+            with self._lock:
+                self._pending -= 1
+                self.rejected += 1
+            return None
+        future.add_done_callback(self._on_done)
+        return future
+
+    def record_timeout(self) -> None:
+        """Count a validator that exceeded its timeout (its thread keeps its slot until it returns)"""
+        with self._lock:
+            self.timeouts += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool size, current queue depth and lifetime counters"""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "active": self._active,
+                "queue_depth": self._pending - self._active,
+                "peak_queue_depth": self.peak_queue_depth,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "rejected_inline": self.rejected,
+                "timeouts": self.timeouts
+            }
+
+
+# Global instance
+_validator_executor: Optional[ValidatorExecutor] = None
+_validator_executor_lock = threading.Lock()
+
+
+def get_validator_executor() -> ValidatorExecutor:
+    """Get the process-wide validator pool (created on first use)"""
+    global _validator_executor
+    if _validator_executor is None:
+        with _validator_executor_lock:
+            if _validator_executor is None:
+                _validator_executor = ValidatorExecutor()
+                logger.info(
+                    f"✅ Validator pool started (workers={_validator_executor.max_workers}, "
+                    f"max_queue={_validator_executor.max_queue})"
+                )
+    return _validator_executor
+
+
+def get_validator_pool_stats() -> Dict[str, Any]:
+    """Get validator pool stats without starting the pool"""
+    if _validator_executor is None:
+        return {
+            "max_workers": DEFAULT_VALIDATOR_MAX_WORKERS,
+            "max_queue": DEFAULT_VALIDATOR_MAX_QUEUE,
+            "active": 0,
+            "queue_depth": 0,
+            "peak_queue_depth": 0,
+            "submitted": 0,
+            "completed": 0,
+            "rejected_inline": 0,
+            "timeouts": 0
+        }
+    return _validator_executor.get_stats()
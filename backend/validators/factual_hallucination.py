@@ -9,7 +9,7 @@ Detects hallucinations in history/science questions:
 import re
 import logging
 from typing import List, Optional
-from .base import Validator, ValidationResult
+from .base import Validator, ValidationResult, ANSWER, CTX_DOCS
 from backend.knowledge.factual_scanner import get_fps, FPSResult
 
 logger = logging.getLogger(__name__)
@@ -33,6 +33,9 @@ class FactualHallucinationValidator(Validator):
     - Detailed descriptions of non-existent concepts (even with disclaimers)
     """
     
+    reads = frozenset({ANSWER, CTX_DOCS})
+    writes = frozenset({ANSWER})
+    
     def __init__(self, hard_mode: bool = True):
         """
         Initialize validator
@@ -487,8 +490,8 @@ class FactualHallucinationValidator(Validator):
             detected_lang = "vi"
             if user_question:
                 try:
-                    from backend.api.utils.chat_helpers import detect_language
-                    detected_lang = detect_language(user_question)
+                    from backend.core.query_profile import get_query_profile
+                    detected_lang = get_query_profile(user_question).language
                 except Exception:
                     pass
             
@@ -655,8 +658,8 @@ class FactualHallucinationValidator(Validator):
             detected_lang = "vi"
             if user_question:
                 try:
-                    from backend.api.utils.chat_helpers import detect_language
-                    detected_lang = detect_language(user_question)
+                    from backend.core.query_profile import get_query_profile
+                    detected_lang = get_query_profile(user_question).language
                 except Exception:
                     pass
             # Return emergency fallback
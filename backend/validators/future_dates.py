@@ -6,7 +6,7 @@ import re
 import logging
 from datetime import datetime
 from typing import Optional, List, Any, Dict
-from .base import Validator, ValidationResult
+from .base import Validator, ValidationResult, ANSWER
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +18,9 @@ class FutureDatesValidator(Validator):
     This prevents StillMe from hallucinating dates in the future (e.g., "2026", "2025-12-23" when current date is 2025-12-22).
     """
     
+    reads = frozenset({ANSWER})
+    writes = frozenset()
+    
     def __init__(self):
         super().__init__()
         self.name = "FutureDatesValidator"
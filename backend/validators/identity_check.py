@@ -11,7 +11,7 @@ This validator checks that responses:
 
 import re
 from typing import List, Optional
-from .base import ValidationResult
+from .base import ValidationResult, ANSWER, CTX_DOCS
 import logging
 
 logger = logging.getLogger(__name__)
@@ -108,6 +108,9 @@ class IdentityCheckValidator:
     5. Consistency with Identity Layer principles
     """
     
+    reads = frozenset({ANSWER, CTX_DOCS})
+    writes = frozenset({ANSWER})
+    
     def __init__(
         self,
         strict_mode: bool = True,
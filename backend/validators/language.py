@@ -5,7 +5,7 @@ Prevents "language drift" where AI responds in wrong language
 
 import logging
 from typing import List, Optional
-from .base import ValidationResult
+from .base import ValidationResult, ANSWER
 from backend.api.utils.chat_helpers import detect_language
 
 logger = logging.getLogger(__name__)
@@ -14,6 +14,9 @@ logger = logging.getLogger(__name__)
 class LanguageValidator:
     """Validator that ensures output language matches input language"""
     
+    reads = frozenset({ANSWER})
+    writes = frozenset({ANSWER})
+    
     def __init__(self, input_language: str):
         """
         Initialize language validator
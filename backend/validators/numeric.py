@@ -4,7 +4,7 @@ NumericUnitsBasic validator - Detects numbers and suggests citations
 
 import re
 from typing import List
-from .base import ValidationResult
+from .base import ValidationResult, DRAFT_ANSWER
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,6 +16,10 @@ NUM_RE = re.compile(r"\b\d+[.,]?\d*\b")
 class NumericUnitsBasic:
     """Validator that detects numbers in answers"""
     
+    # Numbers come from the generated text - later patches don't add any
+    reads = frozenset({DRAFT_ANSWER})
+    writes = frozenset()
+    
     def __init__(self, warn_only: bool = True):
         """
         Initialize numeric validator
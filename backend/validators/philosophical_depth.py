@@ -6,7 +6,7 @@ Validates that philosophical self-reference questions contain required keywords
 import re
 import logging
 from typing import List, Optional, Dict, Any
-from .base import Validator, ValidationResult
+from .base import Validator, ValidationResult, ANSWER
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +55,9 @@ class PhilosophicalDepthValidator(Validator):
     and acknowledge the paradox (not give optimistic answers).
     """
     
+    reads = frozenset({ANSWER})
+    writes = frozenset({ANSWER})
+    
     def __init__(self, min_keywords: int = 2, strict_mode: bool = True):
         """
         Args:
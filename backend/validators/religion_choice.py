@@ -8,7 +8,7 @@ This validator detects if StillMe's response contains religion choice and blocks
 import re
 import logging
 from typing import List, Optional
-from .base import Validator, ValidationResult
+from .base import Validator, ValidationResult, ANSWER
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +59,9 @@ class ReligiousChoiceValidator(Validator):
     CRITICAL: StillMe MUST NEVER choose any religion, even in hypothetical scenarios.
     """
     
+    reads = frozenset({ANSWER})
+    writes = frozenset()
+    
     def run(
         self,
         answer: str,
@@ -3,7 +3,7 @@ SchemaFormat validator - Checks if answer matches required format/sections
 """
 
 from typing import List, Optional
-from .base import ValidationResult
+from .base import ValidationResult, ANSWER
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,6 +12,9 @@ logger = logging.getLogger(__name__)
 class SchemaFormat:
     """Validator that checks answer format/sections"""
     
+    reads = frozenset({ANSWER})
+    writes = frozenset()
+    
     def __init__(self, require_sections: Optional[List[str]] = None):
         """
         Initialize schema format validator
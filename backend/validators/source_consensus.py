@@ -14,7 +14,7 @@ MVP Implementation:
 
 import logging
 from typing import List, Optional, Dict, Any
-from .base import ValidationResult
+from .base import ValidationResult, ANSWER, CTX_DOCS
 import os
 import time
 import httpx
@@ -37,6 +37,9 @@ class SourceConsensusValidator:
     - Forces uncertainty expression when contradictions found
     """
     
+    reads = frozenset({ANSWER, CTX_DOCS})
+    writes = frozenset()
+    
     def __init__(self, enabled: bool = True, timeout: float = 3.0, circuit_breaker_threshold: int = 2, circuit_breaker_disable_duration: int = 3600):
         """
         Initialize source consensus validator
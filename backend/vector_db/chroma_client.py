@@ -7,9 +7,14 @@ import chromadb
 from chromadb.config import Settings
 from typing import List, Dict, Any, Optional
 import logging
+import os
+from backend.services.token_counter import get_token_counter
 
 logger = logging.getLogger(__name__)
 
+# Max documents per collection.add() call for bulk ingestion
+DEFAULT_INSERT_BATCH_SIZE = int(os.getenv("CHROMA_INSERT_BATCH_SIZE", "256"))
+
 # Import backup manager (avoid circular import)
 try:
     from .chroma_backup import ChromaBackupManager
@@ -566,10 +571,57 @@ class ChromaClient:
                 metadata={"description": description}
             )
     
+    def _bulk_add(self,
+                  collection,
+                  documents: List[str],
+                  metadatas: List[Dict[str, Any]],
+                  ids: List[str],
+                  batch_size: Optional[int] = None,
+                  embeddings: Optional[List[List[float]]] = None) -> None:
+        """Embed documents in one batched encode and insert them in chunks
+        
+        Args:
+            collection: Target ChromaDB collection
+            documents: List of text documents
+            metadatas: List of metadata for each document
+            ids: List of unique IDs for each document
+            batch_size: Embedding batch size (defaults to EMBEDDING_BATCH_SIZE)
+            embeddings: Optional precomputed embeddings (skips encoding)
+        """
+        # Store each document's token count so context packing never re-counts it
+        token_counter = get_token_counter()
+        metadatas = [token_counter.annotate_metadata(doc, meta) for doc, meta in zip(documents, metadatas)]
+        
+        if embeddings is None and self.embedding_service:
+            # One model.encode() call for the whole batch instead of one per document
+            embeddings = self.embedding_service.batch_encode(documents, batch_size=batch_size)
+        elif embeddings is None:
+            # Fallback: Let ChromaDB generate embeddings (will use default ONNX model)
+            logger.warning("⚠️ EmbeddingService not provided - ChromaDB will use default ONNX model (all-MiniLM-L6-v2)")
+        
+        insert_batch_size = max(1, DEFAULT_INSERT_BATCH_SIZE)
+        for start in range(0, len(documents), insert_batch_size):
+            end = start + insert_batch_size
+            if embeddings is not None:
+                collection.add(
+                    embeddings=embeddings[start:end],
+                    documents=documents[start:end],
+                    metadatas=metadatas[start:end],
+                    ids=ids[start:end]
+                )
+            else:
+                collection.add(
+                    documents=documents[start:end],
+                    metadatas=metadatas[start:end],
+                    ids=ids[start:end]
+                )
+    
     def add_knowledge(self, 
                      documents: List[str], 
                      metadatas: List[Dict[str, Any]], 
-                     ids: List[str]) -> bool:
+                     ids: List[str],
+                     batch_size: Optional[int] = None,
+                     embeddings: Optional[List[List[float]]] = None) -> bool:
         """Add knowledge documents to vector database
         
         This method:
@@ -580,10 +632,15 @@ class ChromaClient:
         CRITICAL: If embedding_service is provided, we generate embeddings ourselves to avoid ChromaDB
         using default ONNX model (all-MiniLM-L6-v2). This ensures we use paraphrase-multilingual-MiniLM-L12-v2.
         
+        Bulk writes are encoded with a single batched model call (no per-text query cache) and
+        inserted in chunks of CHROMA_INSERT_BATCH_SIZE.
+        
         Args:
             documents: List of text documents
             metadatas: List of metadata for each document
             ids: List of unique IDs for each document
+            batch_size: Optional embedding batch size (defaults to EMBEDDING_BATCH_SIZE)
+            embeddings: Optional precomputed embeddings for documents (e.g. from a duplicate check)
             
         Returns:
             bool: Success status
@@ -594,26 +651,9 @@ class ChromaClient:
             
             # CRITICAL: Generate embeddings using EmbeddingService if available
             # This prevents ChromaDB from using default ONNX model (all-MiniLM-L6-v2)
-            if self.embedding_service:
-                logger.debug(f"🔧 Generating embeddings using EmbeddingService (paraphrase-multilingual-MiniLM-L12-v2) for {len(documents)} document(s)...")
-                embeddings = [self.embedding_service.encode_text(doc) for doc in documents]
-                
-                self.knowledge_collection.add(
-                    embeddings=embeddings,
-                    documents=documents,
-                    metadatas=metadatas,
-                    ids=ids
-                )
-            else:
-                # Fallback: Let ChromaDB generate embeddings (will use default ONNX model)
-                logger.warning("⚠️ EmbeddingService not provided - ChromaDB will use default ONNX model (all-MiniLM-L6-v2)")
-                logger.debug(f"🔧 ChromaDB: Generating embeddings for {len(documents)} document(s)...")
-                
-                self.knowledge_collection.add(
-                    documents=documents,
-                    metadatas=metadatas,
-                    ids=ids
-                )
+            logger.debug(f"🔧 Generating embeddings for {len(documents)} document(s)...")
+            self._bulk_add(self.knowledge_collection, documents, metadatas, ids,
+                           batch_size=batch_size, embeddings=embeddings)
             
             elapsed = time.time() - start_time
             logger.debug(
@@ -628,7 +668,8 @@ class ChromaClient:
     def add_conversation(self, 
                         documents: List[str], 
                         metadatas: List[Dict[str, Any]], 
-                        ids: List[str]) -> bool:
+                        ids: List[str],
+                        batch_size: Optional[int] = None) -> bool:
         """Add conversation context to vector database
         
         CRITICAL: If embedding_service is provided, we generate embeddings ourselves to avoid ChromaDB
@@ -638,6 +679,7 @@ class ChromaClient:
             documents: List of conversation texts
             metadatas: List of metadata for each conversation
             ids: List of unique IDs for each conversation
+            batch_size: Optional embedding batch size (defaults to EMBEDDING_BATCH_SIZE)
             
         Returns:
             bool: Success status
@@ -651,25 +693,7 @@ class ChromaClient:
             
             # CRITICAL: Generate embeddings using EmbeddingService if available
             # This prevents ChromaDB from using default ONNX model (all-MiniLM-L6-v2)
-            if self.embedding_service:
-                logger.debug(f"🔧 Generating embeddings using EmbeddingService (paraphrase-multilingual-MiniLM-L12-v2) for {len(documents)} conversation(s)...")
-                embeddings = [self.embedding_service.encode_text(doc) for doc in documents]
-                
-                self.conversation_collection.add(
-                    embeddings=embeddings,
-                    documents=documents,
-                    metadatas=cleaned_metadatas,
-                    ids=ids
-                )
-            else:
-                # Fallback: Let ChromaDB generate embeddings (will use default ONNX model)
-                logger.warning("⚠️ EmbeddingService not provided - ChromaDB will use default ONNX model (all-MiniLM-L6-v2)")
-                
-                self.conversation_collection.add(
-                    documents=documents,
-                    metadatas=cleaned_metadatas,
-                    ids=ids
-                )
+            self._bulk_add(self.conversation_collection, documents, cleaned_metadatas, ids, batch_size=batch_size)
             logger.info(f"Added {len(documents)} conversation documents")
             return True
         except Exception as e:
@@ -679,13 +703,16 @@ class ChromaClient:
     def search_knowledge(self, 
                         query_embedding: List[float], 
                         limit: int = 5,
-                        where: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+                        where: Optional[Dict[str, Any]] = None,
+                        include_embeddings: bool = False) -> List[Dict[str, Any]]:
         """Search knowledge base using embedding
         
         Args:
             query_embedding: Query embedding vector
             limit: Number of results to return
             where: Optional metadata filter
+            include_embeddings: If True, attach each hit's stored embedding under "embedding"
+                (used by embedding-based MMR so diversity doesn't need re-encoding)
             
         Returns:
             List of search results
@@ -696,12 +723,23 @@ class ChromaClient:
             return []
         
         try:
+            query_kwargs = {}
+            if include_embeddings:
+                query_kwargs["include"] = ["documents", "metadatas", "distances", "embeddings"]
             results = self.knowledge_collection.query(
                 query_embeddings=[query_embedding],
                 n_results=limit,
-                where=where
+                where=where,
+                **query_kwargs
             )
             
+            # NOTE: ChromaDB may return embeddings as numpy arrays - never truth-test them directly
+            result_embeddings = results.get("embeddings") if include_embeddings else None
+            if result_embeddings is not None and len(result_embeddings) > 0:
+                result_embeddings = result_embeddings[0]
+            else:
+                result_embeddings = None
+            
             # Convert to list of dictionaries
             search_results = []
             if results["documents"] and results["documents"][0]:
@@ -717,12 +755,67 @@ class ChromaClient:
                         "distance": results["distances"][0][i] if results["distances"] and results["distances"][0] and i < len(results["distances"][0]) else 0.0,
                         "id": results["ids"][0][i] if results["ids"] and results["ids"][0] and i < len(results["ids"][0]) else f"doc_{i}"
                     })
+                    if result_embeddings is not None and i < len(result_embeddings):
+                        # Plain list keeps result dicts comparable/serializable like the other fields
+                        embedding = result_embeddings[i]
+                        search_results[-1]["embedding"] = embedding.tolist() if hasattr(embedding, 'tolist') else list(embedding)
             
             return search_results
         except Exception as e:
             logger.error(f"Failed to search knowledge: {e}")
             return []
     
+    def search_knowledge_batch(self,
+                               query_embeddings: List[List[float]],
+                               limit: int = 1,
+                               where: Optional[Dict[str, Any]] = None) -> List[List[Dict[str, Any]]]:
+        """Search knowledge base for many embeddings in a single query call
+        
+        Args:
+            query_embeddings: Query embedding vectors
+            limit: Number of results per query
+            where: Optional metadata filter
+            
+        Returns:
+            One list of search results (content, metadata, distance, id) per query embedding
+        """
+        if not query_embeddings:
+            return []
+        if limit <= 0:
+            logger.warning(f"Invalid knowledge search limit: {limit}. Must be > 0. Returning empty results.")
+            return [[] for _ in query_embeddings]
+        
+        try:
+            results = self.knowledge_collection.query(
+                query_embeddings=query_embeddings,
+                n_results=limit,
+                where=where
+            )
+            
+            batch_results = []
+            for q in range(len(query_embeddings)):
+                documents = results["documents"][q] if results["documents"] and q < len(results["documents"]) else []
+                metadatas = results["metadatas"][q] if results["metadatas"] and q < len(results["metadatas"]) else []
+                distances = results["distances"][q] if results["distances"] and q < len(results["distances"]) else []
+                ids = results["ids"][q] if results["ids"] and q < len(results["ids"]) else []
+                
+                search_results = []
+                for i, doc in enumerate(documents or []):
+                    raw_metadata = metadatas[i] if metadatas and i < len(metadatas) else {}
+                    clean_metadata = {k: v for k, v in raw_metadata.items() if v is not None} if isinstance(raw_metadata, dict) else {}
+                    search_results.append({
+                        "content": doc,
+                        "metadata": clean_metadata,
+                        "distance": distances[i] if distances and i < len(distances) else 0.0,
+                        "id": ids[i] if ids and i < len(ids) else f"doc_{i}"
+                    })
+                batch_results.append(search_results)
+            
+            return batch_results
+        except Exception as e:
+            logger.error(f"Failed to batch search knowledge: {e}")
+            return [[] for _ in query_embeddings]
+    
     def search_conversations(self, 
                            query_embedding: List[float], 
                            limit: int = 3,
@@ -799,6 +892,39 @@ class ChromaClient:
             logger.debug(f"Duplicate check by link failed (non-critical): {e}")
             return False
     
+    def find_existing_links(self, links: List[str], chunk_size: int = 100) -> set:
+        """Return the subset of links that already exist in the knowledge collection
+        
+        Batched version of check_duplicate_by_link(): one metadata query ($in filter)
+        per chunk of links instead of one query per link.
+        
+        Args:
+            links: URL links to check
+            chunk_size: Max links per metadata query
+            
+        Returns:
+            Set of links that already have documents in the knowledge collection
+        """
+        unique_links = list(dict.fromkeys(link for link in links if link))
+        existing = set()
+        
+        for start in range(0, len(unique_links), chunk_size):
+            chunk = unique_links[start:start + chunk_size]
+            try:
+                results = self.knowledge_collection.get(
+                    where={"link": {"$in": chunk}},
+                    include=["metadatas"]
+                )
+                for metadata in results.get("metadatas") or []:
+                    if isinstance(metadata, dict) and metadata.get("link"):
+                        existing.add(metadata["link"])
+            except Exception as e:
+                # $in filter not supported - fall back to per-link checks for this chunk
+                logger.debug(f"Batched duplicate check by link failed, checking individually: {e}")
+                existing.update(link for link in chunk if self.check_duplicate_by_link(link))
+        
+        return existing
+    
     def get_collection_stats(self) -> Dict[str, int]:
         """Get statistics about collections
         
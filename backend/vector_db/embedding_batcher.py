@@ -0,0 +1,181 @@
+"""
+Micro-batching layer for query embeddings
+
+Concurrent chat requests each need one query embedding. Encoding them one by one runs
+many batch-of-1 forward passes that contend for CPU; this batcher coalesces queries that
+arrive within a few milliseconds into a single EmbeddingService.batch_encode() call and
+fans the vectors back out to the waiting callers.
+
+Results are written into the EmbeddingService in-memory cache, so a later synchronous
+encode_text() for the same query (e.g. inside RAGRetrieval.retrieve_context) is a cache hit.
+"""
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Max time the worker waits for more queries after the first one arrives
+DEFAULT_MICROBATCH_MAX_WAIT_MS = float(os.getenv("EMBEDDING_MICROBATCH_MAX_WAIT_MS", "5"))
+# Max queries encoded in one forward pass
+DEFAULT_MICROBATCH_MAX_SIZE = int(os.getenv("EMBEDDING_MICROBATCH_MAX_SIZE", "32"))
+ENABLE_EMBEDDING_MICROBATCH = os.getenv("ENABLE_EMBEDDING_MICROBATCH", "true").lower() == "true"
+
+
+class EmbeddingMicroBatcher:
+    """Coalesces concurrent single-query encodes into batched forward passes"""
+
+    def __init__(
+        self,
+        embedding_service,
+        max_wait_ms: float = DEFAULT_MICROBATCH_MAX_WAIT_MS,
+        max_batch_size: int = DEFAULT_MICROBATCH_MAX_SIZE
+    ):
+        """
+        Args:
+            embedding_service: EmbeddingService instance (must provide batch_encode)
+            max_wait_ms: How long to keep collecting queries after the first one arrives
+            max_batch_size: Maximum number of queries per batched encode
+        """
+        self.embedding_service = embedding_service
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.queries = 0
+        self.max_observed_batch = 0
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name="embedding-microbatcher",
+                    daemon=True
+                )
+                self._worker.start()
+
+    def _collect_batch(self) -> List[Tuple[str, Future]]:
+        """Block for the first query, then gather more until max_wait or max_batch_size"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    # Still drain anything already queued - it costs no extra latency
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect_batch()
+            self._encode_batch(batch)
+
+    def _encode_batch(self, batch: List[Tuple[str, Future]]) -> None:
+        # Identical queries in one window share a single slot in the forward pass
+        unique_texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            embeddings = self.embedding_service.batch_encode(
+                unique_texts,
+                batch_size=self.max_batch_size
+            )
+        except Exception as e:
+            logger.error(f"❌ Micro-batch embedding failed for {len(unique_texts)} queries: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_text = dict(zip(unique_texts, embeddings))
+        for text, embedding in by_text.items():
+            try:
+                self.embedding_service.cache_embedding(text, embedding)
+            except Exception as cache_error:
+                logger.debug(f"Could not cache micro-batched embedding: {cache_error}")
+
+        for text, future in batch:
+            if not future.done():
+                future.set_result(list(by_text[text]))
+
+        with self._stats_lock:
+            self.batches += 1
+            self.queries += len(batch)
+            self.max_observed_batch = max(self.max_observed_batch, len(batch))
+        if len(batch) > 1:
+            logger.debug(f"🧮 Micro-batched {len(batch)} queries ({len(unique_texts)} unique) into one encode")
+
+    def submit(self, text: str) -> Future:
+        """Queue a query for encoding and return a Future resolving to its embedding"""
+        future: Future = Future()
+        cached = self.embedding_service.get_cached_embedding(text)
+        if cached is not None:
+            future.set_result(cached)
+            return future
+        self._ensure_worker()
+        self._queue.put((text, future))
+        return future
+
+    def encode(self, text: str, timeout: Optional[float] = None) -> List[float]:
+        """Encode a single query, blocking until its batch has been processed"""
+        return self.submit(text).result(timeout=timeout)
+
+    async def encode_async(self, text: str) -> List[float]:
+        """Encode a single query without blocking the event loop"""
+        return await asyncio.wrap_future(self.submit(text))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batch counters (batches run, queries served, average and max batch size)"""
+        with self._stats_lock:
+            return {
+                "batches": self.batches,
+                "queries": self.queries,
+                "avg_batch_size": self.queries / self.batches if self.batches else 0.0,
+                "max_batch_size_observed": self.max_observed_batch,
+                "queue_depth": self._queue.qsize(),
+                "max_wait_ms": self.max_wait * 1000.0,
+                "max_batch_size": self.max_batch_size
+            }
+
+
+# Global micro-batcher instance (singleton)
+_embedding_batcher: Optional[EmbeddingMicroBatcher] = None
+_embedding_batcher_lock = threading.Lock()
+
+
+def get_embedding_batcher(embedding_service=None) -> Optional[EmbeddingMicroBatcher]:
+    """Get global micro-batcher wrapping the global embedding service.
+
+    Returns None when micro-batching is disabled (ENABLE_EMBEDDING_MICROBATCH=false).
+    """
+    global _embedding_batcher
+    if not ENABLE_EMBEDDING_MICROBATCH:
+        return None
+    if _embedding_batcher is None:
+        with _embedding_batcher_lock:
+            if _embedding_batcher is None:
+                if embedding_service is None:
+                    from backend.vector_db.embeddings import get_embedding_service
+                    embedding_service = get_embedding_service()
+                _embedding_batcher = EmbeddingMicroBatcher(embedding_service)
+                logger.info(
+                    f"✅ Embedding micro-batcher initialized "
+                    f"(max_wait={_embedding_batcher.max_wait * 1000.0:.1f}ms, "
+                    f"max_batch={_embedding_batcher.max_batch_size})"
+                )
+    return _embedding_batcher
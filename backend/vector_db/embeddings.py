@@ -63,9 +63,14 @@ except Exception as e:
 
 # NOW import SentenceTransformer (after env vars are set)
 from sentence_transformers import SentenceTransformer
-from typing import List, Union, Dict, Optional
+from collections import OrderedDict
+from typing import List, Union, Dict, Optional, Any
 import logging
 import hashlib
+import threading
+import asyncio
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +82,83 @@ except ImportError:
     REDIS_CACHE_AVAILABLE = False
     get_cache_service = None
 
+# Batch size for bulk encoding (learning cycles, knowledge loaders, indexers)
+DEFAULT_EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+
+# Memory budget for the in-process query embedding cache
+# Default ~1.2 MB: what the old 100-entry list-of-floats cache used, ~800 float32 384-dim vectors
+DEFAULT_EMBEDDING_CACHE_MAX_BYTES = int(os.getenv("EMBEDDING_CACHE_MAX_BYTES", str(1200 * 1024)))
+
+
+class EmbeddingLRUCache:
+    """Thread-safe LRU cache of query embeddings stored as float32 arrays, bounded by bytes"""
+    
+    def __init__(self, max_bytes: int = DEFAULT_EMBEDDING_CACHE_MAX_BYTES):
+        """
+        Args:
+            max_bytes: Memory budget for cached vectors (array payload bytes)
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: str) -> Optional[List[float]]:
+        """Return cached embedding as a fresh list (callers may mutate it), or None"""
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return vector.tolist()
+    
+    def put(self, key: str, embedding: Union[List[float], np.ndarray]) -> None:
+        """Store embedding as float32, evicting least recently used entries over budget"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = vector
+            self._bytes += vector.nbytes
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self.evictions += 1
+    
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction counters and current size"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0
+            }
+
 class EmbeddingService:
     """Service for generating text embeddings"""
     
@@ -88,9 +170,8 @@ class EmbeddingService:
         """
         self.model_name = model_name
         # OPTIMIZATION: Embedding cache for similar queries (reduces redundant encoding)
-        # Cache key: hash of normalized query text, value: embedding vector
-        self._embedding_cache: Dict[str, List[float]] = {}
-        self._cache_max_size = 100  # Limit cache size to prevent memory issues
+        # Cache key: hash of normalized query text, value: float32 embedding vector (LRU, byte budget)
+        self._embedding_cache = EmbeddingLRUCache()
         
         # CRITICAL: Use global ModelManager for cache verification
         # ModelManager was already initialized at module level to setup environment
@@ -187,6 +268,13 @@ class EmbeddingService:
             )
             logger.info(f"Embedding model '{model_name}' loaded successfully")
             
+            # Token budgets count with this model's tokenizer unless tiktoken is installed
+            try:
+                from backend.services.token_counter import register_model_tokenizer
+                register_model_tokenizer(getattr(self.model, "tokenizer", None), model_name)
+            except Exception as tokenizer_error:
+                logger.debug(f"Could not register embedding tokenizer for token counting: {tokenizer_error}")
+            
             # CRITICAL: Check where model was actually loaded from
             # SentenceTransformer stores model path in model._modules['0'].auto_model.config._name_or_path
             # But more importantly, check the actual cache location
@@ -439,15 +527,16 @@ class EmbeddingService:
                         logger.debug(f"✅ Redis cache hit for embedding: {text[:50]}...")
                         # Also update in-memory cache
                         cache_key = self._get_cache_key(text)
-                        self._embedding_cache[cache_key] = cached_embedding
+                        self._embedding_cache.put(cache_key, cached_embedding)
                         return cached_embedding.copy() if isinstance(cached_embedding, list) else cached_embedding
             
             # OPTIMIZATION: Check in-memory cache for single text queries
             if isinstance(text, str):
                 cache_key = self._get_cache_key(text)
-                if cache_key in self._embedding_cache:
+                cached_embedding = self._embedding_cache.get(cache_key)
+                if cached_embedding is not None:
                     logger.debug(f"✅ In-memory cache hit for query: {text[:50]}...")
-                    return self._embedding_cache[cache_key].copy()  # Return copy to prevent mutation
+                    return cached_embedding  # Fresh list per hit - safe to mutate
             
             # Generate embeddings
             embeddings = self.model.encode(text, convert_to_tensor=False, show_progress_bar=False)
@@ -457,13 +546,8 @@ class EmbeddingService:
                 embedding_list = embeddings.tolist() if hasattr(embeddings, 'tolist') else list(embeddings)
                 cache_key = self._get_cache_key(text)
                 
-                # Update in-memory cache
-                # Limit cache size (LRU eviction)
-                if len(self._embedding_cache) >= self._cache_max_size:
-                    # Remove oldest entry (simple FIFO, could use LRU but this is simpler)
-                    oldest_key = next(iter(self._embedding_cache))
-                    del self._embedding_cache[oldest_key]
-                self._embedding_cache[cache_key] = embedding_list
+                # Update in-memory cache (LRU eviction by byte budget)
+                self._embedding_cache.put(cache_key, embeddings)
                 
                 # Update Redis cache (if available)
                 if REDIS_CACHE_AVAILABLE:
@@ -605,6 +689,30 @@ class EmbeddingService:
             logger.error(f"Failed to encode text: {e}")
             raise
     
+    async def aencode_text(self, text: Union[str, List[str]]) -> Union[List[float], List[List[float]]]:
+        """Async version of encode_text() for request handlers
+        
+        An in-memory cache hit is returned directly; otherwise the Redis lookup and
+        model call run on a worker thread so they never block the event loop.
+        """
+        if isinstance(text, str):
+            cached_embedding = self._embedding_cache.get(self._get_cache_key(text))
+            if cached_embedding is not None:
+                return cached_embedding
+        return await asyncio.to_thread(self.encode_text, text)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get in-memory embedding cache statistics (hits, misses, evictions, size)"""
+        return self._embedding_cache.get_stats()
+
+    def get_cached_embedding(self, text: str) -> Optional[List[float]]:
+        """Look up a single query embedding in the in-memory cache without encoding"""
+        return self._embedding_cache.get(self._get_cache_key(text))
+
+    def cache_embedding(self, text: str, embedding: Union[List[float], np.ndarray]) -> None:
+        """Store a query embedding computed elsewhere (e.g. by the micro-batcher) in the in-memory cache"""
+        self._embedding_cache.put(self._get_cache_key(text), embedding)
+    
     def get_embedding_dimension(self) -> int:
         """Get the dimension of embeddings
         
@@ -619,26 +727,34 @@ class EmbeddingService:
             logger.error(f"Failed to get embedding dimension: {e}")
             return 384  # Default for multi-qa-MiniLM-L6-dot-v1 (384 dimensions)
     
-    def batch_encode(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+    def batch_encode(self, texts: List[str], batch_size: Optional[int] = None) -> List[List[float]]:
         """Encode texts in batches for efficiency
         
+        Bulk path for ingestion: the whole list goes through a single model.encode() call
+        (sentence-transformers splits it into batches of batch_size internally) and bypasses
+        the per-text in-memory/Redis query cache, which only helps repeated chat queries.
+        
         Args:
             texts: List of text strings to encode
-            batch_size: Batch size for processing
+            batch_size: Batch size for processing (defaults to EMBEDDING_BATCH_SIZE env var, 32)
             
         Returns:
             List of embedding vectors
         """
+        if not texts:
+            return []
+        
+        batch_size = batch_size or DEFAULT_EMBEDDING_BATCH_SIZE
         try:
-            all_embeddings = []
-            
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i:i + batch_size]
-                batch_embeddings = self.encode_text(batch)
-                all_embeddings.extend(batch_embeddings)
+            embeddings = self.model.encode(
+                texts,
+                batch_size=batch_size,
+                convert_to_tensor=False,
+                show_progress_bar=False
+            )
             
             logger.info(f"Encoded {len(texts)} texts in batches of {batch_size}")
-            return all_embeddings
+            return embeddings.tolist() if hasattr(embeddings, 'tolist') else [list(e) for e in embeddings]
             
         except Exception as e:
             logger.error(f"Failed to batch encode texts: {e}")
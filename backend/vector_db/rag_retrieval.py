@@ -6,6 +6,9 @@ Combines vector search with knowledge retrieval
 from typing import List, Dict, Any, Optional
 from .chroma_client import ChromaClient
 from .embeddings import EmbeddingService
+from .retrieval_planner import RetrievalPlanner, DEFAULT_PLANNER_POOL_SIZE
+from backend.services.token_counter import get_token_counter
+from backend.core.query_profile import get_query_profile
 # Try to import Redis cache service (new), fallback to old cache_service if not available
 try:
     from backend.services.redis_cache import get_cache_service as get_redis_cache_service
@@ -37,12 +40,104 @@ def get_cache_service():
     if OLD_CACHE_AVAILABLE:
         return get_old_cache_service()
     return None
+import asyncio
 import logging
 import os
 from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+
+def _lexical_similarity_matrix(documents: List[Dict[str, Any]]) -> np.ndarray:
+    """Pairwise word-overlap (Jaccard) similarity over the first 50 words of each document.
+    
+    Fallback for candidates without stored embeddings (e.g. tier-based retrieval).
+    Word sets are built once per document instead of once per comparison.
+    """
+    word_sets = [set(doc.get("content", "").lower().split()[:50]) for doc in documents]
+    n = len(documents)
+    sim = np.zeros((n, n), dtype=np.float32)
+    for i in range(n):
+        if not word_sets[i]:
+            continue
+        for j in range(i + 1, n):
+            if word_sets[j]:
+                overlap = len(word_sets[i] & word_sets[j]) / len(word_sets[i] | word_sets[j])
+                sim[i, j] = sim[j, i] = overlap
+    return sim
+
+
+def _embedding_similarity_matrix(documents: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+    """Pairwise cosine similarity from the documents' stored embeddings.
+    
+    Returns None if any document has no embedding or dimensions don't match.
+    """
+    embeddings = [doc.get("embedding") for doc in documents]
+    if any(emb is None for emb in embeddings):
+        return None
+    try:
+        matrix = np.asarray(embeddings, dtype=np.float32)
+    except ValueError:
+        return None
+    if matrix.ndim != 2:
+        return None
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix = matrix / norms
+    return matrix @ matrix.T
+
+
+def mmr_select(documents: List[Dict[str, Any]], limit: int, lambda_param: float) -> List[Dict[str, Any]]:
+    """Select documents with Max Marginal Relevance for diversity
+    
+    Relevance is each document's "similarity" to the query. Diversity uses real cosine
+    similarity between stored embeddings (see ChromaClient.search_knowledge(include_embeddings=True)),
+    falling back to the word-overlap heuristic when embeddings are missing. The pairwise
+    similarity matrix is computed once, so selection is O(limit * n) instead of
+    re-comparing document contents on every iteration.
+    
+    Args:
+        documents: Candidate documents with 'similarity' (and optionally 'embedding') fields
+        limit: Number of documents to return
+        lambda_param: MMR lambda (0.0-1.0). Higher = more relevance, lower = more diversity
+    
+    Returns:
+        List of diverse documents (in selection order)
+    """
+    if len(documents) <= limit:
+        return documents
+    
+    # Highest similarity first (stable, so ties keep retrieval order)
+    ranked = sorted(documents, key=lambda x: x.get("similarity", 0.0), reverse=True)
+    
+    pairwise = _embedding_similarity_matrix(ranked)
+    if pairwise is None:
+        logger.debug("MMR: stored embeddings unavailable, using word-overlap similarity")
+        pairwise = _lexical_similarity_matrix(ranked)
+    
+    relevance = np.array([doc.get("similarity", 0.0) for doc in ranked], dtype=np.float32)
+    
+    # Select first document (highest similarity), then track each candidate's
+    # max similarity to the selected set incrementally
+    selected_idx = [0]
+    max_sim_to_selected = pairwise[0].copy()
+    available = np.ones(len(ranked), dtype=bool)
+    available[0] = False
+    
+    while len(selected_idx) < limit and available.any():
+        # MMR score: λ * relevance - (1-λ) * max_similarity_to_selected
+        scores = lambda_param * relevance - (1.0 - lambda_param) * max_sim_to_selected
+        scores[~available] = -np.inf
+        best_idx = int(np.argmax(scores))
+        selected_idx.append(best_idx)
+        available[best_idx] = False
+        np.maximum(max_sim_to_selected, pairwise[best_idx], out=max_sim_to_selected)
+    
+    return [ranked[i] for i in selected_idx]
+
+
 class RAGRetrieval:
     """RAG service for knowledge retrieval and context building"""
     
@@ -215,7 +310,9 @@ class RAGRetrieval:
             
             # If not in cache, perform retrieval
             # Generate query embedding (only once, used for both cache key and search)
-            query_embedding = self.embedding_service.encode_text(query)
+            # Shared through the request's QueryProfile, so the semantic philosophical
+            # detector and retrieval encode the message once between them
+            query_embedding = get_query_profile(query).query_embedding(self.embedding_service)
             
             # ADAPTIVE THRESHOLD: Adjust similarity threshold based on database state
             # This ensures new/empty databases can still retrieve documents
@@ -224,6 +321,9 @@ class RAGRetrieval:
             if similarity_threshold != original_threshold:
                 logger.debug(f"🔧 Adaptive threshold: {original_threshold:.3f} → {similarity_threshold:.3f} (based on database state)")
             
+            # Knowledge sub-queries share one over-fetched ANN query (see RetrievalPlanner)
+            retrieval_planner = None
+            
             # Nested Learning: If tier_preference is specified, use tier-based retrieval
             if tier_preference and ENABLE_CONTINUUM_MEMORY:
                 knowledge_results = self.retrieve_by_tier(query, tier_preference, knowledge_limit)
@@ -231,6 +331,15 @@ class RAGRetrieval:
             else:
                 logger.info(f"Query embedding generated: {len(query_embedding)} dimensions")
                 
+                # OPTIMIZATION: Style guide, foundational, alternative and main passes all use the same
+                # query embedding - serve them from one pooled search partitioned by metadata
+                retrieval_planner = RetrievalPlanner(
+                    self.chroma_client,
+                    query_embedding,
+                    pool_size=max(DEFAULT_PLANNER_POOL_SIZE, knowledge_limit * 2),
+                    include_embeddings=use_mmr
+                )
+                
                 # OPTIMIZATION: Run knowledge and conversation search in parallel for better latency
                 # Helper function to run knowledge search (with all the complex logic)
                 def _search_knowledge():
@@ -239,8 +348,7 @@ class RAGRetrieval:
                     # Fix 2: Force retrieve style guide for philosophical questions
                     if prioritize_style_guide:
                         try:
-                            style_guide_results = self.chroma_client.search_knowledge(
-                                query_embedding=query_embedding,
+                            style_guide_results = retrieval_planner.search(
                                 limit=1,  # Force retrieve at least 1 style guide document
                                 where={"domain": "style_guide"}
                             )
@@ -254,10 +362,7 @@ class RAGRetrieval:
                             else:
                                 # Try alternative search if domain filter doesn't work
                                 logger.debug("Style guide not found with domain filter, trying alternative search")
-                                alt_results = self.chroma_client.search_knowledge(
-                                    query_embedding=query_embedding,
-                                    limit=5
-                                )
+                                alt_results = retrieval_planner.search(limit=5)
                                 for doc in alt_results:
                                     doc_metadata = doc.get("metadata", {})
                                     if ("style_guide" in str(doc_metadata.get("domain", "")).lower() or
@@ -285,8 +390,7 @@ class RAGRetrieval:
                         try:
                             # Try to retrieve foundational knowledge first
                             try:
-                                critical_results = self.chroma_client.search_knowledge(
-                                    query_embedding=query_embedding,
+                                critical_results = retrieval_planner.search(
                                     limit=knowledge_limit,
                                     where={"source": "CRITICAL_FOUNDATION"}
                                 )
@@ -294,8 +398,7 @@ class RAGRetrieval:
                                     foundational_results = critical_results
                                     logger.info(f"Found {len(critical_results)} CRITICAL_FOUNDATION documents")
                                 else:
-                                    foundational_results = self.chroma_client.search_knowledge(
-                                        query_embedding=query_embedding,
+                                    foundational_results = retrieval_planner.search(
                                         limit=knowledge_limit,
                                         where={"$or": [
                                             {"foundational": "stillme"},
@@ -362,8 +465,7 @@ class RAGRetrieval:
                     
                     # If we don't have enough results, do normal search
                     if len(knowledge_results) < knowledge_limit:
-                        normal_results = self.chroma_client.search_knowledge(
-                            query_embedding=query_embedding,
+                        normal_results = retrieval_planner.search(
                             limit=knowledge_limit * 2  # Get more to filter out provenance
                         )
                         # Merge results, avoiding duplicates
@@ -740,78 +842,6 @@ class RAGRetrieval:
                 # Similarity = 1 - distance
                 return max(0.0, min(1.0, 1.0 - distance))
             
-            def _apply_mmr(documents: List[Dict[str, Any]], query_embedding: List[float], 
-                          limit: int, lambda_param: float) -> List[Dict[str, Any]]:
-                """Apply Max Marginal Relevance for diversity
-                
-                Args:
-                    documents: List of documents with 'distance' field
-                    query_embedding: Query embedding vector
-                    limit: Number of documents to return
-                    lambda_param: MMR lambda (0.0-1.0). Higher = more relevance, lower = more diversity
-                
-                Returns:
-                    List of diverse documents
-                """
-                if len(documents) <= limit:
-                    return documents
-                
-                # Convert distances to similarities
-                for doc in documents:
-                    doc["similarity"] = _distance_to_similarity(doc.get("distance", 1.0))
-                
-                # Start with highest similarity document
-                selected = []
-                remaining = documents.copy()
-                
-                # Sort by similarity descending
-                remaining.sort(key=lambda x: x.get("similarity", 0.0), reverse=True)
-                
-                # Select first document (highest similarity)
-                if remaining:
-                    selected.append(remaining.pop(0))
-                
-                # Select remaining documents using MMR
-                while len(selected) < limit and remaining:
-                    best_score = -1.0
-                    best_idx = -1
-                    
-                    for i, candidate in enumerate(remaining):
-                        # Relevance score (similarity to query)
-                        relevance = candidate.get("similarity", 0.0)
-                        
-                        # Diversity score (max similarity to already selected)
-                        max_sim_to_selected = 0.0
-                        for selected_doc in selected:
-                            # Simple heuristic: if content is similar, assume high similarity
-                            # For better diversity, we could compute actual embedding similarity
-                            # But that would require additional compute, so we use a simple heuristic
-                            selected_content = selected_doc.get("content", "")
-                            candidate_content = candidate.get("content", "")
-                            
-                            # Simple overlap heuristic (can be improved with actual embedding similarity)
-                            if selected_content and candidate_content:
-                                # Count common words
-                                selected_words = set(selected_content.lower().split()[:50])  # First 50 words
-                                candidate_words = set(candidate_content.lower().split()[:50])
-                                if selected_words and candidate_words:
-                                    overlap = len(selected_words & candidate_words) / len(selected_words | candidate_words)
-                                    max_sim_to_selected = max(max_sim_to_selected, overlap)
-                        
-                        # MMR score: λ * relevance - (1-λ) * max_similarity_to_selected
-                        mmr_score = lambda_param * relevance - (1.0 - lambda_param) * max_sim_to_selected
-                        
-                        if mmr_score > best_score:
-                            best_score = mmr_score
-                            best_idx = i
-                    
-                    if best_idx >= 0:
-                        selected.append(remaining.pop(best_idx))
-                    else:
-                        break
-                
-                return selected
-            
             # Apply similarity threshold filtering
             original_knowledge_count = len(knowledge_results)
             original_conversation_count = len(conversation_results)
@@ -946,9 +976,13 @@ class RAGRetrieval:
             if use_mmr and len(filtered_knowledge) > knowledge_limit:
                 # Get more candidates for MMR (2x limit to have diversity to choose from)
                 mmr_candidates = filtered_knowledge[:knowledge_limit * 2] if len(filtered_knowledge) > knowledge_limit * 2 else filtered_knowledge
-                filtered_knowledge = _apply_mmr(mmr_candidates, query_embedding, knowledge_limit, mmr_lambda)
+                filtered_knowledge = mmr_select(mmr_candidates, knowledge_limit, mmr_lambda)
                 logger.info(f"🎯 Applied MMR (λ={mmr_lambda}): Selected {len(filtered_knowledge)} diverse documents from {len(mmr_candidates)} candidates")
             
+            # Stored embeddings were only needed for MMR - drop them so cached/returned context stays small and JSON-serializable
+            for doc in knowledge_results:
+                doc.pop("embedding", None)
+            
             # Calculate average similarity for metrics
             avg_similarity = 0.0
             if filtered_knowledge:
@@ -1025,8 +1059,13 @@ class RAGRetrieval:
                 "original_codebase_count": original_codebase_count,
                 "original_git_history_count": original_git_history_count,
                 # CRITICAL: Track unique results count after deduplication (for honesty enforcement)
-                "unique_knowledge_count": unique_knowledge_count
+                "unique_knowledge_count": unique_knowledge_count,
+                # Sub-queries planned vs vector searches actually issued for this request
+                "retrieval_stats": retrieval_planner.get_stats() if retrieval_planner else None
             }
+            if retrieval_planner:
+                stats = retrieval_planner.get_stats()
+                logger.info(f"🧭 Retrieval planner: {stats['subqueries']} knowledge sub-queries, {stats['backend_queries']} vector searches")
             
             if not has_reliable_context:
                 logger.warning(f"⚠️ No reliable context found (avg_similarity={avg_similarity:.3f} < threshold={similarity_threshold})")
@@ -1054,6 +1093,15 @@ class RAGRetrieval:
                 "total_context_docs": 0
             }
     
+    async def aretrieve_context(self, query: str, **kwargs) -> Dict[str, Any]:
+        """Async entry point for retrieve_context() (same arguments and result)
+        
+        Retrieval does blocking Redis, ChromaDB and model calls, so request handlers
+        await this instead: the work runs on a worker thread and a slow Redis or
+        collection query only delays the request that issued it, not the event loop.
+        """
+        return await asyncio.to_thread(self.retrieve_context, query, **kwargs)
+    
     def retrieve_by_tier(self, 
                         query: str,
                         tier: str,
@@ -1190,31 +1238,32 @@ class RAGRetrieval:
             return []
     
     def _estimate_tokens(self, text: str) -> int:
-        """Estimate token count (rough approximation: ~4 chars per token)"""
-        if not text:
-            return 0
-        # Rough estimate: 1 token ≈ 4 characters (conservative for English)
-        # For mixed languages, this is still a reasonable approximation
-        return len(text) // 4
+        """Count tokens with the shared tokenizer (see backend/services/token_counter.py)"""
+        return get_token_counter().count(text)
     
-    def _truncate_text_by_tokens(self, text: str, max_tokens: int) -> str:
-        """Truncate text to fit within max_tokens limit"""
+    def _truncate_text_by_tokens(self, text: str, max_tokens: int, known_tokens: Optional[int] = None) -> str:
+        """Truncate text to fit within max_tokens limit
+        
+        Args:
+            text: Text to truncate
+            max_tokens: Token budget
+            known_tokens: Precomputed token count of text (e.g. from ingestion metadata)
+        """
         if not text:
             return text
         
-        estimated_tokens = self._estimate_tokens(text)
+        estimated_tokens = known_tokens if known_tokens is not None else self._estimate_tokens(text)
         if estimated_tokens <= max_tokens:
             return text
         
-        # Truncate to approximately max_tokens
-        # Use character-based truncation (max_tokens * 4 chars)
-        max_chars = max_tokens * 4
-        if len(text) <= max_chars:
-            return text
-        
-        # Truncate and add ellipsis
-        truncated = text[:max_chars].rsplit(' ', 1)[0]  # Cut at word boundary
-        return truncated + "... [truncated]"
+        # Truncate at word boundary and add ellipsis
+        return get_token_counter().truncate(text, max_tokens)
+    
+    def _packed_doc_tokens(self, doc_text: str, truncated_content: str, content: str, content_tokens: int) -> int:
+        """Tokens of a formatted context entry - reuses the document's stored count when it was not truncated"""
+        if truncated_content is content:
+            return content_tokens + self._estimate_tokens(doc_text.replace(content, "", 1))
+        return self._estimate_tokens(doc_text)
     
     def build_prompt_context(self, context: Dict[str, Any], max_context_tokens: int = 8000) -> str:
         """
@@ -1278,10 +1327,11 @@ class RAGRetrieval:
                         doc_max_tokens = remaining_tokens // max(1, len(foundational_docs) - i + 1)
                         doc_max_tokens = min(doc_max_tokens, 2000)
                         
-                        truncated_content = self._truncate_text_by_tokens(content, doc_max_tokens)
+                        content_tokens = get_token_counter().document_count(content, doc.get("metadata"))
+                        truncated_content = self._truncate_text_by_tokens(content, doc_max_tokens, known_tokens=content_tokens)
                         doc_text = f"{i}. [FOUNDATIONAL] {truncated_content} (Source: {source})"
                         
-                        doc_tokens = self._estimate_tokens(doc_text)
+                        doc_tokens = self._packed_doc_tokens(doc_text, truncated_content, content, content_tokens)
                         remaining_tokens -= doc_tokens
                         context_parts.append(doc_text)
                 
@@ -1303,10 +1353,11 @@ class RAGRetrieval:
                         doc_max_tokens = remaining_tokens // max(1, len(regular_docs) - i + 1)
                         doc_max_tokens = min(doc_max_tokens, 2000)
                         
-                        truncated_content = self._truncate_text_by_tokens(content, doc_max_tokens)
+                        content_tokens = get_token_counter().document_count(content, doc.get("metadata"))
+                        truncated_content = self._truncate_text_by_tokens(content, doc_max_tokens, known_tokens=content_tokens)
                         doc_text = f"{i}. {truncated_content} (Source: {source})"
                         
-                        doc_tokens = self._estimate_tokens(doc_text)
+                        doc_tokens = self._packed_doc_tokens(doc_text, truncated_content, content, content_tokens)
                         remaining_tokens -= doc_tokens
                         context_parts.append(doc_text)
             
@@ -1421,15 +1472,142 @@ class RAGRetrieval:
             logger.warning(f"Semantic duplicate check failed: {e}")
             return False, None  # Fail open - allow content if check fails
     
+    def check_duplicate_by_link(self, link: str) -> bool:
+        """Check if a document with the given link already exists (metadata lookup, no embedding)"""
+        return self.chroma_client.check_duplicate_by_link(link)
+    
+    def find_existing_links(self, links: List[str]) -> set:
+        """Return the subset of links already present in the knowledge collection (batched lookup)"""
+        return self.chroma_client.find_existing_links(links)
+    
+    def check_semantic_duplicates_batch(self,
+                                        contents: List[str],
+                                        embeddings: Optional[List[List[float]]] = None,
+                                        similarity_threshold: float = 0.95) -> List[bool]:
+        """
+        Batched check_semantic_duplicate() for a list of contents
+        
+        Runs one multi-embedding knowledge query (top-1 per content) instead of one query per
+        item, and also flags near-duplicates within the batch itself (later items lose).
+        
+        Args:
+            contents: Content texts to check
+            embeddings: Optional precomputed embeddings for contents (encoded here if None)
+            similarity_threshold: Similarity threshold (0.0-1.0, default 0.95 for very similar)
+            
+        Returns:
+            List of duplicate flags, one per content
+        """
+        flags = [False] * len(contents)
+        # Same minimum as check_semantic_duplicate - very short texts are never duplicates
+        checkable = [i for i, content in enumerate(contents) if content and len(content.strip()) >= 10]
+        if not checkable:
+            return flags
+        
+        try:
+            if embeddings is None:
+                embeddings = self.embedding_service.batch_encode(contents)
+            
+            checkable_embeddings = [embeddings[i] for i in checkable]
+            batch_results = self.chroma_client.search_knowledge_batch(
+                query_embeddings=checkable_embeddings,
+                limit=1
+            )
+            for i, results in zip(checkable, batch_results):
+                if results and 1.0 - results[0].get("distance", 1.0) >= similarity_threshold:
+                    flags[i] = True
+            
+            # Within-batch duplicates: compare each item against earlier non-duplicate items
+            matrix = np.asarray(checkable_embeddings, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix = matrix / norms
+            pairwise = matrix @ matrix.T
+            for row in range(1, len(checkable)):
+                if flags[checkable[row]]:
+                    continue
+                earlier = [col for col in range(row) if not flags[checkable[col]]]
+                if earlier and pairwise[row, earlier].max() >= similarity_threshold:
+                    flags[checkable[row]] = True
+            
+            return flags
+        except Exception as e:
+            logger.warning(f"Batched semantic duplicate check failed: {e}")
+            return [False] * len(contents)  # Fail open - allow content if check fails
+    
+    def add_learning_contents(self,
+                              contents: List[str],
+                              sources: List[str],
+                              content_type: str = "knowledge",
+                              metadatas: Optional[List[Dict[str, Any]]] = None,
+                              embeddings: Optional[List[List[float]]] = None) -> List[str]:
+        """Add many learning contents to the knowledge collection in one batched write
+        
+        Bulk counterpart of add_learning_content() for learning cycles: one embedding batch
+        (or precomputed embeddings) and chunked inserts instead of one encode + insert per item.
+        
+        Args:
+            contents: Content texts
+            sources: Source for each content
+            content_type: Content type for all items (non-conversation types)
+            metadatas: Optional extra metadata per item
+            embeddings: Optional precomputed embeddings per item
+            
+        Returns:
+            List of inserted document IDs (empty list on failure)
+        """
+        if not contents:
+            return []
+        
+        try:
+            import uuid
+            from datetime import datetime
+            import time
+            
+            start_time = time.time()
+            timestamp = datetime.now().isoformat()
+            metadatas = metadatas or [{} for _ in contents]
+            
+            doc_metadatas = [
+                {
+                    "source": source,
+                    "type": content_type,
+                    "timestamp": timestamp,
+                    **(metadata or {})
+                }
+                for source, metadata in zip(sources, metadatas)
+            ]
+            doc_ids = [f"{content_type}_{uuid.uuid4().hex[:8]}" for _ in contents]
+            
+            success = self.chroma_client.add_knowledge(
+                documents=contents,
+                metadatas=doc_metadatas,
+                ids=doc_ids,
+                embeddings=embeddings
+            )
+            
+            if not success:
+                logger.warning(f"❌ Failed to add {len(contents)} {content_type} contents")
+                return []
+            
+            logger.debug(f"✅ Added {len(contents)} {content_type} contents in {time.time() - start_time:.3f}s")
+            return doc_ids
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to add learning contents: {e}", exc_info=True)
+            return []
+    
     def add_learning_content(self, 
                            content: str, 
                            source: str, 
                            content_type: str = "knowledge",
-                           metadata: Optional[Dict[str, Any]] = None) -> bool:
+                           metadata: Optional[Dict[str, Any]] = None,
+                           embedding: Optional[List[float]] = None) -> bool:
         """Add new learning content to vector database
         
         This method:
-        1. Generates embeddings using the embedding service
+        1. Generates embeddings using the embedding service (unless a precomputed
+           knowledge embedding is passed)
         2. Inserts documents into ChromaDB
         3. Logs progress for monitoring
         """
@@ -1470,7 +1648,8 @@ class RAGRetrieval:
                 success = self.chroma_client.add_knowledge(
                     documents=[content],
                     metadatas=[doc_metadata],
-                    ids=[doc_id]
+                    ids=[doc_id],
+                    embeddings=[embedding] if embedding is not None else None
                 )
             
             embedding_time = time.time() - embedding_start
@@ -0,0 +1,168 @@
+"""
+Retrieval planner for RAG knowledge searches
+
+retrieve_context() runs several knowledge searches per request with the same query
+embedding (style guide, CRITICAL_FOUNDATION, foundational $or, alternative, main pass).
+The planner serves them from ONE over-fetched, unfiltered ANN query and partitions the
+pool client-side by metadata. A filtered sub-query only goes back to ChromaDB when the
+pool cannot prove its answer complete, so results match what a dedicated filtered query
+would return.
+
+Why this is exact: the pool holds the global top-N by similarity. If it contains at
+least `limit` documents matching a filter, those are the filter's top-`limit` too - any
+better-matching document would also be in the global top-N. If the pool came back short
+of N, the collection is exhausted and every matching document is already in the pool.
+"""
+
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Minimum number of candidates fetched by the shared ANN query
+DEFAULT_PLANNER_POOL_SIZE = int(os.getenv("RAG_PLANNER_POOL_SIZE", "20"))
+
+
+class UnsupportedFilterError(ValueError):
+    """Raised when a where-filter cannot be evaluated client-side"""
+
+
+def _compare(value: Any, operator: str, operand: Any) -> bool:
+    if operator == "$eq":
+        return value == operand
+    if operator == "$ne":
+        return value != operand
+    if operator == "$in":
+        return value in operand
+    if operator == "$nin":
+        return value not in operand
+    if operator == "$contains":
+        if value is None:
+            return False
+        if isinstance(value, (list, tuple, set)):
+            return operand in value
+        return str(operand) in str(value)
+    if operator in ("$gt", "$gte", "$lt", "$lte"):
+        if value is None:
+            return False
+        try:
+            if operator == "$gt":
+                return value > operand
+            if operator == "$gte":
+                return value >= operand
+            if operator == "$lt":
+                return value < operand
+            return value <= operand
+        except TypeError:
+            return False
+    raise UnsupportedFilterError(f"Unsupported operator: {operator}")
+
+
+def metadata_matches(metadata: Dict[str, Any], where: Optional[Dict[str, Any]]) -> bool:
+    """Evaluate a ChromaDB-style metadata where-filter against one document's metadata
+
+    Supports field equality, $eq/$ne/$gt/$gte/$lt/$lte/$in/$nin/$contains and
+    nested $and/$or. Raises UnsupportedFilterError for anything else.
+    """
+    if not where:
+        return True
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(metadata_matches(metadata, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(metadata_matches(metadata, clause) for clause in condition):
+                return False
+        elif key.startswith("$"):
+            raise UnsupportedFilterError(f"Unsupported logical operator: {key}")
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            for operator, operand in condition.items():
+                if not _compare(value, operator, operand):
+                    return False
+        elif metadata.get(key) != condition:
+            return False
+    return True
+
+
+class RetrievalPlanner:
+    """Serves a request's knowledge sub-queries from one shared ANN query where possible"""
+
+    def __init__(self,
+                 chroma_client,
+                 query_embedding: List[float],
+                 pool_size: int = DEFAULT_PLANNER_POOL_SIZE,
+                 include_embeddings: bool = False):
+        """
+        Args:
+            chroma_client: ChromaClient used for the pooled and fallback queries
+            query_embedding: Query embedding shared by every sub-query of the request
+            pool_size: Number of candidates fetched by the shared unfiltered query
+            include_embeddings: Forwarded to search_knowledge (needed for embedding MMR)
+        """
+        self.chroma_client = chroma_client
+        self.query_embedding = query_embedding
+        self.pool_size = max(1, pool_size)
+        self.include_embeddings = include_embeddings
+        self._pool: Optional[List[Dict[str, Any]]] = None
+        self.backend_queries = 0
+        self.subqueries = 0
+        self.served_from_pool = 0
+
+    def _backend_search(self, limit: int, where: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        self.backend_queries += 1
+        return self.chroma_client.search_knowledge(
+            query_embedding=self.query_embedding,
+            limit=limit,
+            where=where,
+            include_embeddings=self.include_embeddings
+        )
+
+    def _get_pool(self) -> List[Dict[str, Any]]:
+        if self._pool is None:
+            self._pool = self._backend_search(self.pool_size)
+        return self._pool
+
+    def search(self, limit: int, where: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Run one knowledge sub-query, from the shared pool when the answer is provably complete
+
+        Args:
+            limit: Number of results wanted
+            where: Optional ChromaDB metadata filter
+
+        Returns:
+            Search results in similarity order (shallow copies - safe to annotate)
+        """
+        if limit <= 0:
+            return []
+        self.subqueries += 1
+
+        if limit > self.pool_size:
+            return self._backend_search(limit, where)
+
+        pool = self._get_pool()
+        pool_exhausted = len(pool) < self.pool_size
+        try:
+            matches = [doc for doc in pool if metadata_matches(doc.get("metadata", {}), where)]
+        except UnsupportedFilterError as filter_error:
+            logger.debug(f"Planner cannot evaluate filter client-side ({filter_error}), querying backend")
+            return self._backend_search(limit, where)
+
+        if len(matches) >= limit or pool_exhausted:
+            self.served_from_pool += 1
+            return [dict(doc) for doc in matches[:limit]]
+
+        results = self._backend_search(limit, where)
+        # Backend errors surface as [] from search_knowledge - never return less than the pool proved
+        if len(results) < len(matches):
+            return [dict(doc) for doc in matches[:limit]]
+        return results
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get how many sub-queries were planned and how many backend queries actually ran"""
+        return {
+            "subqueries": self.subqueries,
+            "backend_queries": self.backend_queries,
+            "served_from_pool": self.served_from_pool
+        }
@@ -7,13 +7,14 @@ orchestration, caching, and rate limiting.
 This module has been migrated from backend/external_data/ to stillme_core/external_data/
 """
 
-from .orchestrator import ExternalDataOrchestrator
+from .orchestrator import ExternalDataOrchestrator, get_external_data_orchestrator
 from .intent_detector import detect_external_data_intent, ExternalDataIntent
 from .cache import ExternalDataCache
 from .providers.base import ExternalDataProvider, ExternalDataResult
 
 __all__ = [
     "ExternalDataOrchestrator",
+    "get_external_data_orchestrator",
     "detect_external_data_intent",
     "ExternalDataIntent",
     "ExternalDataCache",
@@ -5,14 +5,20 @@ Supports Redis (if available) with in-memory fallback.
 Uses existing CacheService for consistency.
 """
 
+import heapq
+import itertools
+import os
 import time
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 from .providers.base import ExternalDataResult
 
 logger = logging.getLogger(__name__)
 
+# How long an expired result may still be served while it is refreshed in the background
+DEFAULT_STALE_TTL_SECONDS = int(os.getenv("EXTERNAL_DATA_STALE_TTL_SECONDS", "600"))
+
 # Try to use CacheService if available
 try:
     from backend.services.cache_service import get_cache_service
@@ -27,12 +33,23 @@ class ExternalDataCache:
     Cache for external data results
     
     Uses CacheService (Redis) if available, falls back to in-memory cache.
+    Expired entries are kept for stale_ttl seconds so callers can serve them
+    while a refresh is in flight (stale-while-revalidate).
     """
     
-    def __init__(self):
-        """Initialize cache"""
+    def __init__(self, stale_ttl: int = DEFAULT_STALE_TTL_SECONDS):
+        """
+        Initialize cache
+        
+        Args:
+            stale_ttl: Seconds an expired entry can still be returned by get_entry()
+        """
         self._cache: Dict[str, tuple[ExternalDataResult, float]] = {}
+        # Min-heap of (expiry_time, seq, key); entries whose expiry no longer matches _cache are skipped lazily
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._heap_seq = itertools.count()
         self._max_size = 1000  # Max cache entries
+        self.stale_ttl = max(0, stale_ttl)
         self.logger = logging.getLogger(__name__)
         
         # Try to use CacheService if available
@@ -55,6 +72,21 @@ class ExternalDataCache:
         Returns:
             Cached result if exists and not expired, None otherwise
         """
+        entry = self.get_entry(key)
+        if entry is None or entry[1]:
+            return None
+        return entry[0]
+    
+    def get_entry(self, key: str) -> Optional[Tuple[ExternalDataResult, bool]]:
+        """
+        Get cached result, including expired results still within the stale window
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            (result, is_stale) if cached, None otherwise
+        """
         # Try CacheService first (Redis)
         if self._cache_service:
             try:
@@ -74,8 +106,10 @@ class ExternalDataCache:
                         success=data.get("success", True),
                         error_message=data.get("error_message")
                     )
-                    self.logger.debug(f"Cache hit from CacheService: {key}")
-                    return result
+                    # Entries written before expires_at was stored are treated as fresh
+                    is_stale = time.time() > data.get("expires_at", float("inf"))
+                    self.logger.debug(f"Cache hit from CacheService: {key} (stale={is_stale})")
+                    return result, is_stale
             except Exception as e:
                 self.logger.warning(f"Error getting from CacheService: {e}. Falling back to in-memory.")
         
@@ -85,14 +119,15 @@ class ExternalDataCache:
         
         result, expiry_time = self._cache[key]
         
-        # Check if expired
-        if time.time() > expiry_time:
+        # Drop entries past the stale window
+        now = time.time()
+        if now > expiry_time + self.stale_ttl:
             del self._cache[key]
             return None
         
         # Mark as cached
         result.cached = True
-        return result
+        return result, now > expiry_time
     
     def set(self, key: str, result: ExternalDataResult, ttl: int):
         """
@@ -116,11 +151,13 @@ class ExternalDataCache:
                     "raw_response": result.raw_response,
                     "success": result.success,
                     "error_message": result.error_message,
+                    "expires_at": time.time() + ttl,
                 }
+                # Keep the entry through the stale window; expires_at marks when it turns stale
                 self._cache_service.set(
                     f"external_data:{key}",
                     json.dumps(data),
-                    ttl=ttl
+                    ttl_seconds=ttl + self.stale_ttl
                 )
                 self.logger.debug(f"Cached result in CacheService: {key}, TTL: {ttl}s")
                 return
@@ -129,36 +166,43 @@ class ExternalDataCache:
         
         # Fallback to in-memory cache
         # Evict oldest entries if cache is full
-        if len(self._cache) >= self._max_size:
+        if key not in self._cache and len(self._cache) >= self._max_size:
             self._evict_oldest()
         
         expiry_time = time.time() + ttl
         self._cache[key] = (result, expiry_time)
+        heapq.heappush(self._expiry_heap, (expiry_time, next(self._heap_seq), key))
+        # Rebuild when overwritten entries make up most of the heap
+        if len(self._expiry_heap) > 2 * self._max_size:
+            self._expiry_heap = [(expiry, next(self._heap_seq), k) for k, (_, expiry) in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
         
         self.logger.debug(f"Cached result in-memory: {key}, TTL: {ttl}s")
     
     def _evict_oldest(self):
-        """Evict oldest cache entry"""
-        if not self._cache:
-            return
-        
-        # Find oldest entry (lowest expiry time)
-        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-        del self._cache[oldest_key]
-        self.logger.debug(f"Evicted cache entry: {oldest_key}")
+        """Evict oldest cache entry (lowest expiry time), O(log n) amortized"""
+        while self._expiry_heap:
+            expiry_time, _, oldest_key = heapq.heappop(self._expiry_heap)
+            entry = self._cache.get(oldest_key)
+            # Skip heap records of keys that were overwritten or already removed
+            if entry is not None and entry[1] == expiry_time:
+                del self._cache[oldest_key]
+                self.logger.debug(f"Evicted cache entry: {oldest_key}")
+                return
     
     def clear(self):
         """Clear all cache"""
         self._cache.clear()
+        self._expiry_heap.clear()
         self.logger.info("Cache cleared")
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        # Clean expired entries first
+        # Clean entries past the stale window first
         current_time = time.time()
         expired_keys = [
             key for key, (_, expiry) in self._cache.items()
-            if current_time > expiry
+            if current_time > expiry + self.stale_ttl
         ]
         for key in expired_keys:
             del self._cache[key]
@@ -166,6 +210,7 @@ class ExternalDataCache:
         return {
             "size": len(self._cache),
             "max_size": self._max_size,
+            "stale_ttl": self.stale_ttl,
             "usage_percent": (len(self._cache) / self._max_size) * 100
         }
 
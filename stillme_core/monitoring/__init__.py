@@ -14,6 +14,7 @@ from .metrics import (
     UnifiedMetricsCollector,
     MetricCategory,
     MetricRecord,
+    QuantileSketch,
     get_metrics_collector,
 )
 from .task_tracker import TaskTracker, TaskRecord, get_task_tracker
@@ -24,6 +25,7 @@ __all__ = [
     "UnifiedMetricsCollector",
     "MetricCategory",
     "MetricRecord",
+    "QuantileSketch",
     "get_metrics_collector",
     "TaskTracker",
     "TaskRecord",
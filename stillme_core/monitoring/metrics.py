@@ -8,12 +8,26 @@ Consolidates metrics from all components:
 - Post-processing metrics
 
 This provides a single interface for metrics collection and analysis.
+
+Storage is time-bucketed so neither queries nor startup scale with history size:
+- each (category, metric) series keeps a fixed-size ring buffer of recent raw records
+- values are pre-aggregated into minute and hour buckets (plus an all-time total);
+  histogram values go into mergeable streaming quantile sketches
+- records are appended to the JSONL log by a background flusher in batches, with
+  size-based rotation; aggregates are snapshotted periodically and startup loads the
+  snapshot and replays only the log written after it
 """
 
+import atexit
 import logging
-from typing import Dict, List, Optional, Any, Union
-from collections import defaultdict
-from datetime import datetime, timezone, timedelta
+import math
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Any, Tuple, Union
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
 from dataclasses import dataclass, asdict
 from enum import Enum
 import json
@@ -21,6 +35,21 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Raw records kept per (category, metric) series
+METRICS_RING_BUFFER_SIZE = int(os.getenv("METRICS_RING_BUFFER_SIZE", "1000"))
+# Bucket retention
+METRICS_MINUTE_RETENTION_MINUTES = int(os.getenv("METRICS_MINUTE_RETENTION_MINUTES", "180"))
+METRICS_HOUR_RETENTION_DAYS = int(os.getenv("METRICS_HOUR_RETENTION_DAYS", "90"))
+# Background flusher
+METRICS_FLUSH_INTERVAL_SECONDS = float(os.getenv("METRICS_FLUSH_INTERVAL_SECONDS", "2.0"))
+METRICS_FLUSH_BATCH_SIZE = int(os.getenv("METRICS_FLUSH_BATCH_SIZE", "256"))
+METRICS_SNAPSHOT_INTERVAL_SECONDS = float(os.getenv("METRICS_SNAPSHOT_INTERVAL_SECONDS", "60"))
+# Log rotation
+METRICS_MAX_FILE_BYTES = int(os.getenv("METRICS_MAX_FILE_BYTES", str(50 * 1024 * 1024)))
+METRICS_BACKUP_COUNT = int(os.getenv("METRICS_BACKUP_COUNT", "3"))
+
+SNAPSHOT_VERSION = 1
+
 
 class MetricCategory(Enum):
     """Categories of metrics"""
@@ -41,6 +70,254 @@ class MetricRecord:
     metadata: Optional[Dict[str, Any]] = None
 
 
+class QuantileSketch:
+    """
+    Mergeable streaming quantile sketch (log-spaced buckets, DDSketch-style).
+    
+    Quantiles are accurate to within `relative_accuracy` of the true value, memory is
+    bounded by `max_bins`, and sketches of different time buckets can be merged.
+    """
+    
+    _ZERO_THRESHOLD = 1e-12
+    
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+    
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+    
+    def _value(self, key: int) -> float:
+        return 2 * self._gamma ** key / (self._gamma + 1)
+    
+    def add(self, value: float) -> None:
+        """Add one value"""
+        if value > self._ZERO_THRESHOLD:
+            key = self._key(value)
+            self._positive[key] = self._positive.get(key, 0) + 1
+            self._collapse(self._positive)
+        elif value < -self._ZERO_THRESHOLD:
+            key = self._key(-value)
+            self._negative[key] = self._negative.get(key, 0) + 1
+            self._collapse(self._negative)
+        else:
+            self.zero_count += 1
+        self.count += 1
+    
+    def merge(self, other: "QuantileSketch") -> None:
+        """Merge another sketch (same relative accuracy) into this one"""
+        for key, n in other._positive.items():
+            self._positive[key] = self._positive.get(key, 0) + n
+        for key, n in other._negative.items():
+            self._negative[key] = self._negative.get(key, 0) + n
+        self._collapse(self._positive)
+        self._collapse(self._negative)
+        self.zero_count += other.zero_count
+        self.count += other.count
+    
+    def _collapse(self, bins: Dict[int, int]) -> None:
+        """Fold the smallest-magnitude bins together when over max_bins"""
+        if len(bins) <= self.max_bins:
+            return
+        keys = sorted(bins)
+        overflow = keys[:len(keys) - self.max_bins + 1]
+        folded = sum(bins.pop(key) for key in overflow)
+        bins[overflow[-1]] = folded
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate q-quantile (0 <= q <= 1), None when empty"""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        # Most negative first: larger magnitude key = smaller value
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self._positive)) if self._positive else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "a": self.relative_accuracy,
+            "p": {str(k): n for k, n in self._positive.items()},
+            "n": {str(k): n for k, n in self._negative.items()},
+            "z": self.zero_count
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(relative_accuracy=data.get("a", 0.01))
+        sketch._positive = {int(k): n for k, n in data.get("p", {}).items()}
+        sketch._negative = {int(k): n for k, n in data.get("n", {}).items()}
+        sketch.zero_count = data.get("z", 0)
+        sketch.count = sketch.zero_count + sum(sketch._positive.values()) + sum(sketch._negative.values())
+        return sketch
+
+
+class MetricAggregate:
+    """Pre-aggregated values of one series over one time bucket"""
+    
+    __slots__ = (
+        "records", "counter", "counter_count",
+        "gauge_count", "gauge_sum", "gauge_min", "gauge_max", "gauge_latest",
+        "hist_count", "hist_sum", "hist_min", "hist_max", "sketch"
+    )
+    
+    def __init__(self):
+        self.records = 0
+        self.counter = 0
+        self.counter_count = 0
+        self.gauge_count = 0
+        self.gauge_sum = 0.0
+        self.gauge_min = math.inf
+        self.gauge_max = -math.inf
+        self.gauge_latest: Optional[float] = None
+        self.hist_count = 0
+        self.hist_sum = 0.0
+        self.hist_min = math.inf
+        self.hist_max = -math.inf
+        self.sketch: Optional[QuantileSketch] = None
+    
+    def add(self, value: Any) -> None:
+        """Fold one record value in (int = counter, float = gauge, list of numbers = histogram)"""
+        self.records += 1
+        if isinstance(value, int):
+            self.counter += value
+            self.counter_count += 1
+        elif isinstance(value, float):
+            self.gauge_count += 1
+            self.gauge_sum += value
+            self.gauge_min = min(self.gauge_min, value)
+            self.gauge_max = max(self.gauge_max, value)
+            self.gauge_latest = value
+        elif isinstance(value, list) and value and all(isinstance(v, (int, float)) for v in value):
+            if self.sketch is None:
+                self.sketch = QuantileSketch()
+            for v in value:
+                self.hist_count += 1
+                self.hist_sum += v
+                self.hist_min = min(self.hist_min, v)
+                self.hist_max = max(self.hist_max, v)
+                self.sketch.add(v)
+    
+    def merge(self, other: "MetricAggregate") -> None:
+        """Merge a later bucket into this one"""
+        self.records += other.records
+        self.counter += other.counter
+        self.counter_count += other.counter_count
+        if other.gauge_count:
+            self.gauge_count += other.gauge_count
+            self.gauge_sum += other.gauge_sum
+            self.gauge_min = min(self.gauge_min, other.gauge_min)
+            self.gauge_max = max(self.gauge_max, other.gauge_max)
+            self.gauge_latest = other.gauge_latest
+        if other.hist_count:
+            self.hist_count += other.hist_count
+            self.hist_sum += other.hist_sum
+            self.hist_min = min(self.hist_min, other.hist_min)
+            self.hist_max = max(self.hist_max, other.hist_max)
+            if self.sketch is None:
+                self.sketch = QuantileSketch()
+            self.sketch.merge(other.sketch)
+    
+    def gauge_summary(self) -> Dict[str, Optional[float]]:
+        return {
+            "latest": self.gauge_latest,
+            "avg": self.gauge_sum / self.gauge_count,
+            "min": self.gauge_min,
+            "max": self.gauge_max
+        }
+    
+    def histogram_summary(self) -> Dict[str, Optional[float]]:
+        def _q(q: float) -> float:
+            # Sketch values are bucket midpoints - keep them inside the observed range
+            return min(max(self.sketch.quantile(q), self.hist_min), self.hist_max)
+        return {
+            "count": self.hist_count,
+            "avg": self.hist_sum / self.hist_count,
+            "min": self.hist_min,
+            "max": self.hist_max,
+            "p50": _q(0.50),
+            "p95": _q(0.95),
+            "p99": _q(0.99)
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = {"r": self.records}
+        if self.counter_count:
+            data["c"] = [self.counter, self.counter_count]
+        if self.gauge_count:
+            data["g"] = [self.gauge_count, self.gauge_sum, self.gauge_min, self.gauge_max, self.gauge_latest]
+        if self.hist_count:
+            data["h"] = [self.hist_count, self.hist_sum, self.hist_min, self.hist_max, self.sketch.to_dict()]
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MetricAggregate":
+        agg = cls()
+        agg.records = data.get("r", 0)
+        if "c" in data:
+            agg.counter, agg.counter_count = data["c"]
+        if "g" in data:
+            agg.gauge_count, agg.gauge_sum, agg.gauge_min, agg.gauge_max, agg.gauge_latest = data["g"]
+        if "h" in data:
+            agg.hist_count, agg.hist_sum, agg.hist_min, agg.hist_max, sketch = data["h"]
+            agg.sketch = QuantileSketch.from_dict(sketch)
+        return agg
+
+
+class _MetricSeries:
+    """One (category, metric) series: ring buffer of recent records + minute/hour buckets"""
+    
+    __slots__ = ("recent", "minutes", "hours", "total")
+    
+    def __init__(self, ring_size: int):
+        # (seq, epoch, record)
+        self.recent: deque = deque(maxlen=ring_size)
+        self.minutes: "OrderedDict[int, MetricAggregate]" = OrderedDict()
+        self.hours: "OrderedDict[int, MetricAggregate]" = OrderedDict()
+        self.total = MetricAggregate()
+    
+    @staticmethod
+    def _bucket(buckets: "OrderedDict[int, MetricAggregate]", key: int, oldest_key: int) -> MetricAggregate:
+        agg = buckets.get(key)
+        if agg is None:
+            agg = buckets[key] = MetricAggregate()
+            # Keys arrive in time order, so expired buckets are at the front
+            while buckets and next(iter(buckets)) < oldest_key:
+                buckets.popitem(last=False)
+        return agg
+    
+    def add(self, seq: int, epoch: float, record: MetricRecord, now: float) -> None:
+        self.recent.append((seq, epoch, record))
+        minute = int(epoch // 60)
+        hour = int(epoch // 3600)
+        self._bucket(self.minutes, minute, int(now // 60) - METRICS_MINUTE_RETENTION_MINUTES).add(record.value)
+        self._bucket(self.hours, hour, int(now // 3600) - METRICS_HOUR_RETENTION_DAYS * 24).add(record.value)
+        self.total.add(record.value)
+
+
+def _record_epoch(record: MetricRecord) -> float:
+    try:
+        return datetime.fromisoformat(record.timestamp).timestamp()
+    except (TypeError, ValueError):
+        return time.time()
+
+
 class UnifiedMetricsCollector:
     """
     Unified metrics collector for all StillMe framework components.
@@ -58,7 +335,11 @@ class UnifiedMetricsCollector:
         self,
         persist_to_file: bool = True,
         metrics_file: Optional[str] = None,
-        max_in_memory_records: int = 10000
+        max_in_memory_records: int = 10000,
+        ring_buffer_size: int = METRICS_RING_BUFFER_SIZE,
+        flush_interval: float = METRICS_FLUSH_INTERVAL_SECONDS,
+        max_file_bytes: int = METRICS_MAX_FILE_BYTES,
+        backup_count: int = METRICS_BACKUP_COUNT
     ):
         """
         Initialize unified metrics collector
@@ -66,75 +347,249 @@ class UnifiedMetricsCollector:
         Args:
             persist_to_file: Whether to persist metrics to file
             metrics_file: Path to metrics file (default: data/framework_metrics.jsonl)
-            max_in_memory_records: Maximum records to keep in memory
+            max_in_memory_records: Log lines replayed at startup when no snapshot exists yet
+            ring_buffer_size: Recent raw records kept per (category, metric) series
+            flush_interval: Seconds between background flushes to the log
+            max_file_bytes: Rotate the log when it would grow past this size
+            backup_count: Rotated log files kept (framework_metrics.jsonl.1, .2, ...)
         """
         self.persist_to_file = persist_to_file
         self.metrics_file = metrics_file or "data/framework_metrics.jsonl"
+        self.snapshot_file = f"{self.metrics_file}.snapshot.json"
         self.max_in_memory_records = max_in_memory_records
-        
-        # In-memory storage
-        self._records: List[MetricRecord] = []
-        
-        # Aggregated counters by category
-        self._counters: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
-        self._gauges: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
-        self._histograms: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+        self.ring_buffer_size = ring_buffer_size
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes
+        self.backup_count = backup_count
+        
+        # In-memory storage: (category, metric_name) -> series
+        self._series: Dict[Tuple[str, str], _MetricSeries] = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+        
+        # Records waiting for the background flusher
+        self._pending: List[MetricRecord] = []
+        self._flush_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._last_snapshot = time.time()
+        self.records_flushed = 0
+        self.flushes = 0
+        self.rotations = 0
         
         # Ensure data directory exists
         if self.persist_to_file:
             Path(self.metrics_file).parent.mkdir(parents=True, exist_ok=True)
             self._load_metrics()
+            atexit.register(self.close)
         
         logger.info(f"UnifiedMetricsCollector initialized (persist={persist_to_file}, file={self.metrics_file})")
     
+    # Loading
+    
     def _load_metrics(self):
-        """Load recent metrics from file (last N records)"""
+        """Restore aggregates from the snapshot, then replay log lines written after it"""
+        started = time.time()
+        offset = 0
+        replay_tail = False
         try:
-            if Path(self.metrics_file).exists():
-                # Load last N records to avoid memory issues
-                with open(self.metrics_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    # Load last max_in_memory_records
-                    for line in lines[-self.max_in_memory_records:]:
-                        if line.strip():
-                            data = json.loads(line)
-                            record = MetricRecord(**data)
-                            self._records.append(record)
-                            self._update_aggregates(record)
-                logger.info(f"Loaded {len(self._records)} metric records from {self.metrics_file}")
+            with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if snapshot.get("version") == SNAPSHOT_VERSION:
+                self._restore_snapshot(snapshot)
+                offset = snapshot.get("log_offset", 0)
+            else:
+                replay_tail = True
+        except FileNotFoundError:
+            # No snapshot yet (first run or a log written by an older version)
+            replay_tail = True
+        except Exception as e:
+            logger.warning(f"Failed to load metrics snapshot {self.snapshot_file}: {e}")
+            replay_tail = True
+        
+        try:
+            if not Path(self.metrics_file).exists():
+                return
+            size = os.path.getsize(self.metrics_file)
+            if replay_tail:
+                lines = self._read_tail_lines(self.max_in_memory_records)
+            else:
+                if offset > size:
+                    # Log was rotated after the snapshot
+                    offset = 0
+                with open(self.metrics_file, 'rb') as f:
+                    f.seek(offset)
+                    lines = f.read().decode('utf-8', errors='replace').splitlines()
+            replayed = 0
+            for line in lines:
+                if line.strip():
+                    try:
+                        record = MetricRecord(**json.loads(line))
+                    except Exception:
+                        continue
+                    self._ingest(record, _record_epoch(record))
+                    replayed += 1
+            logger.info(
+                f"Loaded metrics from {self.metrics_file} ({len(self._series)} series, "
+                f"{replayed} log records replayed) in {time.time() - started:.2f}s"
+            )
         except Exception as e:
             logger.warning(f"Failed to load metrics from {self.metrics_file}: {e}")
     
-    def _update_aggregates(self, record: MetricRecord):
-        """Update aggregated metrics from a record"""
-        category = record.category
-        metric_name = record.metric_name
-        
-        # Update counters (for integer values)
-        if isinstance(record.value, int):
-            self._counters[category][metric_name] += record.value
-        
-        # Update gauges (for float values)
-        elif isinstance(record.value, float):
-            self._gauges[category][metric_name] = record.value  # Latest value
-        
-        # Update histograms (for list of values)
-        elif isinstance(record.value, list) and all(isinstance(v, (int, float)) for v in record.value):
-            if metric_name not in self._histograms[category]:
-                self._histograms[category][metric_name] = []
-            self._histograms[category][metric_name].extend(record.value)
-            # Keep only last 1000 values per histogram
-            if len(self._histograms[category][metric_name]) > 1000:
-                self._histograms[category][metric_name] = self._histograms[category][metric_name][-1000:]
-    
-    def _save_record(self, record: MetricRecord):
-        """Save a single record to file"""
-        if self.persist_to_file:
+    def _read_tail_lines(self, max_lines: int, block_size: int = 65536) -> List[str]:
+        """Read the last max_lines lines of the log without reading the whole file"""
+        with open(self.metrics_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            data = b""
+            while position > 0 and data.count(b"\n") <= max_lines:
+                read_size = min(block_size, position)
+                position -= read_size
+                f.seek(position)
+                data = f.read(read_size) + data
+        lines = data.decode('utf-8', errors='replace').splitlines()
+        if position > 0:
+            # First line is probably partial
+            lines = lines[1:]
+        return lines[-max_lines:]
+    
+    def _restore_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        now = time.time()
+        min_minute = int(now // 60) - METRICS_MINUTE_RETENTION_MINUTES
+        min_hour = int(now // 3600) - METRICS_HOUR_RETENTION_DAYS * 24
+        with self._lock:
+            for entry in snapshot.get("series", []):
+                series = _MetricSeries(self.ring_buffer_size)
+                series.total = MetricAggregate.from_dict(entry.get("total", {}))
+                series.minutes = OrderedDict(
+                    (int(k), MetricAggregate.from_dict(v)) for k, v in entry.get("minutes", []) if int(k) >= min_minute
+                )
+                series.hours = OrderedDict(
+                    (int(k), MetricAggregate.from_dict(v)) for k, v in entry.get("hours", []) if int(k) >= min_hour
+                )
+                for data in entry.get("recent", []):
+                    record = MetricRecord(**data)
+                    self._seq += 1
+                    series.recent.append((self._seq, _record_epoch(record), record))
+                self._series[(entry["category"], entry["metric_name"])] = series
+    
+    def _snapshot_state(self) -> Dict[str, Any]:
+        """Serializable copy of all series (caller holds self._lock)"""
+        return {
+            "version": SNAPSHOT_VERSION,
+            "series": [
+                {
+                    "category": category,
+                    "metric_name": metric_name,
+                    "total": series.total.to_dict(),
+                    "minutes": [[k, agg.to_dict()] for k, agg in series.minutes.items()],
+                    "hours": [[k, agg.to_dict()] for k, agg in series.hours.items()],
+                    "recent": [asdict(record) for _, _, record in series.recent]
+                }
+                for (category, metric_name), series in self._series.items()
+            ]
+        }
+    
+    # Ingestion
+    
+    def _ingest(self, record: MetricRecord, epoch: float) -> None:
+        """Add a record to its series' ring buffer and buckets"""
+        with self._lock:
+            self._ingest_locked(record, epoch)
+    
+    def _ingest_locked(self, record: MetricRecord, epoch: float) -> None:
+        key = (record.category, record.metric_name)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _MetricSeries(self.ring_buffer_size)
+        self._seq += 1
+        series.add(self._seq, epoch, record, time.time())
+    
+    # Persistence
+    
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or not self._flusher.is_alive():
+            with self._flush_lock:
+                if (self._flusher is None or not self._flusher.is_alive()) and not self._stop_event.is_set():
+                    self._flusher = threading.Thread(target=self._flush_loop, name="metrics-flusher", daemon=True)
+                    self._flusher.start()
+    
+    def _flush_loop(self) -> None:
+        while not self._stop_event.is_set():
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            self.flush()
+    
+    def _rotate(self) -> None:
+        """Shift framework_metrics.jsonl -> .1 -> .2 ... (oldest dropped)"""
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.metrics_file}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.metrics_file}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(self.metrics_file, f"{self.metrics_file}.1")
+        else:
+            os.remove(self.metrics_file)
+        self.rotations += 1
+        logger.info(f"Rotated metrics log {self.metrics_file}")
+    
+    def flush(self, snapshot: bool = False) -> int:
+        """
+        Write pending records to the log in one batch (and the snapshot when due)
+        
+        Args:
+            snapshot: Write the aggregate snapshot even if not due yet
+        
+        Returns:
+            Number of records written
+        """
+        if not self.persist_to_file:
+            return 0
+        with self._flush_lock:
             try:
-                with open(self.metrics_file, 'a', encoding='utf-8') as f:
-                    f.write(json.dumps(asdict(record), ensure_ascii=False) + '\n')
+                size = os.path.getsize(self.metrics_file) if os.path.exists(self.metrics_file) else 0
+                with self._lock:
+                    pending, self._pending = self._pending, []
+                    lines = [json.dumps(asdict(record), ensure_ascii=False) + '\n' for record in pending]
+                    batch = ''.join(lines).encode('utf-8')
+                    rotate = size > 0 and size + len(batch) > self.max_file_bytes
+                    # Snapshot together with the records it covers, so replay starts right after them
+                    take_snapshot = snapshot or rotate or time.time() - self._last_snapshot >= METRICS_SNAPSHOT_INTERVAL_SECONDS
+                    state = self._snapshot_state() if take_snapshot else None
+                if rotate:
+                    self._rotate()
+                if batch:
+                    with open(self.metrics_file, 'ab') as f:
+                        f.write(batch)
+                        offset = f.tell()
+                    self.records_flushed += len(pending)
+                    self.flushes += 1
+                else:
+                    offset = os.path.getsize(self.metrics_file) if os.path.exists(self.metrics_file) else 0
+                if state is not None:
+                    state["log_offset"] = offset
+                    self._write_snapshot(state)
+                    self._last_snapshot = time.time()
+                return len(pending)
             except Exception as e:
-                logger.error(f"Failed to save metric record to {self.metrics_file}: {e}")
+                logger.error(f"Failed to flush metrics to {self.metrics_file}: {e}")
+                return 0
+    
+    def _write_snapshot(self, state: Dict[str, Any]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.snapshot_file))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".metrics-", suffix=".json")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.snapshot_file)
+    
+    def close(self) -> None:
+        """Stop the flusher and write everything (pending records + snapshot)"""
+        self._stop_event.set()
+        self._flush_event.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=5)
+        self.flush(snapshot=True)
     
     def record(
         self,
@@ -155,21 +610,26 @@ class UnifiedMetricsCollector:
         if isinstance(category, MetricCategory):
             category = category.value
         
+        now = datetime.now(timezone.utc)
         record = MetricRecord(
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=now.isoformat(),
             category=category,
             metric_name=metric_name,
             value=value,
             metadata=metadata or {}
         )
         
-        self._records.append(record)
-        self._update_aggregates(record)
-        self._save_record(record)
-        
-        # Keep only recent records in memory
-        if len(self._records) > self.max_in_memory_records:
-            self._records = self._records[-self.max_in_memory_records:]
+        # Aggregates and the pending log batch change together, so a snapshot taken by
+        # flush() either covers the record and its log line or neither
+        with self._lock:
+            self._ingest_locked(record, now.timestamp())
+            if self.persist_to_file:
+                self._pending.append(record)
+                pending = len(self._pending)
+        if self.persist_to_file:
+            self._ensure_flusher()
+            if pending >= METRICS_FLUSH_BATCH_SIZE:
+                self._flush_event.set()
         
         logger.debug(f"Recorded metric: {category}.{metric_name} = {value}")
     
@@ -382,6 +842,16 @@ class UnifiedMetricsCollector:
     
     # Query methods
     
+    def _matching_series(
+        self,
+        category: Optional[str],
+        metric_name: Optional[str]
+    ) -> List[Tuple[Tuple[str, str], _MetricSeries]]:
+        return [
+            (key, series) for key, series in self._series.items()
+            if (not category or key[0] == category) and (not metric_name or key[1] == metric_name)
+        ]
+    
     def get_metrics(
         self,
         category: Optional[Union[MetricCategory, str]] = None,
@@ -391,10 +861,12 @@ class UnifiedMetricsCollector:
         """
         Get aggregated metrics
         
+        Computed from pre-aggregated buckets: O(series x buckets), independent of record count.
+        
         Args:
             category: Filter by category (optional)
             metric_name: Filter by metric name (optional)
-            days: Filter by last N days (optional)
+            days: Filter by last N days (optional, hour granularity, at most the hour-bucket retention)
         
         Returns:
             Dictionary with aggregated metrics
@@ -402,93 +874,148 @@ class UnifiedMetricsCollector:
         if isinstance(category, MetricCategory):
             category = category.value
         
-        # Filter records
-        filtered_records = self._records
-        if days:
-            cutoff_time = datetime.now(timezone.utc) - timedelta(days=days)
-            filtered_records = [
-                r for r in filtered_records
-                if datetime.fromisoformat(r.timestamp) >= cutoff_time
-            ]
-        
-        if category:
-            filtered_records = [r for r in filtered_records if r.category == category]
-        
-        if metric_name:
-            filtered_records = [r for r in filtered_records if r.metric_name == metric_name]
-        
-        # Aggregate
+        cutoff = time.time() - days * 86400 if days else None
         result = {
-            "total_records": len(filtered_records),
+            "total_records": 0,
             "counters": {},
             "gauges": {},
             "histograms": {},
-            "recent_records": [asdict(r) for r in filtered_records[-10:]]
+            "recent_records": []
         }
+        recent = []
+        
+        with self._lock:
+            for (cat, name), series in self._matching_series(category, metric_name):
+                if cutoff is None:
+                    agg = series.total
+                else:
+                    cutoff_hour = int(cutoff // 3600)
+                    agg = MetricAggregate()
+                    for hour, bucket in series.hours.items():
+                        if hour >= cutoff_hour:
+                            agg.merge(bucket)
+                
+                result["total_records"] += agg.records
+                if agg.counter_count:
+                    result["counters"].setdefault(cat, {})[name] = agg.counter
+                if agg.gauge_count:
+                    result["gauges"].setdefault(cat, {})[name] = agg.gauge_summary()
+                if agg.hist_count:
+                    result["histograms"].setdefault(cat, {})[name] = agg.histogram_summary()
+                
+                for seq, epoch, record in list(series.recent)[-10:]:
+                    if cutoff is None or epoch >= cutoff:
+                        recent.append((seq, record))
+        
+        recent.sort(key=lambda item: item[0])
+        result["recent_records"] = [asdict(record) for _, record in recent[-10:]]
+        return result
+    
+    def get_timeseries(
+        self,
+        category: Union[MetricCategory, str],
+        metric_name: str,
+        resolution: str = "hour",
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get per-bucket aggregates of one series (for dashboards)
         
-        # Calculate aggregates from filtered records
-        category_counters = defaultdict(lambda: defaultdict(int))
-        category_gauges = defaultdict(lambda: defaultdict(list))
-        category_histograms = defaultdict(lambda: defaultdict(list))
-        
-        for record in filtered_records:
-            cat = record.category
-            name = record.metric_name
-            
-            if isinstance(record.value, int):
-                category_counters[cat][name] += record.value
-            elif isinstance(record.value, float):
-                category_gauges[cat][name].append(record.value)
-            elif isinstance(record.value, list) and all(isinstance(v, (int, float)) for v in record.value):
-                category_histograms[cat][name].extend(record.value)
-        
-        # Convert to final format
-        for cat, counters in category_counters.items():
-            result["counters"][cat] = dict(counters)
-        
-        for cat, gauges in category_gauges.items():
-            result["gauges"][cat] = {
-                name: {
-                    "latest": values[-1] if values else None,
-                    "avg": sum(values) / len(values) if values else None,
-                    "min": min(values) if values else None,
-                    "max": max(values) if values else None
-                }
-                for name, values in gauges.items()
-            }
+        Args:
+            category: Metric category
+            metric_name: Metric name
+            resolution: "minute" or "hour"
+            limit: Only the last N buckets (optional)
         
-        for cat, histograms in category_histograms.items():
-            result["histograms"][cat] = {
-                name: {
-                    "count": len(values),
-                    "avg": sum(values) / len(values) if values else None,
-                    "min": min(values) if values else None,
-                    "max": max(values) if values else None,
-                    "p50": sorted(values)[len(values) // 2] if values else None,
-                    "p95": sorted(values)[int(len(values) * 0.95)] if values else None,
-                    "p99": sorted(values)[int(len(values) * 0.99)] if values else None
+        Returns:
+            List of {"start", "records", and counter/gauge/histogram summaries} oldest first
+        """
+        if isinstance(category, MetricCategory):
+            category = category.value
+        if resolution not in ("minute", "hour"):
+            raise ValueError(f"Unknown resolution: {resolution}")
+        bucket_seconds = 60 if resolution == "minute" else 3600
+        
+        with self._lock:
+            series = self._series.get((category, metric_name))
+            if series is None:
+                return []
+            buckets = list((series.minutes if resolution == "minute" else series.hours).items())
+            if limit:
+                buckets = buckets[-limit:]
+            points = []
+            for key, agg in buckets:
+                point: Dict[str, Any] = {
+                    "start": datetime.fromtimestamp(key * bucket_seconds, tz=timezone.utc).isoformat(),
+                    "records": agg.records
                 }
-                for name, values in histograms.items()
-            }
+                if agg.counter_count:
+                    point["counter"] = agg.counter
+                if agg.gauge_count:
+                    point["gauge"] = agg.gauge_summary()
+                if agg.hist_count:
+                    point["histogram"] = agg.histogram_summary()
+                points.append(point)
+        return points
+    
+    def get_records(
+        self,
+        category: Optional[Union[MetricCategory, str]] = None,
+        metric_name: Optional[str] = None,
+        days: Optional[int] = None
+    ) -> List[MetricRecord]:
+        """
+        Get recent raw records from the ring buffers (oldest first)
         
-        return result
+        Args:
+            category: Filter by category (optional)
+            metric_name: Filter by metric name (optional)
+            days: Filter by last N days (optional)
+        """
+        if isinstance(category, MetricCategory):
+            category = category.value
+        cutoff = time.time() - days * 86400 if days else None
+        with self._lock:
+            records = [
+                (seq, record)
+                for _, series in self._matching_series(category, metric_name)
+                for seq, epoch, record in series.recent
+                if cutoff is None or epoch >= cutoff
+            ]
+        records.sort(key=lambda item: item[0])
+        return [record for _, record in records]
+    
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """Get series/bucket counts and flusher counters"""
+        with self._lock:
+            return {
+                "series": len(self._series),
+                "recent_records": sum(len(s.recent) for s in self._series.values()),
+                "minute_buckets": sum(len(s.minutes) for s in self._series.values()),
+                "hour_buckets": sum(len(s.hours) for s in self._series.values()),
+                "pending": len(self._pending),
+                "records_flushed": self.records_flushed,
+                "flushes": self.flushes,
+                "rotations": self.rotations
+            }
     
     def reset(self) -> None:
         """Reset all metrics (for testing)"""
-        self._records.clear()
-        self._counters.clear()
-        self._gauges.clear()
-        self._histograms.clear()
+        with self._lock:
+            self._series.clear()
+            self._pending.clear()
 
 
 # Global instance
 _metrics_collector: Optional[UnifiedMetricsCollector] = None
+_metrics_collector_lock = threading.Lock()
 
 
 def get_metrics_collector() -> UnifiedMetricsCollector:
     """Get global unified metrics collector instance"""
     global _metrics_collector
     if _metrics_collector is None:
-        _metrics_collector = UnifiedMetricsCollector()
+        with _metrics_collector_lock:
+            if _metrics_collector is None:
+                _metrics_collector = UnifiedMetricsCollector()
     return _metrics_collector
-
@@ -167,28 +167,24 @@ class TaskTracker:
         Returns:
             List of TaskRecord objects
         """
-        # Get from metrics system
-        metrics = self.metrics.get_metrics(MetricCategory.SYSTEM, days=days)
-        
-        # Extract task_end records
+        # Extract task_end records from the metrics system
         task_records = []
-        for record in self.metrics._records:
-            if record.category == MetricCategory.SYSTEM.value and record.metric_name == "task_end":
-                value = record.value
-                if isinstance(value, dict):
-                    # Reconstruct TaskRecord from metrics
-                    task_records.append(TaskRecord(
-                        task_id=value.get("task_id", ""),
-                        task_type="",  # Will be filled from task_start
-                        complexity="",
-                        size=0,
-                        estimated_time_minutes=value.get("estimated_time_minutes"),
-                        actual_time_minutes=value.get("actual_time_minutes", 0),
-                        accuracy_ratio=value.get("accuracy_ratio", 0),
-                        confidence=0.5,
-                        timestamp=record.timestamp,
-                        metadata=record.metadata or {}
-                    ))
+        for record in self.metrics.get_records(MetricCategory.SYSTEM, "task_end", days=days):
+            value = record.value
+            if isinstance(value, dict):
+                # Reconstruct TaskRecord from metrics
+                task_records.append(TaskRecord(
+                    task_id=value.get("task_id", ""),
+                    task_type="",  # Will be filled from task_start
+                    complexity="",
+                    size=0,
+                    estimated_time_minutes=value.get("estimated_time_minutes"),
+                    actual_time_minutes=value.get("actual_time_minutes", 0),
+                    accuracy_ratio=value.get("accuracy_ratio", 0),
+                    confidence=0.5,
+                    timestamp=record.timestamp,
+                    metadata=record.metadata or {}
+                ))
         
         # Filter
         if task_type:
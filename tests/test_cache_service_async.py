@@ -0,0 +1,81 @@
+"""
+Tests for the async CacheService API
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.services import cache_service as cache_service_module
+from backend.services.cache_service import CacheService
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    monkeypatch.setattr(cache_service_module, "REDIS_AVAILABLE", False)
+    return CacheService()
+
+
+class TestAsyncCacheService:
+    """Test suite for aget/amget/aset on CacheService"""
+
+    async def test_memory_roundtrip(self, memory_cache):
+        """Test async set/get against the in-memory backend"""
+        await memory_cache.aset("k1", {"response": "hi"}, ttl_seconds=60)
+
+        assert await memory_cache.aget("k1") == {"response": "hi"}
+        assert await memory_cache.amget(["k1", "missing"]) == [{"response": "hi"}, None]
+        assert memory_cache.get("k1") == {"response": "hi"}
+
+    async def test_redis_mget_single_round_trip(self, memory_cache):
+        """Test amget issues one MGET and decodes JSON values"""
+        async_client = MagicMock()
+        async_client.mget = AsyncMock(return_value=[json.dumps({"a": 1}), None])
+        memory_cache.redis_client = MagicMock()
+        memory_cache._get_async_client = lambda: async_client
+
+        values = await memory_cache.amget(["a", "b"])
+
+        assert values == [{"a": 1}, None]
+        async_client.mget.assert_awaited_once_with(["a", "b"])
+        assert memory_cache.get_stats()["hits"] == 1
+
+    async def test_redis_error_falls_back_to_memory(self, memory_cache):
+        """Test a Redis failure disables Redis and serves from memory"""
+        memory_cache._memory_set("k", "cached", 60)
+        async_client = MagicMock()
+        async_client.mget = AsyncMock(side_effect=ConnectionError("redis down"))
+        memory_cache.redis_client = MagicMock()
+        memory_cache._get_async_client = lambda: async_client
+
+        assert await memory_cache.aget("k") == "cached"
+        assert memory_cache.redis_client is None
+
+
+class TestAsyncRedisCacheService:
+    """Test suite for the async API of RedisCacheService"""
+
+    async def test_aget_aset_use_redis_client(self, monkeypatch):
+        """Test aget/aset go through the blocking client off the event loop"""
+        from backend.services import redis_cache as redis_cache_module
+
+        monkeypatch.setattr(redis_cache_module, "REDIS_AVAILABLE", False)
+        service = redis_cache_module.RedisCacheService()
+        service.enabled = True
+        service.redis_client = MagicMock()
+        service.redis_client.get.return_value = json.dumps([0.1, 0.2])
+
+        assert await service.aget_embedding("hello") == [0.1, 0.2]
+        assert await service.aset("k", {"a": 1}, ttl=30) is True
+        service.redis_client.setex.assert_called_once_with("k", 30, json.dumps({"a": 1}))
+
+    async def test_disabled_service_short_circuits(self, monkeypatch):
+        """Test the async API is a no-op when Redis is not available"""
+        from backend.services import redis_cache as redis_cache_module
+
+        monkeypatch.setattr(redis_cache_module, "REDIS_AVAILABLE", False)
+        service = redis_cache_module.RedisCacheService()
+
+        assert await service.aget("k") is None
+        assert await service.aset("k", 1) is False
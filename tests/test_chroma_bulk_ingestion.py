@@ -0,0 +1,71 @@
+"""
+Tests for batched document ingestion in ChromaClient
+"""
+
+from unittest.mock import MagicMock, patch
+
+from backend.vector_db import chroma_client as chroma_module
+from backend.vector_db.chroma_client import ChromaClient
+
+
+def _make_client(embedding_service):
+    """Build a ChromaClient without touching the on-disk database"""
+    client = ChromaClient.__new__(ChromaClient)
+    client.embedding_service = embedding_service
+    client.knowledge_collection = MagicMock()
+    client.conversation_collection = MagicMock()
+    return client
+
+
+class TestBulkIngestion:
+    """Test suite for add_knowledge / add_conversation bulk path"""
+
+    def test_add_knowledge_encodes_once_and_inserts_in_chunks(self):
+        """Test one batched encode call and chunked collection inserts"""
+        embedding_service = MagicMock()
+        embedding_service.batch_encode.side_effect = lambda docs, batch_size=None: [[float(i)] for i in range(len(docs))]
+        client = _make_client(embedding_service)
+
+        documents = [f"doc {i}" for i in range(5)]
+        metadatas = [{"source": "test"} for _ in documents]
+        ids = [f"id_{i}" for i in range(5)]
+
+        with patch.object(chroma_module, "DEFAULT_INSERT_BATCH_SIZE", 2):
+            success = client.add_knowledge(documents, metadatas, ids, batch_size=8)
+
+        assert success is True
+        embedding_service.batch_encode.assert_called_once_with(documents, batch_size=8)
+        embedding_service.encode_text.assert_not_called()
+
+        calls = client.knowledge_collection.add.call_args_list
+        assert [len(call.kwargs["ids"]) for call in calls] == [2, 2, 1]
+        assert calls[2].kwargs["ids"] == ["id_4"]
+        assert calls[2].kwargs["embeddings"] == [[4.0]]
+
+    def test_add_conversation_cleans_metadata(self):
+        """Test None metadata values are dropped before bulk insert"""
+        embedding_service = MagicMock()
+        embedding_service.batch_encode.return_value = [[0.1], [0.2]]
+        client = _make_client(embedding_service)
+
+        success = client.add_conversation(
+            documents=["hi", "hello"],
+            metadatas=[{"user": "a", "session": None}, {"user": "b"}],
+            ids=["c1", "c2"]
+        )
+
+        assert success is True
+        call = client.conversation_collection.add.call_args
+        metadatas = call.kwargs["metadatas"]
+        assert [m["user"] for m in metadatas] == ["a", "b"]
+        assert "session" not in metadatas[0]
+        assert all(m["token_count"] >= 1 for m in metadatas)
+
+    def test_add_knowledge_without_embedding_service(self):
+        """Test fallback lets ChromaDB embed documents itself"""
+        client = _make_client(None)
+
+        success = client.add_knowledge(["doc"], [{"source": "test"}], ["id_0"])
+
+        assert success is True
+        assert "embeddings" not in client.knowledge_collection.add.call_args.kwargs
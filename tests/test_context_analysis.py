@@ -0,0 +1,65 @@
+"""
+Tests for shared context document analysis
+"""
+
+from backend.validators.context_analysis import ContextAnalysisCache, build_ngrams, extract_keywords
+from backend.validators.evidence_overlap import EvidenceOverlap, ngram_overlap, ngram_set_overlap
+
+
+class TestContextAnalysisCache:
+    """Test suite for ContextAnalysisCache"""
+
+    def test_documents_are_analyzed_once(self):
+        """Test repeated documents reuse the same analysis and n-gram set"""
+        cache = ContextAnalysisCache(max_entries=10)
+        doc = "StillMe is a transparent learning system built on RAG"
+
+        first = cache.analyze([doc])[0]
+        ngrams = first.ngrams()
+        second = cache.analyze([doc])[0]
+
+        assert second is first
+        assert second.ngrams() is ngrams
+        assert cache.get_stats()["hits"] == 1
+
+    def test_lru_eviction(self):
+        """Test least recently used documents are evicted at capacity"""
+        cache = ContextAnalysisCache(max_entries=2)
+        a = cache.get("doc a")
+        cache.get("doc b")
+        cache.get("doc a")
+        cache.get("doc c")
+
+        assert cache.get("doc a") is a
+        assert cache.get_stats()["entries"] == 2
+        assert cache.get_stats()["misses"] == 3
+
+    def test_keywords_match_citation_relevance_rules(self):
+        """Test keywords are lowercase, >= 3 chars and exclude stop words"""
+        analysis = ContextAnalysisCache().get("The RAG pipeline uses ChromaDB for retrieval")
+
+        assert analysis.keywords == extract_keywords("the rag pipeline uses chromadb for retrieval")
+        assert "the" not in analysis.keywords
+        assert "chromadb" in analysis.keywords
+
+
+class TestPrecomputedOverlap:
+    """Test precomputed n-gram overlap matches ngram_overlap"""
+
+    def test_set_overlap_matches_text_overlap(self):
+        """Test ngram_set_overlap gives the same score as ngram_overlap"""
+        answer = "the quick brown fox jumps over the lazy dog"
+        doc = "a quick brown fox jumps over a sleeping cat"
+
+        assert ngram_set_overlap(build_ngrams(answer.split()), build_ngrams(doc.split())) == ngram_overlap(answer, doc)
+
+    def test_validator_uses_cached_documents(self):
+        """Test EvidenceOverlap result is unchanged when documents come from the cache"""
+        validator = EvidenceOverlap(threshold=0.1)
+        doc = "machine learning is a subset of artificial intelligence"
+
+        first = validator.run("machine learning is a subset of AI", [doc])
+        second = validator.run("machine learning is a subset of AI", [doc])
+
+        assert first.passed is True
+        assert second.passed is True
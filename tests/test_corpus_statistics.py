@@ -0,0 +1,136 @@
+"""
+Tests for the corpus-statistics service used by PromotionManager scoring
+"""
+
+import numpy as np
+import pytest
+
+from backend.learning.corpus_statistics import CorpusStatistics
+from backend.learning.promotion_manager import PromotionManager
+
+
+class FakeCollection:
+    """Minimal ChromaDB collection: get() by ids or by page"""
+
+    def __init__(self):
+        self.docs = {}
+
+    def add(self, doc_id, content, embedding):
+        self.docs[doc_id] = (content, embedding)
+
+    def get(self, ids=None, include=None, limit=None, offset=0):
+        selected = list(self.docs) if ids is None else [i for i in ids if i in self.docs]
+        if ids is None and limit is not None:
+            selected = selected[offset:offset + limit]
+        result = {"ids": selected}
+        if include and "documents" in include:
+            result["documents"] = [self.docs[i][0] for i in selected]
+        if include and "embeddings" in include:
+            result["embeddings"] = np.array([self.docs[i][1] for i in selected]) if selected else None
+        return result
+
+
+class FakeChromaClient:
+    def __init__(self):
+        self.knowledge_collection = FakeCollection()
+
+
+def _cluster_embedding(rng, cluster, dim=8):
+    base = np.zeros(dim)
+    base[cluster] = 1.0
+    return (base + rng.normal(scale=0.05, size=dim)).tolist()
+
+
+@pytest.fixture
+def client():
+    rng = np.random.default_rng(0)
+    chroma = FakeChromaClient()
+    for i in range(40):
+        chroma.knowledge_collection.add(
+            f"doc_{i}",
+            f"neural network training {'quantum' if i < 4 else 'transformer'} models",
+            _cluster_embedding(rng, i % 4)
+        )
+    return chroma
+
+
+class TestCorpusStatistics:
+    """Test suite for CorpusStatistics"""
+
+    def test_rarity_from_document_frequencies(self, client):
+        """Test keywords in every document score low and unseen keywords score high"""
+        stats = CorpusStatistics(path=None, num_centroids=4)
+        stats.refresh(client)
+
+        common = stats.rarity_score("neural network training")
+        uncommon = stats.rarity_score("quantum")
+        unseen = stats.rarity_score("photosynthesis chlorophyll")
+
+        assert common == pytest.approx(0.0, abs=0.05)
+        assert common < uncommon < unseen
+        assert unseen == pytest.approx(1.0)
+        assert CorpusStatistics(path=None).rarity_score("anything") is None
+
+    def test_novelty_against_centroids(self, client):
+        """Test embeddings near a cluster are less novel than out-of-distribution ones"""
+        stats = CorpusStatistics(path=None, num_centroids=4)
+        stats.refresh(client)
+        in_cluster = np.eye(8)[2]
+        out_of_distribution = np.eye(8)[7]
+
+        scores = stats.novelty_scores([in_cluster, out_of_distribution])
+
+        assert scores[0] < 0.05
+        assert scores[1] > 0.9
+        assert stats.novelty_score(out_of_distribution) == pytest.approx(scores[1])
+
+    def test_refresh_is_incremental_and_persisted(self, client, tmp_path):
+        """Test refresh only fetches new documents and the state survives a reload"""
+        path = str(tmp_path / "corpus_stats.json")
+        stats = CorpusStatistics(path=path, num_centroids=4)
+        assert stats.refresh(client)["added"] == 40
+
+        client.knowledge_collection.add("doc_new", "quantum photonics", np.eye(8)[0].tolist())
+        result = stats.refresh(client)
+
+        assert result == {"added": 1, "removed": 0, "rebuilt": False, "documents": 41}
+        reloaded = CorpusStatistics(path=path, num_centroids=4)
+        assert reloaded.num_documents == 41
+        assert reloaded.document_frequency["quantum"] == 5
+        assert reloaded.rarity_score("photonics") == pytest.approx(stats.rarity_score("photonics"))
+        assert reloaded.novelty_score(np.eye(8)[1]) == pytest.approx(stats.novelty_score(np.eye(8)[1]))
+
+    def test_removed_documents_trigger_rebuild(self, client):
+        """Test deletions beyond the rebuild fraction recompute the statistics"""
+        stats = CorpusStatistics(path=None, num_centroids=4)
+        stats.refresh(client)
+        for i in range(4):
+            del client.knowledge_collection.docs[f"doc_{i}"]
+
+        assert stats.refresh(client)["rebuilt"] is False
+        assert stats.document_frequency["quantum"] == 4
+
+        for i in range(4, 20):
+            del client.knowledge_collection.docs[f"doc_{i}"]
+        result = stats.refresh(client)
+
+        assert result["rebuilt"] is True
+        assert stats.num_documents == 20
+        assert stats.document_frequency["quantum"] == 0
+
+
+class TestPromotionManagerCorpusScoring:
+    """Test PromotionManager rarity/novelty use the corpus statistics"""
+
+    def test_scores_use_corpus_statistics(self, client):
+        """Test rarity/novelty come from corpus statistics, with the old defaults when empty"""
+        stats = CorpusStatistics(path=None, num_centroids=4)
+        stats.refresh(client)
+        manager = PromotionManager(db_path=":memory:", corpus_stats=stats)
+
+        assert manager.calculate_rarity_score("photosynthesis") == pytest.approx(1.0)
+        assert manager.calculate_novelty_score(np.eye(8)[7].tolist()) > 0.9
+
+        empty = PromotionManager(db_path=":memory:", corpus_stats=CorpusStatistics(path=None))
+        assert empty.calculate_novelty_score([0.1, 0.2]) == 0.5
+        assert empty.calculate_rarity_score("unique words only") == pytest.approx(1.0)
@@ -0,0 +1,106 @@
+"""
+Tests for the SQLite-backed DocumentUsageTracker
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.learning.document_usage_tracker import DocumentUsageTracker
+
+
+def _docs(*sources):
+    return [
+        {"id": f"doc_{i}", "metadata": {"source": source, "title": f"Title {i}"}, "similarity": 0.5 + i / 10}
+        for i, source in enumerate(sources)
+    ]
+
+
+class TestDocumentUsageTracker:
+    """Test suite for DocumentUsageTracker storage and retention aggregates"""
+
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        return DocumentUsageTracker(usage_file=str(tmp_path / "document_usage.jsonl"))
+
+    def test_retention_metrics_from_aggregates(self, tracker):
+        """Test per-source metrics are computed from the maintained aggregates"""
+        tracker.record_batch_usage("q1", _docs("arxiv", "rss", "arxiv"), response_confidence=0.8, validation_passed=True)
+        tracker.record_usage("q2", "doc_9", "arxiv", similarity_score=0.9, validation_passed=False)
+
+        metrics = tracker.calculate_retention_metrics(days=30)
+
+        assert metrics["arxiv"]["total_used"] == 3
+        assert metrics["arxiv"]["avg_similarity"] == pytest.approx((0.5 + 0.7 + 0.9) / 3)
+        assert metrics["arxiv"]["avg_confidence"] == pytest.approx(0.8)
+        assert metrics["arxiv"]["validation_pass_rate"] == pytest.approx(2 / 3)
+        assert metrics["rss"]["total_used"] == 1
+        assert tracker.get_source_retention_rates(days=30) == {"arxiv": 0.0, "rss": 0.0}
+
+    def test_retention_window_excludes_old_records(self, tracker):
+        """Test records before the window (partial first day included) are not counted"""
+        now = datetime.now(timezone.utc)
+        tracker._insert_records([
+            tracker._make_record("old", "d1", "arxiv", None, True, None, None, None,
+                                 timestamp=(now - timedelta(days=10)).isoformat()),
+            tracker._make_record("edge", "d2", "arxiv", None, True, None, None, None,
+                                 timestamp=(now - timedelta(days=2, hours=-1)).isoformat()),
+            tracker._make_record("new", "d3", "arxiv", None, True, None, None, None),
+        ])
+
+        assert tracker.calculate_retention_metrics(days=2)["arxiv"]["total_used"] == 2
+        assert tracker.calculate_retention_metrics(days=30)["arxiv"]["total_used"] == 3
+
+    def test_batch_usage_is_one_transaction(self, tracker):
+        """Test record_batch_usage writes all documents through a single insert call"""
+        calls = []
+        original = tracker._insert_records
+        tracker._insert_records = lambda records: (calls.append(len(records)), original(records))
+
+        tracker.record_batch_usage("q", _docs("a", "b", "c", "d"))
+
+        assert calls == [4]
+        assert tracker.count_records() == 4
+
+    def test_get_records_filters_by_time_and_source(self, tracker):
+        """Test get_records range and source substring filters"""
+        tracker.record_batch_usage("q", _docs("https://arxiv.org/x", "https://rss.example.com"))
+        start = datetime.now(timezone.utc) - timedelta(minutes=1)
+
+        records = tracker.get_records(start, datetime.now(timezone.utc), source_contains="arxiv")
+
+        assert [r.doc_id for r in records] == ["doc_0"]
+        assert tracker.get_records(end_time=start) == []
+
+    def test_legacy_jsonl_imported_once(self, tmp_path):
+        """Test the old JSONL log is imported on first start only"""
+        usage_file = tmp_path / "document_usage.jsonl"
+        with open(usage_file, "w", encoding="utf-8") as f:
+            for i in range(3):
+                f.write(json.dumps({
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "query": "q",
+                    "doc_id": f"d{i}",
+                    "source": "wiki"
+                }) + "\n")
+
+        assert DocumentUsageTracker(usage_file=str(usage_file)).count_records() == 3
+        tracker = DocumentUsageTracker(usage_file=str(usage_file))
+
+        assert tracker.count_records() == 3
+        assert tracker.calculate_retention_metrics(days=1)["wiki"]["total_used"] == 3
+
+    def test_old_records_pruned_but_aggregates_kept(self, tmp_path):
+        """Test raw records past retention are deleted while daily aggregates remain"""
+        tracker = DocumentUsageTracker(usage_file=str(tmp_path / "usage.jsonl"), retention_days=5)
+        old = (datetime.now(timezone.utc) - timedelta(days=20)).isoformat()
+        tracker._insert_records([tracker._make_record("q", "d1", "arxiv", None, True, None, None, None, timestamp=old)])
+
+        tracker._prune()
+
+        assert tracker.count_records() == 0
+        assert tracker.calculate_retention_metrics(days=30)["arxiv"]["total_used"] == 1
+        with sqlite3.connect(tracker.db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM source_daily_usage").fetchone()[0] == 1
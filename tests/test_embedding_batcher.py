@@ -0,0 +1,94 @@
+"""
+Tests for the query embedding micro-batcher
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.vector_db.embedding_batcher import EmbeddingMicroBatcher
+
+
+def _make_service():
+    """Embedding service stub whose batch_encode maps each text to [len(text)]"""
+    service = MagicMock()
+    service.get_cached_embedding.return_value = None
+    service.batch_encode.side_effect = lambda texts, batch_size=None: [[float(len(t))] for t in texts]
+    return service
+
+
+class TestEmbeddingMicroBatcher:
+    """Test suite for EmbeddingMicroBatcher"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_one_encode(self):
+        """Test queries arriving within the wait window are encoded in one call"""
+        service = _make_service()
+        batcher = EmbeddingMicroBatcher(service, max_wait_ms=200, max_batch_size=8)
+
+        results = await asyncio.gather(
+            batcher.encode_async("a"),
+            batcher.encode_async("bb"),
+            batcher.encode_async("ccc"),
+        )
+
+        assert results == [[1.0], [2.0], [3.0]]
+        assert service.batch_encode.call_count == 1
+        assert batcher.get_stats()["queries"] == 3
+
+    def test_max_batch_size_splits_batches(self):
+        """Test no batch exceeds max_batch_size"""
+        service = _make_service()
+        batcher = EmbeddingMicroBatcher(service, max_wait_ms=100, max_batch_size=2)
+
+        futures = [batcher.submit(text) for text in ["a", "bb", "ccc", "dddd"]]
+        results = [future.result(timeout=5) for future in futures]
+
+        assert results == [[1.0], [2.0], [3.0], [4.0]]
+        assert all(len(call.args[0]) <= 2 for call in service.batch_encode.call_args_list)
+        assert batcher.get_stats()["max_batch_size_observed"] <= 2
+
+    def test_duplicate_queries_encoded_once(self):
+        """Test identical queries in one window share a slot and results are cached"""
+        service = _make_service()
+        batcher = EmbeddingMicroBatcher(service, max_wait_ms=100, max_batch_size=8)
+
+        futures = [batcher.submit("same") for _ in range(3)]
+        results = [future.result(timeout=5) for future in futures]
+
+        assert results == [[4.0]] * 3
+        assert service.batch_encode.call_args.args[0] == ["same"]
+        service.cache_embedding.assert_called_once_with("same", [4.0])
+
+    def test_cache_hit_skips_queue(self):
+        """Test cached queries resolve immediately without encoding"""
+        service = _make_service()
+        service.get_cached_embedding.return_value = [0.5]
+        batcher = EmbeddingMicroBatcher(service)
+
+        assert batcher.encode("cached") == [0.5]
+        service.batch_encode.assert_not_called()
+
+    def test_encode_error_propagates_to_all_callers(self):
+        """Test a failed batch raises in every waiting caller"""
+        service = _make_service()
+        service.batch_encode.side_effect = RuntimeError("model unavailable")
+        batcher = EmbeddingMicroBatcher(service, max_wait_ms=100)
+
+        errors = []
+
+        def call():
+            try:
+                batcher.encode("x", timeout=5)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        threads = [threading.Thread(target=call) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == ["model unavailable", "model unavailable"]
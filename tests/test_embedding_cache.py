@@ -0,0 +1,65 @@
+"""
+Tests for the in-memory query embedding LRU cache
+"""
+
+from backend.vector_db.embeddings import EmbeddingLRUCache
+
+# 4-dim float32 vector = 16 bytes
+VECTOR_BYTES = 16
+
+
+class TestEmbeddingLRUCache:
+    """Test suite for EmbeddingLRUCache"""
+
+    def test_get_returns_fresh_list(self):
+        """Test hits return a new list each time so callers can mutate it"""
+        cache = EmbeddingLRUCache(max_bytes=VECTOR_BYTES * 4)
+        cache.put("a", [0.5, 0.25, 0.0, 1.0])
+
+        first = cache.get("a")
+        first[0] = 99.0
+
+        assert cache.get("a") == [0.5, 0.25, 0.0, 1.0]
+
+    def test_stores_float32(self):
+        """Test entries are stored compactly as float32"""
+        cache = EmbeddingLRUCache(max_bytes=VECTOR_BYTES * 4)
+        cache.put("a", [0.1, 0.2, 0.3, 0.4])
+
+        assert cache.get_stats()["bytes"] == VECTOR_BYTES
+
+    def test_evicts_least_recently_used(self):
+        """Test eviction removes the least recently used entry, not the oldest inserted"""
+        cache = EmbeddingLRUCache(max_bytes=VECTOR_BYTES * 2)
+        cache.put("a", [1.0, 0.0, 0.0, 0.0])
+        cache.put("b", [0.0, 1.0, 0.0, 0.0])
+        cache.get("a")  # "a" becomes most recently used
+        cache.put("c", [0.0, 0.0, 1.0, 0.0])
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_hit_miss_counters(self):
+        """Test hit/miss counters and hit rate"""
+        cache = EmbeddingLRUCache(max_bytes=VECTOR_BYTES * 4)
+        cache.put("a", [1.0, 0.0, 0.0, 0.0])
+
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["entries"] == 1
+
+    def test_replacing_entry_keeps_byte_count(self):
+        """Test re-putting a key does not double count its bytes"""
+        cache = EmbeddingLRUCache(max_bytes=VECTOR_BYTES * 4)
+        cache.put("a", [1.0, 0.0, 0.0, 0.0])
+        cache.put("a", [0.0, 1.0, 0.0, 0.0])
+
+        assert cache.get_stats()["bytes"] == VECTOR_BYTES
+        assert len(cache) == 1
@@ -11,6 +11,7 @@ from datetime import datetime
 
 from backend.external_data import (
     ExternalDataOrchestrator,
+    ExternalDataCache,
     detect_external_data_intent,
     ExternalDataIntent
 )
@@ -196,6 +197,102 @@ class TestOrchestrator:
             assert result2 is not None
             assert result2.cached
 
+    
+    @staticmethod
+    def _mock_provider(ttl: int, delay: float = 0.0):
+        """Mock weather provider whose fetch takes `delay` seconds"""
+        mock_provider = Mock()
+        mock_provider.get_provider_name.return_value = "Open-Meteo"
+        mock_provider.supports.return_value = True
+        mock_provider.get_cache_key.return_value = "Open-Meteo:weather:hanoi"
+        mock_provider.get_cache_ttl.return_value = ttl
+        
+        async def fetch(intent_type, params):
+            await asyncio.sleep(delay)
+            return ExternalDataResult(
+                data={"location": "Hanoi", "temperature": 25},
+                source="Open-Meteo",
+                timestamp=datetime.utcnow(),
+                cached=False,
+                success=True
+            )
+        
+        mock_provider.fetch = AsyncMock(side_effect=fetch)
+        return mock_provider
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_fetch(self):
+        """Test concurrent requests for the same intent make a single provider call"""
+        orchestrator = ExternalDataOrchestrator()
+        orchestrator.cache._cache_service = None  # In-memory cache only
+        intent = ExternalDataIntent(type="weather", params={"location": "Hanoi"}, confidence=0.9)
+        mock_provider = self._mock_provider(ttl=60, delay=0.05)
+        
+        with patch.object(orchestrator, '_find_provider', return_value=mock_provider):
+            results = await asyncio.gather(*[orchestrator.route(intent) for _ in range(5)])
+        
+        assert mock_provider.fetch.call_count == 1
+        assert all(r is not None and r.success for r in results)
+        assert orchestrator.get_stats()["fetches"]["coalesced"] == 4
+    
+    @pytest.mark.asyncio
+    async def test_stale_result_served_while_refreshing(self):
+        """Test an expired result is returned immediately and refreshed in the background"""
+        orchestrator = ExternalDataOrchestrator()
+        orchestrator.cache._cache_service = None  # In-memory cache only
+        intent = ExternalDataIntent(type="weather", params={"location": "Hanoi"}, confidence=0.9)
+        mock_provider = self._mock_provider(ttl=0, delay=0.05)
+        
+        with patch.object(orchestrator, '_find_provider', return_value=mock_provider):
+            first = await orchestrator.route(intent)
+            assert not first.cached
+            
+            stale = await orchestrator.route(intent)
+            assert stale.cached
+            assert mock_provider.fetch.call_count == 1  # Refresh still running
+            
+            await asyncio.sleep(0.1)
+        
+        assert mock_provider.fetch.call_count == 2
+        assert orchestrator.get_stats()["stale_served"] == 1
+
+
+class TestExternalDataCache:
+    """Test ExternalDataCache expiry and eviction"""
+    
+    @staticmethod
+    def _result():
+        return ExternalDataResult(data={}, source="test", timestamp=datetime.utcnow(), cached=False, success=True)
+    
+    def test_evicts_soonest_expiring_entry(self):
+        """Test eviction at capacity removes the entry with the lowest expiry time"""
+        cache = ExternalDataCache()
+        cache._cache_service = None
+        cache._max_size = 3
+        cache.set("long", self._result(), ttl=300)
+        cache.set("short", self._result(), ttl=10)
+        cache.set("medium", self._result(), ttl=100)
+        # Overwriting refreshes the expiry; the old heap record must be ignored
+        cache.set("short", self._result(), ttl=500)
+        
+        cache.set("new", self._result(), ttl=50)
+        
+        assert cache.get("medium") is None
+        assert all(cache.get(key) is not None for key in ("long", "short", "new"))
+    
+    def test_stale_window(self):
+        """Test expired entries are only returned by get_entry, flagged stale"""
+        cache = ExternalDataCache(stale_ttl=60)
+        cache._cache_service = None
+        cache.set("weather", self._result(), ttl=0)
+        
+        assert cache.get("weather") is None
+        result, is_stale = cache.get_entry("weather")
+        assert is_stale and result.cached
+        
+        cache.stale_ttl = 0
+        assert cache.get_entry("weather") is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,49 @@
+"""
+Tests for the shared LLM HTTP client pool
+"""
+
+from backend.api.utils.http_client_pool import HTTPClientPool
+
+
+class TestHTTPClientPool:
+    """Test suite for HTTPClientPool"""
+
+    async def test_same_origin_reuses_client(self):
+        """Test calls to one API origin share a single long-lived client"""
+        pool = HTTPClientPool()
+
+        async with pool.client("https://api.deepseek.com/v1/chat/completions") as first:
+            pass
+        async with pool.client("https://api.deepseek.com/v1/other") as second:
+            assert pool.get_stats()["in_flight"]["https://api.deepseek.com"] == 1
+
+        assert first is second
+        assert not first.is_closed
+        stats = pool.get_stats()
+        assert stats["clients_created"] == 1
+        assert stats["requests"]["https://api.deepseek.com"] == 2
+        assert stats["in_flight"]["https://api.deepseek.com"] == 0
+        await pool.aclose()
+
+    async def test_distinct_origins_and_timeouts(self):
+        """Test different origins or timeouts get separate clients"""
+        pool = HTTPClientPool()
+
+        deepseek = pool.get_client("https://api.deepseek.com/v1/chat/completions", timeout=60.0)
+        openai = pool.get_client("https://api.openai.com/v1/chat/completions", timeout=60.0)
+        rewrite = pool.get_client("https://api.deepseek.com/v1/chat/completions", timeout=5.0)
+
+        assert len({id(deepseek), id(openai), id(rewrite)}) == 3
+        await pool.aclose()
+
+    async def test_aclose_closes_clients(self):
+        """Test shutdown closes pooled clients and a later call gets a fresh one"""
+        pool = HTTPClientPool()
+        client = pool.get_client("https://api.openai.com")
+
+        await pool.aclose()
+
+        assert client.is_closed
+        assert pool.get_stats()["clients"] == 0
+        assert pool.get_client("https://api.openai.com") is not client
+        await pool.aclose()
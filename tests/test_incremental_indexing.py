@@ -0,0 +1,240 @@
+"""
+Tests for incremental codebase and git history indexing
+"""
+
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+chromadb = pytest.importorskip("chromadb")
+
+from backend.services.codebase_indexer import CodebaseIndexer
+from backend.services.git_history_retriever import GitHistoryRetriever
+
+
+def _chroma_client(tmp_path, *collections):
+    client = chromadb.EphemeralClient()
+    for name in collections:
+        try:
+            client.delete_collection(name)
+        except Exception:
+            pass
+    return SimpleNamespace(client=client, persist_directory=str(tmp_path / "vector_db"))
+
+
+def _embedding_service():
+    service = MagicMock()
+    service.encode_text.side_effect = lambda text: [0.1, 0.2, 0.3]
+    service.batch_encode.side_effect = lambda texts, **kwargs: [[0.1, 0.2, 0.3] for _ in texts]
+    return service
+
+
+def _embedded_count(service):
+    return service.encode_text.call_count + sum(
+        len(call.args[0]) for call in service.batch_encode.call_args_list
+    )
+
+
+def _large_module(body_b: str) -> str:
+    """Module over 500 lines, so it is chunked per function"""
+    padding = "\n".join(f"# filler line {i}" for i in range(520))
+    return f"def func_a():\n    return 1\n\n{padding}\n\ndef func_b():\n    {body_b}\n"
+
+
+class TestIncrementalCodebaseIndexer:
+    """Test suite for incremental CodebaseIndexer runs"""
+
+    @pytest.fixture
+    def indexer(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "pkg").mkdir()
+        indexer = CodebaseIndexer(_chroma_client(tmp_path, "stillme_codebase"), _embedding_service())
+        indexer.index_directories = ["pkg"]
+        return indexer
+
+    def test_unchanged_codebase_embeds_nothing(self, indexer, tmp_path):
+        """Test a second run without changes skips every file"""
+        (tmp_path / "pkg" / "small.py").write_text("def hello():\n    return 'hi'\n")
+        (tmp_path / "pkg" / "large.py").write_text(_large_module("return 2"))
+
+        first = indexer.index_codebase()
+        embedded_before = _embedded_count(indexer.embedding_service)
+        second = indexer.index_codebase()
+
+        assert first["chunks_created"] == 3
+        assert second["incremental"] is True
+        assert second["chunks_created"] == 0
+        assert second["files_unchanged"] == 2
+        assert _embedded_count(indexer.embedding_service) == embedded_before
+        assert indexer.codebase_collection.count() == 3
+
+    def test_only_changed_chunk_is_reembedded(self, indexer, tmp_path):
+        """Test editing one function re-embeds only that function's chunk"""
+        large = tmp_path / "pkg" / "large.py"
+        large.write_text(_large_module("return 2"))
+        indexer.index_codebase()
+
+        large.write_text(_large_module("return 3"))
+        stats = indexer.index_codebase()
+
+        assert stats["chunks_created"] == 1
+        assert stats["chunks_unchanged"] == 1
+        document = indexer.codebase_collection.get(ids=[f"{large}::function:func_b"])["documents"][0]
+        assert "return 3" in document
+
+    def test_removed_symbols_and_files_are_deleted(self, indexer, tmp_path):
+        """Test chunks of deleted functions and deleted files are removed"""
+        large = tmp_path / "pkg" / "large.py"
+        small = tmp_path / "pkg" / "small.py"
+        large.write_text(_large_module("return 2"))
+        small.write_text("x = 1\n")
+        indexer.index_codebase()
+
+        large.write_text(_large_module("return 2").replace("def func_a():\n    return 1\n", ""))
+        small.unlink()
+        stats = indexer.index_codebase()
+
+        assert stats["files_removed"] == 1
+        assert stats["chunks_deleted"] == 2
+        assert indexer.codebase_collection.get(include=[])["ids"] == [f"{large}::function:func_b"]
+
+    def test_first_run_removes_chunks_without_manifest_entry(self, indexer, tmp_path):
+        """Test legacy line-range chunks are cleaned up when no manifest exists"""
+        (tmp_path / "pkg" / "small.py").write_text("x = 1\n")
+        indexer.codebase_collection.add(
+            ids=["pkg/small.py:1-1"], embeddings=[[0.1, 0.2, 0.3]], documents=["x = 1"]
+        )
+
+        stats = indexer.index_codebase()
+
+        assert stats["incremental"] is False
+        assert "pkg/small.py:1-1" not in indexer.codebase_collection.get(include=[])["ids"]
+        assert indexer.codebase_collection.count() == 1
+
+
+class TestPipelinedCodebaseIndexer:
+    """Test suite for the parse -> embed -> write indexing pipeline"""
+
+    @pytest.fixture
+    def indexer(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "pkg").mkdir()
+        indexer = CodebaseIndexer(_chroma_client(tmp_path, "stillme_codebase"), _embedding_service())
+        indexer.index_directories = ["pkg"]
+        return indexer
+
+    def test_embedding_batches_span_files(self, indexer, tmp_path):
+        """Test chunks of many small files are packed into full embedding batches"""
+        for i in range(5):
+            (tmp_path / "pkg" / f"mod{i}.py").write_text(f"def f{i}():\n    return {i}\n")
+        indexer.embed_batch_size = 2
+
+        stats = indexer.index_codebase()
+
+        batch_sizes = [len(call.args[0]) for call in indexer.embedding_service.batch_encode.call_args_list]
+        assert sorted(batch_sizes) == [2, 2]
+        assert indexer.embedding_service.encode_text.call_count == 1
+        assert stats["chunks_created"] == 5
+        assert indexer.codebase_collection.count() == 5
+
+    def test_process_pool_parsing(self, indexer, tmp_path, monkeypatch):
+        """Test files parsed in worker processes are indexed like inline-parsed files"""
+        monkeypatch.setattr("backend.services.codebase_indexer.MIN_FILES_FOR_PROCESS_POOL", 2)
+        for i in range(3):
+            (tmp_path / "pkg" / f"mod{i}.py").write_text(f"def f{i}():\n    return {i}\n")
+        indexer.parse_workers = 2
+
+        stats = indexer.index_codebase()
+
+        assert stats["files_indexed"] == 3
+        assert indexer.codebase_collection.count() == 3
+
+    def test_progress_and_failed_writes(self, indexer, tmp_path):
+        """Test progress is reported and files whose embedding failed are retried next run"""
+        (tmp_path / "pkg" / "a.py").write_text("x = 1\n")
+        indexer.embedding_service.encode_text.side_effect = RuntimeError("model unavailable")
+
+        stats = indexer.index_codebase()
+        progress = indexer.get_index_progress()
+
+        assert stats["files_failed"] == 1
+        assert progress["running"] is False
+        assert progress["files_total"] == 1
+        assert progress["files_parsed"] == 1
+        assert progress["last_run"]["files_failed"] == 1
+
+        indexer.embedding_service.encode_text.side_effect = lambda text: [0.1, 0.2, 0.3]
+        assert indexer.index_codebase()["chunks_created"] == 1
+
+
+    def test_non_blocking_run_skips_while_indexing(self, indexer, tmp_path):
+        """Test a non-blocking run returns None instead of waiting for a run in progress"""
+        (tmp_path / "pkg" / "a.py").write_text("x = 1\n")
+
+        with indexer._index_lock:
+            assert indexer.index_codebase(blocking=False) is None
+            assert indexer.start_background_index() is False
+
+        assert indexer.index_codebase(blocking=False)["chunks_created"] == 1
+
+class TestIncrementalGitHistory:
+    """Test suite for incremental GitHistoryRetriever.index_commits"""
+
+    @staticmethod
+    def _commit(repo: Path, name: str):
+        (repo / name).write_text(name)
+        subprocess.run(["git", "add", name], cwd=repo, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-q", "-m", f"Add {name}"], cwd=repo, check=True, capture_output=True)
+
+    def test_only_new_commits_are_appended(self, tmp_path, monkeypatch):
+        """Test a re-run appends commits made since the last indexed one"""
+        for var, value in {"GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@t", "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@t"}.items():
+            monkeypatch.setenv(var, value)
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+        self._commit(repo, "a.txt")
+        self._commit(repo, "b.txt")
+
+        embedding_service = _embedding_service()
+        retriever = GitHistoryRetriever(
+            _chroma_client(tmp_path, "stillme_git_history"), embedding_service, repo_path=str(repo)
+        )
+
+        first = retriever.index_commits()
+        assert first["count"] == 2
+
+        assert retriever.index_commits()["status"] == "up_to_date"
+
+        self._commit(repo, "c.txt")
+        third = retriever.index_commits()
+
+        assert third["status"] == "success"
+        assert third["count"] == 1
+        assert third["total"] == 3
+        assert len(embedding_service.batch_encode.call_args_list[-1].args[0]) == 1
+
+    def test_new_commits_beyond_limit_are_all_appended(self, tmp_path, monkeypatch):
+        """Test more than `limit` new commits are paged through instead of dropping the oldest"""
+        for var, value in {"GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@t", "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@t"}.items():
+            monkeypatch.setenv(var, value)
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+        self._commit(repo, "a.txt")
+
+        retriever = GitHistoryRetriever(
+            _chroma_client(tmp_path, "stillme_git_history"), _embedding_service(), repo_path=str(repo)
+        )
+        assert retriever.index_commits(limit=2)["count"] == 1
+
+        for name in ("b.txt", "c.txt", "d.txt", "e.txt", "f.txt"):
+            self._commit(repo, name)
+        result = retriever.index_commits(limit=2)
+
+        assert result["count"] == 5
+        assert result["total"] == 6
+        assert retriever.index_commits(limit=2)["status"] == "up_to_date"
@@ -263,3 +263,63 @@ class TestLearningScheduler:
         assert scheduler.interval_hours == 8
         assert scheduler.auto_add_to_rag is False
 
+
+
+class TestLearningSchedulerBulkRAG:
+    """Test suite for the staged bulk RAG write path"""
+    
+    @pytest.fixture
+    def rag_retrieval(self):
+        """Create mock RAG retrieval with batched APIs"""
+        rag = Mock()
+        rag.find_existing_links = Mock(return_value={"https://example.com/old"})
+        rag.embedding_service.batch_encode = Mock(side_effect=lambda texts: [[float(i)] for i in range(len(texts))])
+        rag.check_semantic_duplicates_batch = Mock(side_effect=lambda contents, embeddings=None, similarity_threshold=0.95: [
+            content == "near duplicate summary" for content in contents
+        ])
+        rag.add_learning_contents = Mock(side_effect=lambda contents, **kwargs: [f"knowledge_{i}" for i in range(len(contents))])
+        return rag
+    
+    def test_add_entries_to_rag_batches_all_stages(self, rag_retrieval):
+        """Test one call per stage and correct history statuses"""
+        scheduler = LearningScheduler(rss_fetcher=Mock(spec=RSSFetcher), rag_retrieval=rag_retrieval)
+        entries = [
+            {"title": "Old", "link": "https://example.com/old", "summary": "already stored", "source": "feed"},
+            {"title": "New", "link": "https://example.com/new", "summary": "fresh summary", "source": "feed"},
+            {"title": "Repeat", "link": "https://example.com/new", "summary": "fresh summary", "source": "feed"},
+            {"title": "Near", "link": "https://example.com/near", "summary": "near duplicate summary", "source": "feed"},
+        ]
+        history_items = []
+        
+        added = scheduler._add_entries_to_rag(entries, history_items)
+        
+        assert added == 1
+        rag_retrieval.find_existing_links.assert_called_once()
+        rag_retrieval.embedding_service.batch_encode.assert_called_once_with(["fresh summary", "near duplicate summary"])
+        rag_retrieval.add_learning_contents.assert_called_once()
+        add_kwargs = rag_retrieval.add_learning_contents.call_args.kwargs
+        assert add_kwargs["contents"] == ["fresh summary"]
+        assert add_kwargs["embeddings"] == [[0.0]]
+        
+        statuses = {item["title"]: item["status"] for item in history_items}
+        assert statuses == {
+            "Old": "Filtered: Duplicate",
+            "Repeat": "Filtered: Duplicate",
+            "Near": "Filtered: Duplicate",
+            "New": "Added to RAG",
+        }
+    
+    def test_add_entries_to_rag_records_batch_failure(self, rag_retrieval):
+        """Test a failed batch insert marks every pending entry as an error"""
+        rag_retrieval.find_existing_links.return_value = set()
+        rag_retrieval.add_learning_contents = Mock(return_value=[])
+        scheduler = LearningScheduler(rss_fetcher=Mock(spec=RSSFetcher), rag_retrieval=rag_retrieval)
+        history_items = []
+        
+        added = scheduler._add_entries_to_rag(
+            [{"title": "A", "link": "https://example.com/a", "summary": "some summary", "source": "feed"}],
+            history_items
+        )
+        
+        assert added == 0
+        assert [item["status"] for item in history_items] == ["Error: Failed to add"]
@@ -0,0 +1,162 @@
+"""
+Tests for the time-bucketed UnifiedMetricsCollector storage
+"""
+
+import json
+import random
+import threading
+
+import pytest
+
+from stillme_core.monitoring.metrics import (
+    MetricCategory,
+    QuantileSketch,
+    UnifiedMetricsCollector,
+)
+
+
+@pytest.fixture
+def metrics_file(tmp_path):
+    return str(tmp_path / "framework_metrics.jsonl")
+
+
+def _collector(metrics_file, **kwargs):
+    # Long flush interval: tests flush explicitly
+    return UnifiedMetricsCollector(metrics_file=metrics_file, flush_interval=3600, **kwargs)
+
+
+class TestQuantileSketch:
+    """Test suite for QuantileSketch"""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test sketch quantiles are close to exact quantiles"""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(0, 1) for _ in range(5000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        exact = sorted(values)
+        for q in (0.5, 0.95, 0.99):
+            expected = exact[int(q * (len(exact) - 1))]
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.03)
+
+    def test_merge_matches_single_sketch(self):
+        """Test merging per-bucket sketches equals sketching all values at once"""
+        merged, first, second = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in [-2.0, 0.0, 0.5, 1.0, 3.0]:
+            first.add(value)
+            merged.add(value)
+        for value in [4.0, 8.0, 16.0]:
+            second.add(value)
+            merged.add(value)
+
+        first.merge(second)
+
+        assert first.count == merged.count
+        for q in (0.0, 0.25, 0.5, 0.75, 1.0):
+            assert first.quantile(q) == merged.quantile(q)
+
+
+class TestUnifiedMetricsCollector:
+    """Test suite for bucketed aggregation, flushing and restore"""
+
+    def test_aggregates_match_previous_output_shape(self, metrics_file):
+        """Test counters, gauges, histograms and recent records are reported per category"""
+        collector = _collector(metrics_file)
+        collector.record_validation(passed=True, reasons=[], overlap_score=0.2)
+        collector.record_validation(passed=False, reasons=["missing_citation"], overlap_score=0.8)
+        collector.set_gauge(MetricCategory.RAG, "avg_similarity", 0.5)
+        collector.set_gauge(MetricCategory.RAG, "avg_similarity", 0.7)
+
+        metrics = collector.get_metrics(days=1)
+
+        assert metrics["counters"]["validation"]["total_validations"] == 2
+        assert metrics["counters"]["validation"]["failed_count"] == 1
+        assert metrics["gauges"]["rag"]["avg_similarity"]["latest"] == 0.7
+        assert metrics["gauges"]["rag"]["avg_similarity"]["avg"] == pytest.approx(0.6)
+        overlap = metrics["histograms"]["validation"]["overlap_scores"]
+        assert overlap["count"] == 2
+        assert overlap["min"] == 0.2 and overlap["max"] == 0.8
+        assert len(metrics["recent_records"]) == 10
+        assert metrics["recent_records"][-1]["metric_name"] == "avg_similarity"
+        assert collector.get_metrics(category=MetricCategory.RAG)["total_records"] == 2
+
+    def test_records_flushed_in_batches(self, metrics_file):
+        """Test records reach the log only when flushed, in one write"""
+        collector = _collector(metrics_file)
+        for _ in range(5):
+            collector.increment_counter(MetricCategory.SYSTEM, "requests")
+
+        assert collector.get_storage_stats()["pending"] == 5
+        assert collector.flush() == 5
+
+        with open(metrics_file, encoding="utf-8") as f:
+            assert len(f.readlines()) == 5
+        assert collector.get_storage_stats()["flushes"] == 1
+
+    def test_restore_from_snapshot_and_log_tail(self, metrics_file):
+        """Test a new collector restores aggregates from snapshot plus records logged after it"""
+        collector = _collector(metrics_file)
+        collector.increment_counter(MetricCategory.SYSTEM, "requests", 3)
+        collector.flush(snapshot=True)
+        collector.increment_counter(MetricCategory.SYSTEM, "requests", 4)
+        collector.flush()
+
+        restored = _collector(metrics_file)
+
+        assert restored.get_metrics()["counters"]["system"]["requests"] == 7
+        assert len(restored.get_records(MetricCategory.SYSTEM, "requests")) == 2
+
+    def test_flush_during_record_does_not_double_count(self, metrics_file, monkeypatch):
+        """Test a snapshot taken while a record is being ingested never counts it twice after reload"""
+        collector = _collector(metrics_file)
+        original_ingest = collector._ingest_locked
+        flushers = []
+
+        def ingest_then_flush(record, epoch):
+            original_ingest(record, epoch)
+            # Try to snapshot right after the aggregates changed, before the record is queued for the log
+            flusher = threading.Thread(target=collector.flush, kwargs={"snapshot": True})
+            flusher.start()
+            flusher.join(timeout=0.2)
+            flushers.append(flusher)
+
+        monkeypatch.setattr(collector, "_ingest_locked", ingest_then_flush)
+        collector.increment_counter(MetricCategory.SYSTEM, "x")
+        for flusher in flushers:
+            flusher.join()
+        collector.flush()
+
+        assert _collector(metrics_file).get_metrics()["counters"]["system"]["x"] == 1
+
+    def test_legacy_log_without_snapshot_loads_tail(self, metrics_file):
+        """Test a log written before snapshots existed is loaded from its tail only"""
+        with open(metrics_file, "w", encoding="utf-8") as f:
+            for i in range(50):
+                f.write(json.dumps({
+                    "timestamp": "2026-01-01T00:00:00+00:00",
+                    "category": "system",
+                    "metric_name": "requests",
+                    "value": i,
+                    "metadata": {}
+                }) + "\n")
+
+        collector = _collector(metrics_file, max_in_memory_records=10)
+
+        records = collector.get_records(MetricCategory.SYSTEM, "requests")
+        assert [r.value for r in records] == list(range(40, 50))
+
+    def test_log_rotation(self, metrics_file):
+        """Test the log is rotated when a flush would exceed max_file_bytes"""
+        collector = _collector(metrics_file, max_file_bytes=400, backup_count=2)
+        for _ in range(3):
+            for _ in range(4):
+                collector.increment_counter(MetricCategory.SYSTEM, "requests")
+            collector.flush()
+
+        stats = collector.get_storage_stats()
+        assert stats["rotations"] >= 1
+        with open(f"{metrics_file}.1", encoding="utf-8") as f:
+            assert f.readlines()
+        assert _collector(metrics_file).get_metrics()["counters"]["system"]["requests"] == 12
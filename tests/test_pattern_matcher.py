@@ -0,0 +1,76 @@
+"""
+Tests for the compiled keyword/regex matchers used by the query detectors
+"""
+
+import random
+import re
+
+from backend.core.pattern_matcher import KeywordSet, RegexSet
+
+
+class TestKeywordSet:
+    """Test suite for KeywordSet"""
+
+    def test_matches_substring_semantics(self):
+        """Test search/find_all agree with `kw in text` on random texts, overlaps included"""
+        keywords = ["learn", "learning", "earn", "how", "how do you learn", "ai", "a", "your.*system"]
+        matcher = KeywordSet(keywords)
+        rng = random.Random(3)
+        alphabet = ["learn", "ing", "how", " do you ", "ai", "e", "your system", "your.*system", " "]
+
+        for _ in range(500):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 6)))
+            expected = [k for k in keywords if k in text]
+            assert matcher.search(text) == bool(expected)
+            assert matcher.find_all(text) == expected
+            assert matcher.first(text) == (expected[0] if expected else None)
+
+    def test_regex_characters_are_literal(self):
+        """Test keywords like "your.*system" only match literally, as `in` did"""
+        matcher = KeywordSet(["your.*system", "c++"])
+
+        assert not matcher.search("your memory system")
+        assert matcher.find_all("is c++ your.*system?") == ["your.*system", "c++"]
+
+    def test_empty(self):
+        """Test empty keyword lists and texts never match"""
+        assert not KeywordSet([]).search("anything")
+        assert KeywordSet(["a"]).find_all("") == []
+
+
+class TestRegexSet:
+    """Test suite for RegexSet"""
+
+    PATTERNS = [r"\bstillme\b", r"who\s+validates?\s+.*validation", r"^roleplay\s*:", r"(?P<word>echo)\s+chamber"]
+
+    def test_matches_per_pattern_search(self):
+        """Test the combined scan agrees with searching each pattern on its own"""
+        matcher = RegexSet(self.PATTERNS, re.IGNORECASE)
+        texts = [
+            "What is StillMe?", "who validates the validation chain", "roleplay: pirate",
+            "let's roleplay: pirate", "an echo chamber of StillMe", "nothing here", ""
+        ]
+
+        for text in texts:
+            expected = [p for p in self.PATTERNS if re.search(p, text, re.IGNORECASE)]
+            assert matcher.search(text) == bool(expected)
+            assert matcher.find_all(text) == expected
+            assert matcher.first(text) == (expected[0] if expected else None)
+            assert matcher.count(text) == len(expected)
+
+    def test_first_match_in_declaration_order(self):
+        """Test first_match returns the first listed pattern, not the leftmost match"""
+        matcher = RegexSet([r"chamber", r"echo"])
+
+        match = matcher.first_match("echo chamber")
+
+        assert match.re.pattern == "chamber"
+        assert match.start() == 5
+
+    def test_uncombinable_patterns_fall_back(self):
+        """Test duplicate group names and backreferences are checked one pattern at a time"""
+        matcher = RegexSet([r"(?P<x>a)b", r"(?P<x>c)d", r"(\w)\1"])
+
+        assert matcher.find_all("cd") == [r"(?P<x>c)d"]
+        assert matcher.find_all("xyy") == [r"(\w)\1"]
+        assert not matcher.search("xyz")
@@ -0,0 +1,100 @@
+"""
+Tests for the matrix-based SemanticPhilosophicalDetector
+"""
+
+import numpy as np
+import pytest
+
+from backend.core.philosophical_detector_semantic import SemanticPhilosophicalDetector
+from backend.core.query_profile import start_query_profile
+
+
+class FakeEmbeddingService:
+    """Deterministic embeddings that count encode calls"""
+
+    def __init__(self, model_name="fake-model", dim=16):
+        self.model_name = model_name
+        self.dim = dim
+        self.encode_calls = 0
+        self.batch_calls = 0
+
+    def _vector(self, text):
+        rng = np.random.default_rng(sum(ord(c) for c in text) + len(text))
+        return rng.normal(size=self.dim).tolist()
+
+    def encode_text(self, text):
+        self.encode_calls += 1
+        return self._vector(text)
+
+    def batch_encode(self, texts, batch_size=None):
+        self.batch_calls += 1
+        return [self._vector(t) for t in texts]
+
+
+EXAMPLES = ["Do you have consciousness?", "Can a system evaluate itself?", "What is free will really?"]
+
+
+def _loop_reference(service, question):
+    """The previous per-example cosine loop"""
+    q = service._vector(question)
+    best, best_example = 0.0, None
+    for example in EXAMPLES:
+        e = service._vector(example)
+        similarity = np.dot(q, e) / (np.linalg.norm(q) * np.linalg.norm(e))
+        if similarity > best:
+            best, best_example = similarity, example
+    return best, best_example
+
+
+class TestSemanticPhilosophicalDetector:
+    """Test suite for SemanticPhilosophicalDetector"""
+
+    def test_matches_per_example_cosine_loop(self):
+        """Test the matrix product finds the same best example and score as the old loop"""
+        service = FakeEmbeddingService()
+        detector = SemanticPhilosophicalDetector(service, similarity_threshold=0.0, examples=EXAMPLES, cache_dir=None)
+
+        for question in ["Do you have consciousness?", "What is the capital of France?", "Is the universe infinite?"]:
+            expected_score, expected_example = _loop_reference(service, question)
+            _, score, example = detector.detect(question)
+            assert score == pytest.approx(expected_score, abs=1e-5)
+            assert example == expected_example
+
+        assert service.batch_calls == 1
+
+    def test_matrix_persisted_per_model(self, tmp_path):
+        """Test exemplars are embedded once and reloaded from disk by a new detector"""
+        service = FakeEmbeddingService()
+        first = SemanticPhilosophicalDetector(service, examples=EXAMPLES, cache_dir=str(tmp_path))
+        first.detect("Do you have consciousness?")
+
+        second = SemanticPhilosophicalDetector(service, examples=EXAMPLES, cache_dir=str(tmp_path))
+        assert second.detect("Do you have consciousness?")[0] is True
+        assert service.batch_calls == 1
+
+        other_model = FakeEmbeddingService(model_name="other/model")
+        SemanticPhilosophicalDetector(other_model, examples=EXAMPLES, cache_dir=str(tmp_path)).detect("Do you have consciousness?")
+        assert other_model.batch_calls == 1
+        assert len(list(tmp_path.glob("*.npy"))) == 2
+
+    def test_reuses_request_query_embedding(self):
+        """Test the question embedding comes from the request's QueryProfile"""
+        service = FakeEmbeddingService()
+        detector = SemanticPhilosophicalDetector(service, examples=EXAMPLES, cache_dir=None)
+        profile = start_query_profile("Can a system evaluate itself?", warm=False)
+
+        detector.detect("Can a system evaluate itself?")
+        profile.query_embedding(service)
+
+        assert service.encode_calls == 1
+
+    def test_short_question_and_failed_init(self):
+        """Test short questions and embedding failures return no detection"""
+        class BrokenService(FakeEmbeddingService):
+            def batch_encode(self, texts, batch_size=None):
+                raise RuntimeError("model unavailable")
+
+        service = FakeEmbeddingService()
+        assert SemanticPhilosophicalDetector(service, examples=EXAMPLES, cache_dir=None).detect("why?") == (False, 0.0, None)
+        detector = SemanticPhilosophicalDetector(BrokenService(), examples=EXAMPLES, cache_dir=None)
+        assert detector.detect("Do you have consciousness?") == (False, 0.0, None)
@@ -0,0 +1,86 @@
+"""
+Tests for the prefix-stable prompt layout of UnifiedPromptBuilder
+"""
+
+from backend.identity.prompt_builder import (
+    PROMPT_LAYOUT_LEGACY,
+    PROMPT_LAYOUT_PREFIX_STABLE,
+    PromptContext,
+    UnifiedPromptBuilder,
+    insert_after_static_prefix,
+    report_final_prompt,
+)
+
+
+def _context(question, docs=None, status=None):
+    return PromptContext(
+        user_question=question,
+        detected_lang="en",
+        context={"knowledge_docs": docs} if docs else None,
+        has_reliable_context=bool(docs),
+        context_quality="high" if docs else None,
+        num_knowledge_docs=len(docs or []),
+        system_status_note=status
+    )
+
+
+class TestPromptLayout:
+    """Test suite for prompt layout modes"""
+
+    def test_prefix_is_byte_stable_across_requests(self):
+        """Test different questions, contexts and status notes share the same static prefix"""
+        builder = UnifiedPromptBuilder(layout=PROMPT_LAYOUT_PREFIX_STABLE)
+
+        first, first_report = builder.build_prompt_with_report(
+            _context("What is RAG?", docs=[{"content": "RAG is..."}], status="[System: 3 feeds failing]")
+        )
+        second, second_report = builder.build_prompt_with_report(_context("What is the capital of France?"))
+
+        assert first_report.prefix_hash == second_report.prefix_hash
+        assert first[:first_report.prefix_chars] == second[:second_report.prefix_chars]
+        assert "[System: 3 feeds failing]" not in first[:first_report.prefix_chars]
+        assert first.rstrip().endswith("User Question: What is RAG?")
+
+    def test_prefix_is_language_keyed(self):
+        """Test another language gets a different static prefix"""
+        builder = UnifiedPromptBuilder(layout=PROMPT_LAYOUT_PREFIX_STABLE)
+        vi_context = _context("RAG là gì?")
+        vi_context.detected_lang = "vi"
+
+        _, en_report = builder.build_prompt_with_report(_context("What is RAG?"))
+        _, vi_report = builder.build_prompt_with_report(vi_context)
+
+        assert en_report.prefix_hash != vi_report.prefix_hash
+
+    def test_layouts_contain_the_same_blocks(self):
+        """Test the prefix-stable layout only reorders blocks"""
+        context = _context("What is RAG?", docs=[{"content": "RAG is..."}])
+
+        legacy = UnifiedPromptBuilder(layout=PROMPT_LAYOUT_LEGACY).build_prompt(context)
+        stable = UnifiedPromptBuilder(layout=PROMPT_LAYOUT_PREFIX_STABLE).build_prompt(context)
+
+        assert sorted(legacy.split("\n")) == sorted(stable.split("\n"))
+        assert legacy != stable
+
+    def test_style_instruction_keeps_static_prefix(self):
+        """Test a per-user block goes after the static prefix and the sent prompt keeps it"""
+        builder = UnifiedPromptBuilder(layout=PROMPT_LAYOUT_PREFIX_STABLE)
+        prompt, report = builder.build_prompt_with_report(_context("What is RAG?"))
+
+        styled = insert_after_static_prefix(prompt, report, "Answer in bullet points.")
+        sent_report = report_final_prompt(styled, report)
+
+        assert styled[:report.prefix_chars] == prompt[:report.prefix_chars]
+        assert "Answer in bullet points." in styled
+        assert sent_report.prefix_hash == report.prefix_hash
+        assert sent_report.total_chars == len(styled)
+
+    def test_final_report_flags_lost_prefix(self):
+        """Test the report does not claim a prefix the sent prompt no longer starts with"""
+        builder = UnifiedPromptBuilder(layout=PROMPT_LAYOUT_PREFIX_STABLE)
+        prompt, report = builder.build_prompt_with_report(_context("What is RAG?"))
+
+        sent_report = report_final_prompt("Minimal prompt\n\n" + prompt, report)
+
+        assert sent_report.prefix_chars == 0
+        assert sent_report.layout.endswith("+prefix_lost")
@@ -0,0 +1,99 @@
+"""
+Tests for the per-request QueryProfile
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from backend.core import query_profile as query_profile_module
+from backend.core.query_profile import QueryProfile, get_query_profile, start_query_profile
+
+
+@pytest.fixture
+def counting_detectors(monkeypatch):
+    """Replace detectors with counting fakes"""
+    calls = {}
+
+    def make(name, result):
+        def detector(text):
+            calls[name] = calls.get(name, 0) + 1
+            return result
+        return detector
+
+    detectors = {
+        name: (make(name, default), default)
+        for name, (_, default) in query_profile_module.DETECTORS.items()
+    }
+    detectors["stillme"] = (make("stillme", (True, ["stillme"])), (False, []))
+    monkeypatch.setattr(query_profile_module, "DETECTORS", detectors)
+    return calls
+
+
+class TestQueryProfile:
+    """Test suite for QueryProfile"""
+
+    def test_each_detector_runs_once(self, counting_detectors):
+        """Test repeated lookups reuse the first result"""
+        profile = QueryProfile("What is StillMe?")
+
+        for _ in range(5):
+            assert profile.stillme_query == (True, ["stillme"])
+            assert profile.language == "en"
+
+        assert counting_detectors == {"stillme": 1, "language": 1}
+        assert set(profile.timings_ms) == {"stillme", "language"}
+
+    def test_match_lists_are_copies(self, counting_detectors):
+        """Test callers mutating matched keywords do not change the profile"""
+        profile = QueryProfile("What is StillMe?")
+        _, keywords = profile.stillme_query
+        keywords.append("mutated")
+
+        assert profile.stillme_query == (True, ["stillme"])
+
+    def test_warm_skips_semantic_detector(self, counting_detectors):
+        """Test the eager pass runs regex detectors but leaves the embedding-based one lazy"""
+        profile = start_query_profile("Is free will real?")
+
+        assert "philosophical" not in counting_detectors
+        assert counting_detectors["origin"] == 1
+        assert profile.is_philosophical is False
+        assert counting_detectors["philosophical"] == 1
+
+    def test_failing_detector_uses_default(self, monkeypatch):
+        """Test a detector exception yields its default result"""
+        monkeypatch.setitem(query_profile_module.DETECTORS, "origin", (Mock(side_effect=RuntimeError("boom")), (False, [])))
+
+        assert QueryProfile("hi").origin_query == (False, [])
+
+    def test_current_profile_shared_only_for_same_text(self, counting_detectors):
+        """Test get_query_profile returns the request's profile only for its own message"""
+        profile = start_query_profile("What is StillMe?")
+
+        assert get_query_profile("What is StillMe?") is profile
+        assert get_query_profile("Another question") is not profile
+
+    def test_profile_is_request_scoped(self, counting_detectors):
+        """Test concurrent requests each see their own profile"""
+        async def request(message):
+            start_query_profile(message)
+            await asyncio.sleep(0)
+            return get_query_profile(message).text
+
+        async def main():
+            return await asyncio.gather(request("first"), request("second"))
+
+        assert asyncio.run(main()) == ["first", "second"]
+
+    def test_validator_threads_see_request_profile(self, counting_detectors):
+        """Test validators run on the pool read the submitting request's profile"""
+        from backend.validators.executor import ValidatorExecutor
+
+        executor = ValidatorExecutor(max_workers=1, max_queue=1)
+        profile = start_query_profile("What is StillMe?")
+
+        future = executor.try_submit(get_query_profile, "What is StillMe?")
+
+        assert future.result(timeout=5) is profile
@@ -0,0 +1,58 @@
+"""
+Tests for Max Marginal Relevance selection in RAG retrieval
+"""
+
+from backend.vector_db.rag_retrieval import mmr_select
+
+
+def _doc(doc_id, similarity, embedding=None, content=""):
+    doc = {"id": doc_id, "similarity": similarity, "content": content}
+    if embedding is not None:
+        doc["embedding"] = embedding
+    return doc
+
+
+class TestMMRSelect:
+    """Test suite for mmr_select"""
+
+    def test_returns_all_when_under_limit(self):
+        """Test documents are returned unchanged when there are not more than limit"""
+        docs = [_doc("a", 0.9), _doc("b", 0.8)]
+
+        assert mmr_select(docs, limit=3, lambda_param=0.7) == docs
+
+    def test_embedding_diversity_skips_near_duplicate(self):
+        """Test near-duplicate embeddings are penalized in favor of a diverse document"""
+        docs = [
+            _doc("a", 0.90, [1.0, 0.0, 0.0]),
+            _doc("a_dup", 0.89, [0.99, 0.01, 0.0]),
+            _doc("b", 0.80, [0.0, 1.0, 0.0]),
+        ]
+
+        selected = mmr_select(docs, limit=2, lambda_param=0.5)
+
+        assert [doc["id"] for doc in selected] == ["a", "b"]
+
+    def test_pure_relevance_when_lambda_is_one(self):
+        """Test lambda=1.0 selects purely by similarity"""
+        docs = [
+            _doc("c", 0.70, [0.0, 0.0, 1.0]),
+            _doc("a", 0.90, [1.0, 0.0, 0.0]),
+            _doc("a_dup", 0.89, [1.0, 0.0, 0.0]),
+        ]
+
+        selected = mmr_select(docs, limit=2, lambda_param=1.0)
+
+        assert [doc["id"] for doc in selected] == ["a", "a_dup"]
+
+    def test_lexical_fallback_without_embeddings(self):
+        """Test word-overlap similarity is used when any candidate lacks an embedding"""
+        docs = [
+            _doc("a", 0.90, content="stillme validators check citations"),
+            _doc("a_dup", 0.89, content="stillme validators check citations"),
+            _doc("b", 0.80, [0.0, 1.0], content="weather forecast for hanoi"),
+        ]
+
+        selected = mmr_select(docs, limit=2, lambda_param=0.5)
+
+        assert [doc["id"] for doc in selected] == ["a", "b"]
@@ -0,0 +1,89 @@
+"""
+Tests for the pooled knowledge retrieval planner
+"""
+
+from unittest.mock import MagicMock
+
+from backend.vector_db.retrieval_planner import RetrievalPlanner, metadata_matches
+
+
+def _doc(doc_id, **metadata):
+    return {"id": doc_id, "content": doc_id, "metadata": metadata, "distance": 0.1}
+
+
+def _make_client(pool):
+    client = MagicMock()
+    client.search_knowledge.side_effect = lambda query_embedding, limit, where=None, include_embeddings=False: [
+        doc for doc in pool if metadata_matches(doc["metadata"], where)
+    ][:limit]
+    return client
+
+
+class TestMetadataMatches:
+    """Test suite for client-side where-filter evaluation"""
+
+    def test_equality_and_or(self):
+        """Test field equality and $or/$contains clauses"""
+        where = {"$or": [{"source": "foundational"}, {"tags": {"$contains": "CRITICAL_FOUNDATION"}}]}
+
+        assert metadata_matches({"source": "foundational"}, where)
+        assert metadata_matches({"tags": "a,CRITICAL_FOUNDATION,b"}, where)
+        assert not metadata_matches({"source": "rss", "tags": "news"}, where)
+
+    def test_in_and_and(self):
+        """Test $in and $and clauses"""
+        where = {"$and": [{"source": {"$in": ["a", "b"]}}, {"importance": {"$gte": 0.5}}]}
+
+        assert metadata_matches({"source": "a", "importance": 0.7}, where)
+        assert not metadata_matches({"source": "a", "importance": 0.2}, where)
+        assert not metadata_matches({"source": "c", "importance": 0.9}, where)
+
+
+class TestRetrievalPlanner:
+    """Test suite for RetrievalPlanner"""
+
+    def test_subqueries_share_one_backend_query(self):
+        """Test filtered and unfiltered sub-queries are served from the shared pool"""
+        pool = [
+            _doc("crit_1", source="CRITICAL_FOUNDATION"),
+            _doc("rss_1", source="rss"),
+            _doc("crit_2", source="CRITICAL_FOUNDATION"),
+            _doc("rss_2", source="rss"),
+        ]
+        client = _make_client(pool)
+        planner = RetrievalPlanner(client, [0.1, 0.2], pool_size=4)
+
+        critical = planner.search(limit=2, where={"source": "CRITICAL_FOUNDATION"})
+        normal = planner.search(limit=4)
+
+        assert [d["id"] for d in critical] == ["crit_1", "crit_2"]
+        assert [d["id"] for d in normal] == ["crit_1", "rss_1", "crit_2", "rss_2"]
+        assert planner.get_stats() == {"subqueries": 2, "backend_queries": 1, "served_from_pool": 2}
+
+    def test_exhausted_pool_answers_sparse_filter(self):
+        """Test a short pool (collection exhausted) is complete for any filter"""
+        client = _make_client([_doc("rss_1", source="rss")])
+        planner = RetrievalPlanner(client, [0.1], pool_size=10)
+
+        assert planner.search(limit=1, where={"domain": "style_guide"}) == []
+        assert planner.get_stats()["backend_queries"] == 1
+
+    def test_falls_back_when_pool_cannot_prove_completeness(self):
+        """Test a filter with too few matches in a full pool issues its own query"""
+        collection = [_doc(f"rss_{i}", source="rss") for i in range(3)] + [_doc("style", domain="style_guide")]
+        client = _make_client(collection)
+        planner = RetrievalPlanner(client, [0.1], pool_size=3)
+
+        results = planner.search(limit=1, where={"domain": "style_guide"})
+
+        assert [d["id"] for d in results] == ["style"]
+        assert planner.get_stats()["backend_queries"] == 2
+
+    def test_results_are_copies(self):
+        """Test annotating a result does not leak into the pool"""
+        client = _make_client([_doc("a"), _doc("b")])
+        planner = RetrievalPlanner(client, [0.1], pool_size=5)
+
+        planner.search(limit=1)[0]["similarity"] = 0.9
+
+        assert "similarity" not in planner.search(limit=1)[0]
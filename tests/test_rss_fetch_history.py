@@ -317,3 +317,35 @@ class TestRSSFetchHistory:
         cycle_id = history.create_fetch_cycle(cycle_number=1)
         assert cycle_id > 0
 
+    
+    def test_add_fetch_items_bulk(self, history):
+        """Test bulk insert writes all items and aggregates cycle statistics"""
+        cycle_id = history.create_fetch_cycle(cycle_number=1)
+        
+        written = history.add_fetch_items(cycle_id, [
+            {"title": "A1", "source_url": "feed1", "link": "link1", "summary": "S1",
+             "status": "Added to RAG", "vector_id": "knowledge_abc"},
+            {"title": "A2", "source_url": "feed1", "link": "link2", "summary": "S2",
+             "status": "Filtered: Duplicate", "status_reason": "same link"},
+            {"title": "A3", "source_url": "feed1", "link": "link3", "summary": "S3",
+             "status": "Filtered: Low Score"},
+        ])
+        
+        assert written == 3
+        items = history.get_latest_fetch_items(limit=10)
+        assert len(items) == 3
+        
+        import sqlite3
+        conn = sqlite3.connect(history.db_path)
+        row = conn.execute("""
+            SELECT entries_fetched, entries_added, entries_filtered, entries_duplicate, entries_low_score
+            FROM rss_fetch_cycles WHERE id = ?
+        """, (cycle_id,)).fetchone()
+        conn.close()
+        assert row == (3, 1, 2, 1, 1)
+    
+    def test_add_fetch_items_empty(self, history):
+        """Test bulk insert with no items is a no-op"""
+        cycle_id = history.create_fetch_cycle(cycle_number=1)
+        
+        assert history.add_fetch_items(cycle_id, []) == 0
@@ -0,0 +1,108 @@
+"""
+Tests for the embedding-keyed semantic response cache
+"""
+
+from backend.services.semantic_response_cache import (
+    SemanticResponseCache,
+    compute_context_fingerprint,
+    compute_conversation_fingerprint
+)
+
+
+class _Version:
+    """Mutable knowledge version provider"""
+
+    def __init__(self):
+        self.value = "1"
+
+    def __call__(self):
+        return self.value
+
+
+def _make_cache(**kwargs):
+    version = _Version()
+    cache = SemanticResponseCache(version_provider=version, **kwargs)
+    return cache, version
+
+
+class TestSemanticResponseCache:
+    """Test suite for SemanticResponseCache"""
+
+    def test_paraphrase_hit(self):
+        """Test a near-identical embedding with the same context reuses the answer"""
+        cache, _ = _make_cache(threshold=0.95)
+        cache.store("what is StillMe", [1.0, 0.0, 0.0], "StillMe is...", "ctx", scope="en", confidence_score=0.9)
+
+        hit = cache.lookup([0.99, 0.05, 0.0], "ctx", scope="en")
+
+        assert hit is not None
+        assert hit["response"] == "StillMe is..."
+        assert hit["confidence_score"] == 0.9
+        assert hit["similarity"] > 0.95
+
+    def test_miss_below_threshold_or_different_context(self):
+        """Test dissimilar queries, other contexts and other scopes miss"""
+        cache, _ = _make_cache(threshold=0.95)
+        cache.store("q", [1.0, 0.0], "answer", "ctx", scope="en")
+
+        assert cache.lookup([0.0, 1.0], "ctx", scope="en") is None
+        assert cache.lookup([1.0, 0.0], "other_ctx", scope="en") is None
+        assert cache.lookup([1.0, 0.0], "ctx", scope="vi") is None
+        assert cache.get_stats()["misses"] == 3
+
+    def test_knowledge_version_bump_invalidates(self):
+        """Test entries are dropped when the knowledge version changes"""
+        cache, version = _make_cache(version_check_interval=0)
+        cache.store("q", [1.0, 0.0], "answer", "ctx")
+
+        version.value = "2"
+
+        assert cache.lookup([1.0, 0.0], "ctx") is None
+        stats = cache.get_stats()
+        assert stats["entries"] == 0
+        assert stats["invalidations"] == 1
+
+    def test_knowledge_version_read_is_throttled(self):
+        """Test the version provider is not consulted on every lookup"""
+        calls = []
+
+        def version():
+            calls.append(1)
+            return "1"
+
+        cache = SemanticResponseCache(version_provider=version, version_check_interval=60)
+        cache.store("q", [1.0, 0.0], "answer", "ctx")
+        for _ in range(5):
+            cache.lookup([1.0, 0.0], "ctx")
+
+        assert len(calls) == 1
+
+    def test_lru_eviction_at_capacity(self):
+        """Test the least recently used entry is evicted when full"""
+        cache, _ = _make_cache(max_entries=2)
+        cache.store("a", [1.0, 0.0, 0.0], "A", "ctx")
+        cache.store("b", [0.0, 1.0, 0.0], "B", "ctx")
+        cache.lookup([1.0, 0.0, 0.0], "ctx")  # "a" becomes most recently used
+        cache.store("c", [0.0, 0.0, 1.0], "C", "ctx")
+
+        assert cache.lookup([0.0, 1.0, 0.0], "ctx") is None
+        assert cache.lookup([1.0, 0.0, 0.0], "ctx")["response"] == "A"
+        assert cache.lookup([0.0, 0.0, 1.0], "ctx")["response"] == "C"
+
+    def test_context_fingerprint_is_order_independent(self):
+        """Test fingerprint depends on retrieved document ids, not their order"""
+        first = {"knowledge_docs": [{"id": "a"}, {"id": "b"}]}
+        second = {"knowledge_docs": [{"id": "b"}, {"id": "a"}]}
+
+        assert compute_context_fingerprint(first) == compute_context_fingerprint(second)
+        assert compute_context_fingerprint(first) != compute_context_fingerprint({"knowledge_docs": [{"id": "a"}]})
+        assert compute_context_fingerprint(None) == "no_context"
+
+    def test_conversation_fingerprint_separates_conversations(self):
+        """Test history and style preferences change the fingerprint"""
+        history_a = [{"role": "user", "content": "list three databases"}]
+        history_b = [{"role": "user", "content": "list three rivers"}]
+
+        assert compute_conversation_fingerprint(None, "") == "stateless"
+        assert compute_conversation_fingerprint(history_a) != compute_conversation_fingerprint(history_b)
+        assert compute_conversation_fingerprint(history_a) != compute_conversation_fingerprint(history_a, "be concise")
@@ -0,0 +1,168 @@
+"""
+Tests for single-flight coalescing of identical in-flight chat LLM calls
+"""
+
+import asyncio
+
+import pytest
+
+from backend.services.single_flight import SingleFlight, make_single_flight_key
+
+
+class TestSingleFlight:
+    """Test suite for SingleFlight"""
+
+    def test_concurrent_identical_calls_share_one_call(self):
+        """Test followers await the leader's result instead of calling again"""
+        flight = SingleFlight()
+        calls = []
+
+        async def llm_call():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        async def run():
+            return await asyncio.gather(*[flight.do("key", llm_call) for _ in range(5)])
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert [r[0] for r in results] == ["answer"] * 5
+        assert sum(1 for r in results if r[1]) == 4
+        stats = flight.get_stats()
+        assert stats["coalesced"] == 4
+        assert stats["in_flight"] == 0
+
+    def test_different_keys_and_none_key_do_not_coalesce(self):
+        """Test only identical keys share a call"""
+        flight = SingleFlight()
+        calls = []
+
+        async def llm_call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "answer"
+
+        async def run():
+            await asyncio.gather(flight.do("a", llm_call), flight.do("b", llm_call), flight.do(None, llm_call))
+
+        asyncio.run(run())
+
+        assert len(calls) == 3
+
+    def test_follower_timeout_calls_independently(self):
+        """Test a follower stops waiting after the bounded wait"""
+        flight = SingleFlight(follower_timeout=0.05)
+
+        async def slow_call():
+            await asyncio.sleep(0.3)
+            return "leader"
+
+        async def own_call():
+            return "own"
+
+        async def run():
+            leader = asyncio.ensure_future(flight.do("key", slow_call))
+            await asyncio.sleep(0)
+            follower = await flight.do("key", own_call)
+            return await leader, follower
+
+        leader_result, follower_result = asyncio.run(run())
+
+        assert leader_result == ("leader", False)
+        assert follower_result == ("own", False)
+        assert flight.get_stats()["follower_timeouts"] == 1
+
+    def test_leader_cancellation_keeps_call_for_followers(self):
+        """Test a cancelled leader does not cancel the call its followers await"""
+        flight = SingleFlight()
+
+        async def llm_call():
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        async def run():
+            leader = asyncio.ensure_future(flight.do("key", llm_call))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flight.do("key", llm_call))
+            await asyncio.sleep(0)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+        assert asyncio.run(run()) == ("answer", True)
+
+    def test_call_cancelled_when_no_waiters_left(self):
+        """Test the shared call is cancelled once every waiter has gone"""
+        flight = SingleFlight()
+        finished = []
+
+        async def llm_call():
+            await asyncio.sleep(0.2)
+            finished.append(1)
+            return "answer"
+
+        async def run():
+            leader = asyncio.ensure_future(flight.do("key", llm_call))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            await asyncio.sleep(0.3)
+
+        asyncio.run(run())
+
+        assert finished == []
+        assert flight.get_stats()["cancelled"] == 1
+
+    def test_leader_exception_propagates_to_followers(self):
+        """Test followers see the leader's error"""
+        flight = SingleFlight()
+
+        async def failing_call():
+            await asyncio.sleep(0.01)
+            raise ValueError("missing API key")
+
+        async def run():
+            return await asyncio.gather(
+                flight.do("key", failing_call), flight.do("key", failing_call), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    def test_requests_differing_only_by_api_key_do_not_coalesce(self):
+        """Test callers with different credentials never share an answer"""
+        flight = SingleFlight()
+        calls = []
+
+        def llm_call(api_key):
+            async def call():
+                calls.append(api_key)
+                await asyncio.sleep(0.05)
+                return f"answer for {api_key}"
+            return call
+
+        key_a = make_single_flight_key("llm:question", "key-a", None, False)
+        key_b = make_single_flight_key("llm:question", "key-b", None, False)
+
+        async def run():
+            return await asyncio.gather(flight.do(key_a, llm_call("key-a")), flight.do(key_b, llm_call("key-b")))
+
+        results = asyncio.run(run())
+
+        assert sorted(calls) == ["key-a", "key-b"]
+        assert results == [("answer for key-a", False), ("answer for key-b", False)]
+        assert flight.get_stats()["coalesced"] == 0
+
+    def test_single_flight_key(self):
+        """Test the key covers API key, API URL and server-key mode"""
+        base = make_single_flight_key("llm:question")
+        assert base == make_single_flight_key("llm:question", None, None, True)
+        assert make_single_flight_key("llm:question", None, "http://a", True) != base
+        assert make_single_flight_key("llm:question", None, None, False) != base
+        assert "key-a" not in make_single_flight_key("llm:question", "key-a")
+        assert make_single_flight_key(None, "key-a") is None
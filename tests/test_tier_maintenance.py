@@ -0,0 +1,133 @@
+"""
+Tests for batch tier maintenance in PromotionManager
+"""
+
+import random
+import sqlite3
+
+import pytest
+
+from backend.learning import continuum_memory as continuum_memory_module
+from backend.learning import promotion_manager as promotion_manager_module
+from backend.learning.continuum_memory import ContinuumMemory
+from backend.learning.corpus_statistics import CorpusStatistics
+from backend.learning.promotion_manager import PromotionManager
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(continuum_memory_module, "ENABLE_CONTINUUM_MEMORY", True)
+    monkeypatch.setattr(promotion_manager_module, "ENABLE_CONTINUUM_MEMORY", True)
+    path = str(tmp_path / "continuum_memory.db")
+    ContinuumMemory(db_path=path)
+    return path
+
+
+def _insert_items(db_path, items):
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO tier_metrics (item_id, tier, surprise_score, retrieval_count_7d, validator_overlap) "
+            "VALUES (?, ?, ?, ?, ?)",
+            items
+        )
+
+
+def _tiers(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return dict(conn.execute("SELECT item_id, tier FROM tier_metrics").fetchall())
+
+
+def _random_items(n, seed=7):
+    rng = random.Random(seed)
+    return [
+        (
+            f"item_{i}",
+            rng.choice(["L0", "L1", "L2", "L3"]),
+            rng.choice([0.0, 0.1, 0.5, 0.75, 0.9]),
+            rng.choice([0, 0, 3, 120]),
+            rng.choice([0.0, 0.2, 0.5, 0.85]),
+        )
+        for i in range(n)
+    ]
+
+
+class TestTierMaintenance:
+    """Test suite for PromotionManager.run_tier_maintenance"""
+
+    def test_matches_per_item_evaluation(self, db_path, tmp_path):
+        """Test batch decisions equal evaluate_and_promote, then evaluate_and_demote for unpromoted items"""
+        items = _random_items(300)
+        per_item_db = str(tmp_path / "per_item.db")
+        ContinuumMemory(db_path=per_item_db)
+        _insert_items(db_path, items)
+        _insert_items(per_item_db, items)
+
+        per_item = PromotionManager(per_item_db)
+        for item_id, *_ in items:
+            if per_item.evaluate_and_promote(item_id) is None:
+                per_item.evaluate_and_demote(item_id)
+        summary = PromotionManager(db_path).run_tier_maintenance()
+
+        assert _tiers(db_path) == _tiers(per_item_db)
+        assert summary["evaluated"] == 300
+        assert summary["promoted"] + summary["demoted"] == len(summary["transitions"]) > 0
+
+        audit_query = "SELECT item_id, from_tier, to_tier, reason FROM tier_audit ORDER BY item_id"
+        with sqlite3.connect(db_path) as batch_conn, sqlite3.connect(per_item_db) as item_conn:
+            assert batch_conn.execute(audit_query).fetchall() == item_conn.execute(audit_query).fetchall()
+
+    def test_single_connection(self, db_path, monkeypatch):
+        """Test the scan, updates and audit rows all go through one connection"""
+        _insert_items(db_path, _random_items(50))
+        connections = []
+        original_connect = sqlite3.connect
+
+        def counting_connect(*args, **kwargs):
+            connections.append(args)
+            return original_connect(*args, **kwargs)
+
+        monkeypatch.setattr(promotion_manager_module.sqlite3, "connect", counting_connect)
+        summary = PromotionManager(db_path).run_tier_maintenance()
+
+        assert len(connections) == 1
+        assert summary["promoted"] + summary["demoted"] > 0
+
+    def test_dry_run_writes_nothing(self, db_path):
+        """Test dry_run reports decisions without changing tiers or the audit log"""
+        _insert_items(db_path, [("a", "L0", 0.9, 5, 0.0)])
+
+        summary = PromotionManager(db_path).run_tier_maintenance(dry_run=True)
+
+        assert summary["transitions"][0][:3] == ("a", "L0", "L1")
+        assert _tiers(db_path) == {"a": "L0"}
+
+    def test_rescores_items_with_content(self, db_path):
+        """Test surprise is recomputed for items whose content is given, and persisted"""
+        _insert_items(db_path, [("a", "L0", 0.9, 5, 1.0), ("b", "L0", 0.9, 5, 1.0)])
+        manager = PromotionManager(db_path, corpus_stats=CorpusStatistics(path=None))
+
+        summary = manager.run_tier_maintenance(contents={"a": "common common common words"})
+
+        assert summary["rescored"] == 1
+        with sqlite3.connect(db_path) as conn:
+            scores = dict(conn.execute("SELECT item_id, surprise_score FROM tier_metrics").fetchall())
+        expected = manager.calculate_surprise_score("a", "common common common words")
+        assert scores["a"] == pytest.approx(expected)
+        assert scores["b"] == pytest.approx(0.9)
+        assert _tiers(db_path) == {"a": "L0", "b": "L1"}
+
+    def test_refreshes_usage_components_for_all_items(self, db_path):
+        """Test retrieval/overlap changes move surprise for items without content"""
+        _insert_items(db_path, [("a", "L0", 0.6, 1, 0.0)])
+        manager = PromotionManager(db_path)
+
+        first = manager.run_tier_maintenance()
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("UPDATE tier_metrics SET retrieval_count_7d = 100 WHERE item_id = 'a'")
+        second = manager.run_tier_maintenance()
+
+        assert first["refreshed"] == 1 and first["promoted"] == 0
+        with sqlite3.connect(db_path) as conn:
+            score = conn.execute("SELECT surprise_score FROM tier_metrics WHERE item_id = 'a'").fetchone()[0]
+        assert score == pytest.approx(0.6 - 0.2 * 0.01 + 0.2)
+        assert second["transitions"][0][:3] == ("a", "L0", "L1")
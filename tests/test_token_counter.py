@@ -0,0 +1,95 @@
+"""
+Tests for the shared token counting service
+"""
+
+import re
+
+from backend.services import token_counter as token_counter_module
+from backend.services.token_counter import (
+    TOKEN_COUNT_METADATA_KEY,
+    TOKENIZER_METADATA_KEY,
+    TokenCounter,
+    _heuristic_count,
+)
+
+
+class _WhitespaceTokenizer:
+    """Minimal stand-in for a HuggingFace fast tokenizer (one token per word)"""
+
+    is_fast = True
+    name_or_path = "whitespace"
+
+    def __call__(self, text, add_special_tokens=False, return_offsets_mapping=False, verbose=True):
+        spans = [match.span() for match in re.finditer(r"\S+", text)]
+        encoded = {"input_ids": list(range(len(spans)))}
+        if return_offsets_mapping:
+            encoded["offset_mapping"] = spans
+        return encoded
+
+
+class TestTokenCounter:
+    """Test suite for TokenCounter"""
+
+    def test_vietnamese_counts_higher_than_char_ratio(self):
+        """Test non-ASCII text is not undercounted like len(text) // 4"""
+        text = "Xin chào, tôi là StillMe, một hệ thống học tập minh bạch và có trách nhiệm."
+
+        assert _heuristic_count(text) > len(text) // 4
+
+    def test_counts_are_memoized(self):
+        """Test repeated counts hit the cache"""
+        counter = TokenCounter()
+        counter.count("StillMe retrieves context before answering")
+        counter.count("StillMe retrieves context before answering")
+
+        assert counter.get_stats()["cache_hits"] >= 1
+
+    def test_truncate_respects_budget(self):
+        """Test truncated text fits the budget (suffix excluded)"""
+        counter = TokenCounter()
+        text = " ".join(["knowledge"] * 200)
+
+        truncated = counter.truncate(text, 20, suffix="")
+
+        assert counter.count(truncated) <= 20
+        assert counter.truncate("short text", 20) == "short text"
+
+    def test_ingestion_metadata_is_reused_only_for_same_tokenizer(self):
+        """Test stored counts are used when the tokenizer matches"""
+        counter = TokenCounter()
+        metadata = counter.annotate_metadata("some document text", {"source": "rss"})
+
+        assert metadata["source"] == "rss"
+        assert metadata[TOKENIZER_METADATA_KEY] == counter.name
+        assert counter.document_count("ignored", {**metadata, TOKEN_COUNT_METADATA_KEY: 999}) == 999
+        assert counter.document_count("some document text", {TOKEN_COUNT_METADATA_KEY: 999, TOKENIZER_METADATA_KEY: "other"}) == metadata[TOKEN_COUNT_METADATA_KEY]
+
+    def test_hf_tokenizer_backend_counts_and_truncates(self, monkeypatch):
+        """Test the embedding model's tokenizer is used when tiktoken is unavailable"""
+        monkeypatch.setattr(token_counter_module, "TIKTOKEN_AVAILABLE", False)
+        counter = TokenCounter(hf_tokenizer=_WhitespaceTokenizer(), hf_tokenizer_name="minilm")
+
+        assert counter.name == "hf:minilm"
+        assert counter.count("one two three four") == 4
+        assert counter.truncate("one two three four", 3, suffix="") == "one two"
+
+    def test_cache_is_keyed_by_digest(self):
+        """Test memoized counts do not keep large prompts alive as cache keys"""
+        counter = TokenCounter(cache_size=2)
+        for text in ("a " * 5000, "b " * 5000, "c " * 5000):
+            counter.count(text)
+
+        assert counter.get_stats()["cache_size"] == 2
+        assert all(isinstance(key, bytes) and len(key) == 16 for key in counter._cache)
+
+    def test_registering_model_tokenizer_replaces_heuristic_counter(self, monkeypatch):
+        """Test a heuristic global counter is rebuilt once the embedding tokenizer is registered"""
+        monkeypatch.setattr(token_counter_module, "TIKTOKEN_AVAILABLE", False)
+        monkeypatch.setattr(token_counter_module, "_token_counter", None)
+        monkeypatch.setattr(token_counter_module, "_model_tokenizer", None)
+        monkeypatch.setattr(token_counter_module, "_model_tokenizer_name", None)
+
+        assert token_counter_module.get_token_counter().name == "heuristic:v1"
+        token_counter_module.register_model_tokenizer(_WhitespaceTokenizer(), "minilm")
+
+        assert token_counter_module.get_token_counter().name == "hf:minilm"
@@ -2,6 +2,9 @@
 Tests for validator chain
 """
 
+import threading
+from unittest.mock import MagicMock
+
 from backend.validators.chain import ValidatorChain
 from backend.validators.citation import CitationRequired
 from backend.validators.evidence_overlap import EvidenceOverlap
@@ -98,3 +101,173 @@ class TestValidatorChain:
         assert result.passed is True
         assert len(result.reasons) == 0
 
+
+
+class _Recorder:
+    """Validator declaring reads/writes that records the answer it was given"""
+
+    def __init__(self, reads, writes=frozenset(), suffix=None, reasons=None, event_set=None, event_wait=None):
+        self.reads = frozenset(reads)
+        self.writes = frozenset(writes)
+        self.suffix = suffix
+        self.reasons = reasons or []
+        self.event_set = event_set
+        self.event_wait = event_wait
+        self.seen = None
+
+    def run(self, answer, ctx_docs):
+        self.seen = answer
+        if self.event_set is not None:
+            self.event_set.set()
+        if self.event_wait is not None and not self.event_wait.wait(timeout=5):
+            return ValidationResult(passed=False, reasons=["not_concurrent"])
+        return ValidationResult(
+            passed=not self.reasons,
+            reasons=self.reasons,
+            patched_answer=answer + self.suffix if self.suffix else None
+        )
+
+
+class TestValidatorChainScheduling:
+    """Test suite for dependency-graph scheduling in ValidatorChain"""
+
+    def test_dependencies_from_declarations(self):
+        """Test draft-only readers don't wait for answer patches, answer readers do"""
+        from backend.validators.language import LanguageValidator
+
+        chain = ValidatorChain([
+            LanguageValidator(input_language="en"),
+            CitationRequired(),
+            EvidenceOverlap(threshold=0.01),
+            NumericUnitsBasic(),
+        ])
+
+        assert chain._dependencies[1] == frozenset({0})
+        assert chain._dependencies[2] == frozenset()
+        assert chain._dependencies[3] == frozenset()
+
+    def test_independent_validators_overlap(self):
+        """Test two independent validators run at the same time"""
+        first_started, second_started = threading.Event(), threading.Event()
+        from backend.validators.base import DRAFT_ANSWER
+
+        chain = ValidatorChain([
+            _Recorder({DRAFT_ANSWER}, event_set=first_started, event_wait=second_started),
+            _Recorder({DRAFT_ANSWER}, event_set=second_started, event_wait=first_started),
+        ])
+
+        result = chain.run("answer", [])
+
+        assert result.passed is True
+        assert "not_concurrent" not in result.reasons
+
+    def test_patches_flow_in_chain_order(self):
+        """Test answer readers see earlier patches, draft readers see the original answer"""
+        from backend.validators.base import ANSWER, DRAFT_ANSWER
+
+        first_writer = _Recorder({ANSWER}, {ANSWER}, suffix=" +a")
+        draft_reader = _Recorder({DRAFT_ANSWER})
+        second_writer = _Recorder({ANSWER}, {ANSWER}, suffix=" +b")
+        answer_reader = _Recorder({ANSWER})
+
+        result = ValidatorChain([first_writer, draft_reader, second_writer, answer_reader]).run("text", [])
+
+        assert draft_reader.seen == "text"
+        assert second_writer.seen == "text +a"
+        assert answer_reader.seen == "text +a +b"
+        assert result.patched_answer == "text +a +b"
+
+    def test_prior_reasons_wait_for_all_earlier_validators(self):
+        """Test a PRIOR_REASONS reader depends on every earlier validator"""
+        from backend.validators.base import ANSWER, DRAFT_ANSWER, PRIOR_REASONS
+
+        chain = ValidatorChain([
+            _Recorder({DRAFT_ANSWER}),
+            _Recorder({ANSWER}),
+            _Recorder({ANSWER, PRIOR_REASONS}, {ANSWER}),
+        ])
+
+        assert chain._dependencies[2] == frozenset({0, 1})
+
+    def test_early_exit_on_language_mismatch(self):
+        """Test a critical failure without patch stops the chain in chain order"""
+        from backend.validators.base import ANSWER
+
+        chain = ValidatorChain([
+            _Recorder({ANSWER}, {ANSWER}, reasons=["language_mismatch:vi"]),
+            _Recorder({ANSWER}, reasons=["should_not_be_reported"]),
+        ])
+
+        result = chain.run("answer", [])
+
+        assert result.passed is False
+        assert result.reasons == ["language_mismatch:vi"]
+
+
+class _Sleeper:
+    """Validator that blocks until released"""
+
+    reads = frozenset({"draft_answer"})
+    writes = frozenset()
+
+    def __init__(self, release, run_timeout=None):
+        self.release = release
+        if run_timeout is not None:
+            self.run_timeout = run_timeout
+
+    def run(self, answer, ctx_docs):
+        self.release.wait(timeout=5)
+        return ValidationResult(passed=True)
+
+
+class TestValidatorExecutor:
+    """Test suite for the shared validator pool"""
+
+    def test_saturated_pool_refuses_and_counts(self):
+        """Test try_submit returns None once running + queued tasks fill capacity"""
+        from backend.validators.executor import ValidatorExecutor
+
+        release = threading.Event()
+        executor = ValidatorExecutor(max_workers=1, max_queue=1)
+
+        first = executor.try_submit(release.wait, 5)
+        second = executor.try_submit(release.wait, 5)
+        third = executor.try_submit(release.wait, 5)
+
+        assert first is not None and second is not None
+        assert third is None
+        assert executor.get_stats()["rejected_inline"] == 1
+        assert executor.get_stats()["queue_depth"] == 1
+
+        release.set()
+        first.result(timeout=5)
+        second.result(timeout=5)
+        assert executor.get_stats()["completed"] == 2
+
+    def test_slow_validator_times_out(self):
+        """Test a validator exceeding run_timeout is reported and the chain completes"""
+        release = threading.Event()
+        try:
+            chain = ValidatorChain([_Sleeper(release, run_timeout=0.1), _Sleeper(threading.Event())])
+            chain.validators[1].release.set()
+
+            result = chain.run("answer", [])
+
+            assert result.reasons == ["validator_timeout:_Sleeper"]
+        finally:
+            release.set()
+
+    def test_saturated_pool_runs_inline(self, monkeypatch):
+        """Test validators run on the request thread when the pool refuses work"""
+        from backend.validators import chain as chain_module
+
+        refusing = MagicMock()
+        refusing.try_submit.return_value = None
+        monkeypatch.setattr(chain_module, "get_validator_executor", lambda: refusing)
+        released = threading.Event()
+        released.set()
+
+        result = ValidatorChain([_Sleeper(released), _Sleeper(released)]).run("answer", [])
+
+        assert result.passed is True
+        assert refusing.try_submit.call_count == 2
@@ -115,18 +115,18 @@ class TestPreCheckTokenLimit:
 class TestCheckCache:
     """Tests for _check_cache function."""
     
-    def test_returns_cached_response_when_valid(self):
+    async def test_returns_cached_response_when_valid(self):
         """Test that function returns cached response when valid."""
         cache_service = Mock()
-        cache_service.get.return_value = {
+        cache_service.aget = AsyncMock(return_value={
             "response": "Cached response",
             "latency": 0.5
-        }
+        })
         
         processing_steps = []
         timing_logs = {}
         
-        response, cache_hit, latency = _check_cache(
+        response, cache_hit, latency = await _check_cache(
             cache_service=cache_service,
             cache_key="test_key",
             is_validator_count_question=False,
@@ -139,13 +139,13 @@ class TestCheckCache:
         assert latency == 0.5
         assert "⚡ Response from cache" in processing_steps[0]
     
-    def test_force_cache_miss_for_validator_count_question(self):
+    async def test_force_cache_miss_for_validator_count_question(self):
         """Test that function forces cache miss for validator count questions."""
         cache_service = Mock()
         processing_steps = []
         timing_logs = {}
         
-        response, cache_hit, latency = _check_cache(
+        response, cache_hit, latency = await _check_cache(
             cache_service=cache_service,
             cache_key="test_key",
             is_validator_count_question=True,
@@ -156,23 +156,23 @@ class TestCheckCache:
         assert response is None
         assert cache_hit is False
         assert latency == 0.0
-        assert not cache_service.get.called
+        assert not cache_service.aget.called
     
     @patch('backend.api.handlers.llm_handler.is_fallback_message')
-    def test_ignores_fallback_message_in_cache(self, mock_is_fallback):
+    async def test_ignores_fallback_message_in_cache(self, mock_is_fallback):
         """Test that function ignores fallback message in cache."""
         mock_is_fallback.return_value = True
         
         cache_service = Mock()
-        cache_service.get.return_value = {
+        cache_service.aget = AsyncMock(return_value={
             "response": "⚠️ StillMe is experiencing a technical issue",
             "latency": 0.5
-        }
+        })
         
         processing_steps = []
         timing_logs = {}
         
-        response, cache_hit, latency = _check_cache(
+        response, cache_hit, latency = await _check_cache(
             cache_service=cache_service,
             cache_key="test_key",
             is_validator_count_question=False,
@@ -187,11 +187,12 @@ class TestCheckCache:
 class TestStoreCache:
     """Tests for _store_cache function."""
     
-    def test_stores_cache_successfully(self):
+    async def test_stores_cache_successfully(self):
         """Test that function stores cache successfully."""
         cache_service = Mock()
+        cache_service.aset = AsyncMock(return_value=True)
         
-        _store_cache(
+        await _store_cache(
             cache_service=cache_service,
             cache_key="test_key",
             response="Test response",
@@ -200,17 +201,18 @@ class TestStoreCache:
             is_validator_count_question=False
         )
         
-        assert cache_service.set.called
-        call_args = cache_service.set.call_args
+        assert cache_service.aset.called
+        call_args = cache_service.aset.call_args
         assert call_args[0][0] == "test_key"
         assert call_args[0][1]["response"] == "Test response"
         assert call_args[0][1]["latency"] == 1.5
     
-    def test_skips_cache_for_validator_count_question(self):
+    async def test_skips_cache_for_validator_count_question(self):
         """Test that function skips cache for validator count questions."""
         cache_service = Mock()
+        cache_service.aset = AsyncMock(return_value=True)
         
-        _store_cache(
+        await _store_cache(
             cache_service=cache_service,
             cache_key="test_key",
             response="Test response",
@@ -219,13 +221,14 @@ class TestStoreCache:
             is_validator_count_question=True
         )
         
-        assert not cache_service.set.called
+        assert not cache_service.aset.called
     
-    def test_uses_custom_ttl_when_provided(self):
+    async def test_uses_custom_ttl_when_provided(self):
         """Test that function uses custom TTL when provided."""
         cache_service = Mock()
+        cache_service.aset = AsyncMock(return_value=True)
         
-        _store_cache(
+        await _store_cache(
             cache_service=cache_service,
             cache_key="test_key",
             response="Test response",
@@ -234,7 +237,7 @@ class TestStoreCache:
             is_validator_count_question=False
         )
         
-        call_args = cache_service.set.call_args
+        call_args = cache_service.aset.call_args
         assert call_args[1]["ttl_seconds"] == 3600
 
 
@@ -20,7 +20,7 @@ class TestHandleOriginQuery:
     """Tests for _handle_origin_query"""
     
     @patch('backend.core.stillme_detector.detect_origin_query')
-    @patch('backend.api.handlers.query_router.detect_language')
+    @patch('backend.api.utils.chat_helpers.detect_language')
     @patch('backend.identity.system_origin.get_system_origin_answer')
     def test_handles_origin_query(self, mock_get_answer, mock_detect_lang, mock_detect_origin):
         mock_detect_origin.return_value = (True, ["origin", "created"])
@@ -52,7 +52,7 @@ class TestHandleReligionChoiceRejection:
     """Tests for _handle_religion_choice_rejection"""
     
     @patch('backend.core.ai_self_model_detector.detect_religion_choice_query')
-    @patch('backend.api.handlers.query_router.detect_language')
+    @patch('backend.api.utils.chat_helpers.detect_language')
     @patch('backend.identity.religion_rejection_templates.get_religion_rejection_answer')
     def test_handles_religion_choice_query(self, mock_get_answer, mock_detect_lang, mock_detect):
         mock_detect.return_value = (True, ["religion", "choose"])
@@ -84,7 +84,7 @@ class TestHandleHonestyQuestion:
     """Tests for _handle_honesty_question"""
     
     @patch('backend.honesty.handler.is_honesty_question')
-    @patch('backend.api.handlers.query_router.detect_language')
+    @patch('backend.api.utils.chat_helpers.detect_language')
     @patch('backend.honesty.handler.build_honesty_response')
     def test_handles_honesty_question(self, mock_build, mock_detect_lang, mock_check):
         mock_check.return_value = True
@@ -120,7 +120,7 @@ class TestHandleAiSelfModelQuery:
     """Tests for _handle_ai_self_model_query"""
     
     @patch('backend.core.ai_self_model_detector.detect_ai_self_model_query')
-    @patch('backend.api.handlers.query_router.detect_language')
+    @patch('backend.api.utils.chat_helpers.detect_language')
     @patch('backend.core.ai_self_model_detector.get_ai_self_model_opening')
     @patch('backend.api.utils.response_formatters.build_ai_self_model_answer')
     @patch('backend.api.utils.text_utils.strip_philosophy_from_answer')
@@ -212,7 +212,7 @@ class TestHandleAmbiguityClarification:
     
     @pytest.mark.asyncio
     @patch('backend.core.ambiguity_detector.get_ambiguity_detector')
-    @patch('backend.api.handlers.query_router.detect_language')
+    @patch('backend.api.utils.chat_helpers.detect_language')
     async def test_handles_ambiguity_clarification(self, mock_detect_lang, mock_get_detector):
         mock_detector = Mock()
         mock_detector.should_ask_clarification.return_value = (True, "What do you mean?")